@@ -25,8 +25,12 @@ PUBLIC_API_SYMBOLS = {
     "Schema",
     "FeatureSchema",
     "IndexSchema",
+    "Plan",
+    "Profile",
+    "StepProfile",
     "duration",
     "run",
+    "run_sharded",
     "has_leak",
     "event_set",
     "input_node",
@@ -43,11 +47,17 @@ PUBLIC_API_SYMBOLS = {
     "to_numpy",
     "from_pandas",
     "from_polars",
+    "from_arrow",
+    "to_arrow",
     "to_parquet",
     "from_parquet",
+    "to_parquet_dataset",
+    "from_parquet_dataset",
     "to_tensorflow_dataset",
     "from_tensorflow_record",
     "to_tensorflow_record",
+    "save_event_set",
+    "load_event_set",
     "from_struct",
     # DTYPES
     "float64",
@@ -69,6 +69,9 @@ from temporian.core.serialization import load_graph
 # Graph execution
 from temporian.core.evaluation import run
 from temporian.core.evaluation import has_leak
+from temporian.core.sharded_evaluation import run_sharded
+from temporian.core.plan import Plan
+from temporian.core.profile import Profile, StepProfile
 
 # IO
 from temporian.io.csv import to_csv
@@ -78,11 +81,17 @@ from temporian.io.numpy import to_numpy
 from temporian.io.pandas import from_pandas
 from temporian.io.parquet import from_parquet
 from temporian.io.parquet import to_parquet
+from temporian.io.parquet import from_parquet_dataset
+from temporian.io.parquet import to_parquet_dataset
 from temporian.io.polars import to_polars
 from temporian.io.polars import from_polars
 from temporian.io.tensorflow import to_tensorflow_dataset
 from temporian.io.tensorflow import from_tensorflow_record
 from temporian.io.tensorflow import to_tensorflow_record
+from temporian.io.arrow import from_arrow
+from temporian.io.arrow import to_arrow
+from temporian.io.native import save_event_set
+from temporian.io.native import load_event_set
 
 # Plotting
 from temporian.implementation.numpy.data.plotter import plot
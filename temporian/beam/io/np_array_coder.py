@@ -11,6 +11,11 @@ import apache_beam as beam
 from apache_beam.coders import typecoders
 from apache_beam.typehints import typehints
 
+from temporian.implementation.numpy.data import dictionary_encoding
+
+# Value of the "dtype" field for dictionary encoded arrays.
+_DICTIONARY_ENCODED_DTYPE = "dictionary"
+
 
 class NDArrayCoder(beam.coders.Coder):
     """Beam coder for Numpy N-dimensional array of TF-compatible data types.
@@ -25,6 +30,9 @@ class NDArrayCoder(beam.coders.Coder):
     objects, we could not rely on numpy native serialization and using
     `IterableCoder` from the Beam library instead.
 
+    Dictionary encoded string arrays are serialized as their vocabulary and
+    codes, without decoding them.
+
     NOTE: for some simple stages the execution time may be dominated by data
     serialization/deserialization, so any imporvement here translates directly to
     the total execution costs.
@@ -36,8 +44,24 @@ class NDArrayCoder(beam.coders.Coder):
         self._bytes_coder = typecoders.registry.get_coder(
             typehints.Iterable[bytes]
         )
+        # Vocabulary dtype, vocabulary and codes of dictionary encoded arrays.
+        self._dictionary_coder = typecoders.registry.get_coder(
+            typehints.Tuple[str, bytes, bytes]
+        )
 
     def encode(self, value: np.ndarray) -> bytes:
+        if dictionary_encoding.is_encoded(value):
+            vocabulary = value.vocabulary
+            flat_values = self._dictionary_coder.encode(
+                (
+                    vocabulary.dtype.str,
+                    vocabulary.tobytes(),
+                    value.codes.tobytes(),
+                )
+            )
+            return self._coder.encode(
+                (_DICTIONARY_ENCODED_DTYPE, value.shape, flat_values)
+            )
         if value.dtype == np.object_:
             flat_values = self._bytes_coder.encode(value.flat)
         else:
@@ -46,6 +70,19 @@ class NDArrayCoder(beam.coders.Coder):
 
     def decode(self, encoded: bytes) -> np.ndarray:
         dtype_str, shape, serialized_values = self._coder.decode(encoded)
+        if dtype_str == _DICTIONARY_ENCODED_DTYPE:
+            (
+                vocabulary_dtype_str,
+                vocabulary,
+                codes,
+            ) = self._dictionary_coder.decode(serialized_values)
+            return dictionary_encoding.DictionaryEncodedArray(
+                np.reshape(
+                    np.frombuffer(codes, dtype=dictionary_encoding.CODE_DTYPE),
+                    shape,
+                ),
+                np.frombuffer(vocabulary, dtype=np.dtype(vocabulary_dtype_str)),
+            )
         dtype = np.dtype(dtype_str)
         if dtype == np.object_:
             flat_values = np.array(
@@ -63,3 +100,6 @@ class NDArrayCoder(beam.coders.Coder):
 
 
 beam.coders.registry.register_coder(np.ndarray, NDArrayCoder)
+beam.coders.registry.register_coder(
+    dictionary_encoding.DictionaryEncodedArray, NDArrayCoder
+)
@@ -17,6 +17,7 @@ from absl.testing import absltest, parameterized
 from apache_beam.typehints import trivial_inference
 from apache_beam.coders import typecoders
 from temporian.beam.io import np_array_coder
+from temporian.implementation.numpy.data import dictionary_encoding
 from numpy.testing import assert_array_equal
 
 
@@ -47,6 +48,18 @@ class NDArrayCoderTest(parameterized.TestCase):
         decoded = coder.decode(encoded)
         assert_array_equal(value, decoded)
 
+    def test_dictionary_encoded(self):
+        value = dictionary_encoding.encode(np.array([b"b", b"aaa", b"b"]))
+        value_type = trivial_inference.instance_to_type(value)
+        coder = typecoders.registry.get_coder(value_type)
+        self.assertIsInstance(coder, np_array_coder.NDArrayCoder)
+
+        decoded = coder.decode(coder.encode(value))
+        self.assertTrue(dictionary_encoding.is_encoded(decoded))
+        assert_array_equal(decoded.codes, [1, 0, 1])
+        assert_array_equal(decoded.vocabulary, [b"aaa", b"b"])
+        assert_array_equal(decoded.decode(), [b"b", b"aaa", b"b"])
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -20,6 +20,10 @@
 from temporian.beam.operators.window import moving_count
 from temporian.beam.operators.window import moving_max
 from temporian.beam.operators.window import moving_min
+from temporian.beam.operators.window import moving_quantile
+from temporian.beam.operators.window import moving_approx_quantile
+from temporian.beam.operators.window import moving_approx_distinct_count
+from temporian.beam.operators.window import moving_approx_heavy_hitters
 from temporian.beam.operators.window import moving_standard_deviation
 from temporian.beam.operators.window import moving_sum
 from temporian.beam.operators.window import simple_moving_average
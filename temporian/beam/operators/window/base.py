@@ -15,6 +15,9 @@
 from abc import abstractmethod
 from functools import partial
 from typing import Dict, Optional, Type
+
+import apache_beam as beam
+
 from temporian.core.operators.window.base import BaseWindowOperator
 
 from temporian.implementation.numpy.operators.window.base import (
@@ -65,7 +68,64 @@ class BaseWindowBeamImplementation(BeamOperatorImplementation):
                 fn=partial(_run_without_sampling, numpy_implementation),
             )
 
-        return {"output": output}
+        return {
+            "output": split_feature_outputs(
+                self.operator,
+                output,
+                numpy_implementation.feature_wise_num_outputs(),
+            )
+        }
+
+
+def split_window_lengths(
+    operator: BaseWindowOperator, output: BeamEventSet
+) -> BeamEventSet:
+    """Splits the outputs of a window operator with several window lengths.
+
+    With several window lengths, the numpy implementation computes all the
+    window lengths of a feature at once, and the values of each item of
+    "output" contain one row per window length. Each row becomes a separate
+    feature.
+    """
+
+    return split_feature_outputs(
+        operator,
+        output,
+        (
+            len(operator.window_lengths)
+            if operator.window_lengths is not None
+            else None
+        ),
+    )
+
+
+def split_feature_outputs(
+    operator: BaseWindowOperator,
+    output: BeamEventSet,
+    num_outputs: Optional[int],
+) -> BeamEventSet:
+    """Splits the outputs computed together for each feature.
+
+    The values of each item of "output" contain `num_outputs` output
+    features (e.g. one per window length, or the heavy hitters and their
+    counts), which become separate features. If `num_outputs` is None, the
+    values are a single output feature.
+    """
+
+    if num_outputs is None:
+        return output
+
+    def extract(item: FeatureItem, output_idx: int) -> FeatureItem:
+        index, (timestamps, values) = item
+        return index, (timestamps, values[output_idx])
+
+    return tuple(
+        feature
+        | f"Extract output #{output_idx} of feature #{idx} {operator}"
+        >> beam.Map(extract, output_idx)
+        for idx, feature in enumerate(output)
+        for output_idx in range(num_outputs)
+    )
 
 
 def _run_with_sampling(
@@ -22,6 +22,7 @@ from temporian.beam.operators.window.base import (
     BaseWindowBeamImplementation,
     _run_with_sampling,
     _run_without_sampling,
+    split_window_lengths,
 )
 from temporian.beam.operators.base import (
     beam_eventset_map,
@@ -78,7 +79,7 @@ class MovingCountBeamImplementation(BaseWindowBeamImplementation):
                 fn=partial(_run_without_sampling, numpy_implementation),
             )
 
-        return {"output": output}
+        return {"output": split_window_lengths(self.operator, output)}
 
 
 implementation_lib.register_operator_implementation(
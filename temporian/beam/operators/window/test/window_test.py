@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 
 from absl.testing import absltest
 from absl.testing.parameterized import parameters
@@ -21,6 +22,16 @@ from temporian.core.operators.window.moving_sum import moving_sum
 from temporian.core.operators.window.moving_min import moving_min
 from temporian.core.operators.window.moving_max import moving_max
 from temporian.core.operators.window.moving_count import moving_count
+from temporian.core.operators.window.moving_quantile import moving_quantile
+from temporian.core.operators.window.moving_approx_quantile import (
+    moving_approx_quantile,
+)
+from temporian.core.operators.window.moving_approx_distinct_count import (
+    moving_approx_distinct_count,
+)
+from temporian.core.operators.window.moving_approx_heavy_hitters import (
+    moving_approx_heavy_hitters,
+)
 from temporian.core.operators.window.moving_standard_deviation import (
     moving_standard_deviation,
 )
@@ -38,6 +49,10 @@ from temporian.beam.test.utils import check_beam_implementation
     (moving_sum, None),
     (simple_moving_average, None),
     (moving_count, DType.INT32),
+    (partial(moving_quantile, quantile=0.5), None),
+    (partial(moving_approx_quantile, quantile=0.5), None),
+    (moving_approx_distinct_count, DType.INT32),
+    (partial(moving_approx_heavy_hitters, k=2), None),
 )
 class BeamWindowImplementationsTest(absltest.TestCase):
     def test_base(self, operator, output_dtype):
@@ -99,6 +114,37 @@ class BeamWindowImplementationsTest(absltest.TestCase):
             cast=output_dtype,
         )
 
+    def test_several_window_lengths(self, operator, output_dtype):
+        input_data = event_set(
+            timestamps=[1, 2, 3, 4, 5, 1, 2, 3, 4],
+            features={
+                "a": ["x", "x", "x", "x", "x", "y", "y", "y", "y"],
+                "c": [2.0, 3.0, 4.0, 3.0, 2.0, 22.0, 23.0, 24.0, 23.0],
+                "d": [10.0, 11.0, 12.0, 13.0, 14.0, 105.0, 106.0, 106.0, 107.0],
+            },
+            indexes=["a"],
+        )
+        sampling_data = event_set(
+            timestamps=[-1, 1.5, 3.5, 1.5, 5],
+            features={"a": ["x", "x", "x", "y", "z"]},
+            indexes=["a"],
+        )
+
+        check_beam_implementation(
+            self,
+            input_data=input_data,
+            output_node=operator(input_data.node(), [1, 3]),
+            cast=output_dtype,
+        )
+        check_beam_implementation(
+            self,
+            input_data=[input_data, sampling_data],
+            output_node=operator(
+                input_data.node(), [1, 3], sampling=sampling_data.node()
+            ),
+            cast=output_dtype,
+        )
+
 
 if __name__ == "__main__":
     absltest.main()
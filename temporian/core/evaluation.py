@@ -16,7 +16,7 @@
 
 import time
 import sys
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Literal, Set, Optional, Tuple, Union, overload
 from collections import defaultdict
 
 from temporian.core.data.node import EventSetNode
@@ -29,17 +29,55 @@ from temporian.core.typing import (
 from temporian.implementation.numpy import evaluation as np_eval
 from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.core.graph import infer_graph
+from temporian.core.memory_estimation import LiveBuffers, MemoryEstimator
+from temporian.core.optimizer import NodeMapping, optimize as optimize_graph
+from temporian.core.profile import Profile
 from temporian.core.schedule import Schedule, ScheduleStep
 from temporian.core.operators.leak import LeakOperator
 
 
+@overload
 def run(
     query: EventSetNodeCollection,
     input: NodeToEventSetMapping,
     verbose: int = 0,
     check_execution: bool = True,
     force_garbage_collector_interval: Optional[float] = 10,
+    num_threads: int = 1,
+    optimize: bool = True,
+    minimize_memory: bool = False,
+    profile: Literal[False] = False,
 ) -> EventSetCollection:
+    ...
+
+
+@overload
+def run(
+    query: EventSetNodeCollection,
+    input: NodeToEventSetMapping,
+    verbose: int = 0,
+    check_execution: bool = True,
+    force_garbage_collector_interval: Optional[float] = 10,
+    num_threads: int = 1,
+    optimize: bool = True,
+    minimize_memory: bool = False,
+    *,
+    profile: Literal[True],
+) -> Tuple[EventSetCollection, Profile]:
+    ...
+
+
+def run(
+    query: EventSetNodeCollection,
+    input: NodeToEventSetMapping,
+    verbose: int = 0,
+    check_execution: bool = True,
+    force_garbage_collector_interval: Optional[float] = 10,
+    num_threads: int = 1,
+    optimize: bool = True,
+    minimize_memory: bool = False,
+    profile: bool = False,
+) -> Union[EventSetCollection, Tuple[EventSetCollection, Profile]]:
     """Evaluates [`EventSetNodes`][temporian.EventSetNode] on [`EventSets`][temporian.EventSet].
 
     Performs all computation defined by the graph between the `query` EventSetNodes and
@@ -111,12 +149,32 @@ def run(
             false, checks are skipped.
         force_garbage_collector_interval: If set, triggers the garbage
             collection every "force_garbage_collector_interval" seconds.
+        num_threads: Number of threads used to run the operators. If greater
+            than 1, operators that do not depend on each other (e.g. several
+            moving windows applied on the same input) are run concurrently.
+            Defaults to 1 i.e. the operators are run one after the other.
+        optimize: If true, the graph is rewritten into an equivalent graph
+            cheaper to evaluate before running it. For instance, duplicated
+            operators are computed once, features not used by the `query`
+            are not computed, and chains of elementwise operators (e.g.
+            `(a * 2 + b).abs()`) are computed by a single operator.
+        minimize_memory: If true, the operators are executed in the order that
+            minimizes the estimated peak memory usage. The memory usage is
+            estimated from the number of events of the `input` EventSets and
+            the features of each EventSetNode. If `verbose` >= 1, the estimated
+            peak memory usage is printed.
+        profile: If true, the execution of each operator (durations, number of
+            events, allocated memory) is recorded, and `tp.run` returns a tuple
+            `(result, profile)` where `profile` is a
+            [`tp.Profile`][temporian.Profile].
 
     Returns:
         An object with the same structure as `query` containing the results.
             If `query` is a dictionary of EventSetNodes, the returned object will be a
             dictionary of EventSet. If `query` is a list of EventSetNodes, the
             returned value will be a list of EventSet with the same order.
+            If `profile` is true, a tuple `(result, profile)` is returned
+            instead.
     """
     # TODO: Create an internal configuration object for options such as
     # `check_execution`.
@@ -132,10 +190,30 @@ def run(
     # Schedule execution
     assert isinstance(normalized_query, set)
     input_nodes = set(input.keys())
+    if optimize:
+        optimized_query = optimize_graph(input_nodes, normalized_query)
+    else:
+        optimized_query = {node: node for node in normalized_query}
     schedule = build_schedule(
-        inputs=input_nodes, outputs=normalized_query, verbose=verbose
+        inputs=input_nodes,
+        outputs=set(optimized_query.values()),
+        verbose=verbose,
+        input_num_events=(
+            {node: evset.num_events() for node, evset in input.items()}
+            if minimize_memory
+            else None
+        ),
     )
 
+    if verbose >= 1 and schedule.estimated_peak_memory is not None:
+        print(
+            (
+                "Estimated peak memory usage:"
+                f" {schedule.estimated_peak_memory / 2**20:.2f} MiB"
+            ),
+            file=sys.stderr,
+        )
+
     if verbose == 1:
         print(
             f"Run {len(schedule.steps)} operators",
@@ -149,12 +227,15 @@ def run(
     #
     # Note: "outputs" is a dictionary of event (including the query events) to
     # event data.
+    execution_profile = Profile() if profile else None
     outputs = np_eval.run_schedule(
         input,
         schedule,
         verbose=verbose,
         check_execution=check_execution,
         force_garbage_collector_interval=force_garbage_collector_interval,
+        num_threads=num_threads,
+        profile=execution_profile,
     )
 
     end_time = time.perf_counter()
@@ -162,13 +243,20 @@ def run(
     if verbose == 1:
         print(f"Execution in {end_time - begin_time:.5f} s", file=sys.stderr)
 
-    return _denormalize_outputs(outputs, query)
+    result = _denormalize_outputs(
+        _map_optimized_outputs(outputs, optimized_query), query
+    )
+    if execution_profile is not None:
+        execution_profile.wall_time = end_time - begin_time
+        return result, execution_profile
+    return result
 
 
 def build_schedule(
     inputs: Optional[Set[EventSetNode]],
     outputs: Set[EventSetNode],
     verbose: int = 0,
+    input_num_events: Optional[Dict[EventSetNode, int]] = None,
 ) -> Schedule:
     """Calculates which operators need to be executed in which order to compute
     a set of output EventSetNodes given a set of input EventSetNodes.
@@ -180,6 +268,10 @@ def build_schedule(
         outputs: Output EventSetNodes.
         verbose: If >0, prints details about the execution on the standard error
             output. The larger the number, the more information is displayed.
+        input_num_events: Number of events in each input EventSetNode. If set,
+            the operators are ordered to reduce the peak memory usage instead
+            of by creation order, and the estimated peak memory usage is
+            reported in `Schedule.estimated_peak_memory`.
 
     Returns:
         Tuple of:
@@ -237,10 +329,55 @@ def build_schedule(
     # Execute the op with smallest internal ordered id first.
     ready_ops.sort(key=lambda op: op._internal_ordered_id, reverse=True)
 
+    # "node_to_step_idx[e]" is the index of the scheduled step computing "e".
+    node_to_step_idx: Dict[EventSetNode, int] = {}
+
+    # Size of the nodes in memory, if the schedule minimizes the memory usage.
+    memory_estimator: Optional[MemoryEstimator] = None
+    live_buffers: Optional[LiveBuffers] = None
+    if input_num_events is not None:
+        memory_estimator = MemoryEstimator(
+            {node: input_num_events.get(node, 0) for node in graph.inputs}
+        )
+        for op in ready_ops:
+            memory_estimator.add_operator(op)
+        live_buffers = LiveBuffers(memory_estimator)
+        live_buffers.add(graph.inputs)
+        schedule.estimated_peak_memory = live_buffers.num_bytes
+
+    def memory_delta(op: Operator) -> int:
+        """Change of memory usage caused by the execution of an op."""
+
+        assert memory_estimator is not None and live_buffers is not None
+        released_nodes = [
+            input
+            for input in op.inputs.values()
+            if input not in outputs
+            and input in node_to_op
+            and all(other_op is op for other_op in node_to_op[input])
+        ]
+        op_outputs = list(op.outputs.values())
+        new_buffers = live_buffers.new_buffers(op_outputs)
+        released_buffers = live_buffers.released_buffers(released_nodes)
+        for output in op_outputs:
+            released_buffers.difference_update(memory_estimator.buffers(output))
+        return memory_estimator.num_bytes(
+            new_buffers
+        ) - memory_estimator.num_bytes(released_buffers)
+
     # Compute the schedule
     while ready_ops:
         # Get an op ready to be scheduled
-        op = ready_ops.pop()
+        if memory_estimator is None:
+            op = ready_ops.pop()
+        else:
+            # Execute the op that increases the memory usage the least (or
+            # decreases it the most) first.
+            op = min(
+                ready_ops,
+                key=lambda op: (memory_delta(op), op._internal_ordered_id),
+            )
+            ready_ops.remove(op)
         ready_ops_set.remove(op)
 
         # Nodes released after the op is executed
@@ -259,11 +396,31 @@ def build_schedule(
                 released_nodes.append(input)
                 del node_to_op[input]
 
+        # Steps computing the inputs of the op.
+        dependencies = {
+            node_to_step_idx[input]
+            for input in op.inputs.values()
+            if input in node_to_step_idx
+        }
+
         # Schedule the op
+        for output in op.outputs.values():
+            node_to_step_idx[output] = len(schedule.steps)
         schedule.steps.append(
-            ScheduleStep(op=op, released_nodes=released_nodes)
+            ScheduleStep(
+                op=op,
+                released_nodes=released_nodes,
+                dependencies=dependencies,
+            )
         )
 
+        if live_buffers is not None:
+            live_buffers.add(op.outputs.values())
+            schedule.estimated_peak_memory = max(
+                schedule.estimated_peak_memory, live_buffers.num_bytes
+            )
+            live_buffers.release(released_nodes)
+
         # Update all the ops that depends on "op". Enlist the ones that are
         # ready to be computed
         for output in op.outputs.values():
@@ -281,6 +438,8 @@ def build_schedule(
                     ready_ops.append(new_op)
                     ready_ops_set.add(new_op)
                     del op_to_num_pending_inputs[new_op]
+                    if memory_estimator is not None:
+                        memory_estimator.add_operator(new_op)
 
     assert not op_to_num_pending_inputs
     return schedule
@@ -393,6 +552,25 @@ def _normalize_query(query: EventSetNodeCollection) -> Set[EventSetNode]:
     )
 
 
+def _map_optimized_outputs(
+    outputs: Dict[EventSetNode, EventSet], optimized_query: NodeMapping
+) -> Dict[EventSetNode, EventSet]:
+    """Gets the EventSets of the query nodes from the EventSets of the
+    equivalent nodes computed by the optimized graph."""
+
+    query_outputs = {}
+    for node, optimized_node in optimized_query.items():
+        evset = outputs[optimized_node]
+        if optimized_node is not node:
+            # The data is shared between the EventSets.
+            evset = EventSet(
+                data=evset.data, schema=node.schema, name=evset.name
+            )
+            evset._internal_node = node
+        query_outputs[node] = evset
+    return query_outputs
+
+
 def _denormalize_outputs(
     outputs: Dict[EventSetNode, EventSet], query: EventSetNodeCollection
 ) -> EventSetCollection:
@@ -3004,6 +3004,334 @@ class EventSetOperations:
 
         return log(self)
 
+    def moving_aggregate(
+        self: EventSetOrNode,
+        window_length: WindowLength,
+        ops: Optional[Union[str, List[str]]] = None,
+        sampling: Optional[EventSetOrNode] = None,
+    ) -> EventSetOrNode:
+        """Computes several statistics in a sliding window over an
+        [`EventSet`][temporian.EventSet].
+
+        For each t in sampling, and for each feature independently, returns at
+        time t the statistics of the values for the feature in the window
+        (t - window_length, t]. One output feature is created for each input
+        feature and statistic, and is named `<feature>_<statistic>`.
+
+        The statistics are computed in a single pass over the events, which is
+        faster than calling the corresponding window operators separately.
+        The supported statistics are:
+
+        - `"sum"`: Like [`EventSet.moving_sum()`][temporian.EventSet.moving_sum].
+        - `"mean"`: Like
+            [`EventSet.simple_moving_average()`][temporian.EventSet.simple_moving_average].
+        - `"std"`: Like
+            [`EventSet.moving_standard_deviation()`][temporian.EventSet.moving_standard_deviation].
+        - `"min"`: Like [`EventSet.moving_min()`][temporian.EventSet.moving_min].
+        - `"max"`: Like [`EventSet.moving_max()`][temporian.EventSet.moving_max].
+        - `"count"`: Number of non-missing values in the window.
+
+        The sum, min and max have the type of the input feature. The mean and
+        standard deviation are float32 for float32 features, and float64
+        otherwise. The count is int32.
+
+        `sampling` can't be  specified if a variable `window_length` is
+        specified (i.e. if `window_length` is an EventSet).
+
+        If `sampling` is specified or `window_length` is an EventSet, the moving
+        window is sampled at each timestamp in them, else it is sampled on the
+        input's.
+
+        Missing values (such as NaNs) are ignored.
+
+        Example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2, 5, 6, 7],
+            ...     features={"value": [np.nan, 1, 5, 10, 15, 20]},
+            ... )
+
+            >>> b = a.moving_aggregate(
+            ...     tp.duration.seconds(4), ops=["sum", "mean", "count"]
+            ... )
+            >>> b
+            indexes: ...
+                (6 events):
+                    timestamps: [0. 1. 2. 5. 6. 7.]
+                    'value_sum': [ 0. 1. 6. 15. 25. 45.]
+                    'value_mean': [ nan 1. 3. 7.5 12.5 15. ]
+                    'value_count': [0 1 2 2 2 3]
+            ...
+
+            ```
+
+        Args:
+            window_length: Sliding window's length. If a list of window lengths
+                is given, the window length is added as a suffix to the output
+                features (e.g. `value_sum_1h`).
+            ops: Statistics to compute, among "sum", "mean", "std", "min",
+                "max" and "count". If not provided, all the statistics are
+                computed.
+            sampling: Timestamps to sample the sliding window's value at. If not
+                provided, timestamps in the input are used.
+
+        Returns:
+            EventSet containing the statistics of each feature in the input.
+        """
+        from temporian.core.operators.window.moving_aggregate import (
+            moving_aggregate,
+        )
+
+        return moving_aggregate(
+            self, window_length=window_length, ops=ops, sampling=sampling
+        )
+
+    def moving_approx_distinct_count(
+        self: EventSetOrNode,
+        window_length: WindowLength,
+        precision: int = 12,
+        sampling: Optional[EventSetOrNode] = None,
+    ) -> EventSetOrNode:
+        """Computes the approximate number of distinct values in a sliding
+        window over an [`EventSet`][temporian.EventSet].
+
+        For each t in sampling, and for each index and feature independently,
+        returns at time t the number of distinct non-nan values for the feature
+        in the window (t - window_length, t].
+
+        The number of distinct values is estimated with a HyperLogLog sketch
+        adapted to sliding windows. The sketch of each index key uses at most
+        2^`precision` registers, whatever the number of values in the window.
+        The relative standard error of the estimate is about
+        `1.04 / sqrt(2^precision)` (1.6% for the default precision of 12).
+        Small numbers of distinct values are generally exact. With the Beam
+        backend, each index key is also processed whole by a single worker,
+        so sketches are never merged.
+
+        Features of any type are supported. The output features are int32.
+
+        `sampling` can't be  specified if a variable `window_length` is
+        specified (i.e. if `window_length` is an EventSet).
+
+        If `sampling` is specified or `window_length` is an EventSet, the moving
+        window is sampled at each timestamp in them, else it is sampled on the
+        input's.
+
+        If the window does not contain any values (e.g., all the values are
+        missing, or the window does not contain any sampling), outputs 0.
+
+        Example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2, 3, 4, 5],
+            ...     features={"user": ["a", "b", "a", "c", "c", "c"]},
+            ... )
+
+            >>> b = a.moving_approx_distinct_count(tp.duration.seconds(3))
+            >>> b
+            indexes: ...
+                (6 events):
+                    timestamps: [0. 1. 2. 3. 4. 5.]
+                    'user': [1 2 2 3 2 1]
+            ...
+
+            ```
+
+        See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
+        examples of moving window operations with external sampling and indices.
+
+        Args:
+            window_length: Sliding window's length.
+            precision: Number of bits of the hash of the values used to select
+                a register, between 4 and 18. Higher values are more accurate
+                but use more memory.
+            sampling: Timestamps to sample the sliding window's value at. If not
+                provided, timestamps in the input are used.
+
+        Returns:
+            EventSet containing the approximate number of distinct values of
+                each feature in the input.
+        """
+        from temporian.core.operators.window.moving_approx_distinct_count import (
+            moving_approx_distinct_count,
+        )
+
+        return moving_approx_distinct_count(
+            self,
+            window_length=window_length,
+            precision=precision,
+            sampling=sampling,
+        )
+
+    def moving_approx_heavy_hitters(
+        self: EventSetOrNode,
+        window_length: WindowLength,
+        k: int = 1,
+        epsilon: float = 0.01,
+        sampling: Optional[EventSetOrNode] = None,
+    ) -> EventSetOrNode:
+        """Computes the approximate most frequent values in a sliding window
+        over an [`EventSet`][temporian.EventSet].
+
+        For each t in sampling, and for each index and feature independently,
+        returns at time t the `k` most frequent non-nan values for the feature
+        in the window (t - window_length, t], with their approximate number of
+        occurrences. For each input feature `<feature>` and rank i in [1, k],
+        the output contains the feature `<feature>_top<i>` with the i-th most
+        frequent value, and the int32 feature `<feature>_top<i>_count` with its
+        number of occurrences. Values with the same number of occurrences are
+        sorted by increasing value.
+
+        The numbers of occurrences are estimated with a Count-Min sketch: They
+        can be over-estimated by up to `epsilon` times the number of values in
+        the window. The sketch of each index key uses about
+        `4 * e / epsilon` counters, whatever the number of values in the
+        window. The most frequent values are tracked among `4 * k` candidates.
+        The Beam backend computes the sketch of an index key on a single
+        worker, without merging partial sketches.
+
+        Features of any type are supported. If the window contains fewer than
+        `k` distinct values, the remaining values are missing (e.g. NaN for
+        floats, 0 for integers, and empty strings), with a count of 0.
+
+        `sampling` can't be  specified if a variable `window_length` is
+        specified (i.e. if `window_length` is an EventSet).
+
+        If `sampling` is specified or `window_length` is an EventSet, the moving
+        window is sampled at each timestamp in them, else it is sampled on the
+        input's.
+
+        Example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2, 3, 4, 5],
+            ...     features={"user": ["a", "b", "a", "c", "c", "c"]},
+            ... )
+
+            >>> b = a.moving_approx_heavy_hitters(tp.duration.seconds(3), k=2)
+            >>> b
+            indexes: ...
+                (6 events):
+                    timestamps: [0. 1. 2. 3. 4. 5.]
+                    'user_top1': [b'a' b'a' b'a' b'a' b'c' b'c']
+                    'user_top1_count': [1 1 2 1 2 3]
+                    'user_top2': [b'' b'b' b'b' b'b' b'a' b'']
+                    'user_top2_count': [0 1 1 1 1 0]
+            ...
+
+            ```
+
+        See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
+        examples of moving window operations with external sampling and indices.
+
+        Args:
+            window_length: Sliding window's length.
+            k: Number of most frequent values to return.
+            epsilon: Maximum over-estimation of the numbers of occurrences,
+                relative to the number of values in the window. Lower values
+                are more accurate but use more memory.
+            sampling: Timestamps to sample the sliding window's value at. If not
+                provided, timestamps in the input are used.
+
+        Returns:
+            EventSet containing the most frequent values of each feature in the
+                input, and their number of occurrences.
+        """
+        from temporian.core.operators.window.moving_approx_heavy_hitters import (
+            moving_approx_heavy_hitters,
+        )
+
+        return moving_approx_heavy_hitters(
+            self,
+            window_length=window_length,
+            k=k,
+            epsilon=epsilon,
+            sampling=sampling,
+        )
+
+    def moving_approx_quantile(
+        self: EventSetOrNode,
+        window_length: WindowLength,
+        quantile: float,
+        relative_accuracy: float = 0.01,
+        sampling: Optional[EventSetOrNode] = None,
+    ) -> EventSetOrNode:
+        """Computes an approximate quantile of values in a sliding window over
+        an [`EventSet`][temporian.EventSet].
+
+        For each t in sampling, and for each index and feature independently,
+        returns at time t an approximation of the `quantile` of non-nan values
+        for the feature in the window (t - window_length, t].
+
+        Unlike [`EventSet.moving_quantile()`][temporian.EventSet.moving_quantile],
+        the memory used by each index key does not grow with the number of
+        values in the window. The values are counted in logarithmically spaced
+        buckets (DDSketch): Each value is approximated with a relative error of
+        at most `relative_accuracy`, and the quantile is linearly interpolated
+        between the two closest approximated values. At most 2048 buckets are
+        used for the positive values, and for the negative values. If more
+        buckets are needed, the buckets of the values closest to zero are
+        merged. With the Beam backend, all the events of an index key are
+        evaluated together, and sketches are not combined across workers.
+
+        The output features are float32 for float32 features, and float64
+        otherwise.
+
+        `sampling` can't be  specified if a variable `window_length` is
+        specified (i.e. if `window_length` is an EventSet).
+
+        If `sampling` is specified or `window_length` is an EventSet, the moving
+        window is sampled at each timestamp in them, else it is sampled on the
+        input's.
+
+        If the window does not contain any values (e.g., all the values are
+        missing, or the window does not contain any sampling), outputs missing
+        values.
+
+        Example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2, 5, 6, 7],
+            ...     features={"value": [np.nan, 1, 5, 10, 15, 20]},
+            ... )
+
+            >>> b = a.moving_approx_quantile(tp.duration.seconds(4), quantile=0.5)
+            >>> b
+            indexes: ...
+                (6 events):
+                    timestamps: [0. 1. 2. 5. 6. 7.]
+                    'value': [ nan 0.99 2.9964 7.5388 12.5523 15.0299]
+            ...
+
+            ```
+
+        See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
+        examples of moving window operations with external sampling and indices.
+
+        Args:
+            window_length: Sliding window's length.
+            quantile: Quantile to compute, between 0 (minimum) and 1 (maximum).
+            relative_accuracy: Maximum relative error of the values, in (0, 1).
+                Lower values are more accurate but use more buckets.
+            sampling: Timestamps to sample the sliding window's value at. If not
+                provided, timestamps in the input are used.
+
+        Returns:
+            EventSet containing the approximate quantile of each feature in the
+                input.
+        """
+        from temporian.core.operators.window.moving_approx_quantile import (
+            moving_approx_quantile,
+        )
+
+        return moving_approx_quantile(
+            self,
+            window_length=window_length,
+            quantile=quantile,
+            relative_accuracy=relative_accuracy,
+            sampling=sampling,
+        )
+
     def moving_count(
         self: EventSetOrNode,
         window_length: WindowLength,
@@ -3342,6 +3670,77 @@ class EventSetOperations:
             self, window_length=window_length, sampling=sampling
         )
 
+    def moving_quantile(
+        self: EventSetOrNode,
+        window_length: WindowLength,
+        quantile: float,
+        sampling: Optional[EventSetOrNode] = None,
+    ) -> EventSetOrNode:
+        """Computes a quantile of values in a sliding window over an
+        [`EventSet`][temporian.EventSet].
+
+        For each t in sampling, and for each index and feature independently,
+        returns at time t the `quantile` of non-nan values for the feature in
+        the window (t - window_length, t]. For example, `quantile=0.5` gives the
+        moving median.
+
+        The quantile is exact. When it falls between two values, it is linearly
+        interpolated like `np.quantile` with the default "linear" method.
+
+        The output features are float32 for float32 features, and float64
+        otherwise.
+
+        `sampling` can't be  specified if a variable `window_length` is
+        specified (i.e. if `window_length` is an EventSet).
+
+        If `sampling` is specified or `window_length` is an EventSet, the moving
+        window is sampled at each timestamp in them, else it is sampled on the
+        input's.
+
+        If the window does not contain any values (e.g., all the values are
+        missing, or the window does not contain any sampling), outputs missing
+        values.
+
+        Example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2, 5, 6, 7],
+            ...     features={"value": [np.nan, 1, 5, 10, 15, 20]},
+            ... )
+
+            >>> b = a.moving_quantile(tp.duration.seconds(4), quantile=0.5)
+            >>> b
+            indexes: ...
+                (6 events):
+                    timestamps: [0. 1. 2. 5. 6. 7.]
+                    'value': [ nan 1. 3. 7.5 12.5 15. ]
+            ...
+
+            ```
+
+        See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
+        examples of moving window operations with external sampling and indices.
+
+        Args:
+            window_length: Sliding window's length.
+            quantile: Quantile to compute, between 0 (minimum) and 1 (maximum).
+            sampling: Timestamps to sample the sliding window's value at. If not
+                provided, timestamps in the input are used.
+
+        Returns:
+            EventSet containing the quantile of each feature in the input.
+        """
+        from temporian.core.operators.window.moving_quantile import (
+            moving_quantile,
+        )
+
+        return moving_quantile(
+            self,
+            window_length=window_length,
+            quantile=quantile,
+            sampling=sampling,
+        )
+
     def moving_sum(
         self: EventSetOrNode,
         window_length: WindowLength,
@@ -3382,13 +3781,20 @@ class EventSetOperations:
                     'value': [ 0. 1.  6.  15.  25.  45.]
             ...
 
+            >>> # Several window lengths, computed in a single pass
+            >>> c = a.moving_sum([tp.duration.seconds(1), tp.duration.seconds(4)])
+            >>> c.schema.feature_names()
+            ['value_1s', 'value_4s']
+
             ```
 
         See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
         examples of moving window operations with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length. If a list of window lengths
+                is given, one output feature is created for each input feature
+                and window length, with the window length as a suffix.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
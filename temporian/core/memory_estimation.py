@@ -0,0 +1,167 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Estimation of the memory used by the EventSets during the evaluation of a
+graph."""
+
+from typing import Dict, Iterable, List, Set, Union
+
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode, Feature, Sampling
+from temporian.core.operators.base import Operator
+
+# Estimated size, in bytes, of a feature value of each dtype. The size of
+# strings depends on the data. We assume short strings.
+_DTYPE_NUM_BYTES = {
+    DType.FLOAT64: 8,
+    DType.FLOAT32: 4,
+    DType.INT64: 8,
+    DType.INT32: 4,
+    DType.BOOLEAN: 1,
+    DType.STRING: 16,
+}
+
+# Size, in bytes, of a timestamp.
+_TIMESTAMP_NUM_BYTES = 8
+
+# A buffer is a piece of data that can be shared between EventSets: The
+# timestamps (Sampling) or the values of a feature (Feature).
+Buffer = Union[Sampling, Feature]
+
+
+class MemoryEstimator:
+    """Estimates the size of the data of the nodes of a graph.
+
+    The number of events of the input nodes is propagated through the
+    operators: An operator that creates a new sampling (e.g. `filter` or
+    `lag`) is assumed to produce as many events as its largest input.
+
+    The memory is tracked at the level of the timestamps and feature values,
+    so that data shared between nodes (e.g. the features selected by `select`,
+    or the timestamps of nodes with the same sampling) is only counted once.
+    """
+
+    def __init__(self, input_num_events: Dict[EventSetNode, int]):
+        """Creates an estimator.
+
+        Args:
+            input_num_events: Total number of events (over all the index
+                keys) of each input node.
+        """
+
+        self._sampling_num_events: Dict[Sampling, int] = {}
+        self._buffer_num_bytes: Dict[Buffer, int] = {}
+
+        for node, num_events in input_num_events.items():
+            self._sampling_num_events[node.sampling_node] = num_events
+            self._add_node(node)
+
+    def add_operator(self, op: Operator) -> None:
+        """Estimates the size of the outputs of an operator.
+
+        The operators computing the inputs of "op" should already be added.
+        """
+
+        num_events = max(
+            (self.num_events(node) for node in op.inputs.values()),
+            default=0,
+        )
+        for node in op.outputs.values():
+            self._sampling_num_events.setdefault(node.sampling_node, num_events)
+            self._add_node(node)
+
+    def num_events(self, node: EventSetNode) -> int:
+        """Estimated number of events in a node."""
+
+        return self._sampling_num_events.get(node.sampling_node, 0)
+
+    def buffers(self, node: EventSetNode) -> List[Buffer]:
+        """Buffers referenced by a node."""
+
+        return [node.sampling_node] + node.feature_nodes
+
+    def buffer_num_bytes(self, buffer: Buffer) -> int:
+        """Estimated size of a buffer, in bytes."""
+
+        return self._buffer_num_bytes.get(buffer, 0)
+
+    def num_bytes(self, buffers: Iterable[Buffer]) -> int:
+        """Estimated size of a set of buffers, in bytes."""
+
+        return sum(self.buffer_num_bytes(buffer) for buffer in buffers)
+
+    def _add_node(self, node: EventSetNode) -> None:
+        num_events = self.num_events(node)
+        self._buffer_num_bytes.setdefault(
+            node.sampling_node, num_events * _TIMESTAMP_NUM_BYTES
+        )
+        for feature, feature_schema in zip(
+            node.feature_nodes, node.schema.features
+        ):
+            self._buffer_num_bytes.setdefault(
+                feature, num_events * _DTYPE_NUM_BYTES[feature_schema.dtype]
+            )
+
+
+class LiveBuffers:
+    """Buffers referenced by the nodes in memory during an evaluation."""
+
+    def __init__(self, estimator: MemoryEstimator):
+        self._estimator = estimator
+        # Number of nodes in memory referencing each buffer.
+        self._num_references: Dict[Buffer, int] = {}
+        self.num_bytes = 0
+
+    def new_buffers(self, nodes: Iterable[EventSetNode]) -> Set[Buffer]:
+        """Buffers of "nodes" not yet in memory."""
+
+        return {
+            buffer
+            for node in nodes
+            for buffer in self._estimator.buffers(node)
+            if buffer not in self._num_references
+        }
+
+    def released_buffers(self, nodes: Iterable[EventSetNode]) -> Set[Buffer]:
+        """Buffers not referenced anymore once "nodes" are released."""
+
+        num_released_references: Dict[Buffer, int] = {}
+        for node in nodes:
+            for buffer in self._estimator.buffers(node):
+                num_released_references[buffer] = (
+                    num_released_references.get(buffer, 0) + 1
+                )
+        return {
+            buffer
+            for buffer, count in num_released_references.items()
+            if count >= self._num_references.get(buffer, 0)
+        }
+
+    def add(self, nodes: Iterable[EventSetNode]) -> None:
+        for node in nodes:
+            for buffer in self._estimator.buffers(node):
+                count = self._num_references.get(buffer, 0)
+                if count == 0:
+                    self.num_bytes += self._estimator.buffer_num_bytes(buffer)
+                self._num_references[buffer] = count + 1
+
+    def release(self, nodes: Iterable[EventSetNode]) -> None:
+        for node in nodes:
+            for buffer in self._estimator.buffers(node):
+                count = self._num_references[buffer] - 1
+                if count == 0:
+                    self.num_bytes -= self._estimator.buffer_num_bytes(buffer)
+                    del self._num_references[buffer]
+                else:
+                    self._num_references[buffer] = count
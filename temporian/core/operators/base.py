@@ -35,6 +35,7 @@ AttributeType = Union[
     List[str],
     Dict[str, str],
     List[DType],
+    List[float],
     List[NormalizedIndexKey],
     Callable,  # Non serializable
 ]
@@ -285,6 +286,11 @@ class Operator(ABC):
                 isinstance(v, DType) for v in value
             )
 
+        def is_list_float(value):
+            return isinstance(value, list) and all(
+                isinstance(v, float) for v in value
+            )
+
         # Check exact matching between attr type (except ANY) and value type
         if (
             attr_type == pb.OperatorDef.Attribute.Type.STRING
@@ -330,6 +336,13 @@ class Operator(ABC):
             raise ValueError(
                 f"Attribute {value=} type mismatch: list[DType] expected"
             )
+        if (
+            attr_type == pb.OperatorDef.Attribute.Type.LIST_FLOAT_64
+            and not is_list_float(value)
+        ):
+            raise ValueError(
+                f"Attribute {value=} type mismatch: list[float] expected"
+            )
 
         # Special case: ANY attribute type, still needs to be a valid type
         if (
@@ -342,6 +355,7 @@ class Operator(ABC):
             and not is_list_str(value)
             and not is_dict_str(value)
             and not is_list_dtype(value)
+            and not is_list_float(value)
         ):
             raise ValueError(
                 "Attribute of type ANY has an invalid value type:"
@@ -0,0 +1,140 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fused elementwise operator class definition.
+
+This operator is not part of the public API. It is created by the graph
+optimizer to compute a chain of elementwise operators in a single operator.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from temporian.core import operator_lib
+from temporian.core.data.node import (
+    EventSetNode,
+    create_node_new_features_existing_sampling,
+)
+from temporian.core.operators.base import Operator
+from temporian.proto import core_pb2 as pb
+
+_INPUT_KEY_PREFIX = "input_"
+
+
+@dataclass(frozen=True)
+class FusedStep:
+    """Operator computed in a fused elementwise operator.
+
+    The values computed by a fused elementwise operator are stored in
+    registers. The first registers contain the inputs of the fused operator
+    (in the order of their keys "input_0", "input_1", ...), and each step
+    stores its result in the next register.
+
+    Attributes:
+        operator: Elementwise operator to apply. The operator is not part of
+            the graph evaluated by the fused operator.
+        inputs: Register containing each of the inputs of the operator.
+    """
+
+    operator: Operator
+    inputs: Dict[str, int]
+
+
+class FusedElementwiseOperator(Operator):
+    def __init__(self, steps: List[FusedStep], **inputs: EventSetNode):
+        """Constructor.
+
+        Args:
+            steps: Operators to apply, in order. The output of the last step
+                is the output of the fused operator.
+            inputs: Input nodes, with keys "input_0", "input_1", ... All the
+                inputs have the same sampling.
+        """
+
+        super().__init__()
+
+        if not steps:
+            raise ValueError("At least one step should be provided.")
+
+        register_nodes: List[EventSetNode] = []
+        for idx in range(len(inputs)):
+            key = f"{_INPUT_KEY_PREFIX}{idx}"
+            if key not in inputs:
+                raise ValueError(
+                    f"Inputs should be named {_INPUT_KEY_PREFIX}0,"
+                    f" {_INPUT_KEY_PREFIX}1, etc. Got {list(inputs)}."
+                )
+            input = inputs[key]
+            if register_nodes:
+                input.check_same_sampling(register_nodes[0])
+            self.add_input(key, input)
+            register_nodes.append(input)
+
+        if not register_nodes:
+            raise ValueError("At least one input should be provided.")
+
+        for step in steps:
+            for key, node in step.operator.inputs.items():
+                register = step.inputs.get(key)
+                if register is None or not (
+                    0 <= register < len(register_nodes)
+                ):
+                    raise ValueError(
+                        f"Invalid register {register} for input {key!r} of"
+                        f" {step.operator}."
+                    )
+                if register_nodes[register].schema != node.schema:
+                    raise ValueError(
+                        f"The schema of register {register} does not match"
+                        f" the input {key!r} of {step.operator}."
+                    )
+            register_nodes.append(step.operator.outputs["output"])
+
+        self._steps = steps
+        self.add_attribute("steps", steps)
+
+        self.add_output(
+            "output",
+            create_node_new_features_existing_sampling(
+                features=register_nodes[-1].schema.features,
+                sampling_node=register_nodes[0],
+                creator=self,
+            ),
+        )
+
+        self.check()
+
+    @property
+    def steps(self) -> List[FusedStep]:
+        return self._steps
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        return pb.OperatorDef(
+            key="FUSED_ELEMENTWISE",
+            attributes=[
+                # Non serializable: The steps reference operators.
+                pb.OperatorDef.Attribute(
+                    key="steps",
+                    type=pb.OperatorDef.Attribute.Type.CALLABLE,
+                    is_optional=False,
+                ),
+            ],
+            inputs=[pb.OperatorDef.Input(key_prefix=_INPUT_KEY_PREFIX)],
+            outputs=[pb.OperatorDef.Output(key="output")],
+            is_serializable=False,
+        )
+
+
+operator_lib.register_operator(FusedElementwiseOperator)
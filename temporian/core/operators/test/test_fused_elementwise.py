@@ -0,0 +1,121 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing.parameterized import TestCase
+import numpy as np
+
+import temporian as tp
+from temporian.core import optimizer
+from temporian.core.operators.fused_elementwise import (
+    FusedElementwiseOperator,
+    FusedStep,
+)
+from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.operators import fused_elementwise
+
+
+class FusedElementwiseTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, -2.0, 3.0, np.nan, 5.0, -6.0],
+                "b": [0.5, 0.5, 1.0, 1.0, 2.0, 2.0],
+                "c": [1, 2, 3, 4, 5, 6],
+                "s": ["x", "y", "x", "y", "x", "y"],
+                "idx": ["A", "A", "A", "B", "B", "B"],
+            },
+            indexes=["idx"],
+        )
+        self.node = self.evset.node()
+
+    def _check_fused(self, query: tp.EventSetNode):
+        optimized = optimizer.optimize({self.node}, {query})[query]
+        self.assertIsInstance(optimized.creator, FusedElementwiseOperator)
+
+        expected = tp.run(query, self.evset, optimize=False)
+        result = tp.run(query, self.evset)
+        self.assertEqual(result, expected)
+
+    def test_arithmetic_chain(self):
+        a, b = self.node["a"], self.node["b"]
+        self._check_fused((a * 2 + b).abs().log() > 0.5)
+
+    def test_multiple_features(self):
+        x = self.node[["a", "b"]]
+        self._check_fused((x - x * x) / 3)
+
+    def test_where_and_cast(self):
+        a, c = self.node["a"], self.node["c"]
+        self._check_fused((a.isnan() | (c > 3)).where(c, -1).cast(tp.float32))
+
+    def test_where_with_scalars(self):
+        self._check_fused((self.node["c"] % 2).equal(0).where(1.5, 2.5) * 2)
+
+    def test_string_input(self):
+        self._check_fused(~self.node["s"].equal("x"))
+
+    def test_cast_overflow(self):
+        x = (self.node["c"] * 1_000_000_000_000).cast(tp.int32)
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            tp.run(x, self.evset)
+
+    @mock.patch.object(fused_elementwise, "_BLOCK_SIZE", 2)
+    def test_blocks(self):
+        a, b = self.node["a"], self.node["b"]
+        self._check_fused((((a + b) * (a - b)) >= 0.0).where(b, a) / 2)
+
+    def test_steps(self):
+        a, b = self.node["a"], self.node["b"]
+        x = a * 2
+        y = x + b
+
+        op = FusedElementwiseOperator(
+            steps=[
+                FusedStep(operator=x.creator, inputs={"input": 0}),
+                FusedStep(
+                    operator=y.creator, inputs={"input_1": 2, "input_2": 1}
+                ),
+            ],
+            input_0=a,
+            input_1=b,
+        )
+        self.assertEqual(op.outputs["output"].schema, y.schema)
+
+        self.assertEqual(
+            tp.run(op.outputs["output"], self.evset), tp.run(y, self.evset)
+        )
+
+    def test_invalid_register(self):
+        a, b = self.node["a"], self.node["b"]
+        y = a + b
+        with self.assertRaisesRegex(ValueError, "Invalid register"):
+            FusedElementwiseOperator(
+                steps=[FusedStep(operator=y.creator, inputs={"input_1": 0})],
+                input_0=a,
+            )
+
+    def test_not_serializable(self):
+        a = self.node["a"]
+        x = (a + 1).abs()
+        optimized = optimizer.optimize({self.node}, {x})[x]
+        with self.assertRaisesRegex(ValueError, "not serializable"):
+            tp.save_graph({"a": self.node}, {"x": optimized}, "/dev/null")
+
+
+if __name__ == "__main__":
+    absltest.main()
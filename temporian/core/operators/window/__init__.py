@@ -27,3 +27,8 @@ from temporian.core.operators.window.moving_min import moving_min
 from temporian.core.operators.window.moving_max import moving_max
 from temporian.core.operators.window.moving_product import cumprod
 from temporian.core.operators.window.moving_product import moving_product
+from temporian.core.operators.window.moving_aggregate import moving_aggregate
+from temporian.core.operators.window.moving_quantile import moving_quantile
+from temporian.core.operators.window.moving_approx_quantile import moving_approx_quantile
+from temporian.core.operators.window.moving_approx_distinct_count import moving_approx_distinct_count
+from temporian.core.operators.window.moving_approx_heavy_hitters import moving_approx_heavy_hitters
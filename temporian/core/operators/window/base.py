@@ -15,11 +15,15 @@
 """Base calendar operator class definition."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
-from temporian.core.data.duration_utils import normalize_duration
+from typing import List, Optional
 
+import numpy as np
 
-from temporian.core.data.duration_utils import NormalizedDuration
+from temporian.core.data.duration_utils import (
+    NormalizedDuration,
+    duration_abbreviation,
+    normalize_duration,
+)
 from temporian.core.data.dtype import DType
 from temporian.core.data.node import (
     EventSetNode,
@@ -69,11 +73,21 @@ class BaseWindowOperator(Operator, ABC):
                 )
             self.add_input("window_length", window_length)
             self._window_length = None
+            self._window_lengths = None
+        elif isinstance(window_length, (list, tuple)):
+            if len(window_length) == 0:
+                raise ValueError("`window_length` cannot be an empty list.")
+            window_lengths = [normalize_duration(w) for w in window_length]
+            self.add_attribute("window_length", window_lengths)
+            self._window_length = None
+            self._window_lengths = window_lengths
         else:
             window_length = normalize_duration(window_length)
             self.add_attribute("window_length", window_length)
             self._window_length = window_length
+            self._window_lengths = None
 
+        self.add_extra_attributes()
         self.add_input("input", input)
 
         # Note: effective_sampling_node can be either the received sampling,
@@ -97,20 +111,53 @@ class BaseWindowOperator(Operator, ABC):
         self.check()
 
     def feature_schema(self, input: EventSetNode):
-        return [  # pylint: disable=g-complex-comprehension
-            FeatureSchema(
-                name=f.name,
-                dtype=self.get_feature_dtype(f),
+        return self.expand_window_lengths(
+            [  # pylint: disable=g-complex-comprehension
+                FeatureSchema(
+                    name=f.name,
+                    dtype=self.get_feature_dtype(f),
+                )
+                for f in input.schema.features
+            ]
+        )
+
+    def expand_window_lengths(
+        self, features: List[FeatureSchema]
+    ) -> List[FeatureSchema]:
+        """Returns one feature per window length for each feature, suffixed
+        with the window length, if several window lengths are specified."""
+
+        if self._window_lengths is None:
+            return features
+
+        suffixes = [_window_length_suffix(w) for w in self._window_lengths]
+        if len(set(suffixes)) != len(suffixes):
+            raise ValueError(
+                "The window lengths should be distinct. Got"
+                f" {self._window_lengths}."
             )
-            for f in input.schema.features
+        return [
+            FeatureSchema(name=f"{f.name}_{suffix}", dtype=f.dtype)
+            for f in features
+            for suffix in suffixes
         ]
 
+    def add_extra_attributes(self) -> None:
+        """Adds the attributes specific to the operator, if any."""
+
     @property
     def window_length(self) -> Optional[NormalizedDuration]:
         """Returns None if window_length is variable (i.e. an EventSet was
-        passed as `window_length` to the operator)."""
+        passed as `window_length` to the operator), or if several window
+        lengths are specified."""
         return self._window_length
 
+    @property
+    def window_lengths(self) -> Optional[List[NormalizedDuration]]:
+        """Returns the window lengths if a list of window lengths was passed
+        as `window_length` to the operator, and None otherwise."""
+        return self._window_lengths
+
     @property
     def has_sampling(self) -> bool:
         return self._has_sampling
@@ -124,9 +171,10 @@ class BaseWindowOperator(Operator, ABC):
         return pb.OperatorDef(
             key=cls.operator_def_key(),
             attributes=[
+                # A float, or a list of floats.
                 pb.OperatorDef.Attribute(
                     key="window_length",
-                    type=pb.OperatorDef.Attribute.Type.FLOAT_64,
+                    type=pb.OperatorDef.Attribute.Type.ANY,
                     is_optional=True,
                 ),
             ],
@@ -146,3 +194,16 @@ class BaseWindowOperator(Operator, ABC):
     @abstractmethod
     def get_feature_dtype(self, feature: FeatureSchema) -> DType:
         """Gets the dtype of the output feature."""
+
+
+def _window_length_suffix(window_length: NormalizedDuration) -> str:
+    """Suffix of the features computed with a given window length, e.g.
+    "1h" or "30min"."""
+
+    if np.isinf(window_length):
+        return "inf"
+    milliseconds = window_length * 1000
+    if milliseconds < 1 or abs(milliseconds - round(milliseconds)) > 1e-6:
+        # Abbreviations are truncated to milliseconds.
+        return f"{window_length:g}"
+    return duration_abbreviation(window_length)
@@ -0,0 +1,133 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Moving aggregate operator class and public API function definition."""
+
+from typing import List, Optional
+
+from temporian.core import operator_lib
+from temporian.core.compilation import compile
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.data.schema import FeatureSchema
+from temporian.core.operators.window.base import BaseWindowOperator
+from temporian.core.typing import EventSetOrNode, WindowLength
+from temporian.proto import core_pb2 as pb
+
+# Statistics supported by moving_aggregate.
+AGGREGATIONS = ["sum", "mean", "std", "min", "max", "count"]
+
+
+class MovingAggregateOperator(BaseWindowOperator):
+    def __init__(
+        self,
+        input: EventSetNode,
+        window_length: WindowLength,
+        ops: List[str],
+        sampling: Optional[EventSetNode] = None,
+    ):
+        if len(ops) == 0:
+            raise ValueError("`ops` cannot be empty.")
+        for op in ops:
+            if op not in AGGREGATIONS:
+                raise ValueError(
+                    f"Unknown aggregation {op!r}. The supported aggregations"
+                    f" are {AGGREGATIONS}."
+                )
+        if len(set(ops)) != len(ops):
+            raise ValueError(f"`ops` contains duplicated values: {ops}.")
+
+        # Note: The output features, computed by the base constructor, depend
+        # on the operations.
+        self._ops = list(ops)
+
+        super().__init__(
+            input=input, window_length=window_length, sampling=sampling
+        )
+
+    @property
+    def ops(self) -> List[str]:
+        return self._ops
+
+    def add_extra_attributes(self) -> None:
+        self.add_attribute("ops", self._ops)
+
+    @classmethod
+    def operator_def_key(cls) -> str:
+        return "MOVING_AGGREGATE"
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        definition = super().build_op_definition()
+        definition.attributes.append(
+            pb.OperatorDef.Attribute(
+                key="ops",
+                type=pb.OperatorDef.Attribute.Type.LIST_STRING,
+            )
+        )
+        return definition
+
+    def get_feature_dtype(self, feature: FeatureSchema) -> DType:
+        if not feature.dtype.is_numerical:
+            raise ValueError(
+                "moving_aggregate requires the input EventSet to contain"
+                " numerical features only, but received feature"
+                f" {feature.name!r} with type {feature.dtype}"
+            )
+        return feature.dtype
+
+    def feature_schema(self, input: EventSetNode):
+        features = []
+        for feature in input.schema.features:
+            dtype = self.get_feature_dtype(feature)
+            float_dtype = (
+                DType.FLOAT32 if dtype == DType.FLOAT32 else DType.FLOAT64
+            )
+            op_dtypes = {
+                "sum": dtype,
+                "mean": float_dtype,
+                "std": float_dtype,
+                "min": dtype,
+                "max": dtype,
+                "count": DType.INT32,
+            }
+            features.extend(
+                FeatureSchema(name=f"{feature.name}_{op}", dtype=op_dtypes[op])
+                for op in self._ops
+            )
+        return self.expand_window_lengths(features)
+
+
+operator_lib.register_operator(MovingAggregateOperator)
+
+
+@compile
+def moving_aggregate(
+    input: EventSetOrNode,
+    window_length: WindowLength,
+    ops: Optional[List[str]] = None,
+    sampling: Optional[EventSetOrNode] = None,
+) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+    if sampling is not None:
+        assert isinstance(sampling, EventSetNode)
+    if isinstance(ops, str):
+        ops = [ops]
+
+    return MovingAggregateOperator(
+        input=input,
+        window_length=window_length,
+        ops=list(AGGREGATIONS) if ops is None else list(ops),
+        sampling=sampling,
+    ).outputs["output"]
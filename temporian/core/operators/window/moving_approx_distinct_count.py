@@ -0,0 +1,103 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Moving approximate distinct count operator class and public API function
+definition."""
+
+from typing import Optional
+
+from temporian.core import operator_lib
+from temporian.core.compilation import compile
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.data.schema import FeatureSchema
+from temporian.core.operators.window.base import BaseWindowOperator
+from temporian.core.typing import EventSetOrNode, WindowLength
+from temporian.proto import core_pb2 as pb
+
+# Range of the supported HyperLogLog precisions.
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+
+class MovingApproxDistinctCountOperator(BaseWindowOperator):
+    def __init__(
+        self,
+        input: EventSetNode,
+        window_length: WindowLength,
+        precision: int,
+        sampling: Optional[EventSetNode] = None,
+    ):
+        if (
+            not isinstance(precision, int)
+            or not MIN_PRECISION <= precision <= MAX_PRECISION
+        ):
+            raise ValueError(
+                "`precision` should be an integer in"
+                f" [{MIN_PRECISION}, {MAX_PRECISION}]. Got {precision!r}"
+                " instead."
+            )
+        self._precision = precision
+
+        super().__init__(
+            input=input, window_length=window_length, sampling=sampling
+        )
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def add_extra_attributes(self) -> None:
+        self.add_attribute("precision", self._precision)
+
+    @classmethod
+    def operator_def_key(cls) -> str:
+        return "MOVING_APPROX_DISTINCT_COUNT"
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        definition = super().build_op_definition()
+        definition.attributes.append(
+            pb.OperatorDef.Attribute(
+                key="precision",
+                type=pb.OperatorDef.Attribute.Type.INTEGER_64,
+            )
+        )
+        return definition
+
+    def get_feature_dtype(self, feature: FeatureSchema) -> DType:
+        return DType.INT32
+
+
+operator_lib.register_operator(MovingApproxDistinctCountOperator)
+
+
+@compile
+def moving_approx_distinct_count(
+    input: EventSetOrNode,
+    window_length: WindowLength,
+    precision: int = 12,
+    sampling: Optional[EventSetOrNode] = None,
+) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+    if sampling is not None:
+        assert isinstance(sampling, EventSetNode)
+
+    return MovingApproxDistinctCountOperator(
+        input=input,
+        window_length=window_length,
+        precision=precision,
+        sampling=sampling,
+    ).outputs["output"]
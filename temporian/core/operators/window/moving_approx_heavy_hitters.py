@@ -0,0 +1,134 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Moving approximate heavy hitters operator class and public API function
+definition."""
+
+from typing import Optional
+
+from temporian.core import operator_lib
+from temporian.core.compilation import compile
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.data.schema import FeatureSchema
+from temporian.core.operators.window.base import BaseWindowOperator
+from temporian.core.typing import EventSetOrNode, WindowLength
+from temporian.proto import core_pb2 as pb
+
+
+class MovingApproxHeavyHittersOperator(BaseWindowOperator):
+    def __init__(
+        self,
+        input: EventSetNode,
+        window_length: WindowLength,
+        k: int,
+        epsilon: float,
+        sampling: Optional[EventSetNode] = None,
+    ):
+        if not isinstance(k, int) or k < 1:
+            raise ValueError(
+                f"`k` should be a strictly positive integer. Got {k!r} instead."
+            )
+        if not 0 < epsilon < 1:
+            raise ValueError(
+                f"`epsilon` should be in (0, 1). Got {epsilon!r} instead."
+            )
+
+        # Note: The output features, computed by the base constructor, depend
+        # on k.
+        self._k = k
+        self._epsilon = float(epsilon)
+
+        super().__init__(
+            input=input, window_length=window_length, sampling=sampling
+        )
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def epsilon(self) -> float:
+        return self._epsilon
+
+    def add_extra_attributes(self) -> None:
+        self.add_attribute("k", self._k)
+        self.add_attribute("epsilon", self._epsilon)
+
+    @classmethod
+    def operator_def_key(cls) -> str:
+        return "MOVING_APPROX_HEAVY_HITTERS"
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        definition = super().build_op_definition()
+        definition.attributes.extend(
+            [
+                pb.OperatorDef.Attribute(
+                    key="k",
+                    type=pb.OperatorDef.Attribute.Type.INTEGER_64,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="epsilon",
+                    type=pb.OperatorDef.Attribute.Type.FLOAT_64,
+                ),
+            ]
+        )
+        return definition
+
+    def get_feature_dtype(self, feature: FeatureSchema) -> DType:
+        return feature.dtype
+
+    def feature_schema(self, input: EventSetNode):
+        features = []
+        for feature in input.schema.features:
+            for rank in range(1, self._k + 1):
+                features.append(
+                    FeatureSchema(
+                        name=f"{feature.name}_top{rank}",
+                        dtype=self.get_feature_dtype(feature),
+                    )
+                )
+                features.append(
+                    FeatureSchema(
+                        name=f"{feature.name}_top{rank}_count",
+                        dtype=DType.INT32,
+                    )
+                )
+        return self.expand_window_lengths(features)
+
+
+operator_lib.register_operator(MovingApproxHeavyHittersOperator)
+
+
+@compile
+def moving_approx_heavy_hitters(
+    input: EventSetOrNode,
+    window_length: WindowLength,
+    k: int = 1,
+    epsilon: float = 0.01,
+    sampling: Optional[EventSetOrNode] = None,
+) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+    if sampling is not None:
+        assert isinstance(sampling, EventSetNode)
+
+    return MovingApproxHeavyHittersOperator(
+        input=input,
+        window_length=window_length,
+        k=k,
+        epsilon=epsilon,
+        sampling=sampling,
+    ).outputs["output"]
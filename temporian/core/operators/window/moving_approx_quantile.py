@@ -0,0 +1,122 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Moving approximate quantile operator class and public API function
+definition."""
+
+from typing import Optional
+
+from temporian.core import operator_lib
+from temporian.core.compilation import compile
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.data.schema import FeatureSchema
+from temporian.core.operators.window.base import BaseWindowOperator
+from temporian.core.typing import EventSetOrNode, WindowLength
+from temporian.proto import core_pb2 as pb
+
+
+class MovingApproxQuantileOperator(BaseWindowOperator):
+    def __init__(
+        self,
+        input: EventSetNode,
+        window_length: WindowLength,
+        quantile: float,
+        relative_accuracy: float,
+        sampling: Optional[EventSetNode] = None,
+    ):
+        if not 0 <= quantile <= 1:
+            raise ValueError(
+                f"`quantile` should be in [0, 1]. Got {quantile!r} instead."
+            )
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                "`relative_accuracy` should be in (0, 1). Got"
+                f" {relative_accuracy!r} instead."
+            )
+        self._quantile = float(quantile)
+        self._relative_accuracy = float(relative_accuracy)
+
+        super().__init__(
+            input=input, window_length=window_length, sampling=sampling
+        )
+
+    @property
+    def quantile(self) -> float:
+        return self._quantile
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self._relative_accuracy
+
+    def add_extra_attributes(self) -> None:
+        self.add_attribute("quantile", self._quantile)
+        self.add_attribute("relative_accuracy", self._relative_accuracy)
+
+    @classmethod
+    def operator_def_key(cls) -> str:
+        return "MOVING_APPROX_QUANTILE"
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        definition = super().build_op_definition()
+        definition.attributes.extend(
+            [
+                pb.OperatorDef.Attribute(
+                    key="quantile",
+                    type=pb.OperatorDef.Attribute.Type.FLOAT_64,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="relative_accuracy",
+                    type=pb.OperatorDef.Attribute.Type.FLOAT_64,
+                ),
+            ]
+        )
+        return definition
+
+    def get_feature_dtype(self, feature: FeatureSchema) -> DType:
+        if not feature.dtype.is_numerical:
+            raise ValueError(
+                "moving_approx_quantile requires the input EventSet to contain"
+                " numerical features only, but received feature"
+                f" {feature.name!r} with type {feature.dtype}"
+            )
+        return (
+            DType.FLOAT32 if feature.dtype == DType.FLOAT32 else DType.FLOAT64
+        )
+
+
+operator_lib.register_operator(MovingApproxQuantileOperator)
+
+
+@compile
+def moving_approx_quantile(
+    input: EventSetOrNode,
+    window_length: WindowLength,
+    quantile: float,
+    relative_accuracy: float = 0.01,
+    sampling: Optional[EventSetOrNode] = None,
+) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+    if sampling is not None:
+        assert isinstance(sampling, EventSetNode)
+
+    return MovingApproxQuantileOperator(
+        input=input,
+        window_length=window_length,
+        quantile=quantile,
+        relative_accuracy=relative_accuracy,
+        sampling=sampling,
+    ).outputs["output"]
@@ -17,11 +17,15 @@
 Use it to test expected behavior from the base classes, such as errors or
 warnings."""
 
+import os
+import tempfile
 from math import nan
 from unittest.mock import patch
 
 from absl.testing import absltest
 
+import temporian as tp
+
 from temporian.implementation.numpy.data.io import event_set
 from temporian.implementation.numpy.operators.window import (
     base as base_window_impl,
@@ -144,6 +148,129 @@ class SimpleMovingAverageTest(absltest.TestCase):
             window_length=window_length.data[()].features[0],
         )
 
+    def test_several_features_match_single_feature(self):
+        """Checks that computing several features at once (single pass over
+        the timestamps) gives the same results as one feature at a time."""
+        evset = event_set(
+            timestamps=[1, 2, 2, 4, 5, 7, 1, 3],
+            features={
+                "a": [1.0, 2.0, nan, 4.0, 5.0, 6.0, 7.0, 8.0],
+                "b": [8.0, 7.0, 6.0, 5.0, nan, 3.0, 2.0, 1.0],
+                "c": f32([1, 2, 3, 4, 5, 6, 7, 8]),
+                "d": [1, 2, 3, 4, 5, 6, 7, 8],
+                "i": ["x", "x", "x", "x", "x", "x", "y", "y"],
+            },
+            indexes=["i"],
+        )
+        sampling = event_set(
+            timestamps=[0, 3, 6, 3],
+            features={"i": ["x", "x", "x", "y"]},
+            indexes=["i"],
+        )
+        window_length = event_set(
+            timestamps=[1, 2, 2, 4, 5, 7, 1, 3],
+            features={
+                "w": [1.0, 2.0, 0.5, 3.0, 1.0, 2.0, 1.0, 4.0],
+                "i": ["x", "x", "x", "x", "x", "x", "y", "y"],
+            },
+            indexes=["i"],
+            same_sampling_as=evset,
+        )
+        for op in [
+            "moving_sum",
+            "moving_min",
+            "moving_max",
+            "moving_product",
+            "moving_standard_deviation",
+            "simple_moving_average",
+        ]:
+            # The other operators only support floating point features.
+            source = evset
+            if op not in ["moving_sum", "moving_min", "moving_max"]:
+                source = evset[["a", "b", "c"]]
+            for kwargs in [
+                {"window_length": 2.0},
+                {"window_length": 2.0, "sampling": sampling},
+                {"window_length": window_length},
+            ]:
+                result = getattr(source, op)(**kwargs)
+                for name in source.schema.feature_names():
+                    assertOperatorResult(
+                        self,
+                        result[name],
+                        getattr(source[name], op)(**kwargs),
+                        check_sampling=False,
+                    )
+
+    def test_several_window_lengths_match_single_window_length(self):
+        evset = event_set(
+            timestamps=[1, 2, 2, 4, 5, 7, 1, 3],
+            features={
+                "a": [1.0, 2.0, nan, 4.0, 5.0, 6.0, 7.0, 8.0],
+                "b": f32([1, 2, 3, 4, 5, 6, 7, 8]),
+                "i": ["x", "x", "x", "x", "x", "x", "y", "y"],
+            },
+            indexes=["i"],
+        )
+        sampling = event_set(
+            timestamps=[0, 3, 6, 3, 1],
+            features={"i": ["x", "x", "x", "y", "z"]},
+            indexes=["i"],
+        )
+        window_lengths = {"1s": 1.0, "2s500ms": 2.5, "inf": float("inf")}
+
+        for op in [
+            "moving_count",
+            "moving_sum",
+            "moving_min",
+            "moving_max",
+            "moving_product",
+            "moving_standard_deviation",
+            "simple_moving_average",
+        ]:
+            for kwargs in [{}, {"sampling": sampling}]:
+                result = getattr(evset, op)(
+                    window_length=list(window_lengths.values()), **kwargs
+                )
+                for suffix, window_length in window_lengths.items():
+                    expected = getattr(evset, op)(
+                        window_length=window_length, **kwargs
+                    )
+                    names = expected.schema.feature_names()
+                    suffixed_names = [f"{name}_{suffix}" for name in names]
+                    assertOperatorResult(
+                        self,
+                        result[suffixed_names],
+                        expected.rename(dict(zip(names, suffixed_names))),
+                        check_sampling=False,
+                    )
+
+    def test_several_window_lengths_errors(self):
+        evset = event_set(timestamps=[0], features={"a": [1.0]})
+        with self.assertRaisesRegex(ValueError, "cannot be an empty list"):
+            evset.moving_sum(window_length=[])
+        with self.assertRaisesRegex(ValueError, "should be distinct"):
+            evset.moving_sum(window_length=[1, 1.0])
+        with self.assertRaisesRegex(ValueError, "strictly positive"):
+            evset.moving_sum(window_length=[1, -1])
+
+    def test_several_window_lengths_serialization(self):
+        evset = event_set(timestamps=[1, 2, 3], features={"a": [1.0, 2.0, 3.0]})
+        node = evset.node()
+        output = node.moving_sum(window_length=[tp.duration.hours(1), 2])
+        path = os.path.join(tempfile.mkdtemp(), "graph.tem")
+        tp.save_graph(
+            inputs={"input": node}, outputs={"output": output}, path=path
+        )
+        inputs, outputs = tp.load_graph(path)
+        self.assertEqual(
+            outputs["output"].schema.feature_names(), ["a_1h", "a_2s"]
+        )
+        self.assertEqual(
+            tp.run(outputs["output"], {inputs["input"]: evset}),
+            tp.run(output, {node: evset}),
+        )
+
 
 if __name__ == "__main__":
     absltest.main()
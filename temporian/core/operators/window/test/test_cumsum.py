@@ -13,9 +13,12 @@
 # limitations under the License.
 
 from absl.testing import absltest
+from absl.testing import parameterized
 from absl.testing.parameterized import TestCase
+import numpy as np
 
 from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy_cc.operators import operators_cc
 from temporian.test.utils import assertOperatorResult
 
 
@@ -47,6 +50,49 @@ class CumsumTest(TestCase):
         result = evset.cumsum()
         assertOperatorResult(self, result, expected)
 
+    def test_nan_and_sampling(self):
+        evset = event_set(
+            timestamps=[1.0, 2.0, 2.0, 3.0, 4.0],
+            features={"a": [np.nan, 2.0, 3.0, np.nan, 4.0]},
+        )
+        sampling = event_set(timestamps=[0.0, 1.0, 2.0, 3.5, 5.0])
+
+        expected = event_set(
+            timestamps=[1.0, 2.0, 2.0, 3.0, 4.0],
+            features={"a": [0.0, 5.0, 5.0, 5.0, 9.0]},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset.cumsum(), expected)
+
+        expected = event_set(
+            timestamps=[0.0, 1.0, 2.0, 3.5, 5.0],
+            features={"a": [0.0, 0.0, 5.0, 5.0, 9.0]},
+            same_sampling_as=sampling,
+        )
+        assertOperatorResult(self, evset.cumsum(sampling=sampling), expected)
+
+    @parameterized.parameters(np.float32, np.float64, np.int32, np.int64)
+    def test_same_as_window_kernel(self, dtype):
+        # The scan kernel gives the same results as the window kernel with an
+        # infinite window.
+        rng = np.random.default_rng(0)
+        timestamps = np.sort(rng.integers(0, 200, size=500)).astype(np.float64)
+        values = rng.choice([-2, -1, 0, 1, 2, 3], size=500).astype(dtype)
+        if np.issubdtype(dtype, np.floating):
+            values[rng.random(500) < 0.1] = np.nan
+        sampling = np.sort(rng.integers(-10, 210, size=300)).astype(np.float64)
+
+        np.testing.assert_array_equal(
+            operators_cc.cumsum(timestamps, values),
+            operators_cc.moving_sum(timestamps, values, window_length=np.inf),
+        )
+        np.testing.assert_array_equal(
+            operators_cc.cumsum(timestamps, values, sampling),
+            operators_cc.moving_sum(
+                timestamps, values, sampling, window_length=np.inf
+            ),
+        )
+
 
 if __name__ == "__main__":
     absltest.main()
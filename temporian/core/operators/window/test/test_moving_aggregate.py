@@ -0,0 +1,175 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import nan
+
+import numpy as np
+from absl.testing import absltest, parameterized
+from absl.testing.parameterized import TestCase
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import assertOperatorResult, f32, i32
+
+_OPERATORS = {
+    "sum": "moving_sum",
+    "mean": "simple_moving_average",
+    "std": "moving_standard_deviation",
+    "min": "moving_min",
+    "max": "moving_max",
+}
+
+
+class MovingAggregateTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[0, 1, 2, 3, 5, 20, 1, 2, 3],
+            features={
+                "a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0, 1.0, 2.0, nan],
+                "b": f32([1, 2, 3, nan, 5, 6, 7, 8, 9]),
+                "x": ["X", "X", "X", "X", "X", "X", "Y", "Y", "Y"],
+            },
+            indexes=["x"],
+        )
+
+    def test_basic(self):
+        timestamps = [0, 1, 2, 3, 5, 20]
+        evset = event_set(
+            timestamps=timestamps,
+            features={"a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0]},
+        )
+
+        result = evset.moving_aggregate(window_length=3.5)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a_sum": [0.0, 10.0, 12.0, 24.0, 27.0, 14.0],
+                "a_mean": [nan, 10.0, 6.0, 8.0, 9.0, 14.0],
+                "a_std": [nan, 0.0, 4.0, np.sqrt(56 / 3), np.sqrt(74 / 3), 0],
+                "a_min": [nan, 10.0, 2.0, 2.0, 2.0, 14.0],
+                "a_max": [nan, 10.0, 10.0, 12.0, 13.0, 14.0],
+                "a_count": i32([0, 1, 2, 3, 3, 1]),
+            },
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    @parameterized.parameters(
+        {"sampling": False, "variable_winlen": False},
+        {"sampling": True, "variable_winlen": False},
+        {"sampling": False, "variable_winlen": True},
+    )
+    def test_matches_window_operators(self, sampling, variable_winlen):
+        kwargs = {"window_length": 2.5}
+        if sampling:
+            kwargs["sampling"] = event_set(
+                timestamps=[-1, 2.5, 3, 30, 2],
+                features={"x": ["X", "X", "X", "X", "Z"]},
+                indexes=["x"],
+            )
+        if variable_winlen:
+            kwargs["window_length"] = event_set(
+                timestamps=self.evset.get_index_value(("X",)).timestamps,
+                features={
+                    "w": [1.0, 0.5, 2.0, 3.0, nan, 20.0],
+                    "x": ["X"] * 6,
+                },
+                indexes=["x"],
+            )
+
+        result = self.evset.moving_aggregate(**kwargs)
+
+        for feature in ["a", "b"]:
+            for op, operator_name in _OPERATORS.items():
+                expected = getattr(self.evset[feature], operator_name)(**kwargs)
+                self.assertEqual(
+                    result[f"{feature}_{op}"],
+                    expected.rename(f"{feature}_{op}"),
+                )
+            expected_count = (
+                self.evset[feature]
+                .notnan()
+                .cast(DType.INT32)
+                .moving_sum(**kwargs)
+            )
+            self.assertEqual(
+                result[f"{feature}_count"],
+                expected_count.rename(f"{feature}_count"),
+            )
+
+    def test_ops_and_dtypes(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": i32([1, 2, 4]), "b": f32([1, 2, 4])},
+        )
+
+        result = evset.moving_aggregate(2, ops=["max", "mean", "count"])
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a_max": i32([1, 2, 4]),
+                "a_mean": [1.0, 1.5, 3.0],
+                "a_count": i32([1, 2, 2]),
+                "b_max": f32([1, 2, 4]),
+                "b_mean": f32([1.0, 1.5, 3.0]),
+                "b_count": i32([1, 2, 2]),
+            },
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+        self.assertEqual(
+            evset.moving_aggregate(2, ops="sum").schema.feature_names(),
+            ["a_sum", "b_sum"],
+        )
+
+    def test_several_window_lengths(self):
+        result = self.evset.moving_aggregate([2, 60], ops=["sum", "count"])
+        self.assertEqual(
+            result.schema.feature_names(),
+            [
+                "a_sum_2s",
+                "a_sum_1min",
+                "a_count_2s",
+                "a_count_1min",
+                "b_sum_2s",
+                "b_sum_1min",
+                "b_count_2s",
+                "b_count_1min",
+            ],
+        )
+        self.assertEqual(
+            result["b_count_2s"],
+            self.evset.moving_aggregate(2, ops=["count"])["b_count"].rename(
+                "b_count_2s"
+            ),
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "Unknown aggregation 'median'"):
+            self.evset.moving_aggregate(2, ops=["sum", "median"])
+        with self.assertRaisesRegex(ValueError, "cannot be empty"):
+            self.evset.moving_aggregate(2, ops=[])
+        with self.assertRaisesRegex(ValueError, "duplicated"):
+            self.evset.moving_aggregate(2, ops=["sum", "sum"])
+        evset = event_set(timestamps=[1], features={"s": ["hello"]})
+        with self.assertRaisesRegex(ValueError, "numerical features only"):
+            evset.moving_aggregate(2)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,168 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import nan
+
+import numpy as np
+from absl.testing import absltest, parameterized
+from absl.testing.parameterized import TestCase
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import assertOperatorResult, f32, i32
+
+
+class MovingApproxDistinctCountTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[0, 1, 2, 3, 5, 20, 1, 2, 3],
+            features={
+                "a": [nan, 10.0, 2.0, 10.0, 13.0, 14.0, 1.0, 2.0, nan],
+                "b": ["u", "v", "u", "u", "w", "u", "u", "u", "v"],
+                "x": ["X", "X", "X", "X", "X", "X", "Y", "Y", "Y"],
+            },
+            indexes=["x"],
+        )
+
+    def test_basic(self):
+        timestamps = [1, 2, 3, 5, 6, 20]
+        evset = event_set(
+            timestamps=timestamps,
+            features={
+                "a": [nan, 2.0, 2.0, 3.0, 1.0, 1.0],
+                "b": i32([1, 2, 2, 3, 0, 1]),
+                "c": [True, True, False, False, True, True],
+                "d": ["a", "b", "a", "c", "c", "c"],
+            },
+        )
+
+        result = evset.moving_approx_distinct_count(window_length=3.5)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a": i32([0, 1, 1, 2, 3, 1]),
+                "b": i32([1, 2, 2, 2, 3, 1]),
+                "c": i32([1, 1, 2, 2, 2, 1]),
+                "d": i32([1, 2, 2, 3, 2, 1]),
+            },
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    @parameterized.parameters(8, 12, 14)
+    def test_relative_error(self, precision):
+        rng = np.random.default_rng(1)
+        timestamps = np.arange(20000, dtype=np.float64)
+        values = rng.integers(0, 50000, 20000)
+        evset = event_set(timestamps=timestamps, features={"a": values})
+
+        result = evset.moving_approx_distinct_count(
+            window_length=5000, precision=precision
+        )
+
+        expected_values = np.array(
+            [
+                len(np.unique(values[max(0, i - 4999) : i + 1]))
+                for i in range(0, 20000, 997)
+            ]
+        )
+        # The standard error of HyperLogLog is 1.04 / sqrt(2^precision).
+        tolerance = 4 * 1.04 / np.sqrt(2**precision)
+        np.testing.assert_allclose(
+            result.get_arbitrary_index_data().features[0][::997],
+            expected_values,
+            rtol=tolerance,
+        )
+
+    @parameterized.parameters(
+        {"sampling": False, "variable_winlen": False},
+        {"sampling": True, "variable_winlen": False},
+        {"sampling": False, "variable_winlen": True},
+    )
+    def test_small_counts_are_exact(self, sampling, variable_winlen):
+        kwargs = {"window_length": 2.5}
+        if sampling:
+            kwargs["sampling"] = event_set(
+                timestamps=[-1, 2.5, 3, 30, 2],
+                features={"x": ["X", "X", "X", "X", "Z"]},
+                indexes=["x"],
+            )
+        if variable_winlen:
+            kwargs["window_length"] = event_set(
+                timestamps=self.evset.get_index_value(("X",)).timestamps,
+                features={
+                    "w": [1.0, 0.5, 2.0, 3.0, nan, 20.0],
+                    "x": ["X"] * 6,
+                },
+                indexes=["x"],
+            )
+
+        result = self.evset.moving_approx_distinct_count(**kwargs)
+
+        # With only a handful of values, linear counting is exact.
+        window_length = kwargs["window_length"]
+        for index_key, result_data in result.data.items():
+            input_data = self.evset.data.get(index_key)
+            for feature_idx, feature_values in enumerate(result_data.features):
+                expected_values = []
+                for event_idx, t in enumerate(result_data.timestamps):
+                    if variable_winlen:
+                        w = window_length.data[index_key].features[0][event_idx]
+                    else:
+                        w = window_length
+                    if input_data is None or np.isnan(w):
+                        expected_values.append(0)
+                        continue
+                    mask = (input_data.timestamps <= t) & (
+                        input_data.timestamps > t - w
+                    )
+                    window = input_data.features[feature_idx][mask]
+                    if window.dtype.kind == "f":
+                        window = window[~np.isnan(window)]
+                    expected_values.append(len(np.unique(window)))
+                np.testing.assert_array_equal(feature_values, expected_values)
+
+    def test_dtypes(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": f32([1, 1, 2]), "b": ["x", "y", "y"]},
+        )
+
+        result = evset.moving_approx_distinct_count(10)
+
+        for feature in result.schema.features:
+            self.assertEqual(feature.dtype, DType.INT32)
+
+    def test_several_window_lengths(self):
+        result = self.evset.moving_approx_distinct_count([2, 60])
+        self.assertEqual(
+            result.schema.feature_names(),
+            ["a_2s", "a_1min", "b_2s", "b_1min"],
+        )
+        self.assertEqual(
+            result["b_1min"],
+            self.evset["b"].moving_approx_distinct_count(60).rename("b_1min"),
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "should be an integer in"):
+            self.evset.moving_approx_distinct_count(2, precision=3)
+        with self.assertRaisesRegex(ValueError, "should be an integer in"):
+            self.evset.moving_approx_distinct_count(2, precision=19)
+
+
+if __name__ == "__main__":
+    absltest.main()
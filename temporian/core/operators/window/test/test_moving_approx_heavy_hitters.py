@@ -0,0 +1,191 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+from math import nan
+
+import numpy as np
+from absl.testing import absltest, parameterized
+from absl.testing.parameterized import TestCase
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import assertOperatorResult, f32, i32
+
+
+class MovingApproxHeavyHittersTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[0, 1, 2, 3, 5, 20, 1, 2, 3],
+            features={
+                "a": [nan, 10.0, 2.0, 10.0, 13.0, 14.0, 1.0, 2.0, nan],
+                "b": ["u", "v", "u", "u", "w", "u", "u", "u", "v"],
+                "x": ["X", "X", "X", "X", "X", "X", "Y", "Y", "Y"],
+            },
+            indexes=["x"],
+        )
+
+    def test_basic(self):
+        timestamps = [1, 2, 3, 4, 5, 6]
+        evset = event_set(
+            timestamps=timestamps,
+            features={
+                "a": ["a", "b", "a", "c", "c", "c"],
+                "b": [nan, 1.0, 2.0, 2.0, 1.0, 2.0],
+            },
+        )
+
+        result = evset.moving_approx_heavy_hitters(window_length=3, k=2)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a_top1": ["a", "a", "a", "a", "c", "c"],
+                "a_top1_count": i32([1, 1, 2, 1, 2, 3]),
+                "a_top2": ["", "b", "b", "b", "a", ""],
+                "a_top2_count": i32([0, 1, 1, 1, 1, 0]),
+                "b_top1": [nan, 1.0, 1.0, 2.0, 2.0, 2.0],
+                "b_top1_count": i32([0, 1, 1, 2, 2, 2]),
+                "b_top2": [nan, nan, 2.0, 1.0, 1.0, 1.0],
+                "b_top2_count": i32([0, 0, 1, 1, 1, 1]),
+            },
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    @parameterized.parameters(0.01, 0.001)
+    def test_matches_exact_counts(self, epsilon):
+        rng = np.random.default_rng(1)
+        timestamps = np.arange(5000, dtype=np.float64)
+        values = rng.zipf(1.5, 5000) % 1000
+        evset = event_set(timestamps=timestamps, features={"a": values})
+
+        result = evset.moving_approx_heavy_hitters(
+            window_length=1000, k=3, epsilon=epsilon
+        )
+        data = result.get_arbitrary_index_data()
+
+        for i in range(0, 5000, 499):
+            window = values[max(0, i - 999) : i + 1]
+            counts = Counter(window.tolist())
+            # The Count-Min sketch never under-estimates, and over-estimates
+            # by at most epsilon times the number of values in the window.
+            for rank in range(3):
+                value = data.features[2 * rank][i]
+                count = data.features[2 * rank + 1][i]
+                self.assertGreaterEqual(count, counts[value])
+                self.assertLessEqual(count, counts[value] + epsilon * 1000)
+            top_value, top_count = counts.most_common(1)[0]
+            self.assertEqual(data.features[0][i], top_value)
+            self.assertEqual(data.features[1][i], top_count)
+
+    @parameterized.parameters(
+        {"sampling": False, "variable_winlen": False},
+        {"sampling": True, "variable_winlen": False},
+        {"sampling": False, "variable_winlen": True},
+    )
+    def test_top1_count_matches_moving_max(self, sampling, variable_winlen):
+        kwargs = {"window_length": 2.5}
+        if sampling:
+            kwargs["sampling"] = event_set(
+                timestamps=[-1, 2.5, 3, 30, 2],
+                features={"x": ["X", "X", "X", "X", "Z"]},
+                indexes=["x"],
+            )
+        if variable_winlen:
+            kwargs["window_length"] = event_set(
+                timestamps=self.evset.get_index_value(("X",)).timestamps,
+                features={
+                    "w": [1.0, 0.5, 2.0, 3.0, nan, 20.0],
+                    "x": ["X"] * 6,
+                },
+                indexes=["x"],
+            )
+
+        result = self.evset.moving_approx_heavy_hitters(**kwargs)
+
+        # With a single distinct value per window, the top-1 count is the
+        # number of non-missing values in the window.
+        constant = self.evset["a"] * 0.0
+        expected_count = (
+            constant.notnan().cast(DType.INT32).moving_sum(**kwargs)
+        )
+        self.assertEqual(
+            constant.moving_approx_heavy_hitters(**kwargs)["a_top1_count"],
+            expected_count.rename("a_top1_count"),
+        )
+        self.assertEqual(
+            result.schema.feature_names(),
+            ["a_top1", "a_top1_count", "b_top1", "b_top1_count"],
+        )
+
+    def test_dtypes(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": i32([1, 2, 2]),
+                "b": f32([1, 1, 2]),
+                "c": [True, False, False],
+            },
+        )
+
+        result = evset.moving_approx_heavy_hitters(10)
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a_top1": i32([1, 1, 2]),
+                "a_top1_count": i32([1, 1, 2]),
+                "b_top1": f32([1, 1, 1]),
+                "b_top1_count": i32([1, 2, 2]),
+                "c_top1": [True, False, False],
+                "c_top1_count": i32([1, 1, 2]),
+            },
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    def test_several_window_lengths(self):
+        result = self.evset.moving_approx_heavy_hitters([2, 60])
+        self.assertEqual(
+            result.schema.feature_names(),
+            [
+                "a_top1_2s",
+                "a_top1_1min",
+                "a_top1_count_2s",
+                "a_top1_count_1min",
+                "b_top1_2s",
+                "b_top1_1min",
+                "b_top1_count_2s",
+                "b_top1_count_1min",
+            ],
+        )
+        self.assertEqual(
+            result["b_top1_count_1min"],
+            self.evset.moving_approx_heavy_hitters(60)["b_top1_count"].rename(
+                "b_top1_count_1min"
+            ),
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "strictly positive"):
+            self.evset.moving_approx_heavy_hitters(2, k=0)
+        with self.assertRaisesRegex(ValueError, "should be in"):
+            self.evset.moving_approx_heavy_hitters(2, epsilon=1.5)
+
+
+if __name__ == "__main__":
+    absltest.main()
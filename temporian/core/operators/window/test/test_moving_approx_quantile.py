@@ -0,0 +1,168 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import nan
+
+import numpy as np
+from absl.testing import absltest, parameterized
+from absl.testing.parameterized import TestCase
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import f32, i32
+
+
+class MovingApproxQuantileTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[0, 1, 2, 3, 5, 20, 1, 2, 3],
+            features={
+                "a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0, 1.0, 2.0, nan],
+                "b": f32([1, 2, 3, nan, 5, 6, 7, 8, 9]),
+                "x": ["X", "X", "X", "X", "X", "X", "Y", "Y", "Y"],
+            },
+            indexes=["x"],
+        )
+
+    def test_basic(self):
+        timestamps = [0, 1, 2, 3, 5, 20]
+        evset = event_set(
+            timestamps=timestamps,
+            features={"a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0]},
+        )
+
+        result = evset.moving_approx_quantile(
+            window_length=3.5, quantile=0.5, relative_accuracy=0.001
+        )
+
+        np.testing.assert_array_equal(
+            result.get_arbitrary_index_data().timestamps, timestamps
+        )
+        np.testing.assert_allclose(
+            result.get_arbitrary_index_data().features[0],
+            [nan, 10.0, 6.0, 10.0, 12.0, 14.0],
+            rtol=0.002,
+        )
+
+    @parameterized.product(
+        quantile=[0.0, 0.1, 0.5, 0.9, 1.0],
+        relative_accuracy=[0.01, 0.05],
+    )
+    def test_relative_accuracy(self, quantile, relative_accuracy):
+        rng = np.random.default_rng(1)
+        timestamps = np.sort(rng.integers(0, 1000, 2000)).astype(np.float64)
+        values = rng.lognormal(0, 2, 2000)
+        values[rng.random(2000) < 0.1] = nan
+        evset = event_set(timestamps=timestamps, features={"a": values})
+
+        result = evset.moving_approx_quantile(
+            window_length=50,
+            quantile=quantile,
+            relative_accuracy=relative_accuracy,
+        )
+
+        expected_values = []
+        for t in timestamps:
+            window = values[(timestamps <= t) & (timestamps > t - 50)]
+            window = window[~np.isnan(window)]
+            expected_values.append(
+                np.quantile(window, quantile) if len(window) else nan
+            )
+        np.testing.assert_allclose(
+            result.get_arbitrary_index_data().features[0],
+            expected_values,
+            rtol=relative_accuracy * 1.01,
+        )
+
+    @parameterized.parameters(
+        {"sampling": False, "variable_winlen": False},
+        {"sampling": True, "variable_winlen": False},
+        {"sampling": False, "variable_winlen": True},
+    )
+    def test_matches_exact_quantile(self, sampling, variable_winlen):
+        kwargs = {"window_length": 2.5}
+        if sampling:
+            kwargs["sampling"] = event_set(
+                timestamps=[-1, 2.5, 3, 30, 2],
+                features={"x": ["X", "X", "X", "X", "Z"]},
+                indexes=["x"],
+            )
+        if variable_winlen:
+            kwargs["window_length"] = event_set(
+                timestamps=self.evset.get_index_value(("X",)).timestamps,
+                features={
+                    "w": [1.0, 0.5, 2.0, 3.0, nan, 20.0],
+                    "x": ["X"] * 6,
+                },
+                indexes=["x"],
+            )
+
+        result = self.evset.moving_approx_quantile(
+            quantile=1.0, relative_accuracy=0.001, **kwargs
+        )
+        expected = self.evset.moving_max(**kwargs)
+
+        self.assertEqual(result.schema, expected.schema)
+        for index_key, expected_data in expected.data.items():
+            result_data = result.data[index_key]
+            np.testing.assert_array_equal(
+                result_data.timestamps, expected_data.timestamps
+            )
+            for result_feature, expected_feature in zip(
+                result_data.features, expected_data.features
+            ):
+                np.testing.assert_allclose(
+                    result_feature, expected_feature, rtol=0.002
+                )
+
+    def test_dtypes(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"a": i32([1, 2, 4, 8]), "b": f32([1, 2, 4, 8])},
+        )
+
+        result = evset.moving_approx_quantile(3, quantile=0.0)
+
+        self.assertEqual(result.schema.features[0].dtype, DType.FLOAT64)
+        self.assertEqual(result.schema.features[1].dtype, DType.FLOAT32)
+        for feature in result.get_arbitrary_index_data().features:
+            np.testing.assert_allclose(feature, [1, 1, 1, 2], rtol=0.01)
+
+    def test_several_window_lengths(self):
+        result = self.evset.moving_approx_quantile([2, 60], quantile=0.5)
+        self.assertEqual(
+            result.schema.feature_names(),
+            ["a_2s", "a_1min", "b_2s", "b_1min"],
+        )
+        self.assertEqual(
+            result["b_1min"],
+            self.evset["b"]
+            .moving_approx_quantile(60, quantile=0.5)
+            .rename("b_1min"),
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "should be in"):
+            self.evset.moving_approx_quantile(2, quantile=1.5)
+        with self.assertRaisesRegex(ValueError, "should be in"):
+            self.evset.moving_approx_quantile(
+                2, quantile=0.5, relative_accuracy=0.0
+            )
+        evset = event_set(timestamps=[1], features={"s": ["hello"]})
+        with self.assertRaisesRegex(ValueError, "numerical features only"):
+            evset.moving_approx_quantile(2, quantile=0.5)
+
+
+if __name__ == "__main__":
+    absltest.main()
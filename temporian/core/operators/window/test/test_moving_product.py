@@ -180,7 +180,7 @@ class MovingProductTest(TestCase):
 
         expected = event_set(
             timestamps=timestamps,
-            features={"a": f32([nan, 10, 110, 12, nan, nan])},
+            features={"a": f32([nan, 10, 110, 12, 1716, 240240])},
             same_sampling_as=evset,
         )
 
@@ -203,13 +203,55 @@ class MovingProductTest(TestCase):
 
         expected = event_set(
             timestamps=window_timestamps,
-            features={"a": f32([nan, 10.0, 132.0, nan, 182.0, nan])},
+            features={"a": f32([nan, 10.0, 132.0, 17160.0, 182.0, 240240.0])},
             same_sampling_as=window,
         )
 
         result = evset.moving_product(window_length=window)
         assertOperatorResult(self, result, expected)
 
+    @parameters(False, True)
+    def test_random(self, variable_window_length: bool):
+        # Compare with a direct computation of the product of each window.
+        rng = np.random.default_rng(0)
+        timestamps = np.sort(rng.integers(0, 100, size=200)).astype(np.float64)
+        values = rng.choice([-2.0, -1.0, 0.0, 0.5, 2.0, nan], size=200)
+        sampling_timestamps = np.sort(rng.integers(-5, 105, size=150)).astype(
+            np.float64
+        )
+        if variable_window_length:
+            window_lengths = rng.uniform(0, 20, size=150)
+        else:
+            window_lengths = np.full(150, 7.0)
+
+        expected_values = []
+        for sampling_timestamp, window_length in zip(
+            sampling_timestamps, window_lengths
+        ):
+            window_values = values[
+                (timestamps <= sampling_timestamp)
+                & (timestamps > sampling_timestamp - window_length)
+            ]
+            window_values = window_values[~np.isnan(window_values)]
+            expected_values.append(
+                np.prod(window_values) if len(window_values) else nan
+            )
+
+        evset = event_set(timestamps=timestamps, features={"a": values})
+        if variable_window_length:
+            window = event_set(
+                timestamps=sampling_timestamps,
+                features={"a": window_lengths},
+            )
+            result = evset.moving_product(window_length=window)
+        else:
+            sampling = event_set(timestamps=sampling_timestamps)
+            result = evset.moving_product(7.0, sampling=sampling)
+
+        np.testing.assert_array_equal(
+            result.get_arbitrary_index_data().features[0], expected_values
+        )
+
     def test_error_input_int(self):
         evset = event_set([1, 2], {"f": [1, 2]})
         with self.assertRaisesRegex(
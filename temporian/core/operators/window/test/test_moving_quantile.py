@@ -0,0 +1,149 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import nan
+
+import numpy as np
+from absl.testing import absltest, parameterized
+from absl.testing.parameterized import TestCase
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import assertOperatorResult, f32, i32
+
+
+class MovingQuantileTest(TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[0, 1, 2, 3, 5, 20, 1, 2, 3],
+            features={
+                "a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0, 1.0, 2.0, nan],
+                "b": f32([1, 2, 3, nan, 5, 6, 7, 8, 9]),
+                "x": ["X", "X", "X", "X", "X", "X", "Y", "Y", "Y"],
+            },
+            indexes=["x"],
+        )
+
+    def test_basic(self):
+        timestamps = [0, 1, 2, 3, 5, 20]
+        evset = event_set(
+            timestamps=timestamps,
+            features={"a": [nan, 10.0, 2.0, 12.0, 13.0, 14.0]},
+        )
+
+        result = evset.moving_quantile(window_length=3.5, quantile=0.5)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={"a": [nan, 10.0, 6.0, 10.0, 12.0, 14.0]},
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    @parameterized.parameters(0.0, 0.1, 0.25, 0.5, 0.8, 1.0)
+    def test_matches_numpy(self, quantile):
+        rng = np.random.default_rng(1)
+        timestamps = np.sort(rng.integers(0, 100, 200)).astype(np.float64)
+        values = rng.integers(0, 20, 200).astype(np.float64)
+        values[rng.random(200) < 0.1] = nan
+        evset = event_set(timestamps=timestamps, features={"a": values})
+
+        result = evset.moving_quantile(window_length=7.5, quantile=quantile)
+
+        expected_values = []
+        for t in timestamps:
+            window = values[(timestamps <= t) & (timestamps > t - 7.5)]
+            window = window[~np.isnan(window)]
+            expected_values.append(
+                np.quantile(window, quantile) if len(window) else nan
+            )
+        expected = event_set(
+            timestamps=timestamps,
+            features={"a": expected_values},
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
+    @parameterized.parameters(
+        {"sampling": False, "variable_winlen": False},
+        {"sampling": True, "variable_winlen": False},
+        {"sampling": False, "variable_winlen": True},
+    )
+    def test_extremes_match_min_max(self, sampling, variable_winlen):
+        kwargs = {"window_length": 2.5}
+        if sampling:
+            kwargs["sampling"] = event_set(
+                timestamps=[-1, 2.5, 3, 30, 2],
+                features={"x": ["X", "X", "X", "X", "Z"]},
+                indexes=["x"],
+            )
+        if variable_winlen:
+            kwargs["window_length"] = event_set(
+                timestamps=self.evset.get_index_value(("X",)).timestamps,
+                features={
+                    "w": [1.0, 0.5, 2.0, 3.0, nan, 20.0],
+                    "x": ["X"] * 6,
+                },
+                indexes=["x"],
+            )
+
+        self.assertEqual(
+            self.evset.moving_quantile(quantile=0.0, **kwargs),
+            self.evset.moving_min(**kwargs),
+        )
+        self.assertEqual(
+            self.evset.moving_quantile(quantile=1.0, **kwargs),
+            self.evset.moving_max(**kwargs),
+        )
+
+    def test_dtypes(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"a": i32([1, 2, 4, 8]), "b": f32([1, 2, 4, 8])},
+        )
+
+        result = evset.moving_quantile(3, quantile=0.25)
+
+        expected = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"a": [1.0, 1.25, 1.5, 3.0], "b": f32([1, 1.25, 1.5, 3])},
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+        self.assertEqual(result.schema.features[0].dtype, DType.FLOAT64)
+
+    def test_several_window_lengths(self):
+        result = self.evset.moving_quantile([2, 60], quantile=0.5)
+        self.assertEqual(
+            result.schema.feature_names(),
+            ["a_2s", "a_1min", "b_2s", "b_1min"],
+        )
+        self.assertEqual(
+            result["b_1min"],
+            self.evset["b"].moving_quantile(60, quantile=0.5).rename("b_1min"),
+        )
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "should be in"):
+            self.evset.moving_quantile(2, quantile=1.5)
+        evset = event_set(timestamps=[1], features={"s": ["hello"]})
+        with self.assertRaisesRegex(ValueError, "numerical features only"):
+            evset.moving_quantile(2, quantile=0.5)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -172,6 +172,53 @@ class MovingSumTest(TestCase):
         result = evset.moving_sum(window_length=window)
         assertOperatorResult(self, result, expected)
 
+    def test_several_window_lengths(self):
+        timestamps = [1, 2, 3, 5, 20, 1, 4]
+        evset = event_set(
+            timestamps=timestamps,
+            features={
+                "a": [10.0, nan, 12.0, 13.0, 14.0, 1.0, 2.0],
+                "b": [1, 2, 3, 4, 5, 6, 7],
+                "x": ["X1", "X1", "X1", "X1", "X1", "X2", "X2"],
+            },
+            indexes=["x"],
+        )
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a_2s": [10.0, 10.0, 12.0, 13.0, 14.0, 1.0, 2.0],
+                "a_1min": [10.0, 10.0, 22.0, 35.0, 49.0, 1.0, 3.0],
+                "b_2s": [1, 3, 5, 4, 5, 6, 7],
+                "b_1min": [1, 3, 6, 10, 15, 6, 13],
+                "x": ["X1", "X1", "X1", "X1", "X1", "X2", "X2"],
+            },
+            indexes=["x"],
+            same_sampling_as=evset,
+        )
+
+        result = evset.moving_sum(window_length=[2.0, 60.0])
+        assertOperatorResult(self, result, expected)
+
+    def test_several_window_lengths_with_sampling(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 5, 20],
+            features={"a": [10.0, 11.0, 12.0, 13.0, 14.0]},
+        )
+        sampling = event_set(timestamps=[0, 3, 6, 21])
+
+        expected = event_set(
+            timestamps=[0, 3, 6, 21],
+            features={
+                "a_1s": [0.0, 12.0, 0.0, 0.0],
+                "a_5s": [0.0, 33.0, 36.0, 14.0],
+            },
+            same_sampling_as=sampling,
+        )
+
+        result = evset.moving_sum(window_length=[1, 5], sampling=sampling)
+        assertOperatorResult(self, result, expected)
+
     def test_error_input_bytes(self):
         evset = event_set([1, 2], {"f": ["A", "B"]})
         with self.assertRaisesRegex(
@@ -0,0 +1,758 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewriting of a graph into an equivalent graph cheaper to evaluate.
+
+The optimizer never modifies the user's graph. Instead, it creates new
+operators and returns, for each output node, an equivalent node (i.e. a node
+with the same schema and the same data) to compute instead.
+
+Operators are re-created with `operator_class(**inputs, **attributes)`, the
+same way as when a graph is unserialized.
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from temporian.core.data.dtype import DType
+from temporian.core.data.node import EventSetNode
+from temporian.core.graph import infer_graph
+from temporian.core.operators.base import Operator
+from temporian.core.operators.binary.base import BaseBinaryOperator
+from temporian.core.operators.cast import CastOperator
+from temporian.core.operators.fused_elementwise import (
+    FusedElementwiseOperator,
+    FusedStep,
+)
+from temporian.core.operators.filter import FilterOperator
+from temporian.core.operators.glue import GlueOperator
+from temporian.core.operators.join import Join
+from temporian.core.operators.lag import LagOperator
+from temporian.core.operators.leak import LeakOperator
+from temporian.core.operators.prefix import Prefix
+from temporian.core.operators.rename import RenameOperator
+from temporian.core.operators.resample import Resample
+from temporian.core.operators.scalar.base import BaseScalarOperator
+from temporian.core.operators.select import SelectOperator
+from temporian.core.operators import unary
+from temporian.core.operators.unary import BaseUnaryOperator
+from temporian.core.operators.where import Where
+from temporian.core.operators.window.moving_aggregate import (
+    MovingAggregateOperator,
+)
+from temporian.core.operators.window.moving_approx_distinct_count import (
+    MovingApproxDistinctCountOperator,
+)
+from temporian.core.operators.window.moving_approx_heavy_hitters import (
+    MovingApproxHeavyHittersOperator,
+)
+from temporian.core.operators.window.moving_approx_quantile import (
+    MovingApproxQuantileOperator,
+)
+from temporian.core.operators.window.moving_count import MovingCountOperator
+from temporian.core.operators.window.moving_max import MovingMaxOperator
+from temporian.core.operators.window.moving_min import MovingMinOperator
+from temporian.core.operators.window.moving_product import (
+    MovingProductOperator,
+)
+from temporian.core.operators.window.moving_quantile import (
+    MovingQuantileOperator,
+)
+from temporian.core.operators.window.moving_standard_deviation import (
+    MovingStandardDeviationOperator,
+)
+from temporian.core.operators.window.moving_sum import MovingSumOperator
+from temporian.core.operators.window.simple_moving_average import (
+    SimpleMovingAverageOperator,
+)
+
+# Mapping between nodes of the original graph and equivalent nodes of the
+# optimized graph.
+NodeMapping = Dict[EventSetNode, EventSetNode]
+
+# Names of the features of each input / output of an operator.
+FeatureNames = Dict[str, Set[str]]
+
+
+def optimize(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> NodeMapping:
+    """Optimizes the graph between the `inputs` and `outputs` nodes.
+
+    Args:
+        inputs: Input nodes. If None, the inputs are inferred.
+        outputs: Output nodes.
+
+    Returns:
+        For each of the output nodes, an equivalent node to compute instead.
+    """
+
+    mapping = {node: node for node in outputs}
+    if not _has_multiple_operators(inputs, outputs):
+        # Nothing to optimize.
+        return mapping
+
+    for optimization_pass in _PASSES:
+        pass_mapping = optimization_pass(inputs, set(mapping.values()))
+        mapping = {
+            node: pass_mapping[optimized_node]
+            for node, optimized_node in mapping.items()
+        }
+    return mapping
+
+
+def eliminate_common_subexpressions(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> NodeMapping:
+    """Merges the operators computing the same results.
+
+    Two operators compute the same results if they have the same definition
+    key, the same attributes, and the same inputs (after merging).
+    """
+
+    # "canonical[n]" is the node computing the same data as "n".
+    canonical: NodeMapping = {}
+    signature_to_op: Dict[Any, Operator] = {}
+
+    for op in _sorted_operators(inputs, outputs):
+        new_inputs = {
+            key: canonical.get(node, node) for key, node in op.inputs.items()
+        }
+        signature = _operator_signature(op, new_inputs)
+        new_op = signature_to_op.get(signature) if signature else None
+
+        if new_op is None:
+            new_op = _rebuild_operator(op, new_inputs)
+            if signature:
+                signature_to_op[signature] = new_op
+
+        for key, node in op.outputs.items():
+            canonical[node] = new_op.outputs[key]
+
+    return {node: canonical.get(node, node) for node in outputs}
+
+
+def prune_unused_features(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> NodeMapping:
+    """Removes the computation of features not used by the outputs.
+
+    Features are tracked through the operators registered in
+    `_FEATURE_RULES`. For example, in `tp.glue(a, b)["x"]` where "x" is a
+    feature of "a", "b" is not computed, and in `a.moving_sum(5)["x"]`, the
+    moving sum is only computed on "x". Other operators are assumed to use
+    all the features of their inputs.
+    """
+
+    operators = _sorted_operators(inputs, outputs)
+
+    # "used[n]" is the set of features of "n" used by the outputs.
+    used: Dict[EventSetNode, Set[str]] = defaultdict(set)
+    for node in outputs:
+        used[node].update(node.schema.feature_names())
+
+    for op in reversed(operators):
+        rule = _FEATURE_RULES.get(op.definition.key)
+        used_outputs = {key: used[node] for key, node in op.outputs.items()}
+        if rule is None:
+            used_inputs = {
+                key: set(node.schema.feature_names())
+                for key, node in op.inputs.items()
+            }
+        else:
+            used_inputs = rule.used_inputs(op, used_outputs)
+        for key, node in op.inputs.items():
+            used[node].update(used_inputs[key])
+
+    # "new_nodes[n]" is a node computing the data of "n" or a subset of its
+    # features including the used ones.
+    new_nodes: NodeMapping = {}
+    for op in operators:
+        new_inputs = {
+            key: new_nodes.get(node, node) for key, node in op.inputs.items()
+        }
+        new_outputs = None
+        rule = _FEATURE_RULES.get(op.definition.key)
+        if rule is not None and (
+            any(
+                used[node] != set(node.schema.feature_names())
+                for node in op.outputs.values()
+            )
+            or any(new_inputs[key] is not op.inputs[key] for key in new_inputs)
+        ):
+            new_outputs = rule.project(
+                op,
+                new_inputs,
+                {key: used[node] for key, node in op.outputs.items()},
+            )
+        if new_outputs is None:
+            new_op = _rebuild_operator(op, new_inputs)
+            new_outputs = new_op.outputs
+        for key, node in op.outputs.items():
+            new_nodes[node] = new_outputs[key]
+
+    return {node: new_nodes.get(node, node) for node in outputs}
+
+
+def fuse_elementwise_operators(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> NodeMapping:
+    """Replaces chains of elementwise operators with fused operators.
+
+    Elementwise operators (binary, scalar, unary, where and cast) compute each
+    output value from the input values of the same event. A tree of
+    elementwise operators where each intermediate result is only used by the
+    next operator of the tree is replaced by a single
+    `FusedElementwiseOperator`, which does not materialize the intermediate
+    results. For example, `((a * 2 + b).abs().log() > 0.5)` is computed by a
+    single operator.
+    """
+
+    operators = _sorted_operators(inputs, outputs)
+
+    # Operators using each node.
+    consumers: Dict[EventSetNode, Set[Operator]] = defaultdict(set)
+    for op in operators:
+        for node in op.inputs.values():
+            consumers[node].add(op)
+
+    def can_be_fused_in(node: EventSetNode, op: Operator) -> bool:
+        """Checks if the creator of "node" can be fused in "op"."""
+
+        creator = node.creator
+        return (
+            creator is not None
+            and _is_fusable(creator)
+            and (inputs is None or node not in inputs)
+            and node not in outputs
+            and consumers[node] == {op}
+        )
+
+    # Operators fused in each root operator. The root operator, i.e., the
+    # operator computing the output of the fused operator, is listed last.
+    fused: Dict[Operator, List[Operator]] = {}
+    fused_ops: Set[Operator] = set()
+    for op in reversed(operators):
+        if op in fused_ops or not _is_fusable(op):
+            continue
+        members = {op}
+        stack = [op]
+        while stack:
+            member = stack.pop()
+            for node in member.inputs.values():
+                if (
+                    can_be_fused_in(node, member)
+                    and node.creator not in members
+                ):
+                    members.add(node.creator)
+                    stack.append(node.creator)
+        if len(members) > 1:
+            fused[op] = [member for member in operators if member in members]
+            fused_ops.update(members)
+
+    if not fused:
+        return {node: node for node in outputs}
+
+    new_nodes: NodeMapping = {}
+    for op in operators:
+        if op in fused:
+            new_output = _fuse_operators(fused[op], new_nodes)
+            new_nodes[op.outputs["output"]] = new_output
+        elif op not in fused_ops:
+            new_inputs = {
+                key: new_nodes.get(node, node)
+                for key, node in op.inputs.items()
+            }
+            new_op = _rebuild_operator(op, new_inputs)
+            for key, node in op.outputs.items():
+                new_nodes[node] = new_op.outputs[key]
+
+    return {node: new_nodes.get(node, node) for node in outputs}
+
+
+def _is_fusable(op: Operator) -> bool:
+    """Checks if an operator can be computed by a fused operator."""
+
+    # Strings are not fused as their numpy representation has a variable
+    # size.
+    return isinstance(
+        op,
+        (
+            BaseBinaryOperator,
+            BaseScalarOperator,
+            BaseUnaryOperator,
+            Where,
+            CastOperator,
+        ),
+    ) and all(
+        feature.dtype != DType.STRING
+        for feature in op.outputs["output"].schema.features
+    )
+
+
+def _fuse_operators(
+    operators: List[Operator], new_nodes: NodeMapping
+) -> EventSetNode:
+    """Creates a fused operator computing a list of sorted operators."""
+
+    members = set(operators)
+
+    # Register of the nodes computed by the fused operator.
+    registers: Dict[EventSetNode, int] = {}
+    fused_inputs: Dict[str, EventSetNode] = {}
+    for op in operators:
+        for node in op.inputs.values():
+            if node.creator not in members and node not in registers:
+                registers[node] = len(fused_inputs)
+                fused_inputs[f"input_{len(fused_inputs)}"] = new_nodes.get(
+                    node, node
+                )
+
+    steps = []
+    for op in operators:
+        steps.append(
+            FusedStep(
+                operator=op,
+                inputs={
+                    key: registers[node] for key, node in op.inputs.items()
+                },
+            )
+        )
+        registers[op.outputs["output"]] = len(fused_inputs) + len(steps) - 1
+
+    return FusedElementwiseOperator(steps, **fused_inputs).outputs["output"]
+
+
+class _FeatureRule:
+    """Tracking of the features through an operator.
+
+    Only operators that do not require all the features of their inputs, or
+    that can compute a subset of their output features should have a rule.
+    """
+
+    def __init__(
+        self,
+        used_inputs: Callable[[Operator, FeatureNames], FeatureNames],
+        project: Callable[
+            [Operator, Dict[str, EventSetNode], FeatureNames],
+            Optional[Dict[str, EventSetNode]],
+        ],
+    ):
+        """Creates a rule.
+
+        Args:
+            used_inputs: Given the features used in each output of an
+                operator, returns the features used in each input.
+            project: Given the new inputs of an operator, which contain at
+                least the used input features, and the features used in each
+                output, returns the new outputs. The new outputs contain at
+                least the used output features. Can return None to re-create
+                the operator as is.
+        """
+
+        self.used_inputs = used_inputs
+        self.project = project
+
+
+def _select_used_inputs(op: Operator, used: FeatureNames) -> FeatureNames:
+    return {"input": set(op.attributes["feature_names"]) & used["output"]}
+
+
+def _select_project(
+    op: Operator, inputs: Dict[str, EventSetNode], used: FeatureNames
+) -> Optional[Dict[str, EventSetNode]]:
+    feature_names = [
+        f for f in op.attributes["feature_names"] if f in used["output"]
+    ]
+    return {"output": _select(inputs["input"], feature_names)}
+
+
+def _glue_used_inputs(op: Operator, used: FeatureNames) -> FeatureNames:
+    return {
+        key: set(node.schema.feature_names()) & used["output"]
+        for key, node in op.inputs.items()
+    }
+
+
+def _glue_project(
+    op: Operator, inputs: Dict[str, EventSetNode], used: FeatureNames
+) -> Optional[Dict[str, EventSetNode]]:
+    new_inputs = {}
+    for key, node in inputs.items():
+        feature_names = [
+            f
+            for f in op.inputs[key].schema.feature_names()
+            if f in used["output"]
+        ]
+        if feature_names:
+            new_inputs[key] = _select(node, feature_names)
+
+    if not new_inputs:
+        # Only the sampling is used.
+        return {"output": _select(next(iter(inputs.values())), [])}
+    if len(new_inputs) == 1:
+        # All the inputs have the same sampling as the output.
+        return {"output": next(iter(new_inputs.values()))}
+    return {"output": GlueOperator(**new_inputs).outputs["output"]}
+
+
+def _feature_wise_used_inputs(op: Operator, used: FeatureNames) -> FeatureNames:
+    """Used input features of an operator computing each output feature from
+    the input feature at the same position in the "input" input.
+
+    The "sampling" input only provides timestamps. The other inputs (e.g., the
+    "window_length" of window operators) are used entirely.
+    """
+
+    output_names = op.outputs["output"].schema.feature_names()
+    used_inputs = {
+        "input": {
+            input_name
+            for input_name, output_name in zip(
+                _feature_wise_input_names(op), output_names
+            )
+            if output_name in used["output"]
+        }
+    }
+    for key, node in op.inputs.items():
+        if key == "sampling":
+            used_inputs[key] = set()
+        elif key != "input":
+            used_inputs[key] = set(node.schema.feature_names())
+    return used_inputs
+
+
+def _feature_wise_input_names(op: Operator) -> List[str]:
+    """Name of the input feature of each output feature of a feature-wise
+    operator.
+
+    Window operators with several window lengths (one output feature per
+    window length), `moving_aggregate` (one output feature per aggregation) and
+    `moving_approx_heavy_hitters` (two output features per heavy hitter)
+    compute consecutive output features from each input feature.
+    """
+
+    input_names = op.inputs["input"].schema.feature_names()
+    num_outputs = len(op.outputs["output"].schema.features)
+    if not input_names or num_outputs <= len(input_names):
+        return input_names[:num_outputs]
+    num_outputs_per_input = num_outputs // len(input_names)
+    return [
+        input_names[idx // num_outputs_per_input] for idx in range(num_outputs)
+    ]
+
+
+def _feature_wise_project(
+    op: Operator, inputs: Dict[str, EventSetNode], used: FeatureNames
+) -> Optional[Dict[str, EventSetNode]]:
+    input_names = op.inputs["input"].schema.feature_names()
+    used_input_names = _feature_wise_used_inputs(op, used)["input"]
+    positions = [
+        idx for idx, name in enumerate(input_names) if name in used_input_names
+    ]
+    if len(positions) == len(input_names):
+        return None
+
+    attributes = dict(op.attributes)
+    if isinstance(op, CastOperator):
+        attributes["dtypes"] = [op.dtypes[idx] for idx in positions]
+    elif isinstance(op, RenameOperator):
+        attributes["features"] = {
+            src: dst
+            for src, dst in op.attributes["features"].items()
+            if src in [input_names[idx] for idx in positions]
+        }
+
+    new_inputs = dict(inputs)
+    new_inputs["input"] = _select(
+        inputs["input"], [input_names[idx] for idx in positions]
+    )
+    return _create_projected_operator(op, new_inputs, attributes, used)
+
+
+def _moving_count_used_inputs(op: Operator, used: FeatureNames) -> FeatureNames:
+    # The count only depends on the timestamps of the input.
+    used_inputs = _feature_wise_used_inputs(op, used)
+    used_inputs["input"] = set()
+    return used_inputs
+
+
+def _moving_count_project(
+    op: Operator, inputs: Dict[str, EventSetNode], used: FeatureNames
+) -> Optional[Dict[str, EventSetNode]]:
+    if not op.inputs["input"].schema.features:
+        return None
+    new_inputs = dict(inputs)
+    new_inputs["input"] = _select(inputs["input"], [])
+    return _create_projected_operator(op, new_inputs, op.attributes, used)
+
+
+def _join_used_inputs(op: Operator, used: FeatureNames) -> FeatureNames:
+    on = op.attributes.get("on")
+    return {
+        key: {
+            f
+            for f in node.schema.feature_names()
+            if f in used["output"] or f == on
+        }
+        for key, node in op.inputs.items()
+    }
+
+
+def _join_project(
+    op: Operator, inputs: Dict[str, EventSetNode], used: FeatureNames
+) -> Optional[Dict[str, EventSetNode]]:
+    if used["output"] == set(op.outputs["output"].schema.feature_names()):
+        return None
+
+    on = op.attributes.get("on")
+    new_inputs = {
+        key: _select(
+            inputs[key],
+            [
+                f
+                for f in node.schema.feature_names()
+                if f in used["output"] or f == on
+            ],
+        )
+        for key, node in op.inputs.items()
+    }
+    return _create_projected_operator(op, new_inputs, op.attributes, used)
+
+
+def _create_projected_operator(
+    op: Operator,
+    inputs: Dict[str, EventSetNode],
+    attributes: Dict[str, Any],
+    used: FeatureNames,
+) -> Optional[Dict[str, EventSetNode]]:
+    """Creates an operator computing a subset of the outputs of "op".
+
+    Returns None if the new operator cannot be created, or if it does not
+    compute the used features of "op".
+    """
+
+    try:
+        new_op = op.__class__(**inputs, **attributes)
+    except (ValueError, TypeError, IndexError):
+        return None
+
+    for key, node in op.outputs.items():
+        new_node = new_op.outputs[key]
+        if new_node.schema.indexes != node.schema.indexes:
+            return None
+        new_features = {f.name: f.dtype for f in new_node.schema.features}
+        if any(
+            new_features.get(f.name) != f.dtype
+            for f in node.schema.features
+            if f.name in used[key]
+        ):
+            return None
+    return new_op.outputs
+
+
+# Operators computing each output feature from the input feature at the same
+# position (see `_feature_wise_input_names()`).
+_FEATURE_WISE_OPERATORS: List[type] = [
+    CastOperator,
+    FilterOperator,
+    LagOperator,
+    LeakOperator,
+    MovingAggregateOperator,
+    MovingApproxDistinctCountOperator,
+    MovingApproxHeavyHittersOperator,
+    MovingApproxQuantileOperator,
+    MovingMaxOperator,
+    MovingMinOperator,
+    MovingProductOperator,
+    MovingQuantileOperator,
+    MovingStandardDeviationOperator,
+    MovingSumOperator,
+    Prefix,
+    RenameOperator,
+    Resample,
+    SimpleMovingAverageOperator,
+    unary.AbsOperator,
+    unary.ArcCosOperator,
+    unary.ArcSinOperator,
+    unary.ArcTanOperator,
+    unary.CosOperator,
+    unary.InvertOperator,
+    unary.IsNanOperator,
+    unary.LogOperator,
+    unary.NotNanOperator,
+    unary.SinOperator,
+    unary.TanOperator,
+]
+
+_FEATURE_RULES: Dict[str, _FeatureRule] = {
+    SelectOperator.operator_key(): _FeatureRule(
+        _select_used_inputs, _select_project
+    ),
+    GlueOperator.operator_key(): _FeatureRule(_glue_used_inputs, _glue_project),
+    Join.operator_key(): _FeatureRule(_join_used_inputs, _join_project),
+    MovingCountOperator.operator_key(): _FeatureRule(
+        _moving_count_used_inputs, _moving_count_project
+    ),
+    **{
+        operator_class.operator_key(): _FeatureRule(
+            _feature_wise_used_inputs, _feature_wise_project
+        )
+        for operator_class in _FEATURE_WISE_OPERATORS
+    },
+}
+
+
+def _select(node: EventSetNode, feature_names: List[str]) -> EventSetNode:
+    """Selects features, without creating an operator if not necessary."""
+
+    if node.schema.feature_names() == feature_names:
+        return node
+    return SelectOperator(node, feature_names).outputs["output"]
+
+
+def _rebuild_operator(
+    op: Operator, inputs: Dict[str, EventSetNode]
+) -> Operator:
+    """Creates a copy of an operator with different inputs.
+
+    Returns the operator itself if the inputs are the same, or if the operator
+    cannot be re-created. In this last case, the original inputs of the
+    operator are computed.
+    """
+
+    if all(node is op.inputs[key] for key, node in inputs.items()):
+        return op
+
+    try:
+        new_op = op.__class__(**inputs, **op.attributes)
+    except (ValueError, TypeError, IndexError):
+        return op
+
+    if new_op.outputs.keys() != op.outputs.keys() or any(
+        new_op.outputs[key].schema != node.schema
+        for key, node in op.outputs.items()
+    ):
+        return op
+    return new_op
+
+
+def _operator_signature(
+    op: Operator, inputs: Dict[str, EventSetNode]
+) -> Optional[Tuple]:
+    """Key identifying the computation of an operator.
+
+    Returns None if the operator cannot be compared to other operators.
+    """
+
+    signature = (
+        op.definition.key,
+        tuple(sorted((key, id(node)) for key, node in inputs.items())),
+        _hashable(op.attributes),
+    )
+    try:
+        hash(signature)
+    except TypeError:
+        return None
+    return signature
+
+
+def _hashable(value: Any) -> Any:
+    """Converts an attribute value into a hashable value.
+
+    Values are tagged with their type, and scalars are compared through their
+    representation, since values such as `0.0` and `-0.0`, or `1`, `1.0` and
+    `True`, are equal but give different results.
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_hashable(v) for v in value)
+    if isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return (type(value).__name__, repr(value))
+    return (type(value).__name__, value)
+
+
+def _has_multiple_operators(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> bool:
+    """Checks cheaply if the graph contains more than one operator."""
+
+    creators = set()
+    for node in outputs:
+        if node.creator is None or (inputs is not None and node in inputs):
+            continue
+        creators.add(node.creator)
+        if len(creators) > 1:
+            return True
+        for input_node in node.creator.inputs.values():
+            if input_node.creator is not None and (
+                inputs is None or input_node not in inputs
+            ):
+                return True
+    return False
+
+
+def _sorted_operators(
+    inputs: Optional[Set[EventSetNode]], outputs: Set[EventSetNode]
+) -> List[Operator]:
+    """Lists the operators between the inputs and outputs such that an
+    operator is listed after the operators computing its inputs.
+
+    Ties are broken by creation order, to make the optimization deterministic.
+    """
+
+    graph = infer_graph(inputs, outputs)
+    operators = sorted(graph.operators, key=lambda op: op._internal_ordered_id)
+
+    sorted_operators = []
+    done: Set[Operator] = set()
+
+    def visit(op: Operator) -> None:
+        # Iterative post-order traversal, as graphs can be deep.
+        stack = [(op, False)]
+        while stack:
+            item, expanded = stack.pop()
+            if item in done:
+                continue
+            if expanded:
+                done.add(item)
+                sorted_operators.append(item)
+                continue
+            stack.append((item, True))
+            for node in reversed(list(item.inputs.values())):
+                creator = node.creator
+                if (
+                    creator is not None
+                    and creator in graph.operators
+                    and creator not in done
+                    and node not in graph.inputs
+                ):
+                    stack.append((creator, False))
+
+    for op in operators:
+        visit(op)
+    return sorted_operators
+
+
+_PASSES: List[
+    Callable[[Optional[Set[EventSetNode]], Set[EventSetNode]], NodeMapping]
+] = [
+    prune_unused_features,
+    eliminate_common_subexpressions,
+    fuse_elementwise_operators,
+]
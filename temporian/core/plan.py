@@ -0,0 +1,248 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Plan class definition."""
+
+from typing import Dict, List, Optional, Union
+
+from temporian.core import evaluation
+from temporian.core.data.node import EventSetNode
+from temporian.core.graph import infer_graph, normalize_named_nodes
+from temporian.core.optimizer import optimize as optimize_graph
+from temporian.core.typing import (
+    EventSetCollection,
+    EventSetNodeCollection,
+)
+from temporian.implementation.numpy import evaluation as np_eval
+from temporian.implementation.numpy.data.event_set import EventSet
+
+
+class Plan:
+    """Pre-computed evaluation of [`EventSetNodes`][temporian.EventSetNode].
+
+    A Plan computes the same `query` nodes as [`tp.run()`][temporian.run],
+    but the graph analysis, the operator schedule and the operator
+    implementations are computed once when the Plan is created instead of at
+    each call. This is beneficial when the same graph is evaluated many times
+    on small EventSets, where this fixed overhead dominates.
+
+    Usage example:
+        ```python
+        >>> input_node = tp.input_node([("f", tp.float64)])
+        >>> output_node = input_node.moving_sum(5)
+        >>> plan = tp.Plan(output_node, input_node)
+
+        >>> for x in [1.0, 2.0, 3.0]:
+        ...     evset = tp.event_set(timestamps=[1, 2], features={"f": [x, x]})
+        ...     result = plan(evset)
+        >>> result
+        indexes: []
+        features: [('f', float64)]
+        events:
+            (2 events):
+                timestamps: [1. 2.]
+                'f': [3. 6.]
+        ...
+
+        ```
+
+    When called, the input EventSets are mapped to the input nodes in the
+    same way as the input nodes are specified when the Plan is created:
+    a single EventSet for a single input node, a list of EventSets for a list
+    of input nodes (in the same order), and a dictionary of EventSets for a
+    dictionary of input nodes (with the same keys). A dictionary of
+    EventSetNode to EventSet is always accepted.
+
+    Attributes:
+        inputs: Input nodes of the Plan.
+    """
+
+    def __init__(
+        self,
+        query: EventSetNodeCollection,
+        input: Optional[EventSetNodeCollection] = None,
+        verbose: int = 0,
+        check_execution: bool = True,
+        force_garbage_collector_interval: Optional[float] = 10,
+        num_threads: int = 1,
+        optimize: bool = True,
+    ):
+        """Creates a Plan.
+
+        Args:
+            query: EventSetNodes to compute. Supports EventSetNode, dict of
+                EventSetNodes and list of EventSetNodes.
+            input: Input EventSetNodes. Supports EventSetNode, dict of
+                EventSetNodes and list of EventSetNodes. If None, the input
+                nodes are inferred from the graph. If there are several
+                input nodes, they should be named, and the EventSets are
+                mapped to the input nodes by name.
+            verbose: If >0, prints details about the execution on the standard
+                error output. The larger the number, the more information is
+                displayed.
+            check_execution: If true, the input and output of the op
+                implementation are validated to check any bug in the library
+                internal code. If false, checks are skipped.
+            force_garbage_collector_interval: If set, triggers the garbage
+                collection every "force_garbage_collector_interval" seconds.
+            num_threads: Number of threads used to run the operators. See
+                [`tp.run()`][temporian.run].
+            optimize: If true, the graph is optimized before running it. See
+                [`tp.run()`][temporian.run].
+        """
+
+        if num_threads < 1:
+            raise ValueError(
+                "num_threads should be greater or equal to 1. Got"
+                f" {num_threads}."
+            )
+
+        self._query = query
+        self._verbose = verbose
+        self._check_execution = check_execution
+        self._force_garbage_collector_interval = (
+            force_garbage_collector_interval
+        )
+        self._num_threads = num_threads
+
+        normalized_query = evaluation._normalize_query(query)
+
+        if input is None:
+            graph = infer_graph(inputs=None, outputs=normalized_query)
+            if len(graph.inputs) == 1:
+                input = next(iter(graph.inputs))
+            else:
+                input = normalize_named_nodes(graph.inputs)
+        self._input = input
+
+        if isinstance(input, EventSetNode):
+            self._inputs = [input]
+        elif isinstance(input, list):
+            self._inputs = list(input)
+        elif isinstance(input, dict):
+            self._inputs = list(input.values())
+        else:
+            raise TypeError(
+                f"Input argument must be one of {EventSetNodeCollection}."
+                f" Received {type(input)} instead."
+            )
+
+        input_nodes = set(self._inputs)
+        if optimize:
+            self._optimized_query = optimize_graph(
+                input_nodes, normalized_query
+            )
+        else:
+            self._optimized_query = {node: node for node in normalized_query}
+
+        self._schedule = evaluation.build_schedule(
+            inputs=input_nodes,
+            outputs=set(self._optimized_query.values()),
+            verbose=verbose,
+        )
+        self._implementations = np_eval.build_implementations(self._schedule)
+
+    @property
+    def inputs(self) -> List[EventSetNode]:
+        return self._inputs
+
+    def __call__(
+        self,
+        input: Union[
+            EventSet,
+            List[EventSet],
+            Dict[str, EventSet],
+            Dict[EventSetNode, EventSet],
+        ],
+    ) -> EventSetCollection:
+        """Evaluates the Plan on EventSets.
+
+        Args:
+            input: EventSets to use as input.
+
+        Returns:
+            An object with the same structure as the `query` argument of the
+            Plan containing the results.
+        """
+
+        outputs = np_eval.run_schedule(
+            self._normalize_input(input),
+            self._schedule,
+            verbose=self._verbose,
+            check_execution=self._check_execution,
+            force_garbage_collector_interval=(
+                self._force_garbage_collector_interval
+            ),
+            num_threads=self._num_threads,
+            implementations=self._implementations,
+        )
+        return evaluation._denormalize_outputs(
+            evaluation._map_optimized_outputs(outputs, self._optimized_query),
+            self._query,
+        )
+
+    def _normalize_input(self, input) -> Dict[EventSetNode, EventSet]:
+        """Maps the input EventSets to the input nodes."""
+
+        if isinstance(input, EventSet):
+            if len(self._inputs) != 1:
+                raise ValueError(
+                    f"The plan has {len(self._inputs)} input nodes, but a"
+                    " single EventSet was provided."
+                )
+            normalized_input = {self._inputs[0]: input}
+
+        elif isinstance(input, list):
+            if len(input) != len(self._inputs):
+                raise ValueError(
+                    f"The plan has {len(self._inputs)} input nodes, but"
+                    f" {len(input)} EventSets were provided."
+                )
+            normalized_input = dict(zip(self._inputs, input))
+
+        elif isinstance(input, dict):
+            if all(isinstance(key, EventSetNode) for key in input.keys()):
+                normalized_input = input
+            elif isinstance(self._input, dict):
+                missing_keys = set(self._input.keys()) - set(input.keys())
+                if missing_keys:
+                    raise ValueError(
+                        f"Missing input EventSets for {sorted(missing_keys)}."
+                    )
+                normalized_input = {
+                    node: input[key] for key, node in self._input.items()
+                }
+            else:
+                raise ValueError(
+                    "A dictionary of EventSets is only supported if the"
+                    " inputs of the plan are specified as a dictionary."
+                )
+
+        else:
+            raise TypeError(
+                "The input must be an EventSet, a list of EventSets, or a"
+                f" dictionary of EventSets. Received {input!r} instead."
+            )
+
+        for node in self._schedule.input_nodes:
+            if node not in normalized_input:
+                raise ValueError(f"Missing input EventSet for node {node}.")
+            if normalized_input[node].schema != node.schema:
+                raise ValueError(
+                    "The schema of the input EventSet does not match the"
+                    " schema of the input node.\nEventSet"
+                    f" schema:\n{normalized_input[node].schema}\nNode"
+                    f" schema:\n{node.schema}"
+                )
+        return normalized_input
@@ -0,0 +1,144 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profile class definition."""
+
+import dataclasses
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas
+
+
+@dataclass
+class StepProfile:
+    """Execution profile of an operator.
+
+    Attributes:
+        step_idx: Index of the operator in the schedule.
+        operator_key: Key of the operator e.g. "MOVING_SUM".
+        thread: Index of the thread that ran the operator. Always 0 if the
+            operators are run sequentially.
+        begin_time: Time, in seconds, at which the operator started, relative
+            to the beginning of the evaluation.
+        wall_time: Duration, in seconds, of the operator.
+        cpu_time: CPU time, in seconds, used by the operator. If the
+            operators are run sequentially, this is the CPU time of the
+            process (including the threads used to process the index keys in
+            parallel). Otherwise, this is the CPU time of the thread that ran
+            the operator.
+        num_input_events: Total number of events in the inputs.
+        num_output_events: Total number of events in the outputs.
+        num_index_keys: Total number of index keys in the outputs.
+        allocated_bytes: Size, in bytes, of the output data that is not shared
+            with EventSets already in memory (e.g. the timestamps of an output
+            with the same sampling as its input are not counted).
+        released_bytes: Size, in bytes, of the data released after the
+            operator, because it is not used by any other operator.
+    """
+
+    step_idx: int
+    operator_key: str
+    thread: int
+    begin_time: float
+    wall_time: float
+    cpu_time: float
+    num_input_events: int
+    num_output_events: int
+    num_index_keys: int
+    allocated_bytes: int
+    released_bytes: int
+
+
+@dataclass
+class Profile:
+    """Execution profile of a graph, returned by
+    [`tp.run(..., profile=True)`][temporian.run].
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(timestamps=[1, 2, 3], features={"f": [0, 4, 10]})
+        >>> node = evset.node()
+        >>> output, profile = tp.run(node.moving_sum(5) * 2, evset, profile=True)
+        >>> [step.operator_key for step in profile.steps]
+        ['MOVING_SUM', 'MULTIPLICATION_SCALAR']
+
+        >>> # Look for the most expensive operators
+        >>> df = profile.to_pandas()
+        >>> df = df.sort_values("wall_time", ascending=False)
+
+        >>> # Open the file in chrome://tracing or https://ui.perfetto.dev
+        >>> trace = profile.to_chrome_trace(str(tmp_dir / "profile.json"))
+
+        ```
+
+    Attributes:
+        steps: Profile of each operator, in execution order.
+        wall_time: Total duration, in seconds, of the evaluation.
+    """
+
+    steps: List[StepProfile] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Converts the profile to a pandas DataFrame with one row per
+        operator and one column per `StepProfile` attribute."""
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            [dataclasses.asdict(step) for step in self.steps],
+            columns=[f.name for f in dataclasses.fields(StepProfile)],
+        )
+
+    def to_chrome_trace(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """Converts the profile to the Chrome trace event format.
+
+        The trace can be opened with chrome://tracing or
+        [Perfetto](https://ui.perfetto.dev). Each operator is a "complete"
+        event on the row of the thread that ran it. The other attributes of
+        the operators are available as event arguments.
+
+        Args:
+            path: If set, the trace is saved as a JSON file at this path.
+
+        Returns:
+            The trace, as a JSON serializable dictionary.
+        """
+
+        events = []
+        for step in self.steps:
+            args = dataclasses.asdict(step)
+            for key in ["operator_key", "thread", "begin_time", "wall_time"]:
+                del args[key]
+            events.append(
+                {
+                    "name": step.operator_key,
+                    "cat": "operator",
+                    "ph": "X",
+                    "ts": step.begin_time * 1e6,
+                    "dur": step.wall_time * 1e6,
+                    "pid": 0,
+                    "tid": step.thread,
+                    "args": args,
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+        return trace
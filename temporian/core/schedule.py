@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import List, Set
+from typing import List, Optional, Set
 
 from temporian.core.data.node import EventSetNode
 from temporian.core.operators.base import Operator
@@ -26,8 +26,17 @@ class ScheduleStep:
     # List of nodes that will not be used anymore after "op" is executed.
     released_nodes: List[EventSetNode]
 
+    # Indices, in "Schedule.steps", of the steps computing the inputs of "op".
+    # Used by executors that run independent steps concurrently.
+    dependencies: Set[int] = field(default_factory=set, compare=False)
+
 
 @dataclass
 class Schedule:
     steps: List[ScheduleStep] = field(default_factory=list)
     input_nodes: Set[EventSetNode] = field(default_factory=set)
+
+    # Estimated peak memory usage, in bytes, of the EventSets during the
+    # evaluation. Only set if the schedule was built with the number of events
+    # of the inputs.
+    estimated_peak_memory: Optional[int] = field(default=None, compare=False)
@@ -703,6 +703,12 @@ def _attribute_to_proto(
                 values=[_serialize_dtype(x) for x in value]
             ),
         )
+    # list of floats
+    if isinstance(value, list) and all(isinstance(val, float) for val in value):
+        return pb.Operator.Attribute(
+            key=key,
+            list_float_64=pb.Operator.Attribute.ListFloat64(values=value),
+        )
     # list of index keys
     if isinstance(value, list) and all(isinstance(val, tuple) for val in value):
         return pb.Operator.Attribute(
@@ -734,6 +740,8 @@ def _attribute_from_proto(src: pb.Operator.Attribute) -> base.AttributeType:
         return dict(src.map_str_str.values)
     if src.HasField("list_dtype"):
         return [_unserialize_dtype(x) for x in src.list_dtype.values]
+    if src.HasField("list_float_64"):
+        return list(src.list_float_64.values)
     if src.HasField("list_index_keys"):
         return [_unserialize_index_key(x) for x in src.list_index_keys.values]
     raise ValueError(f"Non supported proto attribute {src}")
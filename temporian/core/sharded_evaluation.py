@@ -0,0 +1,304 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Evaluation of a graph on several processes, each one processing a subset
+of the index keys."""
+
+import multiprocessing
+import sys
+from concurrent import futures
+from multiprocessing import shared_memory
+from typing import List, Set, Tuple
+
+from temporian.core import evaluation
+from temporian.core.data.node import EventSetNode
+from temporian.core.graph import infer_graph
+from temporian.core.typing import (
+    EventSetCollection,
+    EventSetNodeCollection,
+    NodeToEventSetMapping,
+)
+from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.shared_memory import (
+    PackedEventSets,
+    pack_event_sets,
+    unpack_event_sets,
+)
+
+# State of a worker process. Set by "_init_worker".
+_worker_inputs: List[EventSetNode] = []
+_worker_outputs: List[EventSetNode] = []
+_worker_check_execution = True
+
+
+def run_sharded(
+    query: EventSetNodeCollection,
+    input: NodeToEventSetMapping,
+    num_workers: int,
+    verbose: int = 0,
+    check_execution: bool = True,
+) -> EventSetCollection:
+    """Evaluates [`EventSetNodes`][temporian.EventSetNode] on
+    [`EventSets`][temporian.EventSet] using several processes.
+
+    The index keys of the input EventSets are partitioned into `num_workers`
+    shards according to their hash. Each shard is sent to a worker process
+    through shared memory (i.e., the feature values are not pickled), and
+    the worker processes compute the graph on their shard in parallel. The
+    results are then merged.
+
+    Only the operators that process each index key independently of the
+    others can be sharded. Operators that change the index (e.g.
+    [`EventSet.add_index()`][temporian.EventSet.add_index],
+    [`EventSet.drop_index()`][temporian.EventSet.drop_index] or
+    [`EventSet.propagate()`][temporian.EventSet.propagate]), and the
+    operators that depend on them, run in the calling process after the
+    sharded part of the graph.
+
+    `run_sharded` is beneficial for large graphs with many index keys, where
+    the computation is dominated by the per-index python overhead. For
+    graphs dominated by the operator kernels, `tp.run` with
+    `tp.config.num_index_threads > 1` has a lower overhead.
+
+    The worker processes are created with `fork`. On platforms without
+    `fork`, or if `num_workers=1`, `run_sharded` is equivalent to
+    [`tp.run()`][temporian.run].
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3, 1, 2],
+        ...     features={"f": [1, 2, 3, 4, 5], "k": ["a", "a", "a", "b", "b"]},
+        ...     indexes=["k"],
+        ... )
+        >>> node = evset.node()
+        >>> result = tp.run_sharded(node.moving_sum(2), evset, num_workers=2)
+        >>> result == tp.run(node.moving_sum(2), evset)
+        True
+
+        ```
+
+    Args:
+        query: EventSetNodes to compute. Supports EventSetNode, dict of
+            EventSetNodes and list of EventSetNodes.
+        input: Event sets to be used for the computation. Supports the same
+            formats as [`tp.run()`][temporian.run].
+        num_workers: Number of worker processes.
+        verbose: If >0, prints details about the execution on the standard error
+            output. The larger the number, the more information is displayed.
+        check_execution: If true, the input and output of the op implementation
+            are validated to check any bug in the library internal code. If
+            false, checks are skipped.
+
+    Returns:
+        An object with the same structure as `query` containing the results.
+    """
+
+    if num_workers < 1:
+        raise ValueError(
+            f"num_workers should be greater or equal to 1. Got {num_workers}."
+        )
+
+    input = evaluation._normalize_input(input)
+    normalized_query = evaluation._normalize_query(query)
+
+    remote_inputs, remote_outputs = _split_graph(
+        inputs=set(input.keys()), outputs=normalized_query
+    )
+
+    if (
+        num_workers == 1
+        or not remote_outputs
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return evaluation.run(
+            query, input, verbose=verbose, check_execution=check_execution
+        )
+
+    if verbose >= 1:
+        print(
+            (
+                f"Compute {len(remote_outputs)} EventSet(s) on {num_workers}"
+                " worker(s)"
+            ),
+            file=sys.stderr,
+        )
+
+    # Partition the index keys.
+    shards: List[List[EventSet]] = [
+        [EventSet(data={}, schema=node.schema) for node in remote_inputs]
+        for _ in range(num_workers)
+    ]
+    for node_idx, node in enumerate(remote_inputs):
+        evset = input[node]
+        for index_key, index_data in evset.data.items():
+            shard = shards[hash(index_key) % num_workers][node_idx]
+            shard.set_index_value(index_key, index_data, normalize=False)
+        for shard_evsets in shards:
+            shard_evsets[node_idx].name = evset.name
+
+    merged_outputs = [
+        EventSet(data={}, schema=node.schema) for node in remote_outputs
+    ]
+    input_shms: List[shared_memory.SharedMemory] = []
+    try:
+        packed_shards = []
+        for shard_evsets in shards:
+            shm, packed = pack_event_sets(shard_evsets)
+            input_shms.append(shm)
+            packed_shards.append(packed)
+        del shards
+
+        # Note: With "fork", the initializer arguments are not pickled.
+        with futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(remote_inputs, remote_outputs, check_execution),
+        ) as executor:
+            for packed_outputs in executor.map(_run_shard, packed_shards):
+                _merge_outputs(packed_outputs, remote_outputs, merged_outputs)
+    finally:
+        for shm in input_shms:
+            shm.close()
+            shm.unlink()
+
+    # Compute the rest of the graph in this process.
+    coordinator_input = dict(input)
+    coordinator_input.update(zip(remote_outputs, merged_outputs))
+    return evaluation.run(
+        query,
+        coordinator_input,
+        verbose=verbose,
+        check_execution=check_execution,
+    )
+
+
+def _split_graph(
+    inputs: Set[EventSetNode], outputs: Set[EventSetNode]
+) -> Tuple[List[EventSetNode], List[EventSetNode]]:
+    """Lists the nodes computed by the worker processes.
+
+    A node can be computed by the workers if it is derived from the inputs
+    through operators that preserve the index.
+
+    Returns:
+        The input nodes sent to the workers, and the nodes computed by the
+        workers and returned to the calling process.
+    """
+
+    schedule = evaluation.build_schedule(inputs=inputs, outputs=outputs)
+
+    # Nodes that can be computed independently for each index key.
+    shardable: Set[EventSetNode] = {
+        node for node in schedule.input_nodes if node.schema.indexes
+    }
+    remote_outputs: Set[EventSetNode] = set()
+    for step in schedule.steps:
+        op = step.op
+        op_inputs = list(op.inputs.values())
+        op_outputs = list(op.outputs.values())
+        if (
+            op_inputs
+            and all(node in shardable for node in op_inputs)
+            and all(
+                node.schema.indexes == op_inputs[0].schema.indexes
+                for node in op_inputs + op_outputs
+            )
+        ):
+            shardable.update(op_outputs)
+        else:
+            # The op runs in the calling process.
+            remote_outputs.update(
+                node
+                for node in op_inputs
+                if node in shardable and node not in schedule.input_nodes
+            )
+    remote_outputs.update(
+        node
+        for node in outputs
+        if node in shardable and node not in schedule.input_nodes
+    )
+
+    if not remote_outputs:
+        return [], []
+
+    remote_graph = infer_graph(inputs, remote_outputs)
+    return list(remote_graph.inputs), list(remote_outputs)
+
+
+def _init_worker(
+    inputs: List[EventSetNode],
+    outputs: List[EventSetNode],
+    check_execution: bool,
+) -> None:
+    global _worker_inputs, _worker_outputs, _worker_check_execution
+    _worker_inputs = inputs
+    _worker_outputs = outputs
+    _worker_check_execution = check_execution
+
+
+def _run_shard(packed_inputs: PackedEventSets) -> PackedEventSets:
+    """Computes the outputs of the graph on a shard. Runs in a worker."""
+
+    input_shm = shared_memory.SharedMemory(
+        name=packed_inputs.shared_memory_name
+    )
+    inputs = unpack_event_sets(
+        input_shm.buf,
+        packed_inputs,
+        schemas=[node.schema for node in _worker_inputs],
+        copy=False,
+    )
+    outputs = evaluation.run(
+        _worker_outputs,
+        dict(zip(_worker_inputs, inputs)),
+        check_execution=_worker_check_execution,
+    )
+    output_shm, packed_outputs = pack_event_sets(outputs)
+
+    # The calling process unlinks the output shared memory block.
+    output_shm.close()
+    del inputs, outputs
+    try:
+        input_shm.close()
+    except BufferError:
+        # Some arrays still reference the block. The block is released when
+        # the worker exits.
+        pass
+    return packed_outputs
+
+
+def _merge_outputs(
+    packed_outputs: PackedEventSets,
+    nodes: List[EventSetNode],
+    merged_outputs: List[EventSet],
+) -> None:
+    """Adds the outputs of a worker to the merged outputs."""
+
+    shm = shared_memory.SharedMemory(name=packed_outputs.shared_memory_name)
+    try:
+        outputs = unpack_event_sets(
+            shm.buf,
+            packed_outputs,
+            schemas=[node.schema for node in nodes],
+            copy=True,
+        )
+    finally:
+        shm.close()
+        shm.unlink()
+
+    for output, merged_output in zip(outputs, merged_outputs):
+        merged_output.name = output.name
+        merged_output.data.update(output.data)
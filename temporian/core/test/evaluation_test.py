@@ -126,6 +126,103 @@ class EvaluationTest(absltest.TestCase):
             ],
         )
 
+    def test_schedule_dependencies(self):
+        i1 = utils.create_input_node()
+        o2 = utils.OpI1O1(i1)
+        i3 = utils.create_input_node()
+        o4 = utils.OpI1O1(i3)
+        o5 = utils.OpI2O1(o2.outputs["output"], o4.outputs["output"])
+
+        schedule = evaluation.build_schedule(
+            inputs={i1, i3}, outputs={o5.outputs["output"]}
+        )
+
+        self.assertEqual(
+            [step.dependencies for step in schedule.steps],
+            [set(), set(), {0, 1}],
+        )
+
+    def test_schedule_minimize_memory(self):
+        features = [(f"f{i}", tp.float64) for i in range(10)]
+        x = tp.input_node(features)
+        y = tp.input_node(features)
+        # Same size as "x". Can be computed only after "x" is released.
+        x_sum = x.moving_sum(1)
+        # Can release the features of "y".
+        y_count = y.moving_count(1)
+
+        # Each input has 100 timestamps (800 bytes) and 10 features of 100
+        # float64 values (8000 bytes).
+        schedule = evaluation.build_schedule(
+            inputs={x, y},
+            outputs={x_sum, y_count},
+            input_num_events={x: 100, y: 100},
+        )
+        self.assertEqual(
+            [step.op for step in schedule.steps],
+            [y_count.creator, x_sum.creator],
+        )
+        # Inputs + "y_count" (100 int32 values). The features of "y" are
+        # released before "x_sum" is computed.
+        self.assertEqual(schedule.estimated_peak_memory, 2 * 8800 + 400)
+
+        # By default, the operators are executed in creation order.
+        schedule = evaluation.build_schedule(
+            inputs={x, y}, outputs={x_sum, y_count}
+        )
+        self.assertEqual(
+            [step.op for step in schedule.steps],
+            [x_sum.creator, y_count.creator],
+        )
+        self.assertIsNone(schedule.estimated_peak_memory)
+
+    def test_schedule_minimize_memory_shared_data(self):
+        node = tp.input_node([("a", tp.float64), ("b", tp.int32)])
+        # "select" and "filter" re-use the data of their input.
+        selected = node["a"]
+        filtered = node.filter(selected > 0)
+
+        schedule = evaluation.build_schedule(
+            inputs={node},
+            outputs={selected, filtered},
+            input_num_events={node: 10},
+        )
+        # Input: 10 * (8 + 8 + 4). Condition: 10 * 1. Filter: 10 * (8 + 8 + 4).
+        self.assertEqual(schedule.estimated_peak_memory, 200 + 10 + 200)
+
+    def test_run_minimize_memory(self):
+        evset = utils.create_input_event_set()
+        node = evset.node()
+        output = node.moving_sum(2) + node.moving_sum(3) * node.moving_sum(4)
+        self.assertEqual(
+            evaluation.run(output, evset, minimize_memory=True),
+            evaluation.run(output, evset),
+        )
+
+    def test_run_num_threads(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [1, 1, 1, 2, 2, 2],
+            },
+            indexes=["b"],
+        )
+        node = evset.node()
+        branches = [node.moving_sum(w) for w in range(1, 10)]
+        output = tp.glue(*[b.prefix(f"w{i}_") for i, b in enumerate(branches)])
+        output = output + output
+
+        expected = evaluation.run(output, evset)
+        for num_threads in [2, 4]:
+            result = evaluation.run(output, evset, num_threads=num_threads)
+            self.assertEqual(result, expected)
+
+    def test_run_num_threads_invalid(self):
+        evset = utils.create_input_event_set()
+        with self.assertRaisesRegex(ValueError, "num_threads"):
+            evaluation.run(evset.node(), evset, num_threads=0)
+
     def test_run_value(self):
         i1 = utils.create_input_node()
         result = evaluation.run(i1, {i1: utils.create_input_event_set()})
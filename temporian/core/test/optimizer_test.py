@@ -0,0 +1,283 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Set
+
+import numpy as np
+from absl.testing import absltest
+
+import temporian as tp
+from temporian.core import optimizer
+from temporian.core.data.node import EventSetNode
+from temporian.core.evaluation import build_schedule
+from temporian.implementation.numpy.data.io import event_set
+
+
+class OptimizerTest(absltest.TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0],
+                "b": [5.0, 6.0, 7.0, 8.0],
+                "c": [1, 2, 3, 4],
+            },
+        )
+        self.node = self.evset.node()
+
+    def _optimized_operators(self, outputs: Set[EventSetNode]) -> List[str]:
+        mapping = optimizer.optimize({self.node}, outputs)
+        for node, optimized_node in mapping.items():
+            self.assertEqual(node.schema, optimized_node.schema)
+        schedule = build_schedule({self.node}, set(mapping.values()))
+        return [step.op.definition.key for step in schedule.steps]
+
+    def _check_results(self, query):
+        expected = tp.run(query, self.evset, optimize=False)
+        result = tp.run(query, self.evset)
+        self.assertEqual(result, expected)
+
+    def test_common_subexpressions(self):
+        x = self.node.moving_sum(2) + self.node.moving_sum(2)
+        y = self.node.moving_sum(2) * self.node.moving_sum(3)
+
+        self.assertEqual(
+            self._optimized_operators({x, y}),
+            [
+                "MOVING_SUM",
+                "ADDITION",
+                "MOVING_SUM",
+                "MULTIPLICATION",
+            ],
+        )
+        self._check_results([x, y])
+
+    def test_common_subexpressions_different_attributes(self):
+        x = self.node.rename({"a": "x"})
+        y = self.node.rename({"a": "y"})
+        self.assertEqual(
+            self._optimized_operators({x, y}), ["RENAME", "RENAME"]
+        )
+
+    def test_common_subexpressions_equal_attributes(self):
+        x = self.node["a"] * 0.0
+        y = self.node["a"] * -0.0
+        self.assertEqual(
+            self._optimized_operators({x, y}),
+            ["SELECT", "MULTIPLICATION_SCALAR", "MULTIPLICATION_SCALAR"],
+        )
+        result_x, result_y = tp.run([x, y], self.evset)
+        self.assertFalse(
+            np.signbit(result_x.get_index_value(()).features[0]).any()
+        )
+        self.assertTrue(
+            np.signbit(result_y.get_index_value(()).features[0]).all()
+        )
+
+        x = self.node["a"] + 1
+        y = self.node["a"] + 1.0
+        self.assertEqual(
+            self._optimized_operators({x, y}),
+            ["SELECT", "ADDITION_SCALAR", "ADDITION_SCALAR"],
+        )
+
+    def test_duplicated_outputs(self):
+        x = self.node.moving_sum(2)
+        y = self.node.moving_sum(2)
+        self.assertEqual(self._optimized_operators({x, y}), ["MOVING_SUM"])
+
+        result_x, result_y = tp.run([x, y], self.evset)
+        self.assertIs(result_x.node(), x)
+        self.assertIs(result_y.node(), y)
+        self.assertEqual(result_x, result_y)
+
+    def test_prune_glue(self):
+        x = tp.glue(
+            self.node["a"].moving_sum(2).prefix("x_"),
+            self.node["b"].moving_sum(3).prefix("y_"),
+            self.node["c"].cast(float),
+        )[["x_a", "c"]]
+
+        self.assertEqual(
+            self._optimized_operators({x}),
+            [
+                "SELECT",
+                "MOVING_SUM",
+                "PREFIX",
+                "SELECT",
+                "CAST",
+                "GLUE",
+            ],
+        )
+        self._check_results(x)
+
+    def test_prune_glue_single_input(self):
+        x = tp.glue(
+            self.node["a"].moving_sum(2).prefix("x_"),
+            self.node["b"].moving_sum(3).prefix("y_"),
+        )
+        y = x["x_a"] + x["x_a"]
+
+        self.assertEqual(
+            self._optimized_operators({y}),
+            ["SELECT", "MOVING_SUM", "PREFIX", "ADDITION"],
+        )
+        self._check_results(y)
+
+    def test_glue_used_by_other_operator(self):
+        x = tp.glue(
+            self.node["a"].moving_sum(2).prefix("x_"),
+            self.node["b"].moving_sum(3).prefix("y_"),
+        )
+        self.assertLen(self._optimized_operators({x["x_a"], x.lag(1)}), 9)
+        self._check_results([x["x_a"], x.lag(1)])
+
+    def test_prune_window(self):
+        x = self.node.moving_sum(2)[["a"]]
+        self.assertEqual(
+            self._optimized_operators({x}), ["SELECT", "MOVING_SUM"]
+        )
+        self._check_results(x)
+
+    def test_prune_window_several_window_lengths(self):
+        x = self.node.moving_sum([2, 3])[["b_3s"]]
+        mapping = optimizer.optimize({self.node}, {x})
+        schedule = build_schedule({self.node}, set(mapping.values()))
+        self.assertEqual(
+            [step.op.definition.key for step in schedule.steps],
+            ["SELECT", "MOVING_SUM", "SELECT"],
+        )
+        self.assertEqual(
+            schedule.steps[1].op.outputs["output"].schema.feature_names(),
+            ["b_2s", "b_3s"],
+        )
+        self._check_results(x)
+
+    def test_prune_moving_aggregate(self):
+        x = self.node.moving_aggregate(2, ops=["sum", "max"])[["b_max"]]
+        mapping = optimizer.optimize({self.node}, {x})
+        schedule = build_schedule({self.node}, set(mapping.values()))
+        self.assertEqual(
+            [step.op.definition.key for step in schedule.steps],
+            ["SELECT", "MOVING_AGGREGATE", "SELECT"],
+        )
+        self.assertEqual(
+            schedule.steps[1].op.outputs["output"].schema.feature_names(),
+            ["b_sum", "b_max"],
+        )
+        self._check_results(x)
+
+    def test_prune_feature_wise_chain(self):
+        x = (
+            self.node.lag(1)
+            .resample(self.node)
+            .prefix("p_")
+            .rename({"p_c": "x"})
+            .cast(tp.float32)
+            .simple_moving_average(2)
+            .abs()["x"]
+        )
+
+        mapping = optimizer.optimize({self.node}, {x})
+        schedule = build_schedule({self.node}, set(mapping.values()))
+        self.assertEqual(schedule.steps[0].op.definition.key, "SELECT")
+        # Only "c" is computed.
+        for step in schedule.steps:
+            self.assertLen(step.op.outputs["output"].schema.features, 1)
+        self._check_results(x)
+
+    def test_prune_sampling_only(self):
+        x = self.node.moving_sum(2).moving_count(3)
+        y = self.node["a"].resample(self.node.lag(1))
+
+        mapping = optimizer.optimize({self.node}, {x, y})
+        schedule = build_schedule({self.node}, set(mapping.values()))
+        for step in schedule.steps:
+            if step.op.definition.key in ["MOVING_SUM", "LAG"]:
+                self.assertEmpty(step.op.outputs["output"].schema.features)
+        self._check_results([x, y])
+
+    def test_prune_join(self):
+        right = event_set(
+            timestamps=[1, 3],
+            features={"d": [1.0, 2.0], "e": [3.0, 4.0]},
+        )
+        right_node = right.node()
+        x = self.node.join(right_node.moving_sum(2))[["a", "d"]]
+
+        mapping = optimizer.optimize({self.node, right_node}, {x})
+        schedule = build_schedule(
+            {self.node, right_node}, set(mapping.values())
+        )
+        join_op = schedule.steps[-1].op
+        self.assertEqual(join_op.definition.key, "JOIN")
+        self.assertEqual(
+            join_op.outputs["output"].schema.feature_names(), ["a", "d"]
+        )
+        self.assertEqual(
+            tp.run(x, {self.node: self.evset, right_node: right}),
+            tp.run(
+                x, {self.node: self.evset, right_node: right}, optimize=False
+            ),
+        )
+
+    def test_fuse_elementwise(self):
+        a, b = self.node["a"], self.node["b"]
+        x = ((a * 2 + b).abs().log() > 0.5).where(a, b)
+
+        self.assertEqual(
+            self._optimized_operators({x}),
+            ["SELECT", "SELECT", "FUSED_ELEMENTWISE"],
+        )
+        self._check_results(x)
+
+    def test_fuse_elementwise_shared_intermediate(self):
+        # "y" is used by two operators, and "z" is an output.
+        y = self.node["a"] * 2
+        z = y + 1
+        x = (y - z).abs()
+
+        self.assertEqual(
+            self._optimized_operators({x, z}),
+            [
+                "SELECT",
+                "MULTIPLICATION_SCALAR",
+                "ADDITION_SCALAR",
+                "FUSED_ELEMENTWISE",
+            ],
+        )
+        self._check_results([x, z])
+
+    def test_fuse_elementwise_not_elementwise(self):
+        x = (self.node["a"] + 1).moving_sum(2) * 2
+        self.assertEqual(
+            self._optimized_operators({x}),
+            [
+                "SELECT",
+                "ADDITION_SCALAR",
+                "MOVING_SUM",
+                "MULTIPLICATION_SCALAR",
+            ],
+        )
+
+    def test_input_is_output(self):
+        x = self.node.moving_sum(2)
+        self.assertEqual(
+            optimizer.optimize({self.node}, {self.node, x}),
+            {self.node: self.node, x: x},
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
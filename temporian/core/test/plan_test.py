@@ -0,0 +1,90 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from absl.testing import absltest
+
+import temporian as tp
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.io import event_set
+
+
+class PlanTest(absltest.TestCase):
+    def setUp(self):
+        self.a = tp.input_node([("f", tp.float64)], name="a")
+        self.b = tp.input_node(
+            [("g", tp.float64)], same_sampling_as=self.a, name="b"
+        )
+        self.output = self.a.moving_sum(2) + self.b.rename("f")
+
+    def _input(self, i: float):
+        evset_a = event_set(timestamps=[1, 2, 3], features={"f": [i, i, i]})
+        evset_b = event_set(
+            timestamps=[1, 2, 3],
+            features={"g": [1.0, 2.0, 3.0]},
+            same_sampling_as=evset_a,
+        )
+        return evset_a, evset_b
+
+    def test_same_as_run(self):
+        plan = tp.Plan({"x": self.output}, [self.a, self.b])
+        for i in range(3):
+            evset_a, evset_b = self._input(float(i))
+            expected = tp.run(
+                {"x": self.output}, {self.a: evset_a, self.b: evset_b}
+            )
+            self.assertEqual(plan([evset_a, evset_b]), expected)
+
+    def test_input_formats(self):
+        evset_a, evset_b = self._input(1.0)
+        expected = tp.run(self.output, {self.a: evset_a, self.b: evset_b})
+
+        plan = tp.Plan(self.output, {"x": self.a, "y": self.b})
+        self.assertEqual(plan({"x": evset_a, "y": evset_b}), expected)
+        self.assertEqual(plan({self.a: evset_a, self.b: evset_b}), expected)
+
+        # Inputs inferred and mapped by name.
+        plan = tp.Plan(self.output)
+        self.assertEqual(plan({"a": evset_a, "b": evset_b}), expected)
+
+        with self.assertRaisesRegex(ValueError, "single EventSet"):
+            plan(evset_a)
+
+        with self.assertRaisesRegex(ValueError, "Missing input"):
+            plan({"a": evset_a})
+
+    def test_single_input(self):
+        evset_a, _ = self._input(1.0)
+        node = self.a.moving_sum(2)
+        plan = tp.Plan([node], self.a)
+        self.assertEqual(plan(evset_a), [tp.run(node, {self.a: evset_a})])
+
+    def test_wrong_schema(self):
+        plan = tp.Plan(self.a.moving_sum(2), self.a)
+        with self.assertRaisesRegex(ValueError, "schema"):
+            plan(event_set(timestamps=[1], features={"f": [1]}))
+
+    def test_implementations_are_cached(self):
+        plan = tp.Plan(self.output, [self.a, self.b])
+        with mock.patch.object(
+            implementation_lib, "get_implementation_class"
+        ) as get_implementation_class:
+            plan(list(self._input(1.0)))
+            plan(list(self._input(2.0)))
+        get_implementation_class.assert_not_called()
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,123 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+import temporian as tp
+
+
+class ProfileTest(parameterized.TestCase):
+    def setUp(self):
+        self.evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": ["x", "x", "x", "y", "y", "y"],
+            },
+            indexes=["b"],
+        )
+        node = self.evset.node()
+        self.moving_sum = node.moving_sum(2)
+        self.filtered = self.moving_sum.filter(self.moving_sum["a"] > 4)
+
+    @parameterized.parameters(1, 2)
+    def test_run(self, num_threads: int):
+        result, profile = tp.run(
+            self.filtered,
+            self.evset,
+            num_threads=num_threads,
+            profile=True,
+            optimize=False,
+        )
+        self.assertEqual(result, tp.run(self.filtered, self.evset))
+
+        self.assertEqual(
+            [step.operator_key for step in profile.steps],
+            ["MOVING_SUM", "SELECT", "GREATER_SCALAR", "FILTER"],
+        )
+        self.assertEqual(
+            [step.step_idx for step in profile.steps], [0, 1, 2, 3]
+        )
+        self.assertEqual(
+            [step.num_input_events for step in profile.steps], [6, 6, 6, 12]
+        )
+        self.assertEqual(
+            [step.num_output_events for step in profile.steps], [6, 6, 6, 3]
+        )
+        self.assertEqual(
+            [step.num_index_keys for step in profile.steps], [2, 2, 2, 2]
+        )
+        # The moving sum re-uses the timestamps of the input, allocates 6
+        # float64 values, and releases the input values (but not the
+        # timestamps). The select re-uses the data of the moving sum. The
+        # condition allocates 6 booleans. The filter allocates 3 timestamps and
+        # 3 float64 values, and releases the condition and the moving sum.
+        self.assertEqual(
+            [step.allocated_bytes for step in profile.steps],
+            [6 * 8, 0, 6 * 1, 3 * 8 + 3 * 8],
+        )
+        self.assertEqual(
+            [step.released_bytes for step in profile.steps],
+            [6 * 8, 0, 0, 6 * 8 + 6 * 8 + 6 * 1],
+        )
+
+        for step in profile.steps:
+            self.assertGreaterEqual(step.begin_time, 0)
+            self.assertGreaterEqual(step.wall_time, 0)
+            self.assertGreaterEqual(step.cpu_time, 0)
+            self.assertLessEqual(
+                step.begin_time + step.wall_time, profile.wall_time
+            )
+
+    def test_run_without_profile(self):
+        result = tp.run(self.filtered, self.evset)
+        self.assertIsInstance(result, tp.EventSet)
+
+    def test_to_pandas(self):
+        _, profile = tp.run(self.filtered, self.evset, profile=True)
+        df = profile.to_pandas()
+        self.assertLen(df, len(profile.steps))
+        self.assertEqual(
+            list(df["operator_key"]),
+            [step.operator_key for step in profile.steps],
+        )
+        self.assertIn("allocated_bytes", df.columns)
+
+    def test_to_chrome_trace(self):
+        _, profile = tp.run(self.filtered, self.evset, profile=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trace.json")
+            trace = profile.to_chrome_trace(path)
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), trace)
+
+        events = trace["traceEvents"]
+        self.assertLen(events, len(profile.steps))
+        step = profile.steps[0]
+        self.assertEqual(events[0]["name"], step.operator_key)
+        self.assertEqual(events[0]["ph"], "X")
+        self.assertEqual(events[0]["tid"], 0)
+        self.assertAlmostEqual(events[0]["dur"], step.wall_time * 1e6)
+        self.assertEqual(
+            events[0]["args"]["num_output_events"], step.num_output_events
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
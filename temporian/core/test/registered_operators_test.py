@@ -59,6 +59,7 @@ class RegisteredOperatorsTest(absltest.TestCase):
             "FILTER_MAX_MOVING_COUNT",
             "FLOORDIV",
             "FLOORDIV_SCALAR",
+            "FUSED_ELEMENTWISE",
             "GLUE",
             "GREATER",
             "GREATER_EQUAL",
@@ -77,10 +78,15 @@ class RegisteredOperatorsTest(absltest.TestCase):
             "MAP",
             "MODULO",
             "MODULO_SCALAR",
+            "MOVING_AGGREGATE",
+            "MOVING_APPROX_DISTINCT_COUNT",
+            "MOVING_APPROX_HEAVY_HITTERS",
+            "MOVING_APPROX_QUANTILE",
             "MOVING_COUNT",
             "MOVING_MAX",
             "MOVING_MIN",
             "MOVING_PRODUCT",
+            "MOVING_QUANTILE",
             "MOVING_STANDARD_DEVIATION",
             "MOVING_SUM",
             "MULTIPLICATION",
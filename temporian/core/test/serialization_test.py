@@ -195,6 +195,7 @@ class SerializationTest(absltest.TestCase):
             "attr_bool": True,
             "attr_map": {"good": "bye", "nice": "to", "meet": "you"},
             "attr_list_dtypes": [DType.FLOAT32, DType.STRING],
+            "attr_list_floats": [1.5, 3600.0],
         }
         i_event = utils.create_input_node()
         operator = utils.OpWithAttributes(i_event, **attributes)
@@ -0,0 +1,87 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from absl.testing import absltest
+
+import temporian as tp
+from temporian.core import sharded_evaluation
+from temporian.implementation.numpy.data.io import event_set
+
+
+class ShardedEvaluationTest(absltest.TestCase):
+    def setUp(self):
+        num_events = 500
+        rng = np.random.default_rng(seed=0)
+        self.evset = event_set(
+            timestamps=rng.uniform(0, 100, size=num_events),
+            features={
+                "f": rng.normal(size=num_events),
+                "s": rng.choice(["x", "yy", "zzz"], size=num_events),
+                "k": rng.integers(0, 30, size=num_events),
+            },
+            indexes=["k"],
+        )
+
+    def test_same_as_run(self):
+        node = self.evset.node()
+        a = node["f"].moving_sum(5.0)
+        b = a + node["f"]
+        c = tp.glue(b.prefix("b_"), node["s"], a.prefix("a_"))
+        query = {"a": a, "c": c, "d": c.since_last()}
+
+        expected = tp.run(query, self.evset)
+        result = tp.run_sharded(query, self.evset, num_workers=3)
+        self.assertEqual(result, expected)
+
+    def test_index_change_on_coordinator(self):
+        node = self.evset.node()
+        a = node["f"].moving_sum(5.0)
+        b = tp.glue(a, node["s"]).drop_index("k")
+        c = b.add_index("s").moving_sum(2.0)
+
+        expected = tp.run([b, c], self.evset)
+        result = tp.run_sharded([b, c], self.evset, num_workers=2)
+        self.assertEqual(result, expected)
+
+    def test_split_graph(self):
+        node = self.evset.node()
+        a = node["f"].moving_sum(5.0)
+        b = a.drop_index("k")
+        c = b.moving_sum(2.0)
+
+        inputs, outputs = sharded_evaluation._split_graph(
+            inputs={node}, outputs={a, c}
+        )
+        self.assertEqual(inputs, [node])
+        self.assertEqual(outputs, [a])
+
+    def test_no_index(self):
+        evset = event_set(timestamps=[1, 2, 3], features={"f": [1, 2, 3]})
+        node = evset.node()
+        _, outputs = sharded_evaluation._split_graph(
+            inputs={node}, outputs={node.moving_sum(2)}
+        )
+        self.assertEqual(outputs, [])
+
+        result = tp.run_sharded(node.moving_sum(2), evset, num_workers=2)
+        self.assertEqual(result, tp.run(node.moving_sum(2), evset))
+
+    def test_invalid_num_workers(self):
+        with self.assertRaisesRegex(ValueError, "num_workers"):
+            tp.run_sharded(self.evset.node(), self.evset, num_workers=0)
+
+
+if __name__ == "__main__":
+    absltest.main()
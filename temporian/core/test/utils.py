@@ -233,6 +233,10 @@ class OpWithAttributes(base.Operator):
                     key="attr_list_dtypes",
                     type=pb.OperatorDef.Attribute.Type.LIST_DTYPE,
                 ),
+                pb.OperatorDef.Attribute(
+                    key="attr_list_floats",
+                    type=pb.OperatorDef.Attribute.Type.LIST_FLOAT_64,
+                ),
             ],
         )
 
@@ -246,6 +250,7 @@ class OpWithAttributes(base.Operator):
         attr_bool: bool,
         attr_map: Dict[str, str],
         attr_list_dtypes: List[DType],
+        attr_list_floats: List[float],
     ):
         super().__init__()
         self.add_attribute("attr_int", attr_int)
@@ -255,6 +260,7 @@ class OpWithAttributes(base.Operator):
         self.add_attribute("attr_bool", attr_bool)
         self.add_attribute("attr_map", attr_map)
         self.add_attribute("attr_list_dtypes", attr_list_dtypes)
+        self.add_attribute("attr_list_floats", attr_list_floats)
 
         self.add_input("input", input)
         self.add_output(
@@ -95,7 +95,7 @@ If receiving a single IndexKey, it is equivalent to receiving a list with a
 single IndexKey.
 """
 
-WindowLength = Union[Duration, EventSetOrNode]
+WindowLength = Union[Duration, List[Duration], EventSetOrNode]
 """Window length of a moving window operator.
 
 A window length can be either constant or variable.
@@ -104,6 +104,12 @@ A constant window length is specified with a
 [Duration][temporian.duration.Duration]. For example, `window_length=5.0` or
 `window_length=tp.duration.days(4)`.
 
+Several constant window lengths can be specified with a list of durations. For
+example, `window_length=[tp.duration.hours(1), tp.duration.days(1)]`. The
+windows of all the lengths are computed in a single pass over the data, and
+each input feature produces one output feature per window length, suffixed
+with the window length (e.g. "value_1h" and "value_1d").
+
 A variable window length is specified with an [EventSet][temporian.EventSet]
 containing a single float64 feature. This EventSet can have the same sampling as
 the input EventSet or a different one, in which case the output will have the
@@ -0,0 +1,186 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dictionary encoding of string features.
+
+A dictionary encoded string feature is stored as int32 codes in a vocabulary of
+unique values. The vocabulary is shared by all the index keys of an EventSet,
+and by the EventSets computed from it (e.g. with `filter` or `add_index`).
+
+Dictionary encoded features have the `tp.str_` dtype. Operator implementations
+that do not support them (see
+`OperatorImplementation.supports_dictionary_encoding`) receive decoded
+features.
+"""
+
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Numpy type of the codes.
+CODE_DTYPE = np.int32
+
+
+class DictionaryEncodedArray(np.ndarray):
+    """Array of strings stored as int32 codes in a vocabulary.
+
+    The codes are the values of the array. Slicing, indexing and masking the
+    array returns a DictionaryEncodedArray with the same vocabulary object.
+
+    Attributes:
+        vocabulary: Numpy array of unique np.bytes_ values.
+    """
+
+    vocabulary: np.ndarray
+
+    def __new__(
+        cls, codes: np.ndarray, vocabulary: np.ndarray
+    ) -> "DictionaryEncodedArray":
+        array = np.asarray(codes, dtype=CODE_DTYPE).view(cls)
+        array.vocabulary = vocabulary
+        return array
+
+    def __array_finalize__(self, obj: Optional[np.ndarray]) -> None:
+        if obj is not None:
+            self.vocabulary = getattr(obj, "vocabulary", None)
+
+    def __reduce__(self):
+        return (
+            DictionaryEncodedArray,
+            (np.asarray(self), self.vocabulary),
+        )
+
+    @property
+    def codes(self) -> np.ndarray:
+        """The codes, as a regular numpy array."""
+
+        return self.view(np.ndarray)
+
+    def decode(self) -> np.ndarray:
+        """Values of the array, as np.bytes_."""
+
+        return self.vocabulary[self.codes]
+
+
+def is_encoded(values: np.ndarray) -> bool:
+    """Tests if an array is dictionary encoded."""
+
+    return isinstance(values, DictionaryEncodedArray)
+
+
+def value_type(values: np.ndarray) -> Any:
+    """Numpy type of the values of an array, dictionary encoded or not."""
+
+    if isinstance(values, DictionaryEncodedArray):
+        return values.vocabulary.dtype.type
+    return values.dtype.type
+
+
+def encode(values: np.ndarray) -> DictionaryEncodedArray:
+    """Dictionary encodes an array of np.bytes_.
+
+    The vocabulary is sorted.
+    """
+
+    if isinstance(values, DictionaryEncodedArray):
+        return values
+    vocabulary, codes = np.unique(values, return_inverse=True)
+    return DictionaryEncodedArray(codes, vocabulary)
+
+
+def decode(values: np.ndarray) -> np.ndarray:
+    """Decodes an array if it is dictionary encoded."""
+
+    if isinstance(values, DictionaryEncodedArray):
+        return values.decode()
+    return values
+
+
+def lookup(values: DictionaryEncodedArray, value: Union[str, bytes]) -> int:
+    """Code of a value in the vocabulary of an array, or -1 if the value is not
+    in the vocabulary."""
+
+    if isinstance(value, str):
+        value = value.encode()
+    matches = np.flatnonzero(values.vocabulary == value)
+    return int(matches[0]) if len(matches) > 0 else -1
+
+
+def concatenate(arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """Concatenates arrays, possibly dictionary encoded.
+
+    If all the arrays are dictionary encoded, the result is dictionary encoded.
+    The vocabularies are merged if the arrays don't share the same one.
+    """
+
+    encoded = [isinstance(array, DictionaryEncodedArray) for array in arrays]
+    if not any(encoded):
+        return np.concatenate(arrays)
+    if not all(encoded):
+        return np.concatenate([decode(array) for array in arrays])
+
+    vocabulary = arrays[0].vocabulary
+    if all(array.vocabulary is vocabulary for array in arrays):
+        return DictionaryEncodedArray(
+            np.concatenate([array.codes for array in arrays]), vocabulary
+        )
+
+    vocabulary = np.unique(np.concatenate([a.vocabulary for a in arrays]))
+    codes: List[np.ndarray] = [
+        np.searchsorted(vocabulary, array.vocabulary)[array.codes]
+        for array in arrays
+    ]
+    return DictionaryEncodedArray(np.concatenate(codes), vocabulary)
+
+
+def from_codes(
+    codes: np.ndarray, vocabulary: np.ndarray
+) -> DictionaryEncodedArray:
+    """Creates a dictionary encoded array from codes and a vocabulary.
+
+    Negative codes are missing values. They are replaced by the empty string,
+    like for non dictionary encoded string features.
+    """
+
+    codes = np.asarray(codes, dtype=CODE_DTYPE)
+    if np.any(codes < 0):
+        missing = np.flatnonzero(vocabulary == b"")
+        if len(missing) == 0:
+            vocabulary = np.append(vocabulary, b"")
+            missing = [len(vocabulary) - 1]
+        codes = np.where(codes < 0, missing[0], codes).astype(CODE_DTYPE)
+    return DictionaryEncodedArray(codes, vocabulary)
+
+
+def from_pandas_categorical(values: Any) -> DictionaryEncodedArray:
+    """Converts a pandas Categorical of strings.
+
+    Missing values are replaced by the empty string.
+    """
+
+    vocabulary = np.char.encode(
+        np.asarray(values.categories, dtype=str), "UTF-8"
+    )
+    return from_codes(values.codes, vocabulary)
+
+
+def to_pandas_categorical(values: DictionaryEncodedArray, to_str: bool) -> Any:
+    """Converts a dictionary encoded array into a pandas Categorical."""
+
+    import pandas as pd
+
+    categories = values.vocabulary
+    if to_str:
+        categories = categories.astype(str)
+    return pd.Categorical.from_codes(values.codes, categories=categories)
@@ -8,6 +8,7 @@ from temporian.utils import string
 from temporian.utils import config
 from temporian.core.data.dtype import DType
 from temporian.core.data.duration_utils import convert_timestamp_to_datetime
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.event_set import EventSet
 
 ELLIPSIS = "…"
@@ -103,7 +104,7 @@ def display_html(evset: EventSet) -> str:
             )
             display_features = (
                 [
-                    np.concatenate(
+                    dictionary_encoding.concatenate(
                         (
                             values[:half_max_timestamps],
                             values[-half_max_timestamps:],
@@ -114,6 +115,9 @@ def display_html(evset: EventSet) -> str:
                 if num_timestamps > max_timestamps
                 else index_data.features
             )
+        display_features = [
+            dictionary_encoding.decode(values) for values in display_features
+        ]
 
         # Display index values
         html_index_value = html_div(dom)
@@ -457,5 +461,6 @@ def repr_features_text(evset: EventSet, features: List[np.ndarray]) -> str:
             feature_repr.append("...")
             break
 
+        feature_data = dictionary_encoding.decode(feature_data)
         feature_repr.append(f"'{feature_schema.name}': {feature_data}")
     return "\n".join(feature_repr)
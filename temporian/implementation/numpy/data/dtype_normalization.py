@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 import logging
+import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -23,6 +24,7 @@ import numpy as np
 from temporian.core.data.dtype import PY_TYPE_TO_DTYPE, DType
 from temporian.core.data.duration_utils import datetime64_array_to_float64
 from temporian.core.data.node import EventSetNode
+from temporian.implementation.numpy.data import dictionary_encoding
 
 if TYPE_CHECKING:
     from temporian.core.typing import (
@@ -98,7 +100,9 @@ def numpy_array_to_tp_dtype(
 ) -> DType:
     """Gets the matching temporian dtype of a numpy array."""
 
-    return numpy_dtype_to_tp_dtype(feature_name, numpy_array.dtype.type)
+    return numpy_dtype_to_tp_dtype(
+        feature_name, dictionary_encoding.value_type(numpy_array)
+    )
 
 
 def tp_dtype_to_np_dtype(dtype: DType) -> Any:
@@ -122,8 +126,21 @@ def normalize_features(
         """Encode string/object/bytes to np.bytes, using UTF-8 encoding"""
         return np.char.encode(feat_array, "UTF-8")
 
+    # Pandas values can only be given if pandas is already imported.
+    pd = sys.modules.get("pandas")
+
+    # Pandas categorical strings are dictionary encoded
+    if pd is not None and isinstance(feature_values, pd.Series):
+        if isinstance(feature_values.dtype, pd.CategoricalDtype):
+            feature_values = feature_values.array
+    if pd is not None and isinstance(feature_values, pd.Categorical):
+        if feature_values.categories.inferred_type in ["string", "bytes"]:
+            logging.debug("From pandas.Categorical")
+            return dictionary_encoding.from_pandas_categorical(feature_values)
+        feature_values = np.asarray(feature_values)
+
     # Convert pandas, list, tuples -> np.ndarray
-    if str(type(feature_values)) == "<class 'pandas.core.series.Series'>":
+    if pd is not None and isinstance(feature_values, pd.Series):
         logging.debug("From pandas.Series")
         if feature_values.dtype == "object":
             feature_values = feature_values.fillna("")
@@ -18,13 +18,16 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     TYPE_CHECKING,
 )
 import sys
+import weakref
 
 import numpy as np
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.dtype_normalization import (
     _DTYPE_REVERSE_MAPPING,
     normalize_index_key,
@@ -115,7 +118,10 @@ class IndexData:
                 raise ValueError("Features must be one-dimensional arrays")
 
             expected_numpy_type = _DTYPE_REVERSE_MAPPING[feature_schema.dtype]
-            if feature_data.dtype.type != expected_numpy_type:
+            if (
+                dictionary_encoding.value_type(feature_data)
+                != expected_numpy_type
+            ):
                 raise ValueError(
                     "The schema does not match the feature dtype. Feature "
                     f"{feature_schema.name!r} has numpy dtype = "
@@ -144,7 +150,10 @@ class IndexData:
                 if not np.allclose(f1, f2, equal_nan=True):
                     return False
             else:
-                if not np.array_equal(f1, f2):
+                if not np.array_equal(
+                    dictionary_encoding.decode(f1),
+                    dictionary_encoding.decode(f2),
+                ):
                     return False
 
         return True
@@ -155,6 +164,193 @@ class IndexData:
         return len(self.timestamps)
 
 
+class ColumnarSampling:
+    """Index keys and timestamps of all the index keys of an EventSet, stored
+    contiguously.
+
+    The timestamps of the i-th index key are
+    `timestamps[offsets[i]:offsets[i+1]]`. EventSets with the same sampling
+    share the same ColumnarSampling object.
+
+    Attributes:
+        index_keys: Normalized index keys.
+        offsets: Int64 array of `len(index_keys) + 1` offsets in `timestamps`.
+        timestamps: Timestamps of all the index keys, one after the other.
+    """
+
+    def __init__(
+        self,
+        index_keys: List[NormalizedIndexKey],
+        offsets: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> None:
+        if len(offsets) != len(index_keys) + 1:
+            raise ValueError(
+                f"Expecting {len(index_keys) + 1} offsets. Got {len(offsets)}"
+                " instead."
+            )
+        if offsets[-1] != len(timestamps):
+            raise ValueError(
+                "The last offset should be the number of timestamps"
+                f" ({len(timestamps)}). Got {offsets[-1]} instead."
+            )
+
+        self.index_keys = index_keys
+        self.offsets = offsets
+        self.timestamps = timestamps
+
+        # Views in "timestamps" for each index key. Created when first needed,
+        # and shared by all the EventSets with this sampling.
+        self._timestamp_views: Optional[List[np.ndarray]] = None
+
+    def timestamp_views(self) -> List[np.ndarray]:
+        """Timestamps of each index key, as views in `timestamps`."""
+
+        if self._timestamp_views is None:
+            self._timestamp_views = self.split(self.timestamps)
+        return self._timestamp_views
+
+    def split(self, values: np.ndarray) -> List[np.ndarray]:
+        """Splits an array aligned with `timestamps` by index key."""
+
+        offsets = self.offsets.tolist()
+        return [
+            values[begin:end] for begin, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    def __len__(self) -> int:
+        """Number of index keys."""
+
+        return len(self.index_keys)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Views are re-created after unpickling.
+        state = self.__dict__.copy()
+        state["_timestamp_views"] = None
+        return state
+
+
+@dataclass
+class ColumnarData:
+    """Data of all the index keys of an EventSet, stored contiguously.
+
+    This layout (similar to a CSR sparse matrix) avoids the overhead of
+    storing many small arrays when an EventSet has many index keys, and allows
+    operators to process all the index keys at once.
+
+    Attributes:
+        sampling: Index keys, offsets and timestamps.
+        features: Values of each feature for all the index keys, aligned with
+            `sampling.timestamps`.
+    """
+
+    sampling: ColumnarSampling
+    features: List[np.ndarray]
+
+    def to_dict(self) -> Dict[NormalizedIndexKey, IndexData]:
+        """Data of each index key. The arrays are views in the columnar
+        arrays."""
+
+        split_features = [
+            self.sampling.split(feature) for feature in self.features
+        ]
+        return {
+            index_key: IndexData(
+                features=[values[idx] for values in split_features],
+                timestamps=timestamps,
+            )
+            for idx, (index_key, timestamps) in enumerate(
+                zip(self.sampling.index_keys, self.sampling.timestamp_views())
+            )
+        }
+
+    @staticmethod
+    def from_dict(
+        data: Dict[NormalizedIndexKey, IndexData], schema: Schema
+    ) -> ColumnarData:
+        """Concatenates the data of each index key.
+
+        If there is a single index key, its arrays are used without copy.
+        """
+
+        index_datas = list(data.values())
+        offsets = np.zeros(len(index_datas) + 1, dtype=np.int64)
+        np.cumsum([len(d.timestamps) for d in index_datas], out=offsets[1:])
+
+        def concatenate(arrays: List[np.ndarray], dtype) -> np.ndarray:
+            if not arrays:
+                return np.empty(0, dtype=dtype)
+            if len(arrays) == 1:
+                return arrays[0]
+            return dictionary_encoding.concatenate(arrays)
+
+        return ColumnarData(
+            sampling=ColumnarSampling(
+                index_keys=list(data.keys()),
+                offsets=offsets,
+                timestamps=concatenate(
+                    [d.timestamps for d in index_datas], np.float64
+                ),
+            ),
+            features=[
+                concatenate(
+                    [d.features[idx] for d in index_datas],
+                    _DTYPE_REVERSE_MAPPING[feature.dtype],
+                )
+                for idx, feature in enumerate(schema.features)
+            ],
+        )
+
+
+class _ColumnarDataDict(dict):
+    """Data of each index key of a columnar EventSet.
+
+    Modifying the dictionary switches the EventSet to the per index key layout,
+    as the columnar data would not match the dictionary anymore.
+    """
+
+    def __init__(self, evset: EventSet, data: Dict[Any, IndexData]):
+        super().__init__(data)
+        self._evset = weakref.ref(evset)
+
+    def _detach(self) -> None:
+        evset = self._evset()
+        if evset is not None:
+            evset._columnar = None
+
+    def __setitem__(self, key, value):
+        self._detach()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._detach()
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        self._detach()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._detach()
+        return super().popitem()
+
+    def clear(self):
+        self._detach()
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self._detach()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, *args):
+        self._detach()
+        return super().setdefault(*args)
+
+    def __reduce__(self):
+        # Pickled as a regular dictionary.
+        return (dict, (dict(self),))
+
+
 class EventSet(EventSetOperations):
     """Actual temporal data.
 
@@ -172,17 +368,64 @@ class EventSet(EventSetOperations):
         schema: Schema,
         name: Optional[str] = None,
     ) -> None:
-        self._data = data
+        self._data: Optional[Dict[NormalizedIndexKey, IndexData]] = data
         self._schema = schema
         self._name = name
 
+        # Contiguous storage of the data, if the EventSet uses the columnar
+        # layout. In this case, "_data" is created from "_columnar" when
+        # first needed.
+        self._columnar: Optional[ColumnarData] = None
+
         # EventSetNode created when "self.node()" is called.
         self._internal_node: Optional[EventSetNode] = None
 
+    @staticmethod
+    def from_columnar(
+        columnar: ColumnarData,
+        schema: Schema,
+        name: Optional[str] = None,
+    ) -> EventSet:
+        """Creates an EventSet stored in the columnar layout.
+
+        The data of each index key (`EventSet.data`) is exposed as views in
+        the columnar arrays.
+        """
+
+        evset = EventSet(data=None, schema=schema, name=name)  # type: ignore
+        evset._columnar = columnar
+        return evset
+
+    @property
+    def columnar(self) -> Optional[ColumnarData]:
+        """Contiguous storage of the data, or None if the EventSet is stored
+        as a dictionary of index key to IndexData."""
+
+        return self._columnar
+
     @property
     def data(self) -> Dict[NormalizedIndexKey, IndexData]:
+        if self._data is None:
+            assert self._columnar is not None
+            self._data = _ColumnarDataDict(self, self._columnar.to_dict())
         return self._data
 
+    def _to_dict_layout(self) -> None:
+        """Stores the data as a dictionary of index key to IndexData only.
+
+        Should be called before modifying the IndexData objects in place.
+        """
+
+        self._data = dict(self.data)
+        self._columnar = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if self._columnar is not None:
+            # The views are re-created after unpickling.
+            state["_data"] = None
+        return state
+
     @property
     def schema(self) -> Schema:
         return self._schema
@@ -196,7 +439,10 @@ class EventSet(EventSetOperations):
         self._name = name
 
     def get_index_keys(self, sort: bool = False) -> List[NormalizedIndexKey]:
-        idx_list = list(self.data.keys())
+        if self._data is None and self._columnar is not None:
+            idx_list = list(self._columnar.sampling.index_keys)
+        else:
+            idx_list = list(self.data.keys())
         return sorted(idx_list) if sort else idx_list
 
     def get_arbitrary_index_key(self) -> Optional[IndexKey]:
@@ -205,6 +451,10 @@ class EventSet(EventSetOperations):
         If the EventSet is empty, return None.
         """
 
+        if self._data is None and self._columnar is not None:
+            index_keys = self._columnar.sampling.index_keys
+            return index_keys[0] if index_keys else None
+
         if self._data:
             return next(iter(self._data.keys()))
         return None
@@ -215,6 +465,18 @@ class EventSet(EventSetOperations):
         If the EventSet is empty, return None.
         """
 
+        if self._data is None and self._columnar is not None:
+            sampling = self._columnar.sampling
+            if not sampling.index_keys:
+                return None
+            begin, end = sampling.offsets[0], sampling.offsets[1]
+            return IndexData(
+                features=[
+                    values[begin:end] for values in self._columnar.features
+                ],
+                timestamps=sampling.timestamp_views()[0],
+            )
+
         if self._data:
             return next(iter(self._data.values()))
         return None
@@ -293,7 +555,7 @@ class EventSet(EventSetOperations):
         if self._schema != other._schema:
             return False
 
-        if self._data != other._data:
+        if self.data != other.data:
             return False
 
         return True
@@ -315,6 +577,19 @@ class EventSet(EventSetOperations):
         return plotter.plot(evsets=self, *args, **wargs)
 
     def __sizeof__(self) -> int:
+        if self._columnar is not None:
+            # The arrays in "data" are views in the columnar arrays.
+            size = sys.getsizeof(self._columnar.sampling.index_keys)
+            for index_key in self._columnar.sampling.index_keys:
+                size += sys.getsizeof(index_key)
+            for values in [
+                self._columnar.sampling.offsets,
+                self._columnar.sampling.timestamps,
+                *self._columnar.features,
+            ]:
+                size += sys.getsizeof(values)
+            return size + _vocabularies_size(self._columnar.features)
+
         size = sys.getsizeof(self.data)
         for index_key, index_data in self.data.items():
             size += sys.getsizeof(index_key) + sys.getsizeof(
@@ -322,6 +597,9 @@ class EventSet(EventSetOperations):
             )
             for feature in index_data.features:
                 size += sys.getsizeof(feature)
+        index_data = self.get_arbitrary_index_data()
+        if index_data is not None:
+            size += _vocabularies_size(index_data.features)
         return size
 
     def memory_usage(self) -> int:
@@ -335,6 +613,9 @@ class EventSet(EventSetOperations):
     def num_events(self) -> int:
         """Total number of events."""
 
+        if self._columnar is not None:
+            return len(self._columnar.sampling.timestamps)
+
         count = 0
         for data in self.data.values():
             count += len(data.timestamps)
@@ -343,6 +624,9 @@ class EventSet(EventSetOperations):
     def num_indexes(self) -> int:
         """Total number of index values."""
 
+        if self._columnar is not None:
+            return len(self._columnar.sampling)
+
         return len(self.data)
 
     def check_same_sampling(self, other: EventSet):
@@ -373,3 +657,45 @@ class EventSet(EventSetOperations):
         )
 
         return display_html(self)
+
+
+def split_by_index_keys(
+    evset: EventSet, max_num_events: int, sort: bool = False
+) -> Iterator[EventSet]:
+    """Splits an EventSet into EventSets with disjoint sets of index keys.
+
+    The index keys are grouped, in order, so that each EventSet contains at
+    most `max_num_events` events (unless it contains a single index key). The
+    data is not copied.
+
+    Args:
+        evset: EventSet to split.
+        max_num_events: Maximum number of events of each EventSet.
+        sort: If true, the index keys are sorted before being grouped.
+    """
+
+    data = evset.data
+    batch: Dict[NormalizedIndexKey, IndexData] = {}
+    num_events = 0
+    for index_key in evset.get_index_keys(sort=sort):
+        index_data = data[index_key]
+        if batch and num_events + len(index_data) > max_num_events:
+            yield EventSet(data=batch, schema=evset.schema)
+            batch = {}
+            num_events = 0
+        batch[index_key] = index_data
+        num_events += len(index_data)
+    if batch:
+        yield EventSet(data=batch, schema=evset.schema)
+
+
+def _vocabularies_size(features: List[np.ndarray]) -> int:
+    """Size of the vocabularies of dictionary encoded features. Vocabularies
+    are shared by all the index keys."""
+
+    vocabularies = {
+        id(feature.vocabulary): feature.vocabulary
+        for feature in features
+        if dictionary_encoding.is_encoded(feature)
+    }
+    return sum(sys.getsizeof(v) for v in vocabularies.values())
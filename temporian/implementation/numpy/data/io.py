@@ -9,7 +9,13 @@ from temporian.implementation.numpy.data.dtype_normalization import (
 )
 
 from temporian.utils.typecheck import typecheck
-from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    ColumnarSampling,
+    EventSet,
+    IndexData,
+)
 from temporian.core.evaluation import run
 from temporian.core.operators.add_index import add_index
 from temporian.core.data.schema import Schema, IndexSchema, FeatureSchema
@@ -34,6 +40,7 @@ def event_set(
     name: Optional[str] = None,
     is_unix_timestamp: Optional[bool] = None,
     same_sampling_as: Optional[EventSet] = None,
+    presorted: bool = False,
 ) -> EventSet:
     """Creates an [`EventSet`][temporian.EventSet] from arrays (lists, NumPy
     arrays, Pandas Series.)
@@ -110,6 +117,13 @@ def event_set(
             having the same sampling as `same_sampling_as`. Some operators,
             such as [`EventSet.filter()`][temporian.EventSet.filter], require
             their inputs to have the same sampling.
+        presorted: If true, the events are expected to be grouped by index
+            key, and sorted by timestamp within each index key (e.g. data
+            sorted by `(*indexes, timestamp)`). The index keys are then
+            detected as the runs of equal index values, without hashing, and
+            the EventSet uses the feature arrays without copy. The index keys
+            are in order of appearance. Raises an error if the events are not
+            grouped and sorted.
 
     Returns:
         An EventSet.
@@ -133,16 +147,84 @@ def event_set(
     logging.debug("Normalizing timestamps")
     timestamps, auto_is_unix_timestamp = normalize_timestamps(timestamps)
 
+    if is_unix_timestamp is None:
+        is_unix_timestamp = auto_is_unix_timestamp
+    assert isinstance(is_unix_timestamp, bool)
+
+    presorted_columnar = None
+    if indexes and presorted:
+        logging.debug("Indexing pre-sorted events")
+        presorted_columnar = _presorted_columnar(timestamps, features, indexes)
+
+    if presorted_columnar is not None:
+        assert indexes is not None
+        schema = Schema(
+            features=[
+                (feature_key, numpy_array_to_tp_dtype(feature_key, value))
+                for feature_key, value in features.items()
+                if feature_key not in indexes
+            ],
+            indexes=[
+                (index, numpy_array_to_tp_dtype(index, features[index]))
+                for index in indexes
+            ],
+            is_unix_timestamp=is_unix_timestamp,
+        )
+        evset = EventSet.from_columnar(presorted_columnar, schema=schema)
+    else:
+        evset = _sort_and_index(
+            timestamps, features, indexes, is_unix_timestamp
+        )
+
+    evset.name = name
+
+    if same_sampling_as is not None:
+        logging.debug("Setting same sampling")
+        evset.schema.check_compatible_index(same_sampling_as.schema)
+
+        if evset.data.keys() != same_sampling_as.data.keys():
+            raise ValueError(
+                "The new EventSet and `same_sampling_as` have the same"
+                " indexes, but different index keys. They should have the"
+                " same index keys to have the same sampling."
+            )
+
+        # The timestamps are replaced below.
+        evset._to_dict_layout()
+
+        for key, same_sampling_as_value in same_sampling_as.data.items():
+            if not np.all(
+                evset.data[key].timestamps == same_sampling_as_value.timestamps
+            ):
+                raise ValueError(
+                    "The new EventSet and `same_sampling_as` have different"
+                    f" timestamps values for the index={key!r}. The timestamps"
+                    " should be equal for both to have the same sampling."
+                )
+
+            # Discard the new timestamps arrays.
+            evset.data[key].timestamps = same_sampling_as_value.timestamps
+
+        evset.node()._sampling = same_sampling_as.node().sampling_node
+
+    return evset
+
+
+def _sort_and_index(
+    timestamps: np.ndarray,
+    features: Dict[str, np.ndarray],
+    indexes: Optional[List[str]],
+    is_unix_timestamp: bool,
+) -> EventSet:
+    """Sorts the events by timestamp, and groups them by index key with the
+    `add_index` operator."""
+
     if not np.all(timestamps[:-1] <= timestamps[1:]):
         logging.debug("Sorting timestamps")
         order = np.argsort(timestamps, kind="mergesort")
         timestamps = timestamps[order]
         features = {name: value[order] for name, value in features.items()}
 
-    if is_unix_timestamp is None:
-        is_unix_timestamp = auto_is_unix_timestamp
-    assert isinstance(is_unix_timestamp, bool)
-
     # Infer the schema
     logging.debug("Assembling schema")
     schema = Schema(
@@ -176,35 +258,80 @@ def event_set(
         evset = run(output_node, {input_node: evset})
         assert isinstance(evset, EventSet)
 
-    evset.name = name
+    return evset
 
-    if same_sampling_as is not None:
-        logging.debug("Setting same sampling")
-        evset.schema.check_compatible_index(same_sampling_as.schema)
 
-        if evset.data.keys() != same_sampling_as.data.keys():
-            raise ValueError(
-                "The new EventSet and `same_sampling_as` have the same"
-                " indexes, but different index keys. They should have the"
-                " same index keys to have the same sampling."
-            )
+def _presorted_columnar(
+    timestamps: np.ndarray,
+    features: Dict[str, np.ndarray],
+    indexes: List[str],
+) -> Optional[ColumnarData]:
+    """Indexes events already grouped by index key and sorted by timestamp.
 
-        for key, same_sampling_as_value in same_sampling_as.data.items():
-            if not np.all(
-                evset.data[key].timestamps == same_sampling_as_value.timestamps
-            ):
-                raise ValueError(
-                    "The new EventSet and `same_sampling_as` have different"
-                    f" timestamps values for the index={key!r}. The timestamps"
-                    " should be equal for both to have the same sampling."
-                )
+    The index keys are the runs of equal index values. The timestamps and the
+    features (other than the indexes) are used without copy.
 
-            # Discard the new timestamps arrays.
-            evset.data[key].timestamps = same_sampling_as_value.timestamps
+    Returns:
+        The indexed data, or None if there are no events or if the indexes are
+        invalid (in which case the error is raised by the `add_index`
+        operator).
 
-        evset.node()._sampling = same_sampling_as.node().sampling_node
+    Raises:
+        ValueError: If the events are not grouped by index key and sorted by
+            timestamp.
+    """
 
-    return evset
+    num_events = len(timestamps)
+    if num_events == 0 or len(set(indexes)) != len(indexes):
+        return None
+
+    index_values = []
+    for index in indexes:
+        if index not in features or numpy_array_to_tp_dtype(
+            index, features[index]
+        ) not in [DType.INT32, DType.INT64, DType.STRING]:
+            return None
+        index_values.append(features[index])
+
+    # Whether the index key changes between consecutive events.
+    changes = np.zeros(num_events - 1, dtype=np.bool_)
+    for values in index_values:
+        if dictionary_encoding.is_encoded(values):
+            values = values.codes
+        values = np.asarray(values)
+        changes |= values[1:] != values[:-1]
+
+    if np.any((timestamps[1:] < timestamps[:-1]) & ~changes):
+        raise ValueError(
+            "presorted=True but the timestamps of an index key are not sorted."
+        )
+
+    begins = np.concatenate([[0], np.flatnonzero(changes) + 1])
+    index_columns = []
+    for values in index_values:
+        if dictionary_encoding.is_encoded(values):
+            key_values = values.vocabulary[values.codes[begins]]
+        else:
+            key_values = values[begins]
+        index_columns.append(key_values.tolist())
+    index_keys = list(zip(*index_columns))
+    if len(set(index_keys)) != len(index_keys):
+        raise ValueError(
+            "presorted=True but the events of an index key are not contiguous."
+        )
+
+    return ColumnarData(
+        sampling=ColumnarSampling(
+            index_keys=index_keys,
+            offsets=np.append(begins, num_events).astype(np.int64),
+            timestamps=timestamps,
+        ),
+        features=[
+            value
+            for feature_key, value in features.items()
+            if feature_key not in indexes
+        ],
+    )
 
 
 @typecheck
@@ -23,6 +23,7 @@ from temporian.core.data.duration_utils import (
     convert_timestamps_to_datetimes,
 )
 from temporian.core.data import duration_utils
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.core.typing import (
     IndexKeyList,
     NormalizedIndexKey,
@@ -449,7 +450,7 @@ def plot_with_plotter(
                     ys = group_item.evset.data[index].features[
                         group_item.feature_idx
                     ]
-                    ys = ys[plot_mask]
+                    ys = dictionary_encoding.decode(ys[plot_mask])
                     if options.style == Style.auto:
                         effective_stype = auto_style(uniform, xs, ys)
                     else:
@@ -0,0 +1,183 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transfer of EventSets between processes through shared memory."""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from temporian.core.data.schema import Schema
+from temporian.core.typing import NormalizedIndexKey
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+
+# Alignment, in bytes, of the arrays in the shared memory block.
+_ALIGNMENT = 64
+
+
+@dataclass
+class PackedEventSets:
+    """Location of the data of a list of EventSets in a shared memory block.
+
+    PackedEventSets is small and cheap to pickle. The actual timestamps and
+    feature values are stored in the shared memory block.
+
+    Attributes:
+        shared_memory_name: Name of the shared memory block.
+        arrays: Offset (in bytes), dtype and number of items of each array in
+            the shared memory block.
+        event_sets: For each EventSet, the list of index key, timestamps array
+            idx, and feature array idxs. Arrays shared between index keys or
+            EventSets (e.g., EventSets with the same sampling) are stored once.
+        names: Name of each EventSet.
+    """
+
+    shared_memory_name: str
+    arrays: List[Tuple[int, str, int]]
+    event_sets: List[List[Tuple[NormalizedIndexKey, int, List[int]]]]
+    names: List[Optional[str]]
+
+
+def pack_event_sets(
+    evsets: List[EventSet],
+) -> Tuple[shared_memory.SharedMemory, PackedEventSets]:
+    """Copies the data of EventSets into a new shared memory block.
+
+    The caller owns the returned shared memory block, and is responsible for
+    unlinking it once the data is not used anymore.
+
+    Args:
+        evsets: EventSets to pack.
+
+    Returns:
+        The shared memory block, and the location of the EventSets in it.
+    """
+
+    arrays: List[np.ndarray] = []
+    array_to_idx: Dict[int, int] = {}
+
+    def add_array(array: np.ndarray) -> int:
+        idx = array_to_idx.get(id(array))
+        if idx is None:
+            if array.dtype.hasobject:
+                raise ValueError(
+                    "Cannot store arrays of python objects in shared memory."
+                )
+            idx = len(arrays)
+            array_to_idx[id(array)] = idx
+            arrays.append(array)
+        return idx
+
+    packed_evsets = [
+        [
+            (
+                index_key,
+                add_array(index_data.timestamps),
+                [
+                    add_array(dictionary_encoding.decode(feature))
+                    for feature in index_data.features
+                ],
+            )
+            for index_key, index_data in evset.data.items()
+        ]
+        for evset in evsets
+    ]
+
+    offsets = []
+    size = 0
+    for array in arrays:
+        offsets.append(size)
+        size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    # Shared memory blocks cannot be empty.
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for array, offset in zip(arrays, offsets):
+        dst = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=shm.buf, offset=offset
+        )
+        dst[:] = array
+        del dst
+
+    packed = PackedEventSets(
+        shared_memory_name=shm.name,
+        arrays=[
+            (offset, array.dtype.str, len(array))
+            for array, offset in zip(arrays, offsets)
+        ],
+        event_sets=packed_evsets,
+        names=[evset.name for evset in evsets],
+    )
+    return shm, packed
+
+
+def unpack_event_sets(
+    buffer: memoryview,
+    packed: PackedEventSets,
+    schemas: List[Schema],
+    copy: bool,
+) -> List[EventSet]:
+    """Reads EventSets from a shared memory block.
+
+    Args:
+        buffer: Content of the shared memory block.
+        packed: Location of the EventSets in the block.
+        schemas: Schema of each of the EventSets.
+        copy: If true, the data is copied out of the shared memory block. If
+            false, the returned EventSets reference the shared memory block
+            directly. In this case, the block cannot be closed while the
+            EventSets are in use.
+
+    Returns:
+        The EventSets.
+    """
+
+    assert len(schemas) == len(packed.event_sets)
+
+    arrays: List[Optional[np.ndarray]] = [None] * len(packed.arrays)
+
+    def get_array(idx: int) -> np.ndarray:
+        array = arrays[idx]
+        if array is None:
+            offset, dtype, num_items = packed.arrays[idx]
+            array = np.ndarray(
+                (num_items,),
+                dtype=np.dtype(dtype),
+                buffer=buffer,
+                offset=offset,
+            )
+            if copy:
+                array = array.copy()
+            arrays[idx] = array
+        return array
+
+    evsets = []
+    for packed_evset, schema, name in zip(
+        packed.event_sets, schemas, packed.names
+    ):
+        evset = EventSet(data={}, schema=schema, name=name)
+        for index_key, timestamps_idx, feature_idxs in packed_evset:
+            evset.set_index_value(
+                index_key,
+                IndexData(
+                    features=[get_array(idx) for idx in feature_idxs],
+                    timestamps=get_array(timestamps_idx),
+                    schema=schema,
+                ),
+                normalize=False,
+            )
+        evsets.append(evset)
+    return evsets
@@ -0,0 +1,195 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import numpy as np
+from absl.testing import absltest
+from absl.testing import parameterized
+
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    ColumnarSampling,
+    EventSet,
+    IndexData,
+)
+from temporian.implementation.numpy.data.io import event_set
+
+
+def _to_dict_layout(evset: EventSet) -> EventSet:
+    """Copy of an EventSet, stored as a dictionary of IndexData."""
+
+    return EventSet(
+        data={
+            index_key: IndexData(
+                features=[f.copy() for f in index_data.features],
+                timestamps=index_data.timestamps.copy(),
+            )
+            for index_key, index_data in evset.data.items()
+        },
+        schema=evset.schema,
+    )
+
+
+class ColumnarTest(parameterized.TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6, 7],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, np.nan, 6.0, 7.0],
+                "b": [1, 2, 3, 4, 5, 6, 7],
+                "c": ["x", "x", "y", "x", "y", "z", "y"],
+            },
+            indexes=["c"],
+        )
+
+    def test_add_index_is_columnar(self):
+        columnar = self.evset.columnar
+        self.assertIsNotNone(columnar)
+        self.assertCountEqual(
+            columnar.sampling.index_keys, [(b"x",), (b"y",), (b"z",)]
+        )
+        self.assertLen(columnar.sampling.offsets, 4)
+        for index_key, begin, end in zip(
+            columnar.sampling.index_keys,
+            columnar.sampling.offsets[:-1],
+            columnar.sampling.offsets[1:],
+        ):
+            index_data = self.evset.data[index_key]
+            np.testing.assert_array_equal(
+                columnar.sampling.timestamps[begin:end], index_data.timestamps
+            )
+            np.testing.assert_array_equal(
+                columnar.features[1][begin:end], index_data.features[1]
+            )
+
+    def test_no_dict_needed(self):
+        evset = EventSet.from_columnar(self.evset.columnar, self.evset.schema)
+        self.assertEqual(evset.num_events(), 7)
+        self.assertEqual(evset.num_indexes(), 3)
+        self.assertEqual(
+            evset.get_index_keys(sort=True), [(b"x",), (b"y",), (b"z",)]
+        )
+        index_key = evset.get_arbitrary_index_key()
+        index_data = evset.get_arbitrary_index_data()
+        self.assertIsNone(evset._data)
+        self.assertEqual(index_data, self.evset.data[index_key])
+
+    def test_data_are_views(self):
+        columnar = self.evset.columnar
+        index_data = self.evset.data[(b"y",)]
+        np.testing.assert_array_equal(index_data.timestamps, [3, 5, 7])
+        self.assertIs(index_data.timestamps.base, columnar.sampling.timestamps)
+        self.assertIs(index_data.features[0].base, columnar.features[0])
+
+    def test_equal_to_dict_layout(self):
+        evset = _to_dict_layout(self.evset)
+        self.assertIsNone(evset.columnar)
+        self.assertEqual(evset, self.evset)
+        self.assertEqual(self.evset, evset)
+
+    def test_from_dict(self):
+        evset = _to_dict_layout(self.evset)
+        columnar = ColumnarData.from_dict(evset.data, evset.schema)
+        self.assertEqual(
+            EventSet.from_columnar(columnar, evset.schema), self.evset
+        )
+
+    def test_from_empty_dict(self):
+        evset = EventSet(data={}, schema=self.evset.schema)
+        columnar = ColumnarData.from_dict(evset.data, evset.schema)
+        self.assertEqual(columnar.features[0].dtype, np.float64)
+        self.assertEqual(columnar.features[1].dtype, np.int64)
+        self.assertEqual(EventSet.from_columnar(columnar, evset.schema), evset)
+
+    def test_modification_switches_to_dict_layout(self):
+        evset = self.evset
+        evset.data[(b"w",)] = evset.data[(b"x",)]
+        self.assertIsNone(evset.columnar)
+        self.assertEqual(evset.num_events(), 10)
+        self.assertEqual(evset.num_indexes(), 4)
+
+    def test_pickle(self):
+        evset = pickle.loads(pickle.dumps(self.evset))
+        self.assertIsNotNone(evset.columnar)
+        self.assertEqual(evset, self.evset)
+
+    def test_invalid_offsets(self):
+        with self.assertRaisesRegex(ValueError, "Expecting 3 offsets"):
+            ColumnarSampling(
+                index_keys=[(1,), (2,)],
+                offsets=np.array([0, 2], dtype=np.int64),
+                timestamps=np.array([1.0, 2.0]),
+            )
+        with self.assertRaisesRegex(ValueError, "last offset"):
+            ColumnarSampling(
+                index_keys=[(1,)],
+                offsets=np.array([0, 1], dtype=np.int64),
+                timestamps=np.array([1.0, 2.0]),
+            )
+
+    @parameterized.parameters(
+        (lambda x: x.moving_sum(2),),
+        (lambda x: x.moving_count(2),),
+        (lambda x: x.moving_max(3),),
+        (lambda x: x["a"].moving_product(2),),
+        (lambda x: x.cumsum(),),
+        (lambda x: x["a"].simple_moving_average(2),),
+        (lambda x: x.since_last(),),
+        (lambda x: x.since_last(2),),
+        (lambda x: x.moving_sum(2).moving_min(3),),
+    )
+    def test_operator(self, fn):
+        result = fn(self.evset)
+        self.assertIsNotNone(result.columnar)
+        self.assertIs(result.columnar.sampling, self.evset.columnar.sampling)
+        self.assertEqual(result, fn(_to_dict_layout(self.evset)))
+
+    def test_same_sampling(self):
+        result = self.evset.moving_sum(2)
+        for index_key, index_data in result.data.items():
+            self.assertIs(
+                index_data.timestamps, self.evset.data[index_key].timestamps
+            )
+
+    def test_add_index_on_indexed_evset(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1, 2, 3, 4, 5, 6],
+                "b": ["x", "y", "x", "y", "x", "x"],
+                "c": [1, 1, 2, 2, 1, 1],
+            },
+            indexes=["b"],
+        )
+        expected = _to_dict_layout(evset).add_index("c")
+        result = evset.add_index("c")
+        self.assertIsNotNone(result.columnar)
+        self.assertEqual(result, expected)
+        self.assertEqual(
+            result,
+            event_set(
+                timestamps=[1, 5, 6, 3, 2, 4],
+                features={
+                    "a": [1, 5, 6, 3, 2, 4],
+                    "b": ["x", "x", "x", "x", "y", "y"],
+                    "c": [1, 1, 1, 2, 1, 2],
+                },
+                indexes=["b", "c"],
+            ),
+        )
+
+
+if __name__ == "__main__":
+    absltest.main()
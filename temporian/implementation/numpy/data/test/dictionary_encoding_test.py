@@ -0,0 +1,216 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import numpy as np
+import pandas as pd
+from absl.testing import absltest
+from absl.testing import parameterized
+from numpy.testing import assert_array_equal
+
+import temporian as tp
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.dictionary_encoding import (
+    DictionaryEncodedArray,
+)
+from temporian.implementation.numpy.data.io import event_set
+
+
+class DictionaryEncodingTest(parameterized.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "timestamp": [1, 2, 3, 4, 5, 6],
+                "url": pd.Categorical(
+                    ["a" * 100, "b", "a" * 100, "c", "b", "b"]
+                ),
+                "key": pd.Categorical(["x", "y", "x", "y", "x", "x"]),
+                "value": [1, 2, 3, 4, 5, 6],
+            }
+        )
+        self.evset = tp.from_pandas(self.df)
+        # Same data, without dictionary encoding.
+        self.expected = tp.from_pandas(self.df.astype({"url": str, "key": str}))
+
+    def _assert_encoded(self, evset: tp.EventSet, feature_name: str):
+        feature_idx = evset.schema.feature_names().index(feature_name)
+        for index_data in evset.data.values():
+            self.assertTrue(
+                dictionary_encoding.is_encoded(index_data.features[feature_idx])
+            )
+
+    def test_encode_decode(self):
+        values = np.array([b"b", b"a", b"b", b"c"])
+        encoded = dictionary_encoding.encode(values)
+        assert_array_equal(encoded.codes, [1, 0, 1, 2])
+        assert_array_equal(encoded.vocabulary, [b"a", b"b", b"c"])
+        self.assertEqual(encoded.dtype, np.int32)
+        assert_array_equal(dictionary_encoding.decode(encoded), values)
+
+    def test_slicing_keeps_vocabulary(self):
+        encoded = dictionary_encoding.encode(np.array([b"b", b"a", b"c"]))
+        for sliced in [
+            encoded[1:],
+            encoded[np.array([True, False, True])],
+            encoded[[2, 0]],
+        ]:
+            self.assertIsInstance(sliced, DictionaryEncodedArray)
+            self.assertIs(sliced.vocabulary, encoded.vocabulary)
+        assert_array_equal(encoded[[2, 0]].decode(), [b"c", b"b"])
+
+    def test_concatenate_same_vocabulary(self):
+        encoded = dictionary_encoding.encode(np.array([b"b", b"a", b"c"]))
+        result = dictionary_encoding.concatenate([encoded[:1], encoded[1:]])
+        self.assertIs(result.vocabulary, encoded.vocabulary)
+        assert_array_equal(result.codes, encoded.codes)
+
+    def test_concatenate_different_vocabularies(self):
+        result = dictionary_encoding.concatenate(
+            [
+                dictionary_encoding.encode(np.array([b"b", b"d"])),
+                dictionary_encoding.encode(np.array([b"a", b"b"])),
+            ]
+        )
+        self.assertIsInstance(result, DictionaryEncodedArray)
+        assert_array_equal(result.decode(), [b"b", b"d", b"a", b"b"])
+
+    def test_concatenate_with_non_encoded(self):
+        result = dictionary_encoding.concatenate(
+            [
+                dictionary_encoding.encode(np.array([b"b", b"d"])),
+                np.array([b"a"]),
+            ]
+        )
+        self.assertNotIsInstance(result, DictionaryEncodedArray)
+        assert_array_equal(result, [b"b", b"d", b"a"])
+
+    def test_pickle(self):
+        encoded = dictionary_encoding.encode(np.array([b"b", b"a", b"b"]))
+        unpickled = pickle.loads(pickle.dumps(encoded))
+        self.assertIsInstance(unpickled, DictionaryEncodedArray)
+        assert_array_equal(unpickled.decode(), encoded.decode())
+
+    def test_from_pandas(self):
+        self.assertEqual(self.evset.schema.features[0].dtype, tp.str_)
+        self._assert_encoded(self.evset, "url")
+        self._assert_encoded(self.evset, "key")
+        self.assertEqual(self.evset, self.expected)
+
+    def test_from_pandas_missing_values(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": pd.Categorical(["x", None, "x"])},
+        )
+        assert_array_equal(
+            evset.get_arbitrary_index_data().features[0].decode(),
+            [b"x", b"", b"x"],
+        )
+
+    @parameterized.parameters(True, False)
+    def test_from_pandas_categorical_index(self, presorted):
+        df = self.df.sort_values(["key", "timestamp"])
+        evset = tp.from_pandas(df, indexes=["key"], presorted=presorted)
+        self.assertEqual(
+            evset, tp.from_pandas(df.astype({"key": str}), indexes=["key"])
+        )
+
+    def test_non_string_categorical(self):
+        evset = event_set(
+            timestamps=[1, 2, 3], features={"a": pd.Categorical([1, 2, 1])}
+        )
+        self.assertEqual(evset.schema.features[0].dtype, tp.int64)
+
+    def test_to_pandas(self):
+        df = tp.to_pandas(self.evset)
+        self.assertIsInstance(df["url"].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(df["url"]), list(self.df["url"]))
+        self.assertEqual(list(df["key"]), list(self.df["key"]))
+
+        df = tp.to_pandas(self.evset, tp_string_to_pd_string=False)
+        self.assertEqual(df["key"][1], b"y")
+
+    def test_memory_usage(self):
+        self.assertLess(self.evset.memory_usage(), self.expected.memory_usage())
+
+    def test_repr(self):
+        self.assertEqual(repr(self.evset), repr(self.expected))
+
+    def test_add_index(self):
+        result = self.evset.add_index("key")
+        self._assert_encoded(result, "url")
+        self.assertEqual(result, self.expected.add_index("key"))
+        self.assertCountEqual(result.get_index_keys(), [(b"x",), (b"y",)])
+
+    def test_add_index_on_indexed_evset(self):
+        result = self.evset.add_index("value").add_index("url")
+        self.assertEqual(
+            result, self.expected.add_index("value").add_index("url")
+        )
+
+    def test_filter(self):
+        result = self.evset.filter(self.evset["value"] > 2)
+        self._assert_encoded(result, "url")
+        self.assertEqual(
+            result, self.expected.filter(self.expected["value"] > 2)
+        )
+
+    @parameterized.parameters("b", "z")
+    def test_equal_scalar(self, value):
+        self.assertEqual(
+            self.evset["url"].equal(value),
+            self.expected["url"].equal(value),
+        )
+        self.assertEqual(
+            self.evset["url"] != value,
+            self.expected["url"] != value,
+        )
+
+    def test_equal(self):
+        url = self.evset["url"]
+        key = self.evset["key"].rename("url")
+        expected_url = self.expected["url"]
+        expected_key = self.expected["key"].rename("url")
+        # Same vocabulary.
+        self.assertEqual(url.equal(url), expected_url.equal(expected_url))
+        # Different vocabularies.
+        self.assertEqual(url.equal(key), expected_url.equal(expected_key))
+        self.assertEqual(url != key, expected_url != expected_key)
+
+    def test_operator_without_support(self):
+        # Operators not supporting dictionary encoding receive decoded values.
+        result = self.evset.lag(1).drop_index()
+        self.assertEqual(result, self.expected.lag(1).drop_index())
+
+    @parameterized.parameters(True, False)
+    def test_operator_without_support_check_execution(self, check_execution):
+        def query(evset):
+            url = evset["url"]
+            return {
+                "where": (evset["value"] > 2).where(url, "z"),
+                "resample": url.resample(url.lag(1)),
+            }
+
+        result = tp.run(
+            query(self.evset.node()),
+            self.evset,
+            check_execution=check_execution,
+        )
+        expected = tp.run(query(self.expected.node()), self.expected)
+        self.assertEqual(result["where"], expected["where"])
+        self.assertEqual(result["resample"], expected["resample"])
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -77,7 +77,7 @@ events:
         timestamps: [0.4 0.5]
         'a': [7 8]
         'b': [ 9 10]
-memory usage: 1.2 kB
+memory usage: 0.8 kB
 """,
         )
 
@@ -106,7 +106,7 @@ events:
         'a': [ 1  2  3 ...  8  9 10]
         ...
     ... (showing 1 of 2 indexes)
-memory usage: 1.2 kB
+memory usage: 0.9 kB
 """,
         )
 
@@ -232,6 +232,48 @@ class IOTest(absltest.TestCase):
         )
         self.assertEqual(evset, expected)
 
+    def test_presorted(self):
+        timestamps = np.array([3.0, 4.0, 1.0, 2.0, 2.0, 5.0])
+        f1 = np.array([1, 2, 3, 4, 5, 6])
+        i1 = np.array([2, 2, 1, 1, 1, 1])
+        i2 = pd.Categorical(["A", "A", "A", "A", "B", "B"])
+        features = {"f1": f1, "i1": i1, "i2": i2}
+
+        evset = event_set(
+            timestamps=timestamps,
+            features=features,
+            indexes=["i1", "i2"],
+            presorted=True,
+        )
+        expected = event_set(
+            timestamps=timestamps, features=features, indexes=["i1", "i2"]
+        )
+        self.assertEqual(evset, expected)
+        self.assertEqual(evset.schema, expected.schema)
+        self.assertEqual(
+            evset.get_index_keys(), [(2, b"A"), (1, b"A"), (1, b"B")]
+        )
+        # The features are not copied.
+        columnar = evset.columnar
+        self.assertIs(columnar.features[0], f1)
+        assert_array_equal(columnar.sampling.offsets, [0, 2, 4, 6])
+
+    def test_presorted_not_sorted(self):
+        with self.assertRaisesRegex(ValueError, "not sorted"):
+            event_set(
+                timestamps=[2, 1, 3],
+                features={"f": [1, 2, 3], "i": ["a", "a", "b"]},
+                indexes=["i"],
+                presorted=True,
+            )
+        with self.assertRaisesRegex(ValueError, "not contiguous"):
+            event_set(
+                timestamps=[1, 2, 3],
+                features={"f": [1, 2, 3], "i": ["a", "b", "a"]},
+                indexes=["i"],
+                presorted=True,
+            )
+
 
 if __name__ == "__main__":
     absltest.main()
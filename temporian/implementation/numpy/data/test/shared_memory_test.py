@@ -0,0 +1,76 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.data.shared_memory import (
+    pack_event_sets,
+    unpack_event_sets,
+)
+
+
+class SharedMemoryTest(absltest.TestCase):
+    def test_pack_unpack(self):
+        evset_1 = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0],
+                "b": ["x", "yy", "x", "zzz"],
+                "k": [1, 1, 2, 2],
+            },
+            indexes=["k"],
+            name="evset_1",
+        )
+        evset_2 = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"c": [True, False, True, True], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+            same_sampling_as=evset_1,
+        )
+        empty_evset = event_set(timestamps=[], features={"d": []})
+
+        shm, packed = pack_event_sets([evset_1, evset_2, empty_evset])
+        try:
+            # The sampling shared by evset_1 and evset_2 is stored once i.e.
+            # 2 index keys x (1 timestamps + 3 features), and 2 arrays for the
+            # empty EventSet.
+            self.assertLen(packed.arrays, 2 * (1 + 3) + 2)
+
+            for copy in [False, True]:
+                result = unpack_event_sets(
+                    shm.buf,
+                    packed,
+                    schemas=[
+                        evset_1.schema,
+                        evset_2.schema,
+                        empty_evset.schema,
+                    ],
+                    copy=copy,
+                )
+                self.assertEqual(result, [evset_1, evset_2, empty_evset])
+                result_1, result_2, _ = result
+                for index_key, index_data in result_1.data.items():
+                    self.assertIs(
+                        index_data.timestamps,
+                        result_2.data[index_key].timestamps,
+                    )
+                del result, result_1, result_2, index_data
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -17,12 +17,19 @@ import sys
 import time
 import gc
 
-from typing import Dict, Optional
+import threading
+from collections import defaultdict
+from concurrent import futures
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+import numpy as np
 
 from temporian.core.data.node import EventSetNode
+from temporian.core.profile import Profile, StepProfile
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import EventSet
-from temporian.core.schedule import Schedule
+from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.core.schedule import Schedule, ScheduleStep
 
 # Loads all the numpy operator implementations
 from temporian.implementation.numpy import operators as _impls
@@ -34,6 +41,9 @@ def run_schedule(
     verbose: int,
     check_execution: bool,
     force_garbage_collector_interval: Optional[float] = 10,
+    num_threads: int = 1,
+    implementations: Optional[List[OperatorImplementation]] = None,
+    profile: Optional[Profile] = None,
 ) -> Dict[EventSetNode, EventSet]:
     """Evaluates a schedule on a dictionary of input
     [`EventSets`][temporian.EventSet].
@@ -48,23 +58,43 @@ def run_schedule(
             it differs.
         force_garbage_collector_interval: If set, triggers the garbage
             collection every "force_garbage_collector_interval" seconds.
+        num_threads: Number of threads used to run independent steps of the
+            schedule concurrently. If 1, the steps are run sequentially in the
+            schedule order.
+        implementations: Implementation of the operator of each step, as
+            returned by `build_implementations`. If None, the implementations
+            are instantiated.
+        profile: If set, the execution profile of each step is appended to
+            `profile.steps`.
     """
-    data = {**inputs}
+    if num_threads < 1:
+        raise ValueError(
+            f"num_threads should be greater or equal to 1. Got {num_threads}."
+        )
 
-    gc_begin_time = time.time()
+    if implementations is None:
+        implementations = build_implementations(schedule)
 
-    num_steps = len(schedule.steps)
-    for step_idx, step in enumerate(schedule.steps):
-        operator_def = step.op.definition
+    profiler = _Profiler(profile, inputs) if profile is not None else None
 
-        # Get implementation
-        implementation_cls = implementation_lib.get_implementation_class(
-            operator_def.key
+    if num_threads > 1:
+        return _run_schedule_parallel(
+            inputs=inputs,
+            schedule=schedule,
+            implementations=implementations,
+            verbose=verbose,
+            check_execution=check_execution,
+            force_garbage_collector_interval=force_garbage_collector_interval,
+            num_threads=num_threads,
+            profiler=profiler,
         )
 
-        # Instantiate implementation
-        implementation = implementation_cls(step.op)
+    data = {**inputs}
 
+    gc_begin_time = time.time()
+
+    num_steps = len(schedule.steps)
+    for step_idx, step in enumerate(schedule.steps):
         if verbose == 1:
             print(
                 f"    {step_idx+1} / {num_steps}: {step.op.operator_key()}",
@@ -95,10 +125,11 @@ def run_schedule(
 
         # Compute output
         begin_time = time.perf_counter()
-        if check_execution:
-            operator_outputs = implementation.call(**operator_inputs)
-        else:
-            operator_outputs = implementation(**operator_inputs)
+        begin_cpu_time = time.process_time()
+        operator_outputs = _run_step(
+            implementations[step_idx], operator_inputs, check_execution
+        )
+        end_cpu_time = time.process_time()
         end_time = time.perf_counter()
 
         if verbose == 1:
@@ -116,31 +147,393 @@ def run_schedule(
             )
 
         # materialize data in output nodes
-        for output_key, output_node in step.op.outputs.items():
-            output_evset = operator_outputs[output_key]
-            output_evset._internal_node = output_node
-            data[output_node] = output_evset
+        _materialize_outputs(step, operator_outputs, data)
+
+        if profiler is not None:
+            profiler.record(
+                step_idx=step_idx,
+                step=step,
+                operator_inputs=operator_inputs,
+                operator_outputs=operator_outputs,
+                released=[data[node] for node in step.released_nodes],
+                timing=_StepTiming(
+                    begin_time=begin_time,
+                    wall_time=end_time - begin_time,
+                    cpu_time=end_cpu_time - begin_cpu_time,
+                    thread=threading.get_ident(),
+                ),
+            )
 
         # Release unused memory
         for node in step.released_nodes:
             assert node in data
             del data[node]
 
-        if (
-            force_garbage_collector_interval is not None
-            and (time.time() - gc_begin_time)
-            >= force_garbage_collector_interval
-        ):
-            begin_gc = time.time()
-            if verbose >= 2:
-                print("Garbage collection", file=sys.stderr, flush=True, end="")
-            gc.collect()
-            gc_begin_time = time.time()
-            if verbose >= 2:
-                print(
-                    f" [{gc_begin_time - begin_gc:.5f} s]",
-                    file=sys.stderr,
-                    flush=True,
+        gc_begin_time = _maybe_collect_garbage(
+            gc_begin_time, force_garbage_collector_interval, verbose
+        )
+
+    return data
+
+
+def _run_schedule_parallel(
+    inputs: Dict[EventSetNode, EventSet],
+    schedule: Schedule,
+    implementations: List[OperatorImplementation],
+    verbose: int,
+    check_execution: bool,
+    force_garbage_collector_interval: Optional[float],
+    num_threads: int,
+    profiler: Optional["_Profiler"],
+) -> Dict[EventSetNode, EventSet]:
+    """Evaluates a schedule, running independent steps concurrently.
+
+    A step is submitted to the thread pool as soon as all the steps it depends
+    on are done. The "data" dictionary is only modified by the calling thread.
+
+    Because steps do not complete in the schedule order, a node listed in the
+    "released_nodes" of a step is released once all the steps consuming it
+    are done (instead of once this specific step is done).
+    """
+    data = {**inputs}
+
+    gc_begin_time = time.time()
+
+    steps = schedule.steps
+    num_steps = len(steps)
+
+    # "dependents[i]" are the indices of the steps depending on step "i".
+    dependents: Dict[int, List[int]] = defaultdict(list)
+    # "num_pending_dependencies[i]" is the number of not yet completed steps
+    # that step "i" depends on.
+    num_pending_dependencies: List[int] = []
+    for step_idx, step in enumerate(steps):
+        num_pending_dependencies.append(len(step.dependencies))
+        for dependency in step.dependencies:
+            dependents[dependency].append(step_idx)
+
+    # "num_pending_usages[e]" is the number of not yet completed steps
+    # consuming the releasable node "e".
+    releasable_nodes: Set[EventSetNode] = {
+        node for step in steps for node in step.released_nodes
+    }
+    num_pending_usages: Dict[EventSetNode, int] = defaultdict(int)
+    for step in steps:
+        for input_node in step.op.inputs.values():
+            if input_node in releasable_nodes:
+                num_pending_usages[input_node] += 1
+
+    ready_steps = [
+        step_idx
+        for step_idx in range(num_steps)
+        if num_pending_dependencies[step_idx] == 0
+    ]
+    num_done_steps = 0
+
+    with futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+        running: Dict[futures.Future, int] = {}
+        # Inputs of the running steps. Only recorded when profiling.
+        submitted_inputs: Dict[int, Dict[str, EventSet]] = {}
+
+        def submit_ready_steps():
+            # Submit in the schedule order to keep the execution close to the
+            # sequential one.
+            ready_steps.sort(reverse=True)
+            while ready_steps:
+                step_idx = ready_steps.pop()
+                step = steps[step_idx]
+                operator_inputs = {
+                    input_key: data[input_node]
+                    for input_key, input_node in step.op.inputs.items()
+                }
+                future = executor.submit(
+                    _timed_run_step,
+                    implementations[step_idx],
+                    operator_inputs,
+                    check_execution,
                 )
+                running[future] = step_idx
+                if profiler is not None:
+                    submitted_inputs[step_idx] = operator_inputs
+
+        submit_ready_steps()
+        while running:
+            done, _ = futures.wait(
+                running.keys(), return_when=futures.FIRST_COMPLETED
+            )
+            for future in sorted(done, key=lambda f: running[f]):
+                step_idx = running.pop(future)
+                step = steps[step_idx]
+
+                try:
+                    operator_outputs, timing = future.result()
+                except BaseException:
+                    for other_future in running:
+                        other_future.cancel()
+                    raise
+
+                num_done_steps += 1
+                if verbose == 1:
+                    print(
+                        (
+                            f"    {num_done_steps} / {num_steps}:"
+                            f" {step.op.operator_key()}"
+                            f" [{timing.wall_time:.5f} s]"
+                        ),
+                        file=sys.stderr,
+                        flush=True,
+                    )
+                elif verbose >= 2:
+                    print("=============================", file=sys.stderr)
+                    print(
+                        f"{num_done_steps} / {num_steps}: Ran {step.op}",
+                        file=sys.stderr,
+                    )
+                    print(f"Outputs:\n{operator_outputs}\n", file=sys.stderr)
+                    print(
+                        f"Duration: {timing.wall_time} s",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+
+                # materialize data in output nodes
+                _materialize_outputs(step, operator_outputs, data)
+
+                # Release unused memory
+                released = []
+                for input_node in step.op.inputs.values():
+                    if input_node not in num_pending_usages:
+                        continue
+                    num_pending_usages[input_node] -= 1
+                    if num_pending_usages[input_node] == 0:
+                        del num_pending_usages[input_node]
+                        released.append(data.pop(input_node))
+
+                if profiler is not None:
+                    profiler.record(
+                        step_idx=step_idx,
+                        step=step,
+                        operator_inputs=submitted_inputs.pop(step_idx),
+                        operator_outputs=operator_outputs,
+                        released=released,
+                        timing=timing,
+                    )
+
+                for dependent_idx in dependents[step_idx]:
+                    num_pending_dependencies[dependent_idx] -= 1
+                    if num_pending_dependencies[dependent_idx] == 0:
+                        ready_steps.append(dependent_idx)
+
+            submit_ready_steps()
+
+            gc_begin_time = _maybe_collect_garbage(
+                gc_begin_time, force_garbage_collector_interval, verbose
+            )
 
+    assert num_done_steps == num_steps
     return data
+
+
+def build_implementations(schedule: Schedule) -> List[OperatorImplementation]:
+    """Instantiates the implementation of the operator of each schedule step.
+
+    The implementations can be re-used to run the same schedule several times.
+    """
+
+    implementations = []
+    for step in schedule.steps:
+        # Get implementation
+        implementation_cls = implementation_lib.get_implementation_class(
+            step.op.definition.key
+        )
+
+        # Instantiate implementation
+        implementations.append(implementation_cls(step.op))
+    return implementations
+
+
+def _run_step(
+    implementation: OperatorImplementation,
+    operator_inputs: Dict[str, EventSet],
+    check_execution: bool,
+) -> Dict[str, EventSet]:
+    """Runs an operator implementation on its inputs."""
+
+    if check_execution:
+        return implementation.call(**operator_inputs)
+    else:
+        return implementation(**implementation.decode_inputs(operator_inputs))
+
+
+def _timed_run_step(
+    implementation: OperatorImplementation,
+    operator_inputs: Dict[str, EventSet],
+    check_execution: bool,
+):
+    """Same as "_run_step", but also returns the timing of the step."""
+
+    begin_time = time.perf_counter()
+    begin_cpu_time = time.thread_time()
+    operator_outputs = _run_step(
+        implementation, operator_inputs, check_execution
+    )
+    end_cpu_time = time.thread_time()
+    end_time = time.perf_counter()
+    return operator_outputs, _StepTiming(
+        begin_time=begin_time,
+        wall_time=end_time - begin_time,
+        cpu_time=end_cpu_time - begin_cpu_time,
+        thread=threading.get_ident(),
+    )
+
+
+class _StepTiming(NamedTuple):
+    """Timing of the execution of a step."""
+
+    # Value of "time.perf_counter()" at the beginning of the step.
+    begin_time: float
+    wall_time: float
+    cpu_time: float
+    # Identifier of the thread that ran the step.
+    thread: int
+
+
+class _Profiler:
+    """Records the execution profile of the steps of a schedule.
+
+    The memory is tracked at the level of the numpy arrays (timestamps and
+    feature values) referenced by the EventSets in memory, so that arrays
+    shared between EventSets (e.g. the timestamps of EventSets with the same
+    sampling) are only counted once.
+    """
+
+    def __init__(self, profile: Profile, inputs: Dict[EventSetNode, EventSet]):
+        self._profile = profile
+        self._begin_time = time.perf_counter()
+        # Index, in order of first appearance, of the threads running steps.
+        self._threads: Dict[int, int] = {}
+        # Number of EventSets in memory referencing each array, and size of
+        # the array, indexed by the id of the array.
+        self._arrays: Dict[int, List[int]] = {}
+        self._add(inputs.values())
+
+    def record(
+        self,
+        step_idx: int,
+        step: ScheduleStep,
+        operator_inputs: Dict[str, EventSet],
+        operator_outputs: Dict[str, EventSet],
+        released: List[EventSet],
+        timing: _StepTiming,
+    ) -> None:
+        allocated_bytes = self._add(operator_outputs.values())
+        released_bytes = self._release(released)
+        self._profile.steps.append(
+            StepProfile(
+                step_idx=step_idx,
+                operator_key=step.op.operator_key(),
+                thread=self._threads.setdefault(
+                    timing.thread, len(self._threads)
+                ),
+                begin_time=timing.begin_time - self._begin_time,
+                wall_time=timing.wall_time,
+                cpu_time=timing.cpu_time,
+                num_input_events=sum(
+                    evset.num_events() for evset in operator_inputs.values()
+                ),
+                num_output_events=sum(
+                    evset.num_events() for evset in operator_outputs.values()
+                ),
+                num_index_keys=sum(
+                    evset.num_indexes() for evset in operator_outputs.values()
+                ),
+                allocated_bytes=allocated_bytes,
+                released_bytes=released_bytes,
+            )
+        )
+
+    def _add(self, evsets: Iterable[EventSet]) -> int:
+        """Adds EventSets in memory. Returns the size of the new arrays."""
+
+        num_bytes = 0
+        for evset in evsets:
+            for array in _evset_arrays(evset):
+                item = self._arrays.get(id(array))
+                if item is None:
+                    self._arrays[id(array)] = [1, array.nbytes]
+                    num_bytes += array.nbytes
+                else:
+                    item[0] += 1
+        return num_bytes
+
+    def _release(self, evsets: Iterable[EventSet]) -> int:
+        """Removes EventSets from memory. Returns the size of the arrays not
+        referenced anymore."""
+
+        num_bytes = 0
+        for evset in evsets:
+            for array in _evset_arrays(evset):
+                item = self._arrays[id(array)]
+                item[0] -= 1
+                if item[0] == 0:
+                    num_bytes += item[1]
+                    del self._arrays[id(array)]
+        return num_bytes
+
+
+def _evset_arrays(evset: EventSet) -> List[np.ndarray]:
+    """Arrays owning the data referenced by an EventSet.
+
+    Views (e.g. slices) are replaced by the array they are a view of.
+    """
+
+    arrays: Dict[int, np.ndarray] = {}
+    for index_data in evset.data.values():
+        for array in [index_data.timestamps, *index_data.features]:
+            while isinstance(array.base, np.ndarray):
+                array = array.base
+            arrays[id(array)] = array
+    return list(arrays.values())
+
+
+def _materialize_outputs(
+    step: ScheduleStep,
+    operator_outputs: Dict[str, EventSet],
+    data: Dict[EventSetNode, EventSet],
+) -> None:
+    """Records the outputs of a step in "data"."""
+
+    for output_key, output_node in step.op.outputs.items():
+        output_evset = operator_outputs[output_key]
+        output_evset._internal_node = output_node
+        data[output_node] = output_evset
+
+
+def _maybe_collect_garbage(
+    gc_begin_time: float,
+    force_garbage_collector_interval: Optional[float],
+    verbose: int,
+) -> float:
+    """Triggers the garbage collection if the interval is elapsed.
+
+    Returns the new beginning of the garbage collection interval.
+    """
+
+    if (
+        force_garbage_collector_interval is None
+        or (time.time() - gc_begin_time) < force_garbage_collector_interval
+    ):
+        return gc_begin_time
+
+    begin_gc = time.time()
+    if verbose >= 2:
+        print("Garbage collection", file=sys.stderr, flush=True, end="")
+    gc.collect()
+    gc_begin_time = time.time()
+    if verbose >= 2:
+        print(
+            f" [{gc_begin_time - begin_gc:.5f} s]",
+            file=sys.stderr,
+            flush=True,
+        )
+    return gc_begin_time
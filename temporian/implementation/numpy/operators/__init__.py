@@ -46,6 +46,11 @@ from temporian.implementation.numpy.operators.window import moving_sum
 from temporian.implementation.numpy.operators.window import moving_count
 from temporian.implementation.numpy.operators.window import moving_min
 from temporian.implementation.numpy.operators.window import moving_max
+from temporian.implementation.numpy.operators.window import moving_aggregate
+from temporian.implementation.numpy.operators.window import moving_quantile
+from temporian.implementation.numpy.operators.window import moving_approx_quantile
+from temporian.implementation.numpy.operators.window import moving_approx_distinct_count
+from temporian.implementation.numpy.operators.window import moving_approx_heavy_hitters
 from temporian.implementation.numpy.operators.calendar import day_of_month
 from temporian.implementation.numpy.operators.calendar import day_of_week
 from temporian.implementation.numpy.operators.calendar import day_of_year
@@ -62,6 +67,7 @@ from temporian.implementation.numpy.operators import enumerate
 from temporian.implementation.numpy.operators import fast_fourier_transform
 from temporian.implementation.numpy.operators import filter_moving_count
 from temporian.implementation.numpy.operators import filter_empty_index
+from temporian.implementation.numpy.operators import fused_elementwise
 from temporian.implementation.numpy.operators import map
 from temporian.implementation.numpy.operators import select_index_values
 from temporian.implementation.numpy.operators import since_last
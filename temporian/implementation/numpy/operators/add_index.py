@@ -1,9 +1,16 @@
 from collections import defaultdict
 from typing import Dict
 
+import numpy as np
+
 from temporian.core.operators.add_index import AddIndexOperator
 from temporian.implementation.numpy import implementation_lib
-from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    ColumnarSampling,
+    EventSet,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 from temporian.implementation.numpy_cc.operators import operators_cc
 
@@ -11,6 +18,8 @@ from temporian.implementation.numpy_cc.operators import operators_cc
 class AddIndexNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the set index operator."""
 
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: AddIndexOperator) -> None:
         super().__init__(operator)
 
@@ -31,35 +40,87 @@ class AddIndexNumpyImplementation(OperatorImplementation):
             if f_name not in self.operator.indexes
         ]
 
-        dst_data = {}
-        for src_index, src_data in input.data.items():
-            index_features = [src_data.features[i] for i in new_index_idxs]
+        if input.columnar is None and len(input.data) <= 1:
+            # Avoid copying the input data.
+            src_index_keys = list(input.data.keys())
+            src_offsets = [0]
+            src_data = input.get_arbitrary_index_data()
+            if src_data is None:
+                src_columnar = ColumnarData.from_dict(input.data, input.schema)
+                src_timestamps = src_columnar.sampling.timestamps
+                src_features = src_columnar.features
+            else:
+                src_timestamps = src_data.timestamps
+                src_features = src_data.features
+        else:
+            src_columnar = input.columnar
+            if src_columnar is None:
+                src_columnar = ColumnarData.from_dict(input.data, input.schema)
+            src_index_keys = src_columnar.sampling.index_keys
+            src_offsets = src_columnar.sampling.offsets.tolist()
+            src_timestamps = src_columnar.sampling.timestamps
+            src_features = src_columnar.features
+
+        # Dictionary encoded index features are grouped by code. The codes are
+        # then converted into the index key values.
+        vocabularies = [
+            (
+                src_features[i].vocabulary.tolist()
+                if dictionary_encoding.is_encoded(src_features[i])
+                else None
+            )
+            for i in new_index_idxs
+        ]
+        has_vocabularies = any(v is not None for v in vocabularies)
+
+        # The events of all the new index keys are gathered at once, into
+        # contiguous arrays.
+        dst_index_keys = []
+        dst_row_idxs = []
+        dst_offsets = [np.zeros(1, dtype=np.int64)]
+        for src_idx, src_index in enumerate(src_index_keys):
+            begin = src_offsets[src_idx]
+            end = begin + len(input.data[src_index].timestamps)
+            index_features = [
+                np.asarray(src_features[i][begin:end]) for i in new_index_idxs
+            ]
             (
                 group_keys,
                 row_idxs,
                 group_begin_idx,
             ) = operators_cc.add_index_compute_index(index_features)
 
-            for group_idx, group_key in enumerate(group_keys):
+            for group_key in group_keys:
+                if has_vocabularies:
+                    group_key = tuple(
+                        item if vocabulary is None else vocabulary[item]
+                        for item, vocabulary in zip(group_key, vocabularies)
+                    )
                 dst_index = src_index + group_key
                 assert isinstance(dst_index, tuple)
+                dst_index_keys.append(dst_index)
 
-                example_idxs = row_idxs[
-                    group_begin_idx[group_idx] : group_begin_idx[group_idx + 1]
-                ]
-                dst_data[dst_index] = IndexData(
-                    features=[
-                        src_data.features[f_idx][example_idxs]
-                        for f_idx in kept_feature_idxs
-                    ],
-                    timestamps=src_data.timestamps[example_idxs],
-                    schema=output_node.schema,
-                )
+            dst_row_idxs.append(row_idxs + begin)
+            dst_offsets.append(group_begin_idx[1:] + begin)
+
+        if len(dst_row_idxs) == 1:
+            example_idxs = dst_row_idxs[0]
+        else:
+            example_idxs = np.concatenate(
+                [np.zeros(0, dtype=np.int64)] + dst_row_idxs
+            )
 
+        dst_columnar = ColumnarData(
+            sampling=ColumnarSampling(
+                index_keys=dst_index_keys,
+                offsets=np.concatenate(dst_offsets).astype(np.int64),
+                timestamps=src_timestamps[example_idxs],
+            ),
+            features=[src_features[i][example_idxs] for i in kept_feature_idxs],
+        )
         return {
-            "output": EventSet(
-                data=dst_data,
-                schema=output_node.schema,
+            "output": EventSet.from_columnar(
+                dst_columnar, schema=output_node.schema
             )
         }
 
@@ -9,11 +9,21 @@ from temporian.core.data.node import EventSetNode
 from temporian.core.data.schema import Schema
 from temporian.core.operators.base import Operator
 from temporian.core.operators.base import OperatorExceptionDecorator
-from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    EventSet,
+    IndexData,
+)
 import numpy as np
 
 
 class OperatorImplementation(ABC):
+    # If true, the implementation accepts dictionary encoded string features
+    # (see "dictionary_encoding.py"). Otherwise, the input features are decoded
+    # before calling the implementation.
+    supports_dictionary_encoding: bool = False
+
     def __init__(self, operator: Operator):
         assert operator is not None
         self._operator = operator
@@ -27,10 +37,26 @@ class OperatorImplementation(ABC):
         """Like __call__, but with checks."""
 
         _check_input(inputs=inputs, operator=self.operator)
+        inputs = self.decode_inputs(inputs)
         outputs = self(**inputs)
         _check_output(inputs=inputs, outputs=outputs, operator=self.operator)
         return outputs
 
+    def decode_inputs(self, inputs: Dict[str, EventSet]) -> Dict[str, EventSet]:
+        """Decodes the dictionary encoded features of the inputs, unless the
+        implementation supports them.
+
+        Should be applied on the inputs before calling `__call__`. `call`
+        already does it.
+        """
+
+        if self.supports_dictionary_encoding:
+            return inputs
+        return {
+            key: _decode_dictionary_encoded_features(value)
+            for key, value in inputs.items()
+        }
+
     @abstractmethod
     def __call__(self, **inputs: EventSet) -> Dict[str, EventSet]:
         """Applies the operator to its inputs."""
@@ -60,6 +86,51 @@ class OperatorImplementation(ABC):
         raise NotImplementedError()
 
 
+def _decode_dictionary_encoded_features(evset: EventSet) -> EventSet:
+    """Decodes the dictionary encoded features of an EventSet, if any.
+
+    The returned EventSet has the same sampling (i.e., the same timestamp
+    arrays) as the input.
+    """
+
+    columnar = evset.columnar
+    if columnar is not None:
+        if not any(map(dictionary_encoding.is_encoded, columnar.features)):
+            return evset
+        decoded = EventSet.from_columnar(
+            ColumnarData(
+                sampling=columnar.sampling,
+                features=[
+                    dictionary_encoding.decode(f) for f in columnar.features
+                ],
+            ),
+            schema=evset.schema,
+            name=evset.name,
+        )
+    else:
+        index_data = evset.get_arbitrary_index_data()
+        if index_data is None or not any(
+            map(dictionary_encoding.is_encoded, index_data.features)
+        ):
+            return evset
+        decoded = EventSet(
+            data={
+                index_key: IndexData(
+                    features=[
+                        dictionary_encoding.decode(f)
+                        for f in index_data.features
+                    ],
+                    timestamps=index_data.timestamps,
+                )
+                for index_key, index_data in evset.data.items()
+            },
+            schema=evset.schema,
+            name=evset.name,
+        )
+    decoded._internal_node = evset._internal_node
+    return decoded
+
+
 def _check_value_to_schema(
     values: Dict[str, EventSet],
     nodes: Dict[str, EventSetNode],
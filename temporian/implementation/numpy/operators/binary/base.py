@@ -18,9 +18,11 @@ import numpy as np
 
 from temporian.core.data.dtype import DType
 from temporian.core.operators.binary.base import BaseBinaryOperator
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 
 
 class BaseBinaryNumpyImplementation(OperatorImplementation):
@@ -66,7 +68,8 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
 
         assert len(input_1.data) == len(input_2.data)
 
-        for index_key, index_data in input_1.data.items():
+        def compute_index(item) -> IndexData:
+            index_key, index_data = item
             # iterate over index key features
             input_1_features = index_data.features
             input_2_features = input_2.data[index_key].features
@@ -75,7 +78,9 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
             for feature_idx in range(num_features):
                 input_1_feature = input_1_features[feature_idx]
                 input_2_feature = input_2_features[feature_idx]
-                assert input_1_feature.dtype.type == input_2_feature.dtype.type
+                assert dictionary_encoding.value_type(
+                    input_1_feature
+                ) == dictionary_encoding.value_type(input_2_feature)
 
                 result = self._do_operation(
                     input_1_feature,
@@ -84,14 +89,18 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
                 )
                 dst_features.append(result)
 
+            return IndexData(
+                features=dst_features,
+                timestamps=index_data.timestamps,
+                schema=output_schema,
+            )
+
+        items = list(input_1.data.items())
+        for (index_key, _), dst_index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
             dst_evset.set_index_value(
-                index_key,
-                IndexData(
-                    features=dst_features,
-                    timestamps=index_data.timestamps,
-                    schema=output_schema,
-                ),
-                normalize=False,
+                index_key, dst_index_data, normalize=False
             )
 
         return {"output": dst_evset}
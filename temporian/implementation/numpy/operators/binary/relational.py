@@ -11,9 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Tuple
+
 import numpy as np
 
 from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.operators.binary.base import (
     BaseBinaryNumpyImplementation,
 )
@@ -28,9 +31,29 @@ from temporian.core.operators.binary import (
 from temporian.implementation.numpy import implementation_lib
 
 
+def _decode_unless_same_vocabulary(
+    feature_1: np.ndarray, feature_2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Codes of two dictionary encoded features with the same vocabulary, or
+    decoded values otherwise."""
+
+    if (
+        dictionary_encoding.is_encoded(feature_1)
+        and dictionary_encoding.is_encoded(feature_2)
+        and feature_1.vocabulary is feature_2.vocabulary
+    ):
+        return feature_1.codes, feature_2.codes
+    return (
+        dictionary_encoding.decode(feature_1),
+        dictionary_encoding.decode(feature_2),
+    )
+
+
 class EqualNumpyImplementation(BaseBinaryNumpyImplementation):
     """Numpy implementation of the equal operator."""
 
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: EqualOperator) -> None:
         super().__init__(operator)
 
@@ -41,6 +64,11 @@ class EqualNumpyImplementation(BaseBinaryNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
+            evset_1_feature, evset_2_feature = _decode_unless_same_vocabulary(
+                evset_1_feature, evset_2_feature
+            )
+            if evset_1_feature.dtype.type == np.int32:
+                return np.equal(evset_1_feature, evset_2_feature)
             return np.char.equal(evset_1_feature.data, evset_2_feature.data)
         else:
             # returns False on both NaNs
@@ -48,6 +76,8 @@ class EqualNumpyImplementation(BaseBinaryNumpyImplementation):
 
 
 class NotEqualNumpyImplementation(BaseBinaryNumpyImplementation):
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: EqualOperator) -> None:
         super().__init__(operator)
 
@@ -58,6 +88,11 @@ class NotEqualNumpyImplementation(BaseBinaryNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
+            evset_1_feature, evset_2_feature = _decode_unless_same_vocabulary(
+                evset_1_feature, evset_2_feature
+            )
+            if evset_1_feature.dtype.type == np.int32:
+                return np.not_equal(evset_1_feature, evset_2_feature)
             return np.char.not_equal(evset_1_feature.data, evset_2_feature.data)
         else:
             return np.not_equal(evset_1_feature.data, evset_2_feature.data)
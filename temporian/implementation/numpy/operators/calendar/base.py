@@ -6,6 +6,7 @@ import numpy as np
 from temporian.core.operators.calendar.base import BaseCalendarOperator
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 
 
 class BaseCalendarNumpyImplementation(OperatorImplementation):
@@ -23,19 +24,25 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
 
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
-        for index_key, index_data in sampling.data.items():
+
+        def compute_index(item) -> IndexData:
+            _, index_data = item
             output = np.zeros(shape=index_data.timestamps.shape, dtype=np.int32)
             error = implementation(
                 index_data.timestamps, self.operator.tz, output
             )
             if error is not None:
                 raise ValueError(error)
+            return IndexData(
+                [output], index_data.timestamps, schema=output_schema
+            )
+
+        items = list(sampling.data.items())
+        for (index_key, _), dst_index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
             dst_evset.set_index_value(
-                index_key,
-                IndexData(
-                    [output], index_data.timestamps, schema=output_schema
-                ),
-                normalize=False,
+                index_key, dst_index_data, normalize=False
             )
 
         return {"output": dst_evset}
@@ -52,64 +52,64 @@ def _check_overflow(
 class CastNumpyImplementation(OperatorImplementation):
     def __init__(self, operator: CastOperator) -> None:
         super().__init__(operator)
+        assert isinstance(operator, CastOperator)
 
-    def __call__(self, input: EventSet) -> Dict[str, EventSet]:
-        assert isinstance(self.operator, CastOperator)
-        output_schema = self.output_schema("output")
-
-        # Reuse evset if actually no features changed dtype
-        if self.operator.is_noop:
-            return {"output": input}
+        input_features = operator.inputs["input"].schema.features
 
         # Min/max ranges for each of the features. If None, no check is done.
-        mins_maxs: List[Optional[Tuple[Any, Any]]] = []
-        for src_feature, dst_dtype in zip(
-            input.schema.features, self.operator.dtypes
-        ):
-            if self.operator.check_overflow and _can_overflow(
+        self._mins_maxs: List[Optional[Tuple[Any, Any]]] = []
+        for src_feature, dst_dtype in zip(input_features, operator.dtypes):
+            if operator.check_overflow and _can_overflow(
                 src_feature.dtype, dst_dtype
             ):
                 iinfo = _DTYPE_LIMITS[dst_dtype]
-                mins_maxs.append((iinfo.min, iinfo.max))
+                self._mins_maxs.append((iinfo.min, iinfo.max))
             else:
-                mins_maxs.append(None)
+                self._mins_maxs.append(None)
 
         # Numpy output dtype for each feature.
-        np_dtypes = [
-            tp_dtype_to_np_dtype(tp_dtype) for tp_dtype in self.operator.dtypes
+        self._np_dtypes = [
+            tp_dtype_to_np_dtype(tp_dtype) for tp_dtype in operator.dtypes
         ]
 
-        output_evset = EventSet(data={}, schema=output_schema)
-        for index_key, index_data in input.data.items():
-            dst_features = []
-            for feature_idx, (
+    def _do_operation(
+        self, src_values: np.ndarray, feature_idx: int
+    ) -> np.ndarray:
+        """Casts the values of a feature."""
+
+        min_max = self._mins_maxs[feature_idx]
+        if min_max is not None:
+            src_schema = self.operator.inputs["input"].schema.features[
+                feature_idx
+            ]
+            _check_overflow(
+                src_values,
+                src_schema.dtype,
+                self.operator.dtypes[feature_idx],
+                src_schema.name,
                 min_max,
-                np_dtype,
-                src_schema,
-                dst_schema,
-            ) in enumerate(
-                zip(
-                    mins_maxs,
-                    np_dtypes,
-                    input.schema.features,
-                    output_schema.features,
-                )
-            ):
-                src_values = index_data.features[feature_idx]
-                if min_max is not None:
-                    _check_overflow(
-                        src_values,
-                        src_schema.dtype,
-                        dst_schema.dtype,
-                        src_schema.name,
-                        min_max,
-                    )
-                dst_features.append(src_values.astype(np_dtype))
+            )
+        return src_values.astype(self._np_dtypes[feature_idx])
 
+    def __call__(self, input: EventSet) -> Dict[str, EventSet]:
+        assert isinstance(self.operator, CastOperator)
+        output_schema = self.output_schema("output")
+
+        # Reuse evset if actually no features changed dtype
+        if self.operator.is_noop:
+            return {"output": input}
+
+        output_evset = EventSet(data={}, schema=output_schema)
+        for index_key, index_data in input.data.items():
             output_evset.set_index_value(
                 index_key,
                 IndexData(
-                    features=dst_features,
+                    features=[
+                        self._do_operation(src_values, feature_idx)
+                        for feature_idx, src_values in enumerate(
+                            index_data.features
+                        )
+                    ],
                     timestamps=index_data.timestamps,
                     schema=output_schema,
                 ),
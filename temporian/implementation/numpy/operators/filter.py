@@ -10,6 +10,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class FilterNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the filter operator."""
 
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: FilterOperator) -> None:
         super().__init__(operator)
 
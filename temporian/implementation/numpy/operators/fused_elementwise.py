@@ -0,0 +1,195 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Implementation for the fused elementwise operator."""
+
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from temporian.core.operators.base import Operator
+from temporian.core.operators.fused_elementwise import FusedElementwiseOperator
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.operators.binary.base import (
+    BaseBinaryNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.cast import (
+    CastNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.scalar.base import (
+    BaseScalarNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.unary import (
+    BaseUnaryNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.where import (
+    WhereNumpyImplementation,
+)
+from temporian.implementation.numpy.parallel import map_index_items
+
+# Number of events processed at once. The intermediate results of a block
+# should fit in the CPU cache.
+_BLOCK_SIZE = 65536
+
+# Computes the output features of an operator from its input features.
+Kernel = Callable[[Dict[str, List[np.ndarray]]], List[np.ndarray]]
+
+
+class FusedElementwiseNumpyImplementation(OperatorImplementation):
+    """Numpy implementation of the fused elementwise operator.
+
+    For each index key, the events are processed in blocks of `_BLOCK_SIZE`
+    events. All the steps are applied on a block before moving to the next
+    one, so that the intermediate results stay in the CPU cache and the
+    memory of a block is re-used by the next one. Only the output features are
+    allocated at full size.
+    """
+
+    def __init__(self, operator: FusedElementwiseOperator) -> None:
+        super().__init__(operator)
+        assert isinstance(operator, FusedElementwiseOperator)
+
+        self._input_keys = [
+            f"input_{idx}" for idx in range(len(operator.inputs))
+        ]
+        self._kernels: List[Tuple[Kernel, Dict[str, int]]] = [
+            (_build_kernel(step.operator), step.inputs)
+            for step in operator.steps
+        ]
+
+    def __call__(self, **inputs: EventSet) -> Dict[str, EventSet]:
+        assert isinstance(self.operator, FusedElementwiseOperator)
+        output_schema = self.output_schema("output")
+        input_evsets = [inputs[key] for key in self._input_keys]
+
+        def compute_index(item) -> IndexData:
+            index_key, index_data = item
+            input_features = [
+                evset.data[index_key].features for evset in input_evsets
+            ]
+            num_events = len(index_data.timestamps)
+
+            if num_events <= _BLOCK_SIZE:
+                features = self._run_block(input_features)
+            else:
+                features = None
+                for begin in range(0, num_events, _BLOCK_SIZE):
+                    end = min(begin + _BLOCK_SIZE, num_events)
+                    block = self._run_block(
+                        [
+                            [feature[begin:end] for feature in register]
+                            for register in input_features
+                        ]
+                    )
+                    if features is None:
+                        features = [
+                            np.empty(num_events, dtype=values.dtype)
+                            for values in block
+                        ]
+                    for dst_values, src_values in zip(features, block):
+                        dst_values[begin:end] = src_values
+
+            return IndexData(
+                features=features,
+                timestamps=index_data.timestamps,
+                schema=output_schema,
+            )
+
+        dst_evset = EventSet(data={}, schema=output_schema)
+        items = list(input_evsets[0].data.items())
+        for (index_key, _), dst_index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
+            dst_evset.set_index_value(
+                index_key, dst_index_data, normalize=False
+            )
+        return {"output": dst_evset}
+
+    def _run_block(
+        self, input_features: List[List[np.ndarray]]
+    ) -> List[np.ndarray]:
+        """Applies all the steps on a block of events."""
+
+        registers = list(input_features)
+        for kernel, step_inputs in self._kernels:
+            registers.append(
+                kernel(
+                    {key: registers[idx] for key, idx in step_inputs.items()}
+                )
+            )
+        return registers[-1]
+
+
+def _build_kernel(operator: Operator) -> Kernel:
+    """Creates the kernel of an elementwise operator from its implementation."""
+
+    implementation = implementation_lib.get_implementation_class(
+        operator.definition.key
+    )(operator)
+
+    if isinstance(implementation, BaseBinaryNumpyImplementation):
+        dtypes = operator.inputs["input_1"].schema.feature_dtypes()
+        return lambda args: [
+            implementation._do_operation(feature_1, feature_2, dtype)
+            for feature_1, feature_2, dtype in zip(
+                args["input_1"], args["input_2"], dtypes
+            )
+        ]
+
+    if isinstance(implementation, BaseScalarNumpyImplementation):
+        dtypes = operator.inputs["input"].schema.feature_dtypes()
+        return lambda args: [
+            implementation._do_operation(feature, operator.value, dtype)
+            for feature, dtype in zip(args["input"], dtypes)
+        ]
+
+    if isinstance(implementation, BaseUnaryNumpyImplementation):
+        return lambda args: [
+            implementation._do_operation(feature) for feature in args["input"]
+        ]
+
+    if isinstance(implementation, CastNumpyImplementation):
+        if operator.is_noop:
+            return lambda args: args["input"]
+        return lambda args: [
+            implementation._do_operation(feature, feature_idx)
+            for feature_idx, feature in enumerate(args["input"])
+        ]
+
+    if isinstance(implementation, WhereNumpyImplementation):
+
+        def where_kernel(args: Dict[str, List[np.ndarray]]) -> List[np.ndarray]:
+            on_true = (
+                args["on_true"][0] if "on_true" in args else operator.on_true
+            )
+            on_false = (
+                args["on_false"][0] if "on_false" in args else operator.on_false
+            )
+            return [
+                implementation._do_operation(
+                    args["input"][0], on_true, on_false
+                )
+            ]
+
+        return where_kernel
+
+    raise ValueError(f"Operator {operator} cannot be fused.")
+
+
+implementation_lib.register_operator_implementation(
+    FusedElementwiseOperator, FusedElementwiseNumpyImplementation
+)
@@ -25,6 +25,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class GlueNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the glue operator."""
 
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: GlueOperator):
         super().__init__(operator)
         assert isinstance(operator, GlueOperator)
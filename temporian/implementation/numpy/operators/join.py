@@ -28,6 +28,7 @@ from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.join import Join
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 from temporian.implementation.numpy_cc.operators import operators_cc
 
 
@@ -68,8 +69,8 @@ class JoinNumpyImplementation(OperatorImplementation):
         # Create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
 
-        # Fill output EventSet's data
-        for index_key, left_item in left.data.items():
+        def compute_index(item) -> IndexData:
+            index_key, left_item = item
             num_output_events = len(left_item.timestamps)
 
             # The left features are passed directly
@@ -112,16 +113,19 @@ class JoinNumpyImplementation(OperatorImplementation):
                         ],
                     )
 
-            output_evset.set_index_value(
-                index_key,
-                IndexData(
-                    dst_left_data + dst_right_data,
-                    left_item.timestamps,
-                    schema=output_schema,
-                ),
-                normalize=False,
+            return IndexData(
+                dst_left_data + dst_right_data,
+                left_item.timestamps,
+                schema=output_schema,
             )
 
+        # Fill output EventSet's data
+        items = list(left.data.items())
+        for (index_key, _), index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
+            output_evset.set_index_value(index_key, index_data, normalize=False)
+
         return {"output": output_evset}
 
 
@@ -24,6 +24,7 @@ from temporian.implementation.numpy.data.dtype_normalization import (
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.implementation.numpy_cc.operators import operators_cc
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 
 
 class ResampleNumpyImplementation(OperatorImplementation):
@@ -50,16 +51,13 @@ class ResampleNumpyImplementation(OperatorImplementation):
         ]
         # create output EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
-        # iterate over destination sampling
-        for index_key, index_data in sampling.data.items():
+
+        def compute_index(item) -> IndexData:
+            index_key, sampling_data = item
             # initialize destination index data
             dst_mts = []
-
-            index_data = IndexData(dst_mts, index_data.timestamps, schema=None)
-            dst_evset.set_index_value(
-                index_key,
-                index_data,
-                normalize=False,
+            index_data = IndexData(
+                dst_mts, sampling_data.timestamps, schema=None
             )
 
             if index_key not in input.data:
@@ -76,7 +74,7 @@ class ResampleNumpyImplementation(OperatorImplementation):
                         )
                     )
                 index_data.check_schema(output_schema)
-                continue
+                return index_data
 
             src_mts = input.data[index_key].features
             src_timestamps = input.data[index_key].timestamps
@@ -103,6 +101,14 @@ class ResampleNumpyImplementation(OperatorImplementation):
                 dst_mts.append(dst_ts_data)
 
             index_data.check_schema(output_schema)
+            return index_data
+
+        # iterate over destination sampling
+        items = list(sampling.data.items())
+        for (index_key, _), index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
+            dst_evset.set_index_value(index_key, index_data, normalize=False)
 
         return {"output": dst_evset}
 
@@ -16,6 +16,7 @@ from typing import Union
 import numpy as np
 
 from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.operators.scalar.base import (
     BaseScalarNumpyImplementation,
 )
@@ -31,12 +32,16 @@ from temporian.implementation.numpy import implementation_lib
 
 
 class EqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
+    supports_dictionary_encoding = True
+
     def _do_operation(
         self,
         feature: np.ndarray,
         value: Union[float, int, str, bool],
         dtype: DType,
     ) -> np.ndarray:
+        if dictionary_encoding.is_encoded(feature):
+            return feature.codes == dictionary_encoding.lookup(feature, value)
         if dtype == DType.STRING:
             return np.char.equal(feature, value)
         else:
@@ -45,12 +50,16 @@ class EqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
 
 
 class NotEqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
+    supports_dictionary_encoding = True
+
     def _do_operation(
         self,
         feature: np.ndarray,
         value: Union[float, int, str, bool],
         dtype: DType,
     ) -> np.ndarray:
+        if dictionary_encoding.is_encoded(feature):
+            return feature.codes != dictionary_encoding.lookup(feature, value)
         if dtype == DType.STRING:
             return np.char.not_equal(feature, value)
         else:
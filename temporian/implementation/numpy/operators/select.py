@@ -17,13 +17,18 @@ from typing import Dict
 from temporian.core.operators.select import SelectOperator
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData
-from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    EventSet,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class SelectNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the select operator."""
 
+    supports_dictionary_encoding = True
+
     def __init__(self, operator: SelectOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, SelectOperator)
@@ -42,6 +47,20 @@ class SelectNumpyImplementation(OperatorImplementation):
             src_feature_names.index(feature_name)
             for feature_name in feature_names
         ]
+
+        if input.columnar is not None:
+            return {
+                "output": EventSet.from_columnar(
+                    ColumnarData(
+                        sampling=input.columnar.sampling,
+                        features=[
+                            input.columnar.features[idx] for idx in feature_idxs
+                        ],
+                    ),
+                    schema=output_schema,
+                )
+            }
+
         # create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
         # select feature index key-wise
@@ -18,8 +18,13 @@ import numpy as np
 
 from temporian.core.operators.since_last import SinceLast
 from temporian.implementation.numpy import implementation_lib
-from temporian.implementation.numpy.data.event_set import IndexData, EventSet
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    EventSet,
+    IndexData,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 from temporian.implementation.numpy_cc.operators import operators_cc
 
 
@@ -39,40 +44,69 @@ class SinceLastNumpyImplementation(OperatorImplementation):
         steps = self.operator.steps
 
         output_schema = self.output_schema("output")
+
+        if sampling is None and input.columnar is not None:
+            # All the index keys are processed at once.
+            columnar = input.columnar
+            return {
+                "output": EventSet.from_columnar(
+                    ColumnarData(
+                        sampling=columnar.sampling,
+                        features=[_since_last_columnar(columnar, steps)],
+                    ),
+                    schema=output_schema,
+                )
+            }
+
         output_evset = EventSet(data={}, schema=output_schema)
 
-        for index_key, index_data in input.data.items():
+        def compute_index(item) -> IndexData:
+            index_key, index_data = item
             if sampling is not None:
                 sampling_timestamps = sampling.data[index_key].timestamps
                 feature_values = operators_cc.since_last(
                     index_data.timestamps, sampling_timestamps, steps
                 )
-                output_evset.set_index_value(
-                    index_key,
-                    IndexData(
-                        [feature_values],
-                        sampling_timestamps,
-                        schema=output_schema,
-                    ),
-                    normalize=False,
+                return IndexData(
+                    [feature_values],
+                    sampling_timestamps,
+                    schema=output_schema,
                 )
             else:
                 t = index_data.timestamps
                 diffs = np.full_like(t, np.nan)
                 diffs[steps:] = t[steps:] - t[:-steps]  # ok if steps >= len(t)
-                output_evset.set_index_value(
-                    index_key,
-                    IndexData(
-                        [diffs],
-                        index_data.timestamps,
-                        schema=output_schema,
-                    ),
-                    normalize=False,
+                return IndexData(
+                    [diffs],
+                    index_data.timestamps,
+                    schema=output_schema,
                 )
 
+        items = list(input.data.items())
+        for (index_key, _), output_index_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
+            output_evset.set_index_value(
+                index_key, output_index_data, normalize=False
+            )
+
         return {"output": output_evset}
 
 
+def _since_last_columnar(columnar: ColumnarData, steps: int) -> np.ndarray:
+    """Computes "since_last" without sampling for all the index keys."""
+
+    t = columnar.sampling.timestamps
+    offsets = columnar.sampling.offsets
+    diffs = np.full_like(t, np.nan)
+    diffs[steps:] = t[steps:] - t[:-steps]  # ok if steps >= len(t)
+
+    # Events with less than "steps" previous events in their index key.
+    positions = np.arange(len(t)) - np.repeat(offsets[:-1], np.diff(offsets))
+    diffs[positions < steps] = np.nan
+    return diffs
+
+
 implementation_lib.register_operator_implementation(
     SinceLast, SinceLastNumpyImplementation
 )
@@ -16,7 +16,7 @@
 """Implementation for the Where operator."""
 
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import numpy as np
 from temporian.implementation.numpy.data.dtype_normalization import (
     normalize_features,
@@ -57,13 +57,9 @@ class WhereNumpyImplementation(OperatorImplementation):
             if on_false is not None:
                 on_false_source = on_false.data[index_key].features[0]
 
-            feature_values = np.where(
+            normalized_features = self._do_operation(
                 index_data.features[0], on_true_source, on_false_source
             )
-            normalized_features = normalize_features(
-                feature_values,
-                self.operator.output_feature_name,
-            )
 
             output_evset.set_index_value(
                 index_key,
@@ -76,6 +72,19 @@ class WhereNumpyImplementation(OperatorImplementation):
 
         return {"output": output_evset}
 
+    def _do_operation(
+        self,
+        condition: np.ndarray,
+        on_true_source: Any,
+        on_false_source: Any,
+    ) -> np.ndarray:
+        """Selects the values of the sources according to the condition."""
+
+        return normalize_features(
+            np.where(condition, on_true_source, on_false_source),
+            self.operator.output_feature_name,
+        )
+
 
 implementation_lib.register_operator_implementation(
     Where, WhereNumpyImplementation
@@ -14,7 +14,7 @@
 
 from abc import abstractmethod
 import logging
-from typing import Dict, Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Tuple, Union
 
 import numpy as np
 from temporian.core.data.duration_utils import NormalizedDuration
@@ -22,9 +22,11 @@ from temporian.core.data.duration_utils import NormalizedDuration
 from temporian.core.operators.window.base import BaseWindowOperator
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
     EventSet,
 )
 from temporian.implementation.numpy.operators.base import OperatorImplementation
+from temporian.implementation.numpy.parallel import map_index_items
 from temporian.implementation.numpy.data.dtype_normalization import (
     tp_dtype_to_np_dtype,
 )
@@ -62,12 +64,30 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
             is not input.node().sampling_node
         )
 
-        # create destination evset
         output_schema = self.operator.outputs["output"].schema
+
+        if (
+            input.columnar is not None
+            and not has_sampling
+            and window_length is None
+        ):
+            # All the index keys are processed at once.
+            columnar = input.columnar
+            return {
+                "output": EventSet.from_columnar(
+                    ColumnarData(
+                        sampling=columnar.sampling,
+                        features=self._compute_columnar(columnar),
+                    ),
+                    schema=output_schema,
+                )
+            }
+
+        # create destination evset
         output_evset = EventSet(data={}, schema=output_schema)
 
-        # For each index
-        for index_key, sampling_data in effective_sampling.data.items():
+        def compute_index(item) -> IndexData:
+            index_key, sampling_data = item
             output_data = IndexData(
                 features=[],
                 timestamps=sampling_data.timestamps,
@@ -86,8 +106,7 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
                         " output missing values."
                     )
             else:
-                assert self.operator.window_length is not None
-                effective_window_length = self.operator.window_length
+                effective_window_length = self._constant_window_length()
 
             sampling_timestamps = (
                 sampling_data.timestamps if has_sampling else None
@@ -107,7 +126,7 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
                 # Sets the feature data as missing.
                 empty_features = [
                     np.empty((0,), dtype=tp_dtype_to_np_dtype(f.dtype))
-                    for f in output_schema.features
+                    for f in input.schema.features
                 ]
                 empty_timestamps = np.empty((0,), dtype=np.float64)
                 self._compute(
@@ -119,6 +138,13 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
                 )
 
             output_data.check_schema(output_schema)
+            return output_data
+
+        # For each index
+        items = list(effective_sampling.data.items())
+        for (index_key, _), output_data in zip(
+            items, map_index_items(compute_index, items)
+        ):
             output_evset.set_index_value(
                 index_key, output_data, normalize=False
             )
@@ -129,27 +155,222 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
     def _implementation(self) -> Any:
         pass
 
+    def _scan_implementation(self) -> Optional[Any]:
+        """Implementation specialized for windows containing all the past
+        events (i.e. infinite window length), if any.
+
+        Takes the same arguments as `_implementation()`, except for the window
+        length.
+        """
+        return None
+
+    def _multi_implementation(self) -> Optional[Any]:
+        """Implementation computing several features at once, if any.
+
+        Takes the same arguments as `_implementation()`, except that
+        `evset_values` is a list of arrays with the same dtype. Returns the
+        list of output arrays.
+        """
+        return None
+
+    def _windows_implementation(self) -> Optional[Any]:
+        """Implementation computing several features on several constant
+        window lengths at once, if any.
+
+        Takes the same arguments as `_multi_implementation()`, except that
+        `window_length` is replaced by the list `window_lengths`. Returns, for
+        each window length, the list of output arrays.
+        """
+        return None
+
+    def _constant_window_length(
+        self,
+    ) -> Union[NormalizedDuration, List[NormalizedDuration]]:
+        """Window length, or list of window lengths, of an operator without
+        variable window length."""
+
+        assert isinstance(self.operator, BaseWindowOperator)
+        if self.operator.window_lengths is not None:
+            return self.operator.window_lengths
+        assert self.operator.window_length is not None
+        return self.operator.window_length
+
+    def _run_implementation(
+        self,
+        window_length: Union[NormalizedDuration, np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> np.ndarray:
+        """Runs the implementation, or the scan implementation if the window
+        length is infinite."""
+
+        if self._is_scan(window_length):
+            return self._scan_implementation()(**kwargs)
+
+        return self._implementation()(window_length=window_length, **kwargs)
+
+    def _run_implementation_on_features(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+        evset_values: List[np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Runs the implementation on several features.
+
+        The features with the same dtype are computed by a single call to the
+        implementation: The boundaries of the windows are computed once for
+        all of them.
+
+        If `window_length` is a list, returns the output of each window length
+        for each feature (see `_run_implementation_on_windows()`).
+        """
+
+        if isinstance(window_length, list):
+            return self._run_implementation_on_windows(
+                window_length, evset_values, **kwargs
+            )
+
+        multi_implementation = self._multi_implementation()
+        if (
+            multi_implementation is None
+            or self._is_scan(window_length)
+            or len(evset_values) <= 1
+        ):
+            return [
+                self._run_implementation(
+                    window_length, evset_values=values, **kwargs
+                )
+                for values in evset_values
+            ]
+
+        dst_features: List[Optional[np.ndarray]] = [None] * len(evset_values)
+        for feature_idxs in _feature_idxs_per_dtype(evset_values):
+            if len(feature_idxs) == 1:
+                dst_features[feature_idxs[0]] = self._run_implementation(
+                    window_length,
+                    evset_values=evset_values[feature_idxs[0]],
+                    **kwargs,
+                )
+                continue
+            results = multi_implementation(
+                window_length=window_length,
+                evset_values=[evset_values[idx] for idx in feature_idxs],
+                **kwargs,
+            )
+            for feature_idx, result in zip(feature_idxs, results):
+                dst_features[feature_idx] = result
+        return dst_features  # type: ignore
+
+    def _run_implementation_on_windows(
+        self,
+        window_lengths: List[NormalizedDuration],
+        evset_values: List[np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Runs the implementation on several features and window lengths.
+
+        Returns, for each feature, the output of each window length. The
+        features with the same dtype are computed on all the window lengths
+        by a single call to the implementation.
+        """
+
+        windows_implementation = self._windows_implementation()
+        if windows_implementation is None:
+            per_window = [
+                self._run_implementation_on_features(
+                    window_length, evset_values, **kwargs
+                )
+                for window_length in window_lengths
+            ]
+        else:
+            per_window = [[None] * len(evset_values) for _ in window_lengths]
+            for feature_idxs in _feature_idxs_per_dtype(evset_values):
+                results = windows_implementation(
+                    window_lengths=window_lengths,
+                    evset_values=[evset_values[idx] for idx in feature_idxs],
+                    **kwargs,
+                )
+                for window_results, dst_features in zip(results, per_window):
+                    for feature_idx, result in zip(
+                        feature_idxs, window_results
+                    ):
+                        dst_features[feature_idx] = result
+
+        return [
+            window_features[feature_idx]
+            for feature_idx in range(len(evset_values))
+            for window_features in per_window
+        ]
+
+    def _is_scan(
+        self, window_length: Union[NormalizedDuration, np.ndarray]
+    ) -> bool:
+        """Whether the scan implementation should be used."""
+
+        return (
+            not isinstance(window_length, np.ndarray)
+            and np.isinf(window_length)
+            and self._scan_implementation() is not None
+        )
+
     def _compute(
         self,
         src_timestamps: np.ndarray,
         src_features: List[np.ndarray],
         sampling_timestamps: Optional[np.ndarray],
         dst_features: List[np.ndarray],
-        window_length: Union[NormalizedDuration, np.ndarray],
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
     ) -> None:
         assert isinstance(self.operator, BaseWindowOperator)
 
-        implementation = self._implementation()
-        for src_ts in src_features:
-            kwargs = {
-                "evset_timestamps": src_timestamps,
-                "evset_values": src_ts,
-                "window_length": window_length,
-            }
-            if sampling_timestamps is not None:
-                kwargs["sampling_timestamps"] = sampling_timestamps
-            dst_feature = implementation(**kwargs)
-            dst_features.append(dst_feature)
+        kwargs = {"evset_timestamps": src_timestamps}
+        if sampling_timestamps is not None:
+            kwargs["sampling_timestamps"] = sampling_timestamps
+        dst_features.extend(
+            self._run_implementation_on_features(
+                window_length, evset_values=src_features, **kwargs
+            )
+        )
+
+    def _compute_columnar(self, columnar: ColumnarData) -> List[np.ndarray]:
+        """Computes the output features of all the index keys of an EventSet
+        in the columnar layout, without sampling and with a constant window
+        length."""
+
+        window_length = self._constant_window_length()
+        if not isinstance(window_length, list):
+            window_length = float(window_length)
+
+        return self._run_implementation_on_features(
+            window_length,
+            evset_values=columnar.features,
+            evset_timestamps=columnar.sampling.timestamps,
+            offsets=columnar.sampling.offsets,
+        )
+
+    def feature_wise_num_outputs(self) -> Optional[int]:
+        """Number of output features of `apply_feature_wise()` and
+        `apply_feature_wise_with_sampling()` for each input feature, or None
+        if they return a single output feature directly."""
+
+        assert isinstance(self.operator, BaseWindowOperator)
+        if self.operator.window_lengths is None:
+            return None
+        return len(self.operator.window_lengths)
+
+    def _feature_wise_outputs(self, results: List[np.ndarray]) -> Any:
+        """Packs the output features of a single input feature.
+
+        With several window lengths, returns a two-dimensional array with the
+        output of each window length in a row.
+        """
+
+        if self.feature_wise_num_outputs() is None:
+            return results[0]
+        return np.stack(results)
 
     def apply_feature_wise(
         self,
@@ -157,16 +378,18 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
         src_feature: np.ndarray,
         feature_idx: int,
     ) -> np.ndarray:
-        """Applies the operator on a single feature."""
-        assert isinstance(self.operator, BaseWindowOperator)
+        """Applies the operator on a single feature.
 
-        implementation = self._implementation()
-        kwargs = {
-            "evset_timestamps": src_timestamps,
-            "evset_values": src_feature,
-            "window_length": self.operator.window_length,
-        }
-        return implementation(**kwargs)
+        If several window lengths are specified, returns a two-dimensional
+        array with the output of each window length in a row.
+        """
+        window_length = self._constant_window_length()
+        results = self._run_implementation_on_features(
+            window_length,
+            evset_values=[src_feature],
+            evset_timestamps=src_timestamps,
+        )
+        return self._feature_wise_outputs(results)
 
     def apply_feature_wise_with_sampling(
         self,
@@ -175,31 +398,60 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
         sampling_timestamps: np.ndarray,
         feature_idx: int,
     ) -> np.ndarray:
-        """Applies the operator on a single feature with a sampling."""
+        """Applies the operator on a single feature with a sampling.
 
-        assert isinstance(self.operator, BaseWindowOperator)
-        implementation = self._implementation()
-
-        if src_feature is not None:
-            kwargs = {
-                "evset_timestamps": src_timestamps,
-                "evset_values": src_feature,
-                "window_length": self.operator.window_length,
-                "sampling_timestamps": sampling_timestamps,
-            }
-            return implementation(**kwargs)
-        else:
+        If several window lengths are specified, returns a two-dimensional
+        array with the output of each window length in a row.
+        """
+
+        window_length = self._constant_window_length()
+
+        if src_feature is None:
             # Sets the feature data as missing.
+            num_outputs = self.feature_wise_num_outputs() or 1
             output_schema = self.operator.outputs["output"].schema
-            output_dtype = output_schema.features[feature_idx].dtype
-            empty_features = np.empty(
+            output_dtype = output_schema.features[
+                feature_idx * num_outputs
+            ].dtype
+            src_feature = np.empty(
                 (0,), dtype=tp_dtype_to_np_dtype(output_dtype)
             )
-            empty_timestamps = np.empty((0,), dtype=np.float64)
-            kwargs = {
-                "evset_timestamps": empty_timestamps,
-                "evset_values": empty_features,
-                "window_length": self.operator.window_length,
-                "sampling_timestamps": sampling_timestamps,
-            }
-            return implementation(**kwargs)
+            src_timestamps = np.empty((0,), dtype=np.float64)
+
+        results = self._run_implementation_on_features(
+            window_length,
+            evset_values=[src_feature],
+            evset_timestamps=src_timestamps,
+            sampling_timestamps=sampling_timestamps,
+        )
+        return self._feature_wise_outputs(results)
+
+
+def _feature_idxs_per_dtype(evset_values: List[np.ndarray]) -> List[List[int]]:
+    """Groups the indices of the features by dtype."""
+
+    feature_idxs_per_dtype: Dict[np.dtype, List[int]] = {}
+    for feature_idx, values in enumerate(evset_values):
+        feature_idxs_per_dtype.setdefault(values.dtype, []).append(feature_idx)
+    return list(feature_idxs_per_dtype.values())
+
+
+def _encode_values(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Encodes values for the c++ implementations, which only support numerical
+    values.
+
+    Strings are replaced by their int64 index in the sorted unique values, and
+    booleans are cast to int32. Equal values have equal encodings.
+
+    Returns the encoded values, and the unique values to decode them (if the
+    values are strings).
+    """
+
+    if values.dtype.kind in ("S", "U", "O"):
+        vocabulary, codes = np.unique(values, return_inverse=True)
+        return codes.astype(np.int64).reshape(-1), vocabulary
+    if values.dtype == np.bool_:
+        return values.astype(np.int32), None
+    return values, None
@@ -0,0 +1,92 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from temporian.core.data.duration_utils import NormalizedDuration
+from temporian.core.operators.window.moving_aggregate import (
+    MovingAggregateOperator,
+)
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.operators.window.base import (
+    BaseWindowNumpyImplementation,
+    _feature_idxs_per_dtype,
+)
+from temporian.implementation.numpy_cc.operators import operators_cc
+
+
+class MovingAggregateNumpyImplementation(BaseWindowNumpyImplementation):
+    """Numpy implementation of the moving aggregate operator."""
+
+    def _implementation(self):
+        return operators_cc.moving_aggregate
+
+    def _run_implementation_on_features(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+        evset_values: List[np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Computes all the aggregations of all the features.
+
+        The features with the same dtype are computed by a single call to the
+        implementation, which maintains the accumulators of all the
+        aggregations in the same pass.
+
+        Returns, for each feature, the output of each aggregation (and of each
+        window length, if `window_length` is a list).
+        """
+
+        assert isinstance(self.operator, MovingAggregateOperator)
+
+        if isinstance(window_length, list):
+            per_window = [
+                self._run_implementation_on_features(
+                    single_window_length, evset_values, **kwargs
+                )
+                for single_window_length in window_length
+            ]
+            return [
+                window_features[output_idx]
+                for output_idx in range(len(per_window[0]))
+                for window_features in per_window
+            ]
+
+        dst_features: List[Optional[List[np.ndarray]]] = [None] * len(
+            evset_values
+        )
+        for feature_idxs in _feature_idxs_per_dtype(evset_values):
+            results = self._implementation()(
+                window_length=window_length,
+                evset_values=[evset_values[idx] for idx in feature_idxs],
+                ops=self.operator.ops,
+                **kwargs,
+            )
+            for feature_idx, result in zip(feature_idxs, results):
+                dst_features[feature_idx] = result
+
+        return [
+            output
+            for feature_outputs in dst_features
+            for output in feature_outputs  # type: ignore
+        ]
+
+
+implementation_lib.register_operator_implementation(
+    MovingAggregateOperator, MovingAggregateNumpyImplementation
+)
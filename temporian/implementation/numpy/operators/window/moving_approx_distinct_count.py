@@ -0,0 +1,77 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import partial
+from typing import List, Union
+
+import numpy as np
+
+from temporian.core.data.duration_utils import NormalizedDuration
+from temporian.core.operators.window.moving_approx_distinct_count import (
+    MovingApproxDistinctCountOperator,
+)
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.operators.window.base import (
+    BaseWindowNumpyImplementation,
+    _encode_values,
+)
+from temporian.implementation.numpy_cc.operators import operators_cc
+
+
+class MovingApproxDistinctCountNumpyImplementation(
+    BaseWindowNumpyImplementation
+):
+    """Numpy implementation of the moving approximate distinct count
+    operator."""
+
+    def _implementation(self):
+        multi_implementation = self._multi_implementation()
+
+        def implementation(evset_values: np.ndarray, **kwargs) -> np.ndarray:
+            return multi_implementation(evset_values=[evset_values], **kwargs)[
+                0
+            ]
+
+        return implementation
+
+    def _multi_implementation(self):
+        assert isinstance(self.operator, MovingApproxDistinctCountOperator)
+        return partial(
+            operators_cc.moving_approx_distinct_count,
+            precision=self.operator.precision,
+        )
+
+    def _run_implementation_on_features(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+        evset_values: List[np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Counts the distinct values of the encoded features (see
+        `_encode_values()`), since equal values have equal encodings."""
+
+        return super()._run_implementation_on_features(
+            window_length,
+            evset_values=[_encode_values(values)[0] for values in evset_values],
+            **kwargs,
+        )
+
+
+implementation_lib.register_operator_implementation(
+    MovingApproxDistinctCountOperator,
+    MovingApproxDistinctCountNumpyImplementation,
+)
@@ -0,0 +1,146 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+from temporian.core.data.dtype import DType
+from temporian.core.data.duration_utils import NormalizedDuration
+from temporian.core.operators.window.moving_approx_heavy_hitters import (
+    MovingApproxHeavyHittersOperator,
+)
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.operators.window.base import (
+    BaseWindowNumpyImplementation,
+    _encode_values,
+    _feature_idxs_per_dtype,
+)
+from temporian.implementation.numpy_cc.operators import operators_cc
+
+
+class MovingApproxHeavyHittersNumpyImplementation(
+    BaseWindowNumpyImplementation
+):
+    """Numpy implementation of the moving approximate heavy hitters
+    operator."""
+
+    def _implementation(self):
+        return operators_cc.moving_approx_heavy_hitters
+
+    def feature_wise_num_outputs(self) -> Optional[int]:
+        assert isinstance(self.operator, MovingApproxHeavyHittersOperator)
+        num_windows = super().feature_wise_num_outputs() or 1
+        return 2 * self.operator.k * num_windows
+
+    def _feature_wise_outputs(self, results: List[np.ndarray]) -> Any:
+        # The heavy hitters and their counts have different dtypes, and are
+        # not stacked.
+        return results
+
+    def _run_implementation_on_features(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+        evset_values: List[np.ndarray],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Computes the heavy hitters of all the features.
+
+        The features with the same dtype are computed by a single call to the
+        implementation. String and boolean features are encoded (see
+        `_encode_values()`) and the heavy hitters are decoded.
+
+        Returns, for each feature, each heavy hitter followed by its count
+        (for each window length, if `window_length` is a list).
+        """
+
+        assert isinstance(self.operator, MovingApproxHeavyHittersOperator)
+
+        if isinstance(window_length, list):
+            per_window = [
+                self._run_implementation_on_features(
+                    single_window_length, evset_values, **kwargs
+                )
+                for single_window_length in window_length
+            ]
+            return [
+                window_features[output_idx]
+                for output_idx in range(len(per_window[0]))
+                for window_features in per_window
+            ]
+
+        encoded_values = [_encode_values(values) for values in evset_values]
+        dst_features: List[Optional[List[np.ndarray]]] = [None] * len(
+            evset_values
+        )
+        for feature_idxs in _feature_idxs_per_dtype(
+            [codes for codes, _ in encoded_values]
+        ):
+            results = self._implementation()(
+                window_length=window_length,
+                evset_values=[encoded_values[idx][0] for idx in feature_idxs],
+                k=self.operator.k,
+                epsilon=self.operator.epsilon,
+                **kwargs,
+            )
+            for feature_idx, result in zip(feature_idxs, results):
+                dst_features[feature_idx] = _decode_heavy_hitters(
+                    result,
+                    dtype=evset_values[feature_idx].dtype,
+                    vocabulary=encoded_values[feature_idx][1],
+                )
+
+        return [
+            output
+            for feature_outputs in dst_features
+            for output in feature_outputs  # type: ignore
+        ]
+
+
+def _decode_heavy_hitters(
+    outputs: List[np.ndarray],
+    dtype: np.dtype,
+    vocabulary: Optional[np.ndarray],
+) -> List[np.ndarray]:
+    """Decodes the heavy hitters of an encoded feature.
+
+    `outputs` contains each heavy hitter followed by its count. The missing
+    heavy hitters (i.e. with a count of 0) of string features are set to the
+    missing string value.
+    """
+
+    decoded = []
+    for values, counts in zip(outputs[::2], outputs[1::2]):
+        if vocabulary is not None:
+            strings = np.full(
+                len(values),
+                DType.STRING.missing_value(),
+                dtype=vocabulary.dtype if len(vocabulary) > 0 else np.bytes_,
+            )
+            has_value = counts > 0
+            strings[has_value] = vocabulary[values[has_value]]
+            values = strings
+        elif values.dtype != dtype:
+            values = values.astype(dtype)
+        decoded.extend([values, counts])
+    return decoded
+
+
+implementation_lib.register_operator_implementation(
+    MovingApproxHeavyHittersOperator,
+    MovingApproxHeavyHittersNumpyImplementation,
+)
@@ -0,0 +1,54 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import partial
+
+import numpy as np
+
+from temporian.core.operators.window.moving_approx_quantile import (
+    MovingApproxQuantileOperator,
+)
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.operators.window.base import (
+    BaseWindowNumpyImplementation,
+)
+from temporian.implementation.numpy_cc.operators import operators_cc
+
+
+class MovingApproxQuantileNumpyImplementation(BaseWindowNumpyImplementation):
+    """Numpy implementation of the moving approximate quantile operator."""
+
+    def _implementation(self):
+        multi_implementation = self._multi_implementation()
+
+        def implementation(evset_values: np.ndarray, **kwargs) -> np.ndarray:
+            return multi_implementation(evset_values=[evset_values], **kwargs)[
+                0
+            ]
+
+        return implementation
+
+    def _multi_implementation(self):
+        assert isinstance(self.operator, MovingApproxQuantileOperator)
+        return partial(
+            operators_cc.moving_approx_quantile,
+            quantile=self.operator.quantile,
+            relative_accuracy=self.operator.relative_accuracy,
+        )
+
+
+implementation_lib.register_operator_implementation(
+    MovingApproxQuantileOperator, MovingApproxQuantileNumpyImplementation
+)
@@ -20,6 +20,7 @@ from temporian.core.operators.window.moving_count import (
     MovingCountOperator,
 )
 from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.event_set import ColumnarData
 from temporian.implementation.numpy.operators.window.base import (
     BaseWindowNumpyImplementation,
 )
@@ -32,29 +33,58 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_count
 
+    def _count(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+        **kwargs: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Counts the events in the windows of each window length."""
+
+        window_lengths = (
+            window_length
+            if isinstance(window_length, list)
+            else [window_length]
+        )
+        implementation = self._implementation()
+        return [
+            implementation(window_length=window_length, **kwargs)
+            for window_length in window_lengths
+        ]
+
     def _compute(
         self,
         src_timestamps: np.ndarray,
         src_features: List[np.ndarray],
         sampling_timestamps: Optional[np.ndarray],
         dst_features: List[np.ndarray],
-        window_length: Union[NormalizedDuration, np.ndarray],
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
     ) -> None:
         assert isinstance(self.operator, MovingCountOperator)
 
         del src_features  # Features are ignored
 
-        implementation = self._implementation()
-
-        kwargs = {
-            "evset_timestamps": src_timestamps,
-            "window_length": window_length,
-        }
+        kwargs = {"evset_timestamps": src_timestamps}
         if sampling_timestamps is not None:
             kwargs["sampling_timestamps"] = sampling_timestamps
 
-        dst_feature = implementation(**kwargs)
-        dst_features.append(dst_feature)
+        dst_features.extend(self._count(window_length, **kwargs))
+
+    def _compute_columnar(self, columnar: ColumnarData) -> List[np.ndarray]:
+        assert isinstance(self.operator, MovingCountOperator)
+
+        window_length = self._constant_window_length()
+        if not isinstance(window_length, list):
+            window_length = float(window_length)
+
+        return self._count(
+            window_length,
+            evset_timestamps=columnar.sampling.timestamps,
+            offsets=columnar.sampling.offsets,
+        )
 
     def apply_feature_wise(
         self,
@@ -66,12 +96,11 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
 
         assert isinstance(self.operator, MovingCountOperator)
 
-        implementation = self._implementation()
-        kwargs = {
-            "evset_timestamps": src_timestamps,
-            "window_length": self.operator.window_length,
-        }
-        return implementation(**kwargs)
+        window_length = self._constant_window_length()
+        results = self._count(window_length, evset_timestamps=src_timestamps)
+        return (
+            np.stack(results) if isinstance(window_length, list) else results[0]
+        )
 
     def apply_feature_wise_with_sampling(
         self,
@@ -83,24 +112,20 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
         """Applies the operator on a single feature with a sampling."""
 
         assert isinstance(self.operator, MovingCountOperator)
-        implementation = self._implementation()
 
-        if src_feature is not None:
-            kwargs = {
-                "evset_timestamps": src_timestamps,
-                "window_length": self.operator.window_length,
-                "sampling_timestamps": sampling_timestamps,
-            }
-            return implementation(**kwargs)
-        else:
+        if src_feature is None:
             # Sets the feature data as missing.
-            empty_timestamps = np.empty((0,), dtype=np.float64)
-            kwargs = {
-                "evset_timestamps": empty_timestamps,
-                "window_length": self.operator.window_length,
-                "sampling_timestamps": sampling_timestamps,
-            }
-            return implementation(**kwargs)
+            src_timestamps = np.empty((0,), dtype=np.float64)
+
+        window_length = self._constant_window_length()
+        results = self._count(
+            window_length,
+            evset_timestamps=src_timestamps,
+            sampling_timestamps=sampling_timestamps,
+        )
+        return (
+            np.stack(results) if isinstance(window_length, list) else results[0]
+        )
 
 
 implementation_lib.register_operator_implementation(
@@ -29,6 +29,12 @@ class MovingMaxNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_max
 
+    def _multi_implementation(self):
+        return operators_cc.moving_max_multi
+
+    def _windows_implementation(self):
+        return operators_cc.moving_max_windows
+
 
 implementation_lib.register_operator_implementation(
     MovingMaxOperator, MovingMaxNumpyImplementation
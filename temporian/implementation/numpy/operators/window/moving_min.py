@@ -29,6 +29,12 @@ class MovingMinNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_min
 
+    def _multi_implementation(self):
+        return operators_cc.moving_min_multi
+
+    def _windows_implementation(self):
+        return operators_cc.moving_min_windows
+
 
 implementation_lib.register_operator_implementation(
     MovingMinOperator, MovingMinNumpyImplementation
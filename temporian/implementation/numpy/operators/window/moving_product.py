@@ -29,6 +29,15 @@ class MovingProductNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_product
 
+    def _multi_implementation(self):
+        return operators_cc.moving_product_multi
+
+    def _windows_implementation(self):
+        return operators_cc.moving_product_windows
+
+    def _scan_implementation(self):
+        return operators_cc.cumprod
+
 
 implementation_lib.register_operator_implementation(
     MovingProductOperator, MovingProductNumpyImplementation
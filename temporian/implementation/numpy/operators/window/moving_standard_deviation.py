@@ -29,6 +29,12 @@ class MovingStandardDeviationNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_standard_deviation
 
+    def _multi_implementation(self):
+        return operators_cc.moving_standard_deviation_multi
+
+    def _windows_implementation(self):
+        return operators_cc.moving_standard_deviation_windows
+
 
 implementation_lib.register_operator_implementation(
     MovingStandardDeviationOperator, MovingStandardDeviationNumpyImplementation
@@ -29,6 +29,15 @@ class MovingSumNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.moving_sum
 
+    def _multi_implementation(self):
+        return operators_cc.moving_sum_multi
+
+    def _windows_implementation(self):
+        return operators_cc.moving_sum_windows
+
+    def _scan_implementation(self):
+        return operators_cc.cumsum
+
 
 implementation_lib.register_operator_implementation(
     MovingSumOperator, MovingSumNumpyImplementation
@@ -29,6 +29,12 @@ class SimpleMovingAverageNumpyImplementation(BaseWindowNumpyImplementation):
     def _implementation(self):
         return operators_cc.simple_moving_average
 
+    def _multi_implementation(self):
+        return operators_cc.simple_moving_average_multi
+
+    def _windows_implementation(self):
+        return operators_cc.simple_moving_average_windows
+
 
 implementation_lib.register_operator_implementation(
     SimpleMovingAverageOperator, SimpleMovingAverageNumpyImplementation
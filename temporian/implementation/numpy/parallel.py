@@ -0,0 +1,155 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities to process the index keys of EventSets in parallel."""
+
+import os
+import threading
+from concurrent import futures
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from temporian.utils import config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Number of chunks of index keys per thread. More chunks balance the work
+# better between threads, but add scheduling overhead.
+_NUM_CHUNKS_PER_THREAD = 4
+
+# Shared thread pool, and its number of threads. When the number of threads
+# changes, the pool is replaced by a new one.
+_executor: Optional[futures.ThreadPoolExecutor] = None
+_executor_num_threads = 0
+# Number of "map_index_items" calls using each pool. A replaced pool is shut
+# down once it is not used anymore.
+_executor_users: Dict[futures.ThreadPoolExecutor, int] = {}
+_executor_lock = threading.Lock()
+
+
+def _reset_executor_after_fork() -> None:
+    """Drops the thread pools inherited from the parent process.
+
+    The threads of the pools are not copied by os.fork, so the pools are
+    unusable in the child process.
+    """
+
+    global _executor, _executor_num_threads, _executor_users, _executor_lock
+    _executor = None
+    _executor_num_threads = 0
+    _executor_users = {}
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor_after_fork)
+
+
+def _acquire_executor(num_threads: int) -> futures.ThreadPoolExecutor:
+    """Gets the shared thread pool with `num_threads` threads.
+
+    If the shared pool has a different number of threads, it is replaced by a
+    new pool. Each call should be matched by a call to `_release_executor`.
+    """
+
+    global _executor, _executor_num_threads
+    with _executor_lock:
+        if _executor is None or _executor_num_threads != num_threads:
+            previous_executor = _executor
+            _executor = futures.ThreadPoolExecutor(
+                max_workers=num_threads,
+                thread_name_prefix="temporian_index",
+            )
+            _executor_num_threads = num_threads
+            _executor_users[_executor] = 0
+            if previous_executor is not None:
+                _shutdown_if_unused(previous_executor)
+        _executor_users[_executor] += 1
+        return _executor
+
+
+def _release_executor(executor: futures.ThreadPoolExecutor) -> None:
+    """Releases a thread pool returned by `_acquire_executor`."""
+
+    with _executor_lock:
+        _executor_users[executor] -= 1
+        if executor is not _executor:
+            _shutdown_if_unused(executor)
+
+
+def _shutdown_if_unused(executor: futures.ThreadPoolExecutor) -> None:
+    """Shuts down a replaced thread pool if no call is using it.
+
+    Should be called with `_executor_lock` held.
+    """
+
+    if _executor_users[executor] == 0:
+        del _executor_users[executor]
+        executor.shutdown(wait=False)
+
+
+def map_index_items(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    num_threads: Optional[int] = None,
+) -> List[R]:
+    """Applies a function on each item, possibly in parallel.
+
+    The items are typically the (index key, index data) pairs of an EventSet.
+    The results are returned in the same order as the items, such that the
+    output EventSet can be assembled deterministically.
+
+    The items are split into contiguous chunks, and each chunk is processed
+    sequentially by a thread of a shared pool. Threads only speed up the
+    computation if "fn" releases the GIL e.g. by calling NumPy or the c++
+    operator kernels.
+
+    By convention, the c++ operator kernels release the GIL (with a
+    `py::gil_scoped_release` scope) while iterating over the data of an index
+    key: Those loops do not access Python objects, so other threads can
+    process other index keys in the meantime.
+
+    Args:
+        fn: Function to apply on each item. "fn" should not modify any shared
+            state.
+        items: Items to process.
+        num_threads: Number of threads. If None, uses
+            `tp.config.num_index_threads`.
+
+    Returns:
+        The results of "fn" on each of the items.
+    """
+
+    if num_threads is None:
+        num_threads = config.num_index_threads
+
+    if num_threads <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    num_chunks = min(len(items), num_threads * _NUM_CHUNKS_PER_THREAD)
+    chunk_size = (len(items) + num_chunks - 1) // num_chunks
+
+    def process_chunk(begin: int) -> List[R]:
+        return [fn(item) for item in items[begin : begin + chunk_size]]
+
+    executor = _acquire_executor(num_threads)
+    try:
+        results: List[R] = []
+        for chunk_results in executor.map(
+            process_chunk, range(0, len(items), chunk_size)
+        ):
+            results.extend(chunk_results)
+        return results
+    finally:
+        _release_executor(executor)
@@ -0,0 +1,96 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from absl.testing import absltest, parameterized
+
+from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy import parallel
+from temporian.implementation.numpy.parallel import map_index_items
+from temporian.test.utils import assertOperatorResult
+from temporian.utils import config
+
+
+class ParallelTest(parameterized.TestCase):
+    def setUp(self):
+        self._num_index_threads = config.num_index_threads
+
+    def tearDown(self):
+        config.num_index_threads = self._num_index_threads
+
+    @parameterized.parameters(1, 2, 3, 8)
+    def test_map_index_items_keeps_order(self, num_threads):
+        items = list(range(37))
+        result = map_index_items(lambda x: x * 2, items, num_threads)
+        self.assertEqual(result, [x * 2 for x in items])
+
+    def test_map_index_items_empty(self):
+        self.assertEqual(map_index_items(lambda x: x, [], 4), [])
+
+    def test_executor_usable_after_changing_num_threads(self):
+        executor = parallel._acquire_executor(2)
+        # Another thread uses a different number of threads.
+        map_index_items(lambda x: x, list(range(10)), 3)
+        self.assertEqual(executor.submit(lambda: 5).result(), 5)
+        parallel._release_executor(executor)
+        # The replaced pool is shut down once it is not used anymore.
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda: 5)
+
+    def test_single_executor(self):
+        for num_threads in [2, 3, 4, 3]:
+            map_index_items(lambda x: x, list(range(10)), num_threads)
+        self.assertEqual(list(parallel._executor_users.values()), [0])
+        self.assertEqual(parallel._executor_num_threads, 3)
+
+    def test_operators(self):
+        num_events = 200
+        rng = np.random.default_rng(seed=0)
+        evset = event_set(
+            timestamps=rng.uniform(0, 100, size=num_events),
+            features={
+                "x": rng.normal(size=num_events),
+                "y": rng.normal(size=num_events),
+                "k": rng.integers(0, 20, size=num_events),
+            },
+            indexes=["k"],
+            is_unix_timestamp=True,
+        )
+        sampling = event_set(
+            timestamps=np.arange(0, 100, 5.0).tolist() * 20,
+            features={"k": np.repeat(np.arange(20), 20)},
+            indexes=["k"],
+            is_unix_timestamp=True,
+        )
+
+        def compute():
+            return [
+                evset.moving_sum(10.0),
+                evset.moving_sum(10.0, sampling=sampling),
+                evset["x"] + evset["y"],
+                evset.since_last(),
+                evset.resample(sampling),
+                evset.join(sampling),
+                evset.calendar_hour(),
+            ]
+
+        config.num_index_threads = 1
+        expected = compute()
+        config.num_index_threads = 4
+        for result, expected_result in zip(compute(), expected):
+            assertOperatorResult(self, result, expected_result)
+
+
+if __name__ == "__main__":
+    absltest.main()
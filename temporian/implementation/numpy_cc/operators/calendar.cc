@@ -87,14 +87,17 @@ std::optional<std::string> apply_calendar_op(
   auto v_output = output.mutable_unchecked<1>();
   auto v_timestamps = timestamps.unchecked<1>();
 
-  for (Idx i = 0; i < n_events; i++) {
-    // Create absolute time in UTC
-    const auto nanos = static_cast<int64_t>(v_timestamps[i] * 1e9);
-    const auto utc_time = absl::FromUnixNanos(nanos);
-
-    // Convert to civil time and call calendar_op
-    const auto local_time = absl::ToCivilSecond(utc_time, parsed_tz);
-    v_output[i] = calendar_op(local_time);
+  {
+    py::gil_scoped_release release;
+    for (Idx i = 0; i < n_events; i++) {
+      // Create absolute time in UTC
+      const auto nanos = static_cast<int64_t>(v_timestamps[i] * 1e9);
+      const auto utc_time = absl::FromUnixNanos(nanos);
+
+      // Convert to civil time and call calendar_op
+      const auto local_time = absl::ToCivilSecond(utc_time, parsed_tz);
+      v_output[i] = calendar_op(local_time);
+    }
   }
 
   return {};
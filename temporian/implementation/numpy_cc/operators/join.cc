@@ -29,13 +29,16 @@ py::array_t<Idx> left_join_idxs(const py::array_t<double> &left_timestamps,
   auto v_right = right_timestamps.unchecked<1>();
 
   Idx right_idx = 0;
-  for (Idx left_idx = 0; left_idx < n_left; left_idx++) {
-    const auto left = v_left[left_idx];
-    while (right_idx < n_right && v_right[right_idx] < left) {
-      right_idx++;
+  {
+    py::gil_scoped_release release;
+    for (Idx left_idx = 0; left_idx < n_left; left_idx++) {
+      const auto left = v_left[left_idx];
+      while (right_idx < n_right && v_right[right_idx] < left) {
+        right_idx++;
+      }
+      v_idxs[left_idx] =
+          (right_idx < n_right && left == v_right[right_idx]) ? right_idx : -1;
     }
-    v_idxs[left_idx] =
-        (right_idx < n_right && left == v_right[right_idx]) ? right_idx : -1;
   }
 
   return idxs;
@@ -60,26 +63,29 @@ py::array_t<Idx> left_join_on_idxs(const py::array_t<double> &left_timestamps,
   auto v_right_on = right_on.unchecked<1>();
 
   Idx right_idx = 0;
-  for (Idx left_idx = 0; left_idx < n_left; left_idx++) {
-    const auto left = v_left[left_idx];
-    const auto left_on = v_left_on[left_idx];
-
-    while (right_idx < n_right && v_right[right_idx] < left) {
-      right_idx++;
-    }
-
-    // Scan all the right items with the same timestamp until we find an "on"
-    // match.
-    auto sub_right_idx = right_idx;
-    while (sub_right_idx < n_right && v_right[sub_right_idx] == left &&
-           left_on != v_right_on[sub_right_idx]) {
-      sub_right_idx++;
+  {
+    py::gil_scoped_release release;
+    for (Idx left_idx = 0; left_idx < n_left; left_idx++) {
+      const auto left = v_left[left_idx];
+      const auto left_on = v_left_on[left_idx];
+
+      while (right_idx < n_right && v_right[right_idx] < left) {
+        right_idx++;
+      }
+
+      // Scan all the right items with the same timestamp until we find an "on"
+      // match.
+      auto sub_right_idx = right_idx;
+      while (sub_right_idx < n_right && v_right[sub_right_idx] == left &&
+             left_on != v_right_on[sub_right_idx]) {
+        sub_right_idx++;
+      }
+
+      v_idxs[left_idx] =
+          (sub_right_idx < n_right && left == v_right[sub_right_idx])
+              ? sub_right_idx
+              : -1;
     }
-
-    v_idxs[left_idx] =
-        (sub_right_idx < n_right && left == v_right[sub_right_idx])
-            ? sub_right_idx
-            : -1;
   }
 
   return idxs;
@@ -32,14 +32,17 @@ std::tuple<py::array_t<Idx>, Idx> build_sampling_idxs(
   Idx first_valid_idx = 0;
 
   Idx next_event_idx = 0;
-  for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
-    const auto t = v_sampling[sampling_idx];
-    while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
-      next_event_idx++;
-    }
-    v_idxs[sampling_idx] = next_event_idx - 1;
-    if (next_event_idx == 0) {
-      first_valid_idx = sampling_idx + 1;
+  {
+    py::gil_scoped_release release;
+    for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+      const auto t = v_sampling[sampling_idx];
+      while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
+        next_event_idx++;
+      }
+      v_idxs[sampling_idx] = next_event_idx - 1;
+      if (next_event_idx == 0) {
+        first_valid_idx = sampling_idx + 1;
+      }
     }
   }
 
@@ -29,19 +29,22 @@ py::array_t<double> since_last(const py::array_t<double> &event_timestamps,
   auto v_sampling = sampling_timestamps.unchecked<1>();
 
   Idx next_event_idx = 0;
-  for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
-    const auto t = v_sampling[sampling_idx];
-    while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
-      next_event_idx++;
+  {
+    py::gil_scoped_release release;
+    for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+      const auto t = v_sampling[sampling_idx];
+      while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
+        next_event_idx++;
+      }
+      double value;
+      Idx since_last_idx = next_event_idx - steps;
+      if (since_last_idx < 0) {
+        value = std::numeric_limits<double>::quiet_NaN();
+      } else {
+        value = t - v_event[since_last_idx];
+      }
+      v_since_last[sampling_idx] = value;
     }
-    double value;
-    Idx since_last_idx = next_event_idx - steps;
-    if (since_last_idx < 0) {
-      value = std::numeric_limits<double>::quiet_NaN();
-    } else {
-      value = t - v_event[since_last_idx];
-    }
-    v_since_last[sampling_idx] = value;
   }
 
   return since_last;
@@ -1,13 +1,20 @@
 #include <assert.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 
+#include <algorithm>
+#include <cmath>
 #include <cstdint>
+#include <cstring>
 #include <deque>
 #include <iostream>
+#include <limits>
 #include <map>
+#include <stdexcept>
 #include <string>
 #include <type_traits>
+#include <unordered_map>
 #include <vector>
 
 namespace {
@@ -19,37 +26,35 @@ typedef py::array_t<float> ArrayF;
 template <typename T>
 using ArrayRef = py::detail::unchecked_reference<T, 1>;
 
+template <typename T>
+using MutableArrayRef = py::detail::unchecked_mutable_reference<T, 1>;
+
 typedef size_t Idx;
 
 // NOTE: accumulate() is overloaded for the 4 possible combinations of:
 // - with or without external sampling
 // - with constant or variable window length
-
-// TODO: refactor to avoid code duplication where possible.
-
-// No external sampling, constant window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const double window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_event);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-
-  TAccumulator accumulator(v_values);
-
+//
+// The windows are computed by the "accumulate_*" loops below, which move the
+// boundaries of the window and update an accumulator. The loops are shared by
+// the single feature "accumulate()" functions and the "accumulate_multi()"
+// functions, which process several features at once with a
+// "MultiAccumulator": The window boundaries are then moved once for all the
+// features.
+
+// Computes the window of the events in [begin, end).
+// No external sampling, constant window length.
+template <typename TAccumulator, typename TOutput>
+void accumulate_range(const ArrayRef<double> &v_timestamps,
+                      TAccumulator &accumulator, TOutput &v_output,
+                      const size_t begin, const size_t end,
+                      const double window_length) {
   // Index of the first value in the window.
-  size_t begin_idx = 0;
+  size_t begin_idx = begin;
   // Index of the first value outside the window.
-  size_t end_idx = 0;
+  size_t end_idx = begin;
 
-  while (end_idx < n_event) {
+  while (end_idx < end) {
     // Note: We accumulate values in (t-window_length, t] with t=
     // v_timestamps[end_idx], and there may be several contiguous equal
     // values in v_timestamps.
@@ -58,14 +63,14 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     accumulator.Add(end_idx);
     const auto current_ts = v_timestamps[end_idx];
     size_t first_diff_ts_idx = end_idx + 1;
-    while (first_diff_ts_idx < n_event &&
+    while (first_diff_ts_idx < end &&
            v_timestamps[first_diff_ts_idx] == current_ts) {
       accumulator.Add(first_diff_ts_idx);
       first_diff_ts_idx++;
     }
 
     // Remove all values that no longer belong to the window.
-    while (begin_idx < n_event &&
+    while (begin_idx < end &&
            // Compare both sides around ~0 to get maximum float resolution
            v_timestamps[end_idx] - v_timestamps[begin_idx] >= window_length) {
       accumulator.Remove(begin_idx);
@@ -73,7 +78,7 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     }
 
     // Set current value of window to all values with the same timestamp.
-    const auto result = accumulator.Result();
+    const auto &result = accumulator.Result();
     for (size_t i = end_idx; i < first_diff_ts_idx; i++) {
       v_output[i] = result;
     }
@@ -81,29 +86,16 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     // Move pointer to the index of the last value with the same timestamp.
     end_idx = first_diff_ts_idx;
   }
-
-  return output;
 }
 
-// External sampling, constant window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &sampling_timestamps,
-                               const double window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-  const size_t n_sampling = sampling_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_sampling);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_sampling = sampling_timestamps.unchecked<1>();
-
-  TAccumulator accumulator(v_values);
+// External sampling, constant window length.
+template <typename TAccumulator, typename TOutput>
+void accumulate_sampling(const ArrayRef<double> &v_timestamps,
+                         const ArrayRef<double> &v_sampling,
+                         TAccumulator &accumulator, TOutput &v_output,
+                         const double window_length) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
 
   size_t begin_idx = 0;
   size_t end_idx = 0;
@@ -126,8 +118,6 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
 
     v_output[sampling_idx] = accumulator.Result();
   }
-
-  return output;
 }
 
 bool begin_moved_forward(const double ts, const double prev_ts,
@@ -136,26 +126,12 @@ bool begin_moved_forward(const double ts, const double prev_ts,
   return ts - prev_ts - (window_length - prev_window_length) > 0;
 }
 
-// No external sampling, variable window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_event);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_window_length = window_length.unchecked<1>();
-
-  assert(v_timestamps.shape(0) == v_window_length.shape(0));
-  assert(v_timestamps.shape(0) == v_values.shape(0));
-
-  TAccumulator accumulator(v_values);
+// No external sampling, variable window length.
+template <typename TAccumulator, typename TOutput>
+void accumulate_variable(const ArrayRef<double> &v_timestamps,
+                         const ArrayRef<double> &v_window_length,
+                         TAccumulator &accumulator, TOutput &v_output) {
+  const size_t n_event = v_timestamps.shape(0);
 
   // Index of the first value in the window.
   size_t begin_idx = 0;
@@ -196,8 +172,9 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     } else {
       // Window's beginning moved backwards.
       // Note < instead of <= to respect (] window boundaries.
-      while (begin_idx > 0 && v_timestamps[idx] - v_timestamps[begin_idx - 1] <
-                                  curr_window_length) {
+      while (begin_idx > 0 &&
+             v_timestamps[idx] - v_timestamps[begin_idx - 1] <
+                 curr_window_length) {
         begin_idx--;
         accumulator.AddLeft(begin_idx);
       }
@@ -205,33 +182,17 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
 
     v_output[idx] = accumulator.Result();
   }
-
-  return output;
 }
 
-// External sampling, variable window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &sampling_timestamps,
-                               const ArrayD &window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-  const size_t n_sampling = sampling_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_sampling);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_sampling = sampling_timestamps.unchecked<1>();
-  auto v_window_length = window_length.unchecked<1>();
-
-  assert(v_timestamps.shape(0) == v_values.shape(0));
-  assert(v_sampling.shape(0) == v_window_length.shape(0));
-
-  TAccumulator accumulator(v_values);
+// External sampling, variable window length.
+template <typename TAccumulator, typename TOutput>
+void accumulate_sampling_variable(const ArrayRef<double> &v_timestamps,
+                                  const ArrayRef<double> &v_sampling,
+                                  const ArrayRef<double> &v_window_length,
+                                  TAccumulator &accumulator,
+                                  TOutput &v_output) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
 
   size_t begin_idx = 0;
   size_t end_idx = 0;
@@ -272,133 +233,1592 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
 
     v_output[sampling_idx] = accumulator.Result();
   }
-
-  return output;
 }
 
-// Note: We only use inheritance to compile check the code.
-template <typename INPUT, typename OUTPUT>
-struct Accumulator {
-  Accumulator(const ArrayRef<INPUT> &values) : values(values) {}
+// No external sampling, constant window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const double window_length) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
 
-  virtual ~Accumulator() = default;
-  virtual void Add(Idx idx) = 0;
-  virtual void Remove(Idx idx) = 0;
-  virtual OUTPUT Result() = 0;
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_event);
 
-  // // Add a value to left of the window. Relevant in deque-based accumulators.
-  virtual void AddLeft(Idx idx) { return Add(idx); }
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
 
-  ArrayRef<INPUT> values;
-};
+  {
+    py::gil_scoped_release release;
+    TAccumulator accumulator(v_values);
+    accumulate_range(v_timestamps, accumulator, v_output, 0, n_event,
+                     window_length);
+  }
 
-template <typename INPUT, typename OUTPUT>
-struct SimpleMovingAverageAccumulator : public Accumulator<INPUT, OUTPUT> {
-  SimpleMovingAverageAccumulator(const ArrayRef<INPUT> &values)
-      : Accumulator<INPUT, OUTPUT>(values) {}
+  return output;
+}
 
-  void Add(Idx idx) override {
-    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (std::isnan(value)) {
-        return;
-      }
+// No external sampling, constant window length, for the events of all the
+// index keys of an EventSet stored contiguously. The events of the i-th index
+// key are in [offsets[i], offsets[i+1]).
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const py::array_t<int64_t> &offsets,
+                               const double window_length) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_event);
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_offsets = offsets.unchecked<1>();
+
+  // The GIL is released once for all the index keys.
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      TAccumulator accumulator(v_values);
+      accumulate_range(v_timestamps, accumulator, v_output,
+                       v_offsets[index_idx], v_offsets[index_idx + 1],
+                       window_length);
     }
-    sum_values += value;
-    num_values++;
   }
 
-  void Remove(Idx idx) override {
-    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (std::isnan(value)) {
-        return;
-      }
-    }
-    sum_values -= value;
-    num_values--;
+  return output;
+}
+
+// External sampling, constant window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const ArrayD &sampling_timestamps,
+                               const double window_length) {
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(sampling_timestamps.shape(0));
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    TAccumulator accumulator(v_values);
+    accumulate_sampling(v_timestamps, v_sampling, accumulator, v_output,
+                        window_length);
   }
 
-  OUTPUT Result() override {
-    return (num_values > 0) ? (sum_values / num_values)
-                            : std::numeric_limits<OUTPUT>::quiet_NaN();
+  return output;
+}
+
+// No external sampling, variable window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const ArrayD &window_length) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_event);
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_timestamps.shape(0) == v_window_length.shape(0));
+  assert(v_timestamps.shape(0) == v_values.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    TAccumulator accumulator(v_values);
+    accumulate_variable(v_timestamps, v_window_length, accumulator, v_output);
   }
 
-  // TODO(gbm): Increase precision of accumulator.
+  return output;
+}
 
-  // Sum of the values in the rolling window (RW).
-  double sum_values = 0;
-  // Number of values in the RW.
-  int num_values = 0;
-};
+// External sampling, variable window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const ArrayD &sampling_timestamps,
+                               const ArrayD &window_length) {
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(sampling_timestamps.shape(0));
 
-template <typename INPUT, typename OUTPUT>
-struct MovingStandardDeviationAccumulator : Accumulator<INPUT, OUTPUT> {
-  MovingStandardDeviationAccumulator(const ArrayRef<INPUT> &values)
-      : Accumulator<INPUT, OUTPUT>(values) {}
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
 
-  void Add(Idx idx) override {
-    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (std::isnan(value)) {
-        return;
-      }
+  assert(v_timestamps.shape(0) == v_values.shape(0));
+  assert(v_sampling.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    TAccumulator accumulator(v_values);
+    accumulate_sampling_variable(v_timestamps, v_sampling, v_window_length,
+                                 accumulator, v_output);
+  }
+
+  return output;
+}
+
+// One accumulator per feature, updated together. "Result()" returns the
+// result of each accumulator. "args" are passed to the constructor of the
+// accumulators, after the values.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+struct MultiAccumulator {
+  template <typename... TArgs>
+  MultiAccumulator(const std::vector<ArrayRef<INPUT>> &values,
+                   const TArgs &...args)
+      : results(values.size()) {
+    accumulators.reserve(values.size());
+    for (const auto &feature_values : values) {
+      accumulators.emplace_back(feature_values, args...);
     }
-    sum_values += value;
-    sum_square_values += value * value;
-    num_values++;
   }
 
-  void Remove(Idx idx) override {
-    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (std::isnan(value)) {
-        return;
-      }
+  void Add(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Add(idx);
     }
-    sum_values -= value;
-    sum_square_values -= value * value;
-    num_values--;
   }
 
-  OUTPUT Result() override {
-    if (num_values == 0) {
-      return std::numeric_limits<OUTPUT>::quiet_NaN();
+  void AddLeft(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.AddLeft(idx);
     }
-    const auto mean = sum_values / num_values;
-    return sqrt(sum_square_values / num_values - mean * mean);
   }
 
-  // Sum of the values in the rolling window (RW).
-  double sum_values = 0;
+  void Remove(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Remove(idx);
+    }
+  }
+
+  const std::vector<OUTPUT> &Result() {
+    for (size_t i = 0; i < accumulators.size(); i++) {
+      results[i] = accumulators[i].Result();
+    }
+    return results;
+  }
+
+  std::vector<TAccumulator> accumulators;
+  std::vector<OUTPUT> results;
+};
+
+// Output arrays of several features. "outputs[idx] = results" sets the idx-th
+// value of each feature.
+template <typename OUTPUT>
+struct MultiOutput {
+  struct Item {
+    void operator=(const std::vector<OUTPUT> &results) {
+      for (size_t i = 0; i < results.size(); i++) {
+        outputs.refs[i][idx] = results[i];
+      }
+    }
+
+    MultiOutput &outputs;
+    const size_t idx;
+  };
+
+  // Allocates "num_features" arrays of "size" values.
+  MultiOutput(const size_t num_features, const size_t size) {
+    arrays.reserve(num_features);
+    refs.reserve(num_features);
+    for (size_t i = 0; i < num_features; i++) {
+      arrays.push_back(py::array_t<OUTPUT>(size));
+      refs.push_back(arrays.back().template mutable_unchecked<1>());
+    }
+  }
+
+  Item operator[](const size_t idx) { return Item{*this, idx}; }
+
+  std::vector<py::array_t<OUTPUT>> arrays;
+  std::vector<MutableArrayRef<OUTPUT>> refs;
+};
+
+// Unchecked references to the values of several features.
+template <typename INPUT>
+std::vector<ArrayRef<INPUT>> multi_values(
+    const std::vector<py::array_t<INPUT>> &evset_values, const size_t n_event) {
+  std::vector<ArrayRef<INPUT>> v_values;
+  v_values.reserve(evset_values.size());
+  for (const auto &feature_values : evset_values) {
+    if (static_cast<size_t>(feature_values.shape(0)) != n_event) {
+      throw std::invalid_argument(
+          "All the features should have as many values as timestamps.");
+    }
+    v_values.push_back(feature_values.template unchecked<1>());
+  }
+  return v_values;
+}
+
+// The "accumulate_multi" functions are similar to "accumulate", but compute
+// several features of the same type at once.
+
+// No external sampling, constant window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<py::array_t<OUTPUT>> accumulate_multi(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const double window_length) {
+  const size_t n_event = evset_timestamps.shape(0);
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values);
+    accumulate_range(v_timestamps, accumulator, outputs, 0, n_event,
+                     window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, constant window length, with offsets.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<py::array_t<OUTPUT>> accumulate_multi(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const py::array_t<int64_t> &offsets, const double window_length) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_offsets = offsets.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values);
+      accumulate_range(v_timestamps, accumulator, outputs,
+                       v_offsets[index_idx], v_offsets[index_idx + 1],
+                       window_length);
+    }
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, constant window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<py::array_t<OUTPUT>> accumulate_multi(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const double window_length) {
+  MultiOutput<OUTPUT> outputs(evset_values.size(),
+                              sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values);
+    accumulate_sampling(v_timestamps, v_sampling, accumulator, outputs,
+                        window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, variable window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<py::array_t<OUTPUT>> accumulate_multi(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &window_length) {
+  const size_t n_event = evset_timestamps.shape(0);
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_timestamps.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values);
+    accumulate_variable(v_timestamps, v_window_length, accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, variable window length
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<py::array_t<OUTPUT>> accumulate_multi(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const ArrayD &window_length) {
+  MultiOutput<OUTPUT> outputs(evset_values.size(),
+                              sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_sampling.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values);
+    accumulate_sampling_variable(v_timestamps, v_sampling, v_window_length,
+                                 accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// Computes the windows of several lengths of the events in [begin, end) in a
+// single pass: The end of the windows is shared, and each window length has its
+// own beginning and accumulator. "v_outputs[i]" receives the results of the
+// i-th window length.
+// No external sampling, constant window lengths.
+template <typename TAccumulator, typename TOutput>
+void accumulate_range_windows(const ArrayRef<double> &v_timestamps,
+                              std::vector<TAccumulator> &accumulators,
+                              std::vector<TOutput> &v_outputs,
+                              const size_t begin, const size_t end,
+                              const std::vector<double> &window_lengths) {
+  const size_t n_window = window_lengths.size();
+  // Index of the first value in each window.
+  std::vector<size_t> begin_idxs(n_window, begin);
+  // Index of the first value outside the windows.
+  size_t end_idx = begin;
+
+  while (end_idx < end) {
+    // Add all values with same timestamp as the current one.
+    const auto current_ts = v_timestamps[end_idx];
+    size_t first_diff_ts_idx = end_idx;
+    while (first_diff_ts_idx < end &&
+           v_timestamps[first_diff_ts_idx] == current_ts) {
+      for (auto &accumulator : accumulators) {
+        accumulator.Add(first_diff_ts_idx);
+      }
+      first_diff_ts_idx++;
+    }
+
+    for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+      auto &accumulator = accumulators[window_idx];
+      auto &begin_idx = begin_idxs[window_idx];
+
+      // Remove all values that no longer belong to the window.
+      while (begin_idx < end && current_ts - v_timestamps[begin_idx] >=
+                                    window_lengths[window_idx]) {
+        accumulator.Remove(begin_idx);
+        begin_idx++;
+      }
+
+      const auto &result = accumulator.Result();
+      auto &v_output = v_outputs[window_idx];
+      for (size_t i = end_idx; i < first_diff_ts_idx; i++) {
+        v_output[i] = result;
+      }
+    }
+
+    end_idx = first_diff_ts_idx;
+  }
+}
+
+// External sampling, constant window lengths.
+template <typename TAccumulator, typename TOutput>
+void accumulate_sampling_windows(const ArrayRef<double> &v_timestamps,
+                                 const ArrayRef<double> &v_sampling,
+                                 std::vector<TAccumulator> &accumulators,
+                                 std::vector<TOutput> &v_outputs,
+                                 const std::vector<double> &window_lengths) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
+  const size_t n_window = window_lengths.size();
+
+  std::vector<size_t> begin_idxs(n_window, 0);
+  size_t end_idx = 0;
+
+  for (size_t sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+    const auto right_limit = v_sampling[sampling_idx];
+
+    while (end_idx < n_event && v_timestamps[end_idx] <= right_limit) {
+      for (auto &accumulator : accumulators) {
+        accumulator.Add(end_idx);
+      }
+      end_idx++;
+    }
+
+    for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+      auto &accumulator = accumulators[window_idx];
+      auto &begin_idx = begin_idxs[window_idx];
+
+      while (begin_idx < n_event && right_limit - v_timestamps[begin_idx] >=
+                                        window_lengths[window_idx]) {
+        accumulator.Remove(begin_idx);
+        begin_idx++;
+      }
+
+      v_outputs[window_idx][sampling_idx] = accumulator.Result();
+    }
+  }
+}
+
+// Creates one accumulator per window length, each one processing all the
+// features.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<MultiAccumulator<INPUT, OUTPUT, TAccumulator>> window_accumulators(
+    const std::vector<ArrayRef<INPUT>> &v_values, const size_t n_window) {
+  std::vector<MultiAccumulator<INPUT, OUTPUT, TAccumulator>> accumulators;
+  accumulators.reserve(n_window);
+  for (size_t i = 0; i < n_window; i++) {
+    accumulators.emplace_back(v_values);
+  }
+  return accumulators;
+}
+
+// One "MultiOutput" per window length.
+template <typename OUTPUT>
+std::vector<MultiOutput<OUTPUT>> window_outputs(const size_t n_window,
+                                                const size_t num_features,
+                                                const size_t size) {
+  std::vector<MultiOutput<OUTPUT>> outputs;
+  outputs.reserve(n_window);
+  for (size_t i = 0; i < n_window; i++) {
+    outputs.emplace_back(num_features, size);
+  }
+  return outputs;
+}
+
+template <typename OUTPUT>
+std::vector<std::vector<py::array_t<OUTPUT>>> window_arrays(
+    const std::vector<MultiOutput<OUTPUT>> &outputs) {
+  std::vector<std::vector<py::array_t<OUTPUT>>> arrays;
+  arrays.reserve(outputs.size());
+  for (const auto &output : outputs) {
+    arrays.push_back(output.arrays);
+  }
+  return arrays;
+}
+
+// The "accumulate_windows" functions compute several features of the same
+// type on several window lengths at once. The result "r" is such that
+// "r[i][j]" is the j-th feature computed with the i-th window length.
+
+// No external sampling, constant window lengths.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<std::vector<py::array_t<OUTPUT>>> accumulate_windows(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const std::vector<double> &window_lengths) {
+  const size_t n_event = evset_timestamps.shape(0);
+  auto outputs = window_outputs<OUTPUT>(window_lengths.size(),
+                                        evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+
+  {
+    py::gil_scoped_release release;
+    auto accumulators = window_accumulators<INPUT, OUTPUT, TAccumulator>(
+        v_values, window_lengths.size());
+    accumulate_range_windows(v_timestamps, accumulators, outputs, 0, n_event,
+                             window_lengths);
+  }
+
+  return window_arrays(outputs);
+}
+
+// No external sampling, constant window lengths, with offsets.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<std::vector<py::array_t<OUTPUT>>> accumulate_windows(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const py::array_t<int64_t> &offsets,
+    const std::vector<double> &window_lengths) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+  auto outputs = window_outputs<OUTPUT>(window_lengths.size(),
+                                        evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_offsets = offsets.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      auto accumulators = window_accumulators<INPUT, OUTPUT, TAccumulator>(
+          v_values, window_lengths.size());
+      accumulate_range_windows(v_timestamps, accumulators, outputs,
+                               v_offsets[index_idx], v_offsets[index_idx + 1],
+                               window_lengths);
+    }
+  }
+
+  return window_arrays(outputs);
+}
+
+// External sampling, constant window lengths.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+std::vector<std::vector<py::array_t<OUTPUT>>> accumulate_windows(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps,
+    const std::vector<double> &window_lengths) {
+  auto outputs =
+      window_outputs<OUTPUT>(window_lengths.size(), evset_values.size(),
+                             sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    auto accumulators = window_accumulators<INPUT, OUTPUT, TAccumulator>(
+        v_values, window_lengths.size());
+    accumulate_sampling_windows(v_timestamps, v_sampling, accumulators,
+                                outputs, window_lengths);
+  }
+
+  return window_arrays(outputs);
+}
+
+// Computes the prefix scan of the events in [begin, end) with a new
+// accumulator.
+template <typename OUTPUT, typename TAccumulator, typename TValues>
+void scan_range(const ArrayRef<double> &v_timestamps, const TValues &v_values,
+                MutableArrayRef<OUTPUT> &v_output, const size_t begin,
+                const size_t end) {
+  TAccumulator accumulator(v_values);
+
+  size_t idx = begin;
+  while (idx < end) {
+    // Add all values with same timestamp as the current one.
+    const auto current_ts = v_timestamps[idx];
+    size_t first_diff_ts_idx = idx;
+    while (first_diff_ts_idx < end &&
+           v_timestamps[first_diff_ts_idx] == current_ts) {
+      accumulator.Add(first_diff_ts_idx);
+      first_diff_ts_idx++;
+    }
+
+    const auto result = accumulator.Result();
+    for (; idx < first_diff_ts_idx; idx++) {
+      v_output[idx] = result;
+    }
+  }
+}
+
+// Prefix scan i.e. window containing all the past events, without external
+// sampling.
+//
+// Only the "Add" and "Result" methods of the accumulator are used.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> scan(const ArrayD &evset_timestamps,
+                         const py::array_t<INPUT> &evset_values) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_event);
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    scan_range<OUTPUT, TAccumulator>(v_timestamps, v_values, v_output, 0,
+                                     n_event);
+  }
+
+  return output;
+}
+
+// Prefix scan without external sampling, for the events of all the index keys
+// of an EventSet stored contiguously. See "accumulate" for the format of
+// "offsets".
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> scan(const ArrayD &evset_timestamps,
+                         const py::array_t<INPUT> &evset_values,
+                         const py::array_t<int64_t> &offsets) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_event);
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_offsets = offsets.unchecked<1>();
+
+  // The GIL is released once for all the index keys.
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      scan_range<OUTPUT, TAccumulator>(v_timestamps, v_values, v_output,
+                                       v_offsets[index_idx],
+                                       v_offsets[index_idx + 1]);
+    }
+  }
+
+  return output;
+}
+
+// Prefix scan with external sampling.
+template <typename INPUT, typename OUTPUT, typename TAccumulator>
+py::array_t<OUTPUT> scan(const ArrayD &evset_timestamps,
+                         const py::array_t<INPUT> &evset_values,
+                         const ArrayD &sampling_timestamps) {
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_sampling = sampling_timestamps.shape(0);
+
+  // Allocate output array
+  auto output = py::array_t<OUTPUT>(n_sampling);
+
+  auto v_output = output.template mutable_unchecked<1>();
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  auto v_values = evset_values.template unchecked<1>();
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  TAccumulator accumulator(v_values);
+
+  size_t end_idx = 0;
+
+  {
+    py::gil_scoped_release release;
+    for (size_t sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+      const auto right_limit = v_sampling[sampling_idx];
+      while (end_idx < n_event && v_timestamps[end_idx] <= right_limit) {
+        accumulator.Add(end_idx);
+        end_idx++;
+      }
+      v_output[sampling_idx] = accumulator.Result();
+    }
+  }
+
+  return output;
+}
+
+// Note: We only use inheritance to compile check the code.
+template <typename INPUT, typename OUTPUT>
+struct Accumulator {
+  Accumulator(const ArrayRef<INPUT> &values) : values(values) {}
+
+  virtual ~Accumulator() = default;
+  virtual void Add(Idx idx) = 0;
+  virtual void Remove(Idx idx) = 0;
+  virtual OUTPUT Result() = 0;
+
+  // // Add a value to left of the window. Relevant in deque-based accumulators.
+  virtual void AddLeft(Idx idx) { return Add(idx); }
+
+  ArrayRef<INPUT> values;
+};
+
+template <typename INPUT, typename OUTPUT>
+struct SimpleMovingAverageAccumulator final
+    : public Accumulator<INPUT, OUTPUT> {
+  SimpleMovingAverageAccumulator(const ArrayRef<INPUT> &values)
+      : Accumulator<INPUT, OUTPUT>(values) {}
+
+  void Add(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values += value;
+    num_values++;
+  }
+
+  void Remove(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values -= value;
+    num_values--;
+  }
+
+  OUTPUT Result() override {
+    return (num_values > 0) ? (sum_values / num_values)
+                            : std::numeric_limits<OUTPUT>::quiet_NaN();
+  }
+
+  // TODO(gbm): Increase precision of accumulator.
+
+  // Sum of the values in the rolling window (RW).
+  double sum_values = 0;
+  // Number of values in the RW.
+  int num_values = 0;
+};
+
+template <typename INPUT, typename OUTPUT>
+struct MovingStandardDeviationAccumulator final : Accumulator<INPUT, OUTPUT> {
+  MovingStandardDeviationAccumulator(const ArrayRef<INPUT> &values)
+      : Accumulator<INPUT, OUTPUT>(values) {}
+
+  void Add(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values += value;
+    sum_square_values += value * value;
+    num_values++;
+  }
+
+  void Remove(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values -= value;
+    sum_square_values -= value * value;
+    num_values--;
+  }
+
+  OUTPUT Result() override {
+    if (num_values == 0) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    }
+    const auto mean = sum_values / num_values;
+    return sqrt(sum_square_values / num_values - mean * mean);
+  }
+
+  // Sum of the values in the rolling window (RW).
+  double sum_values = 0;
+  double sum_square_values = 0;
+  // Number of values in the RW.
+  int num_values = 0;
+};
+
+template <typename OUTPUT>
+struct MovingCountAccumulator final : Accumulator<double, OUTPUT> {
+  MovingCountAccumulator(const ArrayRef<double> &values)
+      : Accumulator<double, OUTPUT>(values) {}
+
+  void Add(Idx idx) override {
+    static_assert(std::is_same<OUTPUT, int32_t>::value,
+                  "OUTPUT must be int32_t");
+    num_values++;
+  }
+
+  void Remove(Idx idx) override { num_values--; }
+
+  OUTPUT Result() override { return num_values; }
+
+  // Number of values in the RW.
+  int32_t num_values = 0;
+};
+
+template <typename INPUT, typename OUTPUT>
+struct MovingSumAccumulator final : Accumulator<INPUT, OUTPUT> {
+  MovingSumAccumulator(const ArrayRef<INPUT> &values)
+      : Accumulator<INPUT, OUTPUT>(values) {}
+
+  void Add(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values += value;
+  }
+
+  void Remove(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
+      }
+    }
+    sum_values -= value;
+  }
+
+  OUTPUT Result() override { return sum_values; }
+
+  // Sum of the values in the rolling window (RW).
+  double sum_values = 0;
+};
+
+template <typename INPUT, typename OUTPUT>
+struct MovingExtremumAccumulator : Accumulator<INPUT, OUTPUT> {
+  MovingExtremumAccumulator(const ArrayRef<INPUT> &values)
+      : Accumulator<INPUT, OUTPUT>(values) {}
+
+  virtual ~MovingExtremumAccumulator() = default;
+
+  virtual bool Compare(INPUT a, INPUT b) = 0;
+
+  void Add(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (!(value == value)) {
+        return;
+      }
+    }
+
+    while (!best_indices.empty() &&
+           !Compare(Accumulator<INPUT, OUTPUT>::values[best_indices.back()],
+                    value)) {
+      best_indices.pop_back();
+    }
+    best_indices.push_back(idx);
+  }
+
+  void AddLeft(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (!(value == value)) {
+        return;
+      }
+    }
+
+    if (best_indices.empty()) {
+      best_indices.push_back(idx);
+    } else {
+      if (Compare(value,
+                  Accumulator<INPUT, OUTPUT>::values[best_indices.front()])) {
+        best_indices.push_front(idx);
+      }
+    }
+  }
+
+  void Remove(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (!(value == value)) {
+        return;
+      }
+    }
+
+    assert(!best_indices.empty());
+    assert(best_indices.front() >= idx);
+    if (best_indices.front() == idx) {
+      best_indices.pop_front();
+    }
+  }
+
+  OUTPUT Result() override {
+    if (best_indices.empty()) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    } else {
+      return Accumulator<INPUT, OUTPUT>::values[best_indices.front()];
+    }
+  }
+
+  // Subset of indexes of the observations in the window, sorted by index value,
+  // and such that index "j" is not part of "best_indices" if there is another
+  // index "i" in "best_indices" such that "i>j" (i is after j) and the value of
+  // i is greater than the value if j.
+  std::deque<size_t> best_indices;
+};
+
+template <typename INPUT, typename OUTPUT>
+struct MovingMinAccumulator final : MovingExtremumAccumulator<INPUT, OUTPUT> {
+  MovingMinAccumulator(const ArrayRef<INPUT> &values)
+      : MovingExtremumAccumulator<INPUT, OUTPUT>(values) {}
+
+  bool Compare(INPUT a, INPUT b) { return a < b; }
+};
+
+template <typename INPUT, typename OUTPUT>
+struct MovingMaxAccumulator final : MovingExtremumAccumulator<INPUT, OUTPUT> {
+  MovingMaxAccumulator(const ArrayRef<INPUT> &values)
+      : MovingExtremumAccumulator<INPUT, OUTPUT>(values) {}
+
+  bool Compare(INPUT a, INPUT b) { return a > b; }
+};
+
+// The product of the window is maintained with a queue implemented with two
+// stacks, each one storing the running products of its values. Adding or
+// removing a value is O(1) amortized, and the product is computed from values
+// multiplied in (almost) the same order as a direct computation, which keeps
+// the result exact for values such as small integers.
+//
+// Zero and NaN values are counted separately and stored as 1 in the stacks:
+// The product is zero if the window contains a zero, and NaN if the window
+// does not contain any non-NaN value.
+template <typename INPUT, typename OUTPUT>
+struct MovingProductAccumulator final : public Accumulator<INPUT, OUTPUT> {
+  MovingProductAccumulator(const ArrayRef<INPUT> &values)
+      : Accumulator<INPUT, OUTPUT>(values) {}
+
+  void Add(Idx idx) override {
+    const double value = Track(idx, +1);
+    back_values.push_back(value);
+    back_product *= value;
+  }
+
+  void AddLeft(Idx idx) override {
+    const double value = Track(idx, +1);
+    front_products.push_back(
+        front_products.empty() ? value : value * front_products.back());
+  }
+
+  void Remove(Idx idx) override {
+    Track(idx, -1);
+    if (front_products.empty()) {
+      // Move the values of the back stack into the front stack. The last
+      // value of the front stack is the first value of the window.
+      double product = 1.0;
+      for (auto it = back_values.rbegin(); it != back_values.rend(); ++it) {
+        product *= *it;
+        front_products.push_back(product);
+      }
+      back_values.clear();
+      back_product = 1.0;
+    }
+    assert(!front_products.empty());
+    front_products.pop_back();
+  }
+
+  OUTPUT Result() override {
+    if (num_zeros > 0) {
+      return 0;
+    }
+    if (num_valid_values == 0) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    }
+    const double front_product =
+        front_products.empty() ? 1.0 : front_products.back();
+    return front_product * back_product;
+  }
+
+  // Updates the zero and valid value counts with the value at "idx", and
+  // returns the value to store in the stacks.
+  double Track(Idx idx, int delta) {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if (value == 0) {
+      num_zeros += delta;
+      return 1.0;
+    }
+    if (std::isnan(value)) {
+      return 1.0;
+    }
+    num_valid_values += delta;
+    return value;
+  }
+
+  // Front of the window. "front_products[i]" is the product of the values
+  // "i" to 0 of the stack, the last value being the first of the window.
+  std::vector<double> front_products;
+  // Back of the window, in order, and their product.
+  std::vector<double> back_values;
+  double back_product = 1.0;
+
+  // Number of zero and non-zero non-NaN values in the window.
+  int num_zeros = 0;
+  int num_valid_values = 0;
+};
+
+// Product of all the values added so far. Only supports prefix scans.
+//
+// Like MovingProductAccumulator, NaN values are ignored, the product is zero if
+// any value is zero, and the result is NaN if there are no non-NaN values.
+template <typename INPUT, typename OUTPUT>
+struct CumulativeProductAccumulator {
+  CumulativeProductAccumulator(const ArrayRef<INPUT> &values)
+      : values(values) {}
+
+  void Add(Idx idx) {
+    const INPUT value = values[idx];
+    if (value == 0) {
+      has_zero = true;
+    } else if (!std::isnan(value)) {
+      product *= value;
+      has_valid_value = true;
+    }
+  }
+
+  OUTPUT Result() {
+    if (has_zero) {
+      return 0;
+    }
+    if (!has_valid_value) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    }
+    return product;
+  }
+
+  ArrayRef<INPUT> values;
+  double product = 1.0;
+  bool has_zero = false;
+  bool has_valid_value = false;
+};
+
+// Statistics computed by "moving_aggregate".
+enum class AggregateOp { kSum, kMean, kStd, kMin, kMax, kCount };
+
+std::vector<AggregateOp> parse_aggregate_ops(
+    const std::vector<std::string> &ops) {
+  std::vector<AggregateOp> parsed_ops;
+  parsed_ops.reserve(ops.size());
+  for (const auto &op : ops) {
+    if (op == "sum") {
+      parsed_ops.push_back(AggregateOp::kSum);
+    } else if (op == "mean") {
+      parsed_ops.push_back(AggregateOp::kMean);
+    } else if (op == "std") {
+      parsed_ops.push_back(AggregateOp::kStd);
+    } else if (op == "min") {
+      parsed_ops.push_back(AggregateOp::kMin);
+    } else if (op == "max") {
+      parsed_ops.push_back(AggregateOp::kMax);
+    } else if (op == "count") {
+      parsed_ops.push_back(AggregateOp::kCount);
+    } else {
+      throw std::invalid_argument("Unknown aggregation \"" + op + "\".");
+    }
+  }
+  return parsed_ops;
+}
+
+// Accumulates the statistics of "moving_aggregate" on a single feature: The
+// sum, sum of squares and number of the non-missing values of the window, and,
+// if requested, the minimum and maximum. Missing values (NaN) are ignored.
+//
+// The results are the same as the ones of the MovingSumAccumulator,
+// SimpleMovingAverageAccumulator, MovingStandardDeviationAccumulator,
+// MovingMinAccumulator and MovingMaxAccumulator.
+template <typename INPUT>
+struct AggregateAccumulator {
+  AggregateAccumulator(const ArrayRef<INPUT> &values, const bool use_min,
+                       const bool use_max)
+      : values(values),
+        min(values),
+        max(values),
+        use_min(use_min),
+        use_max(use_max) {}
+
+  void Add(Idx idx) {
+    if (Update(idx, true)) {
+      if (use_min) min.Add(idx);
+      if (use_max) max.Add(idx);
+    }
+  }
+
+  void AddLeft(Idx idx) {
+    if (Update(idx, true)) {
+      if (use_min) min.AddLeft(idx);
+      if (use_max) max.AddLeft(idx);
+    }
+  }
+
+  void Remove(Idx idx) {
+    if (Update(idx, false)) {
+      if (use_min) min.Remove(idx);
+      if (use_max) max.Remove(idx);
+    }
+  }
+
+  double Mean() const {
+    return (num_values > 0) ? (sum_values / num_values)
+                            : std::numeric_limits<double>::quiet_NaN();
+  }
+
+  INPUT Min() const { return min.Result(); }
+
+  INPUT Max() const { return max.Result(); }
+
+  double StandardDeviation() const {
+    if (num_values == 0) {
+      return std::numeric_limits<double>::quiet_NaN();
+    }
+    const auto mean = sum_values / num_values;
+    return sqrt(sum_square_values / num_values - mean * mean);
+  }
+
+  // Adds or removes the value at "idx" from the sums. Returns false if the
+  // value is missing.
+  bool Update(Idx idx, const bool add) {
+    const INPUT value = values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return false;
+      }
+    }
+    // Note: The square of integer values is computed with doubles to avoid
+    // overflows.
+    double square_value;
+    if constexpr (std::is_floating_point<INPUT>::value) {
+      square_value = value * value;
+    } else {
+      square_value = static_cast<double>(value) * value;
+    }
+    if (add) {
+      sum_values += value;
+      sum_square_values += square_value;
+      num_values++;
+    } else {
+      sum_values -= value;
+      sum_square_values -= square_value;
+      num_values--;
+    }
+    return true;
+  }
+
+  ArrayRef<INPUT> values;
+  // Note: "Result()" of the extremum accumulators is not const.
+  mutable MovingMinAccumulator<INPUT, INPUT> min;
+  mutable MovingMaxAccumulator<INPUT, INPUT> max;
+  bool use_min;
+  bool use_max;
+
+  double sum_values = 0;
   double sum_square_values = 0;
-  // Number of values in the RW.
-  int num_values = 0;
+  // Number of non-missing values in the window.
+  int32_t num_values = 0;
+};
+
+// One AggregateAccumulator per feature, updated together. The outputs read the
+// statistics directly from the accumulators returned by "Result()".
+template <typename INPUT>
+struct MultiAggregateAccumulator {
+  MultiAggregateAccumulator(const std::vector<ArrayRef<INPUT>> &values,
+                            const std::vector<AggregateOp> &ops) {
+    bool use_min = false;
+    bool use_max = false;
+    for (const auto op : ops) {
+      use_min |= op == AggregateOp::kMin;
+      use_max |= op == AggregateOp::kMax;
+    }
+    accumulators.reserve(values.size());
+    for (const auto &feature_values : values) {
+      accumulators.emplace_back(feature_values, use_min, use_max);
+    }
+  }
+
+  void Add(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Add(idx);
+    }
+  }
+
+  void AddLeft(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.AddLeft(idx);
+    }
+  }
+
+  void Remove(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Remove(idx);
+    }
+  }
+
+  const std::vector<AggregateAccumulator<INPUT>> &Result() {
+    return accumulators;
+  }
+
+  std::vector<AggregateAccumulator<INPUT>> accumulators;
+};
+
+// Output arrays of "moving_aggregate": One array per feature and statistic.
+// The sum, minimum and maximum have the type of the input, the mean and
+// standard deviation are float32 for float32 inputs and float64 otherwise,
+// and the count is int32. "outputs[idx] = accumulators" sets the idx-th value
+// of each array.
+template <typename INPUT>
+struct AggregateOutput {
+  typedef typename std::conditional<std::is_same<INPUT, float>::value, float,
+                                    double>::type FLOAT;
+
+  struct Item {
+    void operator=(
+        const std::vector<AggregateAccumulator<INPUT>> &accumulators) {
+      const auto &ops = outputs.ops;
+      for (size_t feature_idx = 0; feature_idx < accumulators.size();
+           feature_idx++) {
+        const auto &accumulator = accumulators[feature_idx];
+        void *const *data = &outputs.data[feature_idx * ops.size()];
+        for (size_t op_idx = 0; op_idx < ops.size(); op_idx++) {
+          switch (ops[op_idx]) {
+            case AggregateOp::kSum:
+              static_cast<INPUT *>(data[op_idx])[idx] = accumulator.sum_values;
+              break;
+            case AggregateOp::kMean:
+              static_cast<FLOAT *>(data[op_idx])[idx] = accumulator.Mean();
+              break;
+            case AggregateOp::kStd:
+              static_cast<FLOAT *>(data[op_idx])[idx] =
+                  accumulator.StandardDeviation();
+              break;
+            case AggregateOp::kMin:
+              static_cast<INPUT *>(data[op_idx])[idx] = accumulator.Min();
+              break;
+            case AggregateOp::kMax:
+              static_cast<INPUT *>(data[op_idx])[idx] = accumulator.Max();
+              break;
+            case AggregateOp::kCount:
+              static_cast<int32_t *>(data[op_idx])[idx] =
+                  accumulator.num_values;
+              break;
+          }
+        }
+      }
+    }
+
+    AggregateOutput &outputs;
+    const size_t idx;
+  };
+
+  // Allocates the arrays of "num_features" features with "size" values.
+  AggregateOutput(const std::vector<AggregateOp> &ops,
+                  const size_t num_features, const size_t size)
+      : ops(ops), arrays(num_features) {
+    data.reserve(num_features * ops.size());
+    for (auto &feature_arrays : arrays) {
+      for (const auto op : ops) {
+        py::array array;
+        switch (op) {
+          case AggregateOp::kSum:
+          case AggregateOp::kMin:
+          case AggregateOp::kMax:
+            array = py::array_t<INPUT>(size);
+            break;
+          case AggregateOp::kMean:
+          case AggregateOp::kStd:
+            array = py::array_t<FLOAT>(size);
+            break;
+          case AggregateOp::kCount:
+            array = py::array_t<int32_t>(size);
+            break;
+        }
+        data.push_back(array.mutable_data());
+        feature_arrays.push_back(array);
+      }
+    }
+  }
+
+  Item operator[](const size_t idx) { return Item{*this, idx}; }
+
+  const std::vector<AggregateOp> ops;
+  // "arrays[i][j]" is the j-th statistic of the i-th feature.
+  std::vector<std::vector<py::array>> arrays;
+  // Data of the arrays, in the same order.
+  std::vector<void *> data;
 };
 
-template <typename OUTPUT>
-struct MovingCountAccumulator : Accumulator<double, OUTPUT> {
-  MovingCountAccumulator(const ArrayRef<double> &values)
-      : Accumulator<double, OUTPUT>(values) {}
+// The "aggregate" functions compute several statistics of several features of
+// the same type at once. The result "r" is such that "r[i][j]" is the j-th
+// statistic in "ops" of the i-th feature.
+
+// No external sampling, constant window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> aggregate(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const double window_length, const std::vector<std::string> &ops) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const auto parsed_ops = parse_aggregate_ops(ops);
+  AggregateOutput<INPUT> outputs(parsed_ops, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+
+  {
+    py::gil_scoped_release release;
+    MultiAggregateAccumulator<INPUT> accumulator(v_values, parsed_ops);
+    accumulate_range(v_timestamps, accumulator, outputs, 0, n_event,
+                     window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, constant window length, with offsets.
+template <typename INPUT>
+std::vector<std::vector<py::array>> aggregate(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const py::array_t<int64_t> &offsets, const double window_length,
+    const std::vector<std::string> &ops) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+  const auto parsed_ops = parse_aggregate_ops(ops);
+  AggregateOutput<INPUT> outputs(parsed_ops, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_offsets = offsets.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      MultiAggregateAccumulator<INPUT> accumulator(v_values, parsed_ops);
+      accumulate_range(v_timestamps, accumulator, outputs,
+                       v_offsets[index_idx], v_offsets[index_idx + 1],
+                       window_length);
+    }
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, constant window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> aggregate(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const double window_length,
+    const std::vector<std::string> &ops) {
+  const auto parsed_ops = parse_aggregate_ops(ops);
+  AggregateOutput<INPUT> outputs(parsed_ops, evset_values.size(),
+                                 sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    MultiAggregateAccumulator<INPUT> accumulator(v_values, parsed_ops);
+    accumulate_sampling(v_timestamps, v_sampling, accumulator, outputs,
+                        window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, variable window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> aggregate(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &window_length, const std::vector<std::string> &ops) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const auto parsed_ops = parse_aggregate_ops(ops);
+  AggregateOutput<INPUT> outputs(parsed_ops, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_timestamps.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAggregateAccumulator<INPUT> accumulator(v_values, parsed_ops);
+    accumulate_variable(v_timestamps, v_window_length, accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, variable window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> aggregate(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const ArrayD &window_length,
+    const std::vector<std::string> &ops) {
+  const auto parsed_ops = parse_aggregate_ops(ops);
+  AggregateOutput<INPUT> outputs(parsed_ops, evset_values.size(),
+                                 sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_sampling.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAggregateAccumulator<INPUT> accumulator(v_values, parsed_ops);
+    accumulate_sampling_variable(v_timestamps, v_sampling, v_window_length,
+                                 accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// Order statistic tree of values: A treap (randomized binary search tree) of
+// (value, index) pairs, where each node stores the size of its subtree.
+// Inserting, erasing and selecting the k-th smallest value are O(log(w)) on
+// average, with w the number of values in the tree.
+//
+// The index of the values makes all the keys distinct, so the values erased
+// are the exact ones inserted, even if some values are equal.
+template <typename INPUT>
+class OrderStatisticTree {
+ public:
+  void Insert(const INPUT value, const Idx idx) {
+    int32_t node_id;
+    if (free_nodes_.empty()) {
+      node_id = nodes_.size();
+      nodes_.emplace_back();
+    } else {
+      node_id = free_nodes_.back();
+      free_nodes_.pop_back();
+    }
+    nodes_[node_id] = Node{value, idx, NextPriority()};
+
+    int32_t left, right;
+    Split(root_, value, idx, left, right);
+    root_ = Merge(Merge(left, node_id), right);
+  }
+
+  // Erases a pair inserted with "Insert".
+  void Erase(const INPUT value, const Idx idx) {
+    int32_t left, middle, right;
+    Split(root_, value, idx, left, right);
+    // "middle" only contains the (value, idx) pair.
+    Split(right, value, idx + 1, middle, right);
+    assert(middle >= 0 && Size(middle) == 1);
+    free_nodes_.push_back(middle);
+    root_ = Merge(left, right);
+  }
+
+  // Returns the k-th smallest value (0-based).
+  INPUT Select(size_t k) const {
+    assert(k < size());
+    int32_t node_id = root_;
+    while (true) {
+      const Node &node = nodes_[node_id];
+      const size_t left_size = Size(node.left);
+      if (k < left_size) {
+        node_id = node.left;
+      } else if (k == left_size) {
+        return node.value;
+      } else {
+        k -= left_size + 1;
+        node_id = node.right;
+      }
+    }
+  }
+
+  size_t size() const { return Size(root_); }
+
+ private:
+  struct Node {
+    INPUT value;
+    Idx idx;
+    uint32_t priority;
+    int32_t left = -1;
+    int32_t right = -1;
+    uint32_t size = 1;
+  };
+
+  size_t Size(const int32_t node_id) const {
+    return node_id < 0 ? 0 : nodes_[node_id].size;
+  }
+
+  void UpdateSize(const int32_t node_id) {
+    Node &node = nodes_[node_id];
+    node.size = 1 + Size(node.left) + Size(node.right);
+  }
 
-  void Add(Idx idx) override {
-    static_assert(std::is_same<OUTPUT, int32_t>::value,
-                  "OUTPUT must be int32_t");
-    num_values++;
+  // Splits the tree "node_id" into the pairs lower than (value, idx), and the
+  // other pairs.
+  void Split(const int32_t node_id, const INPUT value, const Idx idx,
+             int32_t &left, int32_t &right) {
+    if (node_id < 0) {
+      left = right = -1;
+      return;
+    }
+    Node &node = nodes_[node_id];
+    if (node.value < value || (node.value == value && node.idx < idx)) {
+      Split(node.right, value, idx, node.right, right);
+      left = node_id;
+    } else {
+      Split(node.left, value, idx, left, node.left);
+      right = node_id;
+    }
+    UpdateSize(node_id);
   }
 
-  void Remove(Idx idx) override { num_values--; }
+  // Merges two trees, where all the pairs of "left" are lower than the pairs
+  // of "right".
+  int32_t Merge(const int32_t left, const int32_t right) {
+    if (left < 0) {
+      return right;
+    }
+    if (right < 0) {
+      return left;
+    }
+    if (nodes_[left].priority > nodes_[right].priority) {
+      const int32_t merged = Merge(nodes_[left].right, right);
+      nodes_[left].right = merged;
+      UpdateSize(left);
+      return left;
+    }
+    const int32_t merged = Merge(left, nodes_[right].left);
+    nodes_[right].left = merged;
+    UpdateSize(right);
+    return right;
+  }
 
-  OUTPUT Result() override { return num_values; }
+  // Xorshift pseudo-random generator. The tree is balanced on average for any
+  // order of insertion.
+  uint32_t NextPriority() {
+    random_state_ ^= random_state_ << 13;
+    random_state_ ^= random_state_ >> 17;
+    random_state_ ^= random_state_ << 5;
+    return random_state_;
+  }
 
-  // Number of values in the RW.
-  int32_t num_values = 0;
+  std::vector<Node> nodes_;
+  // Nodes of "nodes_" that are not used anymore.
+  std::vector<int32_t> free_nodes_;
+  int32_t root_ = -1;
+  uint32_t random_state_ = 2463534242;
 };
 
+// Quantile of "num_values" values, where "select(k)" returns the k-th smallest
+// value (0-based). The quantile is linearly interpolated between the two
+// closest values, like numpy's default "np.quantile" method.
+template <typename TSelect>
+double interpolated_quantile(const double quantile, const size_t num_values,
+                             const TSelect &select) {
+  const double position = quantile * (num_values - 1);
+  const size_t below_idx = static_cast<size_t>(position);
+  const double fraction = position - below_idx;
+  const double below = select(below_idx);
+  if (fraction == 0 || below_idx + 1 >= num_values) {
+    return below;
+  }
+  const double above = select(below_idx + 1);
+  // Same interpolation as numpy.
+  const double diff = above - below;
+  if (fraction >= 0.5) {
+    return above - diff * (1 - fraction);
+  }
+  return below + diff * fraction;
+}
+
+// Quantile of the non-missing values of the window (see
+// "interpolated_quantile").
 template <typename INPUT, typename OUTPUT>
-struct MovingSumAccumulator : Accumulator<INPUT, OUTPUT> {
-  MovingSumAccumulator(const ArrayRef<INPUT> &values)
-      : Accumulator<INPUT, OUTPUT>(values) {}
+struct MovingQuantileAccumulator final : Accumulator<INPUT, OUTPUT> {
+  MovingQuantileAccumulator(const ArrayRef<INPUT> &values,
+                            const double quantile)
+      : Accumulator<INPUT, OUTPUT>(values), quantile(quantile) {}
 
   void Add(Idx idx) override {
     const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
@@ -407,7 +1827,7 @@ struct MovingSumAccumulator : Accumulator<INPUT, OUTPUT> {
         return;
       }
     }
-    sum_values += value;
+    tree.Insert(value, idx);
   }
 
   void Remove(Idx idx) override {
@@ -417,160 +1837,913 @@ struct MovingSumAccumulator : Accumulator<INPUT, OUTPUT> {
         return;
       }
     }
-    sum_values -= value;
+    tree.Erase(value, idx);
   }
 
-  OUTPUT Result() override { return sum_values; }
+  OUTPUT Result() override {
+    const size_t num_values = tree.size();
+    if (num_values == 0) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    }
+    return interpolated_quantile(
+        quantile, num_values,
+        [this](const size_t k) -> double { return tree.Select(k); });
+  }
 
-  // Sum of the values in the rolling window (RW).
-  double sum_values = 0;
+  const double quantile;
+  OrderStatisticTree<INPUT> tree;
+};
+
+// The "accumulate_multi_with" functions are similar to "accumulate_multi", for
+// accumulators which also depend on the parameters "args" of the operator
+// (e.g. the quantile to compute). "args" is passed to the constructor of the
+// accumulators, after the values.
+
+// No external sampling, constant window length.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TArgs>
+std::vector<py::array_t<OUTPUT>> accumulate_multi_with(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const double window_length, const TArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values, args);
+    accumulate_range(v_timestamps, accumulator, outputs, 0, n_event,
+                     window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, constant window length, with offsets.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TArgs>
+std::vector<py::array_t<OUTPUT>> accumulate_multi_with(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const py::array_t<int64_t> &offsets, const double window_length,
+    const TArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_offsets = offsets.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values,
+                                                                args);
+      accumulate_range(v_timestamps, accumulator, outputs,
+                       v_offsets[index_idx], v_offsets[index_idx + 1],
+                       window_length);
+    }
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, constant window length.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TArgs>
+std::vector<py::array_t<OUTPUT>> accumulate_multi_with(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const double window_length,
+    const TArgs &args) {
+  MultiOutput<OUTPUT> outputs(evset_values.size(),
+                              sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values, args);
+    accumulate_sampling(v_timestamps, v_sampling, accumulator, outputs,
+                        window_length);
+  }
+
+  return outputs.arrays;
+}
+
+// No external sampling, variable window length.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TArgs>
+std::vector<py::array_t<OUTPUT>> accumulate_multi_with(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &window_length, const TArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  MultiOutput<OUTPUT> outputs(evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_timestamps.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values, args);
+    accumulate_variable(v_timestamps, v_window_length, accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, variable window length.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TArgs>
+std::vector<py::array_t<OUTPUT>> accumulate_multi_with(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const ArrayD &window_length,
+    const TArgs &args) {
+  MultiOutput<OUTPUT> outputs(evset_values.size(),
+                              sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_sampling.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiAccumulator<INPUT, OUTPUT, TAccumulator> accumulator(v_values, args);
+    accumulate_sampling_variable(v_timestamps, v_sampling, v_window_length,
+                                 accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// Approximate quantile sketch with a relative accuracy guarantee (DDSketch,
+// Masson et al., 2019). The non-zero values are counted in logarithmically
+// spaced buckets: The bucket "key" contains the values x such that
+// gamma^(key-1) < |x| <= gamma^key, with gamma = (1 + a) / (1 - a) and "a" the
+// relative accuracy. The k-th smallest value is estimated with a relative
+// error of at most "a".
+//
+// Unlike KLL or t-digest, values can be removed from the sketch, which is
+// required for sliding windows. Two sketches with the same relative accuracy
+// are merged by summing the counts of their buckets.
+//
+// The memory is bounded: When the values of a sign use more than
+// "kMaxNumBuckets" buckets, the two buckets with the lowest absolute values
+// are collapsed together.
+class LogBucketSketch {
+ public:
+  explicit LogBucketSketch(const double relative_accuracy)
+      : log_gamma_(std::log((1 + relative_accuracy) / (1 - relative_accuracy))),
+        bucket_value_factor_(2 / (1 + std::exp(log_gamma_))) {}
+
+  // Adds "count" times "value". A negative count removes values.
+  void Update(const double value, const int64_t count) {
+    if (std::abs(value) < std::numeric_limits<double>::min()) {
+      // Zero, or too close to zero to be indexed.
+      zero_count_ += count;
+    } else if (value > 0) {
+      positive_.Update(Key(value), count);
+    } else {
+      negative_.Update(Key(-value), count);
+    }
+    num_values_ += count;
+  }
+
+  // Estimates the k-th smallest value (0-based).
+  double Select(size_t k) const {
+    assert(k < size());
+    // Negative values, from the lowest.
+    for (auto it = negative_.buckets.rbegin(); it != negative_.buckets.rend();
+         it++) {
+      if (k < static_cast<size_t>(it->second)) {
+        return -Value(it->first);
+      }
+      k -= it->second;
+    }
+    if (k < static_cast<size_t>(zero_count_)) {
+      return 0;
+    }
+    k -= zero_count_;
+    for (const auto &[key, count] : positive_.buckets) {
+      if (k < static_cast<size_t>(count)) {
+        return Value(key);
+      }
+      k -= count;
+    }
+    assert(false);
+    return std::numeric_limits<double>::quiet_NaN();
+  }
+
+  size_t size() const { return num_values_; }
+
+ private:
+  static constexpr size_t kMaxNumBuckets = 2048;
+
+  // Buckets of the absolute values of one sign.
+  struct Store {
+    void Update(int64_t key, const int64_t count) {
+      // The values lower than "min_key" are counted in the bucket of
+      // "min_key" since the lowest buckets were collapsed.
+      key = std::max(key, min_key);
+      auto it = buckets.emplace(key, 0).first;
+      it->second += count;
+      if (it->second == 0) {
+        buckets.erase(it);
+      } else if (buckets.size() > kMaxNumBuckets) {
+        const auto lowest = buckets.begin();
+        const auto next = std::next(lowest);
+        next->second += lowest->second;
+        min_key = next->first;
+        buckets.erase(lowest);
+      }
+    }
+
+    // Number of values of each bucket. Empty buckets are removed.
+    std::map<int64_t, int64_t> buckets;
+    int64_t min_key = std::numeric_limits<int64_t>::min();
+  };
+
+  int64_t Key(const double abs_value) const {
+    return static_cast<int64_t>(std::ceil(std::log(abs_value) / log_gamma_));
+  }
+
+  // Value of the bucket with the lowest maximum relative error, i.e.
+  // 2 * gamma^key / (1 + gamma).
+  double Value(const int64_t key) const {
+    return std::exp(key * log_gamma_) * bucket_value_factor_;
+  }
+
+  const double log_gamma_;
+  const double bucket_value_factor_;
+  Store positive_;
+  Store negative_;
+  int64_t zero_count_ = 0;
+  int64_t num_values_ = 0;
 };
 
+// Parameters of the ApproxQuantileAccumulator.
+struct ApproxQuantileArgs {
+  double quantile;
+  double relative_accuracy;
+};
+
+// Approximate quantile of the non-missing values of the window (see
+// "interpolated_quantile"), computed with a LogBucketSketch.
 template <typename INPUT, typename OUTPUT>
-struct MovingExtremumAccumulator : Accumulator<INPUT, OUTPUT> {
-  MovingExtremumAccumulator(const ArrayRef<INPUT> &values)
-      : Accumulator<INPUT, OUTPUT>(values) {}
+struct ApproxQuantileAccumulator final : Accumulator<INPUT, OUTPUT> {
+  ApproxQuantileAccumulator(const ArrayRef<INPUT> &values,
+                            const ApproxQuantileArgs &args)
+      : Accumulator<INPUT, OUTPUT>(values),
+        quantile(args.quantile),
+        sketch(args.relative_accuracy) {}
 
-  virtual ~MovingExtremumAccumulator() = default;
+  void Add(Idx idx) override { Update(idx, 1); }
 
-  virtual bool Compare(INPUT a, INPUT b) = 0;
+  void Remove(Idx idx) override { Update(idx, -1); }
 
-  void Add(Idx idx) override {
+  OUTPUT Result() override {
+    const size_t num_values = sketch.size();
+    if (num_values == 0) {
+      return std::numeric_limits<OUTPUT>::quiet_NaN();
+    }
+    return interpolated_quantile(
+        quantile, num_values,
+        [this](const size_t k) -> double { return sketch.Select(k); });
+  }
+
+  void Update(Idx idx, const int64_t count) {
     const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
     if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (!(value == value)) {
+      if (std::isnan(value)) {
         return;
       }
     }
+    sketch.Update(value, count);
+  }
 
-    while (!best_indices.empty() &&
-           !Compare(Accumulator<INPUT, OUTPUT>::values[best_indices.back()],
-                    value)) {
-      best_indices.pop_back();
+  const double quantile;
+  LogBucketSketch sketch;
+};
+
+// Mixes the bits of a 64 bits integer (SplitMix64 finalizer).
+inline uint64_t mix_bits(uint64_t x) {
+  x += 0x9e3779b97f4a7c15;
+  x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9;
+  x = (x ^ (x >> 27)) * 0x94d049bb133111eb;
+  return x ^ (x >> 31);
+}
+
+// Hash of a feature value. Equal values have the same hash.
+template <typename INPUT>
+uint64_t hash_value(const INPUT value) {
+  if constexpr (std::is_floating_point<INPUT>::value) {
+    // Note: -0 and +0 are equal.
+    const double double_value = value == 0 ? 0 : static_cast<double>(value);
+    uint64_t bits;
+    std::memcpy(&bits, &double_value, sizeof(bits));
+    return mix_bits(bits);
+  } else {
+    return mix_bits(static_cast<uint64_t>(static_cast<int64_t>(value)));
+  }
+}
+
+// Approximate number of distinct values in a sliding window: A HyperLogLog
+// (Flajolet et al., 2007) over a sliding window (Chabchoub and Hebrail, 2010).
+//
+// Each value is hashed into one of the 2^precision registers. The "rank" of a
+// value is the position of the first 1 bit in the rest of its hash. The number
+// of distinct values is estimated from the maximum rank of each register. The
+// relative standard error is ~1.04 / sqrt(2^precision).
+//
+// Instead of its maximum rank, each register keeps the values that can become
+// its maximum when older values leave the window: The values whose rank is
+// greater than the rank of all the more recent values of the register. These
+// lists contain O(log(w)) values on average, with w the number of values in
+// the window. Only the non-empty registers are stored: The memory is bounded
+// by the number of registers, and is small for windows with few values.
+class SlidingHyperLogLog {
+ public:
+  explicit SlidingHyperLogLog(const int precision)
+      : precision_(precision),
+        num_registers_(size_t{1} << precision),
+        rank_counts_(66 - precision, 0) {}
+
+  // Adds a value more recent than all the values in the sketch.
+  void Add(const uint64_t hash, const Idx idx) {
+    const auto register_idx = RegisterIdx(hash);
+    const auto rank = Rank(hash);
+    auto &entries = registers_[register_idx];
+    const uint8_t old_rank = entries.empty() ? 0 : entries.front().rank;
+    while (!entries.empty() && entries.back().rank <= rank) {
+      entries.pop_back();
+    }
+    entries.push_back({idx, rank});
+    UpdateRankCounts(old_rank, entries.front().rank);
+  }
+
+  // Adds a value older than all the values in the sketch.
+  void AddLeft(const uint64_t hash, const Idx idx) {
+    const auto register_idx = RegisterIdx(hash);
+    const auto rank = Rank(hash);
+    auto &entries = registers_[register_idx];
+    if (!entries.empty() && entries.front().rank >= rank) {
+      // A more recent value has a greater or equal rank.
+      return;
+    }
+    const uint8_t old_rank = entries.empty() ? 0 : entries.front().rank;
+    entries.insert(entries.begin(), {idx, rank});
+    UpdateRankCounts(old_rank, rank);
+  }
+
+  // Removes the oldest value in the sketch.
+  void Remove(const uint64_t hash, const Idx idx) {
+    const auto it = registers_.find(RegisterIdx(hash));
+    if (it == registers_.end() || it->second.front().idx != idx) {
+      // The value was superseded by a more recent value.
+      return;
+    }
+    auto &entries = it->second;
+    const uint8_t old_rank = entries.front().rank;
+    entries.erase(entries.begin());
+    if (entries.empty()) {
+      registers_.erase(it);
+      UpdateRankCounts(old_rank, 0);
+    } else {
+      UpdateRankCounts(old_rank, entries.front().rank);
+    }
+  }
+
+  double Estimate() const {
+    const double m = num_registers_;
+    const size_t num_empty_registers = num_registers_ - registers_.size();
+    double sum = num_empty_registers;
+    for (size_t rank = 1; rank < rank_counts_.size(); rank++) {
+      sum += std::ldexp(rank_counts_[rank], -static_cast<int>(rank));
+    }
+    double alpha;
+    switch (num_registers_) {
+      case 16:
+        alpha = 0.673;
+        break;
+      case 32:
+        alpha = 0.697;
+        break;
+      case 64:
+        alpha = 0.709;
+        break;
+      default:
+        alpha = 0.7213 / (1 + 1.079 / m);
+    }
+    const double estimate = alpha * m * m / sum;
+    if (estimate <= 2.5 * m && num_empty_registers > 0) {
+      // Linear counting, more accurate for small numbers of values.
+      return m * std::log(m / num_empty_registers);
+    }
+    return estimate;
+  }
+
+ private:
+  struct Entry {
+    Idx idx;
+    uint8_t rank;
+  };
+
+  size_t RegisterIdx(const uint64_t hash) const {
+    return hash >> (64 - precision_);
+  }
+
+  uint8_t Rank(const uint64_t hash) const {
+    const uint64_t rest = hash << precision_;
+    if (rest == 0) {
+      return 65 - precision_;
+    }
+    return __builtin_clzll(rest) + 1;
+  }
+
+  void UpdateRankCounts(const uint8_t old_rank, const uint8_t new_rank) {
+    if (old_rank > 0) {
+      rank_counts_[old_rank]--;
+    }
+    if (new_rank > 0) {
+      rank_counts_[new_rank]++;
+    }
+  }
+
+  const int precision_;
+  const size_t num_registers_;
+  // Values of the non-empty registers, from the oldest. The ranks are
+  // decreasing, so the first value has the maximum rank.
+  std::unordered_map<size_t, std::vector<Entry>> registers_;
+  // Number of non-empty registers with a given maximum rank.
+  std::vector<size_t> rank_counts_;
+};
+
+// Approximate number of distinct non-missing values of the window, computed
+// with a SlidingHyperLogLog.
+template <typename INPUT, typename OUTPUT>
+struct ApproxDistinctCountAccumulator final : Accumulator<INPUT, OUTPUT> {
+  ApproxDistinctCountAccumulator(const ArrayRef<INPUT> &values,
+                                 const int precision)
+      : Accumulator<INPUT, OUTPUT>(values), sketch(precision) {}
+
+  void Add(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if (!IsMissing(value)) {
+      sketch.Add(hash_value(value), idx);
     }
-    best_indices.push_back(idx);
   }
 
   void AddLeft(Idx idx) override {
     const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if (!IsMissing(value)) {
+      sketch.AddLeft(hash_value(value), idx);
+    }
+  }
+
+  void Remove(Idx idx) override {
+    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
+    if (!IsMissing(value)) {
+      sketch.Remove(hash_value(value), idx);
+    }
+  }
 
+  OUTPUT Result() override { return std::llround(sketch.Estimate()); }
+
+  static bool IsMissing(const INPUT value) {
     if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (!(value == value)) {
+      return std::isnan(value);
+    }
+    return false;
+  }
+
+  SlidingHyperLogLog sketch;
+};
+
+// Count-Min sketch (Cormode and Muthukrishnan, 2005): "kDepth" rows of
+// ceil(e / epsilon) counters. Each value is counted in one counter of each
+// row, and its count is estimated by the minimum of these counters. The
+// estimate exceeds the count by more than epsilon * n, where n is the total
+// count, with a probability of at most exp(-kDepth).
+//
+// Counts can be decremented, and two sketches with the same epsilon are
+// merged by summing their counters.
+class CountMinSketch {
+ public:
+  explicit CountMinSketch(const double epsilon)
+      : width_(static_cast<size_t>(std::ceil(std::exp(1.) / epsilon))),
+        counters_(kDepth * width_, 0) {}
+
+  void Update(const uint64_t hash, const int64_t count) {
+    for (size_t row = 0; row < kDepth; row++) {
+      counters_[row * width_ + Column(hash, row)] += count;
+    }
+  }
+
+  int64_t Estimate(const uint64_t hash) const {
+    int64_t estimate = std::numeric_limits<int64_t>::max();
+    for (size_t row = 0; row < kDepth; row++) {
+      estimate =
+          std::min(estimate, counters_[row * width_ + Column(hash, row)]);
+    }
+    return estimate;
+  }
+
+ private:
+  static constexpr size_t kDepth = 4;
+
+  size_t Column(const uint64_t hash, const size_t row) const {
+    return mix_bits(hash + row) % width_;
+  }
+
+  const size_t width_;
+  std::vector<int64_t> counters_;
+};
+
+// Parameters of the HeavyHittersAccumulator.
+struct HeavyHittersArgs {
+  int k;
+  double epsilon;
+};
+
+// Approximate "k" most frequent non-missing values of the window, with their
+// estimated number of occurrences. The numbers of occurrences are estimated
+// with a CountMinSketch. The values that can be the most frequent are tracked
+// in a set of "kCandidatesPerItem * k" candidates: A new value replaces the
+// candidate with the lowest estimated count if it has a greater estimated
+// count.
+template <typename INPUT>
+struct HeavyHittersAccumulator {
+  struct Candidate {
+    INPUT value;
+    uint64_t hash;
+    int64_t count;
+  };
+
+  HeavyHittersAccumulator(const ArrayRef<INPUT> &values,
+                          const HeavyHittersArgs &args)
+      : values(values),
+        k(args.k),
+        max_num_candidates(kCandidatesPerItem * args.k),
+        sketch(args.epsilon) {}
+
+  void Add(Idx idx) {
+    const INPUT value = values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
         return;
       }
     }
+    const uint64_t hash = hash_value(value);
+    sketch.Update(hash, 1);
+    Track(value, hash);
+  }
 
-    if (best_indices.empty()) {
-      best_indices.push_back(idx);
-    } else {
-      if (Compare(value,
-                  Accumulator<INPUT, OUTPUT>::values[best_indices.front()])) {
-        best_indices.push_front(idx);
+  void AddLeft(Idx idx) { Add(idx); }
+
+  void Remove(Idx idx) {
+    const INPUT value = values[idx];
+    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+      if (std::isnan(value)) {
+        return;
       }
     }
+    sketch.Update(hash_value(value), -1);
   }
 
-  void Remove(Idx idx) override {
-    const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-    if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
-      if (!(value == value)) {
+  // Sorts the candidates by decreasing estimated count (and increasing value
+  // for equal counts), and sets "num_items" to the number of candidates
+  // to output.
+  void Update() {
+    for (auto &candidate : candidates) {
+      candidate.count = sketch.Estimate(candidate.hash);
+    }
+    std::sort(candidates.begin(), candidates.end(),
+              [](const Candidate &a, const Candidate &b) {
+                return a.count > b.count ||
+                       (a.count == b.count && a.value < b.value);
+              });
+    num_items = 0;
+    while (num_items < std::min<size_t>(k, candidates.size()) &&
+           candidates[num_items].count > 0) {
+      num_items++;
+    }
+  }
+
+  void Track(const INPUT value, const uint64_t hash) {
+    for (const auto &candidate : candidates) {
+      if (candidate.value == value) {
         return;
       }
     }
+    if (candidates.size() < max_num_candidates) {
+      candidates.push_back({value, hash, 0});
+      return;
+    }
+    size_t lowest_idx = 0;
+    int64_t lowest_count = std::numeric_limits<int64_t>::max();
+    for (size_t idx = 0; idx < candidates.size(); idx++) {
+      const int64_t count = sketch.Estimate(candidates[idx].hash);
+      if (count < lowest_count) {
+        lowest_idx = idx;
+        lowest_count = count;
+      }
+    }
+    if (sketch.Estimate(hash) > lowest_count) {
+      candidates[lowest_idx] = {value, hash, 0};
+    }
+  }
 
-    assert(!best_indices.empty());
-    assert(best_indices.front() >= idx);
-    if (best_indices.front() == idx) {
-      best_indices.pop_front();
+  static constexpr size_t kCandidatesPerItem = 4;
+
+  ArrayRef<INPUT> values;
+  const size_t k;
+  const size_t max_num_candidates;
+  CountMinSketch sketch;
+  std::vector<Candidate> candidates;
+  // The first "num_items" candidates are the most frequent values, after
+  // "Update()".
+  size_t num_items = 0;
+};
+
+// One HeavyHittersAccumulator per feature, updated together. The outputs read
+// the most frequent values directly from the accumulators returned by
+// "Result()".
+template <typename INPUT>
+struct MultiHeavyHittersAccumulator {
+  MultiHeavyHittersAccumulator(const std::vector<ArrayRef<INPUT>> &values,
+                               const HeavyHittersArgs &args) {
+    accumulators.reserve(values.size());
+    for (const auto &feature_values : values) {
+      accumulators.emplace_back(feature_values, args);
     }
   }
 
-  OUTPUT Result() override {
-    if (best_indices.empty()) {
-      return std::numeric_limits<OUTPUT>::quiet_NaN();
-    } else {
-      return Accumulator<INPUT, OUTPUT>::values[best_indices.front()];
+  void Add(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Add(idx);
     }
   }
 
-  // Subset of indexes of the observations in the window, sorted by index value,
-  // and such that index "j" is not part of "best_indices" if there is another
-  // index "i" in "best_indices" such that "i>j" (i is after j) and the value of
-  // i is greater than the value if j.
-  std::deque<size_t> best_indices;
+  void AddLeft(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.AddLeft(idx);
+    }
+  }
+
+  void Remove(Idx idx) {
+    for (auto &accumulator : accumulators) {
+      accumulator.Remove(idx);
+    }
+  }
+
+  const std::vector<HeavyHittersAccumulator<INPUT>> &Result() {
+    for (auto &accumulator : accumulators) {
+      accumulator.Update();
+    }
+    return accumulators;
+  }
+
+  std::vector<HeavyHittersAccumulator<INPUT>> accumulators;
 };
 
-template <typename INPUT, typename OUTPUT>
-struct MovingMinAccumulator : MovingExtremumAccumulator<INPUT, OUTPUT> {
-  MovingMinAccumulator(const ArrayRef<INPUT> &values)
-      : MovingExtremumAccumulator<INPUT, OUTPUT>(values) {}
+// Output arrays of "moving_approx_heavy_hitters": For each feature, the i-th
+// most frequent value (with the type of the input) followed by its estimated
+// count (int32), for i in [0, k). Missing items are set to NaN for floating
+// point values, 0 for integer values, and a count of 0. "outputs[idx] =
+// accumulators" sets the idx-th value of each array.
+template <typename INPUT>
+struct HeavyHittersOutput {
+  struct Item {
+    void operator=(
+        const std::vector<HeavyHittersAccumulator<INPUT>> &accumulators) {
+      const size_t k = outputs.k;
+      for (size_t feature_idx = 0; feature_idx < accumulators.size();
+           feature_idx++) {
+        const auto &accumulator = accumulators[feature_idx];
+        void *const *data = &outputs.data[feature_idx * 2 * k];
+        for (size_t item_idx = 0; item_idx < k; item_idx++) {
+          INPUT value;
+          int32_t count;
+          if (item_idx < accumulator.num_items) {
+            const auto &candidate = accumulator.candidates[item_idx];
+            value = candidate.value;
+            count = candidate.count;
+          } else {
+            if constexpr (std::numeric_limits<INPUT>::has_quiet_NaN) {
+              value = std::numeric_limits<INPUT>::quiet_NaN();
+            } else {
+              value = 0;
+            }
+            count = 0;
+          }
+          static_cast<INPUT *>(data[2 * item_idx])[idx] = value;
+          static_cast<int32_t *>(data[2 * item_idx + 1])[idx] = count;
+        }
+      }
+    }
+
+    HeavyHittersOutput &outputs;
+    const size_t idx;
+  };
+
+  // Allocates the arrays of "num_features" features with "size" values.
+  HeavyHittersOutput(const size_t k, const size_t num_features,
+                     const size_t size)
+      : k(k), arrays(num_features) {
+    data.reserve(num_features * 2 * k);
+    for (auto &feature_arrays : arrays) {
+      for (size_t item_idx = 0; item_idx < k; item_idx++) {
+        py::array values = py::array_t<INPUT>(size);
+        py::array counts = py::array_t<int32_t>(size);
+        data.push_back(values.mutable_data());
+        data.push_back(counts.mutable_data());
+        feature_arrays.push_back(values);
+        feature_arrays.push_back(counts);
+      }
+    }
+  }
+
+  Item operator[](const size_t idx) { return Item{*this, idx}; }
 
-  bool Compare(INPUT a, INPUT b) { return a < b; }
+  const size_t k;
+  // "arrays[i][2*j]" and "arrays[i][2*j+1]" are the j-th most frequent value
+  // and its count for the i-th feature.
+  std::vector<std::vector<py::array>> arrays;
+  // Data of the arrays, in the same order.
+  std::vector<void *> data;
 };
 
-template <typename INPUT, typename OUTPUT>
-struct MovingMaxAccumulator : MovingExtremumAccumulator<INPUT, OUTPUT> {
-  MovingMaxAccumulator(const ArrayRef<INPUT> &values)
-      : MovingExtremumAccumulator<INPUT, OUTPUT>(values) {}
+// The "heavy_hitters" functions compute the most frequent values of several
+// features of the same type at once. The result "r" is such that "r[i]" are
+// the arrays of the i-th feature, as described in "HeavyHittersOutput".
 
-  bool Compare(INPUT a, INPUT b) { return a > b; }
-};
+// No external sampling, constant window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> heavy_hitters(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const double window_length, const HeavyHittersArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  HeavyHittersOutput<INPUT> outputs(args.k, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
 
-// TODO: Revisit the MovingProductAccumulator for potential optimization to
-// improve calculation efficiency while maintaining accuracy.
-template <typename INPUT, typename OUTPUT>
-struct MovingProductAccumulator : public Accumulator<INPUT, OUTPUT> {
-    int start_idx = 0;
-    int end_idx = -1; // Initialize to -1 to indicate an empty window initially
+  {
+    py::gil_scoped_release release;
+    MultiHeavyHittersAccumulator<INPUT> accumulator(v_values, args);
+    accumulate_range(v_timestamps, accumulator, outputs, 0, n_event,
+                     window_length);
+  }
 
-    MovingProductAccumulator(const ArrayRef<INPUT>& values)
-        : Accumulator<INPUT, OUTPUT>(values) {}
-    void Add(Idx idx) override {
-        // Simply move the end to the given index
-        end_idx = idx;
-    }
+  return outputs.arrays;
+}
 
-    void Remove(Idx idx) override {
-        // Adjust the start index to exclude the removed value, signaling a window shift.
-        start_idx = idx + 1;
+// No external sampling, constant window length, with offsets.
+template <typename INPUT>
+std::vector<std::vector<py::array>> heavy_hitters(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const py::array_t<int64_t> &offsets, const double window_length,
+    const HeavyHittersArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_index = offsets.shape(0) - 1;
+  HeavyHittersOutput<INPUT> outputs(args.k, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_offsets = offsets.unchecked<1>();
+
+  {
+    py::gil_scoped_release release;
+    for (size_t index_idx = 0; index_idx < n_index; index_idx++) {
+      MultiHeavyHittersAccumulator<INPUT> accumulator(v_values, args);
+      accumulate_range(v_timestamps, accumulator, outputs,
+                       v_offsets[index_idx], v_offsets[index_idx + 1],
+                       window_length);
     }
+  }
 
-    OUTPUT Result() override {
-        if (start_idx > end_idx) {
-            // No valid indices to process, indicating an empty window or EventSet
-            return std::numeric_limits<OUTPUT>::quiet_NaN();
-        }
+  return outputs.arrays;
+}
 
-        double product = 1.0;
-        bool hasEncounteredValidValue = false; // This will be true if any non-NaN and non-zero value is encountered
+// External sampling, constant window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> heavy_hitters(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const double window_length,
+    const HeavyHittersArgs &args) {
+  HeavyHittersOutput<INPUT> outputs(args.k, evset_values.size(),
+                                    sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
 
-        for (int idx = start_idx; idx <= end_idx; ++idx) {
-            const INPUT value = Accumulator<INPUT, OUTPUT>::values[idx];
-            if (value == 0) {
-                return 0;  // If a zero is found, return 0 immediately.
-            } else if (!std::isnan(value)) {
-                product *= value;
-                hasEncounteredValidValue = true;
-            }
-        }
+  {
+    py::gil_scoped_release release;
+    MultiHeavyHittersAccumulator<INPUT> accumulator(v_values, args);
+    accumulate_sampling(v_timestamps, v_sampling, accumulator, outputs,
+                        window_length);
+  }
 
-        if (!hasEncounteredValidValue) {
-            return std::numeric_limits<OUTPUT>::quiet_NaN();
-        }
+  return outputs.arrays;
+}
 
-        return product;
-    }
+// No external sampling, variable window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> heavy_hitters(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &window_length, const HeavyHittersArgs &args) {
+  const size_t n_event = evset_timestamps.shape(0);
+  HeavyHittersOutput<INPUT> outputs(args.k, evset_values.size(), n_event);
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values = multi_values(evset_values, n_event);
+  auto v_window_length = window_length.unchecked<1>();
 
-    void Reset()  {
-        start_idx = 0;
-        end_idx = -1;
-    }
-};
+  assert(v_timestamps.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiHeavyHittersAccumulator<INPUT> accumulator(v_values, args);
+    accumulate_variable(v_timestamps, v_window_length, accumulator, outputs);
+  }
+
+  return outputs.arrays;
+}
+
+// External sampling, variable window length.
+template <typename INPUT>
+std::vector<std::vector<py::array>> heavy_hitters(
+    const ArrayD &evset_timestamps,
+    const std::vector<py::array_t<INPUT>> &evset_values,
+    const ArrayD &sampling_timestamps, const ArrayD &window_length,
+    const HeavyHittersArgs &args) {
+  HeavyHittersOutput<INPUT> outputs(args.k, evset_values.size(),
+                                    sampling_timestamps.shape(0));
+  auto v_timestamps = evset_timestamps.unchecked<1>();
+  const auto v_values =
+      multi_values(evset_values, evset_timestamps.shape(0));
+  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_window_length = window_length.unchecked<1>();
+
+  assert(v_sampling.shape(0) == v_window_length.shape(0));
+
+  {
+    py::gil_scoped_release release;
+    MultiHeavyHittersAccumulator<INPUT> accumulator(v_values, args);
+    accumulate_sampling_variable(v_timestamps, v_sampling, v_window_length,
+                                 accumulator, outputs);
+  }
 
+  return outputs.arrays;
+}
 
+// Instantiate the "scan" function with and without sampling.
+//
+// Args:
+//   NAME: Name of the python and c++ function.
+//   INPUT: Input value type.
+//   OUTPUT: Output value type.
+//   ACCUMULATOR: Accumulator class.
+#define REGISTER_CC_SCAN_FUNC(NAME, INPUT, OUTPUT, ACCUMULATOR)               \
+                                                                              \
+  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                    \
+                           const py::array_t<INPUT> &evset_values,            \
+                           const py::array_t<int64_t> &offsets) {             \
+    return scan<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(                   \
+        evset_timestamps, evset_values, offsets);                             \
+  }                                                                           \
+                                                                              \
+  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                    \
+                           const py::array_t<INPUT> &evset_values) {          \
+    return scan<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(evset_timestamps,  \
+                                                           evset_values);     \
+  }                                                                           \
+                                                                              \
+  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                    \
+                           const py::array_t<INPUT> &evset_values,            \
+                           const ArrayD &sampling_timestamps) {               \
+    return scan<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(                   \
+        evset_timestamps, evset_values, sampling_timestamps);                 \
+  }
 
 // Instantiate the "accumulate" function with and without sampling,
-// and with and without variable window length.
+// and with and without variable window length, for a single feature
+// ("evset_values" is an array) and for several features of the same type
+// ("evset_values" is a list of arrays). Also instantiate the
+// "accumulate_windows" function as "<NAME>_windows".
 //
 // Args:
 //   NAME: Name of the python and c++ function.
@@ -579,6 +2752,13 @@ struct MovingProductAccumulator : public Accumulator<INPUT, OUTPUT> {
 //   ACCUMULATOR: Accumulator class.
 #define REGISTER_CC_FUNC(NAME, INPUT, OUTPUT, ACCUMULATOR)                    \
                                                                               \
+  py::array_t<OUTPUT> NAME(                                                   \
+      const ArrayD &evset_timestamps, const py::array_t<INPUT> &evset_values, \
+      const py::array_t<int64_t> &offsets, const double window_length) {      \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, offsets, window_length);              \
+  }                                                                           \
+                                                                              \
   py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                    \
                            const py::array_t<INPUT> &evset_values,            \
                            const double window_length) {                      \
@@ -605,11 +2785,85 @@ struct MovingProductAccumulator : public Accumulator<INPUT, OUTPUT> {
       const ArrayD &sampling_timestamps, const ArrayD &window_length) {       \
     return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(             \
         evset_timestamps, evset_values, sampling_timestamps, window_length);  \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> NAME(                                      \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length) {      \
+    return accumulate_multi<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(       \
+        evset_timestamps, evset_values, offsets, window_length);              \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> NAME(                                      \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length) {                                          \
+    return accumulate_multi<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(       \
+        evset_timestamps, evset_values, window_length);                       \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> NAME(                                      \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length) {        \
+    return accumulate_multi<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(       \
+        evset_timestamps, evset_values, sampling_timestamps, window_length);  \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> NAME(                                      \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length) {                                          \
+    return accumulate_multi<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(       \
+        evset_timestamps, evset_values, window_length);                       \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> NAME(                                      \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length) {       \
+    return accumulate_multi<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(       \
+        evset_timestamps, evset_values, sampling_timestamps, window_length);  \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array_t<OUTPUT>>> NAME##_windows(               \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets,                                    \
+      const std::vector<double> &window_lengths) {                            \
+    return accumulate_windows<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(     \
+        evset_timestamps, evset_values, offsets, window_lengths);             \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array_t<OUTPUT>>> NAME##_windows(               \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const std::vector<double> &window_lengths) {                            \
+    return accumulate_windows<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(     \
+        evset_timestamps, evset_values, window_lengths);                      \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array_t<OUTPUT>>> NAME##_windows(               \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps,                                      \
+      const std::vector<double> &window_lengths) {                            \
+    return accumulate_windows<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(     \
+        evset_timestamps, evset_values, sampling_timestamps, window_lengths); \
   }
 
 // Similar to REGISTER_CC_FUNC, but without inputs
 #define REGISTER_CC_FUNC_NO_INPUT(NAME, OUTPUT, ACCUMULATOR)     \
                                                                  \
+  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,       \
+                           const py::array_t<int64_t> &offsets,  \
+                           const double window_length) {         \
+    return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(      \
+        evset_timestamps, evset_timestamps, offsets,             \
+        window_length);                                          \
+  }                                                              \
+                                                                 \
   py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,       \
                            const double window_length) {         \
     return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(      \
@@ -638,6 +2892,288 @@ struct MovingProductAccumulator : public Accumulator<INPUT, OUTPUT> {
         window_length);                                          \
   }
 
+// Instantiate the "aggregate" function with and without sampling, and with and
+// without variable window length, as "moving_aggregate".
+//
+// Args:
+//   INPUT: Input value type.
+#define REGISTER_CC_AGGREGATE_FUNC(INPUT)                                     \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_aggregate(                       \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length,        \
+      const std::vector<std::string> &ops) {                                  \
+    return aggregate<INPUT>(evset_timestamps, evset_values, offsets,          \
+                            window_length, ops);                              \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_aggregate(                       \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length, const std::vector<std::string> &ops) {     \
+    return aggregate<INPUT>(evset_timestamps, evset_values, window_length,    \
+                            ops);                                             \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_aggregate(                       \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length,          \
+      const std::vector<std::string> &ops) {                                  \
+    return aggregate<INPUT>(evset_timestamps, evset_values,                   \
+                            sampling_timestamps, window_length, ops);         \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_aggregate(                       \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length, const std::vector<std::string> &ops) {     \
+    return aggregate<INPUT>(evset_timestamps, evset_values, window_length,    \
+                            ops);                                             \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_aggregate(                       \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length,         \
+      const std::vector<std::string> &ops) {                                  \
+    return aggregate<INPUT>(evset_timestamps, evset_values,                   \
+                            sampling_timestamps, window_length, ops);         \
+  }
+
+// Instantiate the "quantile" function with and without sampling, and with and
+// without variable window length, as "moving_quantile".
+//
+// Args:
+//   INPUT: Input value type.
+//   OUTPUT: Output value type.
+#define REGISTER_CC_QUANTILE_FUNC(INPUT, OUTPUT)                              \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_quantile(                           \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length,        \
+      const double quantile) {                                                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, MovingQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, offsets, window_length, quantile);    \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_quantile(                           \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length, const double quantile) {                    \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, MovingQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, window_length, quantile);             \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_quantile(                           \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length,          \
+      const double quantile) {                                                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, MovingQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        quantile);                                                            \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_quantile(                           \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length, const double quantile) {                   \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, MovingQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, window_length, quantile);             \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_quantile(                           \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length,         \
+      const double quantile) {                                                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, MovingQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        quantile);                                                            \
+  }
+
+// Instantiate the "accumulate_multi_with" function with the
+// ApproxQuantileAccumulator, with and without sampling, and with and without
+// variable window length, as "moving_approx_quantile".
+//
+// Args:
+//   INPUT: Input value type.
+//   OUTPUT: Output value type.
+#define REGISTER_CC_APPROX_QUANTILE_FUNC(INPUT, OUTPUT)                       \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_approx_quantile(                    \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length,        \
+      const double quantile, const double relative_accuracy) {                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, ApproxQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, offsets, window_length,               \
+        ApproxQuantileArgs{quantile, relative_accuracy});                     \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_approx_quantile(                    \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length, const double quantile,                      \
+      const double relative_accuracy) {                                       \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, ApproxQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, window_length,                        \
+        ApproxQuantileArgs{quantile, relative_accuracy});                     \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_approx_quantile(                    \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length,          \
+      const double quantile, const double relative_accuracy) {                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, ApproxQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        ApproxQuantileArgs{quantile, relative_accuracy});                     \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_approx_quantile(                    \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length, const double quantile,                     \
+      const double relative_accuracy) {                                       \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, ApproxQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, window_length,                        \
+        ApproxQuantileArgs{quantile, relative_accuracy});                     \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<OUTPUT>> moving_approx_quantile(                    \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length,         \
+      const double quantile, const double relative_accuracy) {                \
+    return ::accumulate_multi_with<                                           \
+        INPUT, OUTPUT, ApproxQuantileAccumulator<INPUT, OUTPUT>>(             \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        ApproxQuantileArgs{quantile, relative_accuracy});                     \
+  }
+
+// Instantiate the "accumulate_multi_with" function with the
+// ApproxDistinctCountAccumulator, with and without sampling, and with and
+// without variable window length, as "moving_approx_distinct_count".
+//
+// Args:
+//   INPUT: Input value type.
+#define REGISTER_CC_APPROX_DISTINCT_COUNT_FUNC(INPUT)                         \
+                                                                              \
+  std::vector<py::array_t<int32_t>> moving_approx_distinct_count(             \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length,        \
+      const int precision) {                                                  \
+    return ::accumulate_multi_with<                                           \
+        INPUT, int32_t, ApproxDistinctCountAccumulator<INPUT, int32_t>>(      \
+        evset_timestamps, evset_values, offsets, window_length, precision);   \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<int32_t>> moving_approx_distinct_count(             \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length, const int precision) {                      \
+    return ::accumulate_multi_with<                                           \
+        INPUT, int32_t, ApproxDistinctCountAccumulator<INPUT, int32_t>>(      \
+        evset_timestamps, evset_values, window_length, precision);            \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<int32_t>> moving_approx_distinct_count(             \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length,          \
+      const int precision) {                                                  \
+    return ::accumulate_multi_with<                                           \
+        INPUT, int32_t, ApproxDistinctCountAccumulator<INPUT, int32_t>>(      \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        precision);                                                           \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<int32_t>> moving_approx_distinct_count(             \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length, const int precision) {                     \
+    return ::accumulate_multi_with<                                           \
+        INPUT, int32_t, ApproxDistinctCountAccumulator<INPUT, int32_t>>(      \
+        evset_timestamps, evset_values, window_length, precision);            \
+  }                                                                           \
+                                                                              \
+  std::vector<py::array_t<int32_t>> moving_approx_distinct_count(             \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length,         \
+      const int precision) {                                                  \
+    return ::accumulate_multi_with<                                           \
+        INPUT, int32_t, ApproxDistinctCountAccumulator<INPUT, int32_t>>(      \
+        evset_timestamps, evset_values, sampling_timestamps, window_length,   \
+        precision);                                                           \
+  }
+
+// Instantiate the "heavy_hitters" function with and without sampling, and with
+// and without variable window length, as "moving_approx_heavy_hitters".
+//
+// Args:
+//   INPUT: Input value type.
+#define REGISTER_CC_HEAVY_HITTERS_FUNC(INPUT)                                 \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_approx_heavy_hitters(            \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const py::array_t<int64_t> &offsets, const double window_length,        \
+      const int k, const double epsilon) {                                    \
+    return heavy_hitters<INPUT>(evset_timestamps, evset_values, offsets,      \
+                                window_length, HeavyHittersArgs{k, epsilon}); \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_approx_heavy_hitters(            \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const double window_length, const int k, const double epsilon) {        \
+    return heavy_hitters<INPUT>(evset_timestamps, evset_values,               \
+                                window_length, HeavyHittersArgs{k, epsilon}); \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_approx_heavy_hitters(            \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const double window_length,          \
+      const int k, const double epsilon) {                                    \
+    return heavy_hitters<INPUT>(evset_timestamps, evset_values,               \
+                                sampling_timestamps, window_length,           \
+                                HeavyHittersArgs{k, epsilon});                \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_approx_heavy_hitters(            \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &window_length, const int k, const double epsilon) {       \
+    return heavy_hitters<INPUT>(evset_timestamps, evset_values,               \
+                                window_length, HeavyHittersArgs{k, epsilon}); \
+  }                                                                           \
+                                                                              \
+  std::vector<std::vector<py::array>> moving_approx_heavy_hitters(            \
+      const ArrayD &evset_timestamps,                                         \
+      const std::vector<py::array_t<INPUT>> &evset_values,                    \
+      const ArrayD &sampling_timestamps, const ArrayD &window_length,         \
+      const int k, const double epsilon) {                                    \
+    return heavy_hitters<INPUT>(evset_timestamps, evset_values,               \
+                                sampling_timestamps, window_length,           \
+                                HeavyHittersArgs{k, epsilon});                \
+  }
+
 // Note: ";" are not needed for the code, but are required for our code
 // formatter.
 
@@ -670,6 +3206,39 @@ REGISTER_CC_FUNC_NO_INPUT(moving_count, int32_t, MovingCountAccumulator);
 
 REGISTER_CC_FUNC(moving_product, float, float, MovingProductAccumulator);
 REGISTER_CC_FUNC(moving_product, double, double, MovingProductAccumulator);
+
+REGISTER_CC_SCAN_FUNC(cumsum, float, float, MovingSumAccumulator);
+REGISTER_CC_SCAN_FUNC(cumsum, double, double, MovingSumAccumulator);
+REGISTER_CC_SCAN_FUNC(cumsum, int32_t, int32_t, MovingSumAccumulator);
+REGISTER_CC_SCAN_FUNC(cumsum, int64_t, int64_t, MovingSumAccumulator);
+
+REGISTER_CC_SCAN_FUNC(cumprod, float, float, CumulativeProductAccumulator);
+REGISTER_CC_SCAN_FUNC(cumprod, double, double, CumulativeProductAccumulator);
+
+REGISTER_CC_AGGREGATE_FUNC(float);
+REGISTER_CC_AGGREGATE_FUNC(double);
+REGISTER_CC_AGGREGATE_FUNC(int32_t);
+REGISTER_CC_AGGREGATE_FUNC(int64_t);
+
+REGISTER_CC_QUANTILE_FUNC(float, float);
+REGISTER_CC_QUANTILE_FUNC(double, double);
+REGISTER_CC_QUANTILE_FUNC(int32_t, double);
+REGISTER_CC_QUANTILE_FUNC(int64_t, double);
+
+REGISTER_CC_APPROX_QUANTILE_FUNC(float, float);
+REGISTER_CC_APPROX_QUANTILE_FUNC(double, double);
+REGISTER_CC_APPROX_QUANTILE_FUNC(int32_t, double);
+REGISTER_CC_APPROX_QUANTILE_FUNC(int64_t, double);
+
+REGISTER_CC_APPROX_DISTINCT_COUNT_FUNC(float);
+REGISTER_CC_APPROX_DISTINCT_COUNT_FUNC(double);
+REGISTER_CC_APPROX_DISTINCT_COUNT_FUNC(int32_t);
+REGISTER_CC_APPROX_DISTINCT_COUNT_FUNC(int64_t);
+
+REGISTER_CC_HEAVY_HITTERS_FUNC(float);
+REGISTER_CC_HEAVY_HITTERS_FUNC(double);
+REGISTER_CC_HEAVY_HITTERS_FUNC(int32_t);
+REGISTER_CC_HEAVY_HITTERS_FUNC(int64_t);
 }  // namespace
 
 // Register c++ functions to pybind with and without sampling,
@@ -681,6 +3250,13 @@ REGISTER_CC_FUNC(moving_product, double, double, MovingProductAccumulator);
 //   OUTPUT: Output value type.
 //
 #define ADD_PY_DEF(NAME, INPUT, OUTPUT)                                        \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
+                          const py::array_t<int64_t> &, double>(&NAME),        \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("offsets").noconvert(), py::arg("window_length"));             \
+                                                                               \
   m.def(#NAME,                                                                 \
         py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
                           const ArrayD &, double>(&NAME),                      \
@@ -707,8 +3283,92 @@ REGISTER_CC_FUNC(moving_product, double, double, MovingProductAccumulator);
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("evset_values").noconvert(), py::arg("window_length"));
 
+// Registers the c++ functions computing several features at once, with and
+// without sampling, and with and without variable window length. The python
+// function is named "<NAME>_multi", and "evset_values" is a list of arrays of
+// the same type.
+//
+// Note: The functions are registered under a different name than the single
+// feature ones, as a numpy array would otherwise be accepted as a list of
+// values.
+#define ADD_PY_DEF_MULTI(NAME, INPUT, OUTPUT)                                  \
+  m.def(#NAME "_multi",                                                        \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const py::array_t<int64_t> &, double>(&NAME),        \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("offsets").noconvert(), py::arg("window_length"));             \
+                                                                               \
+  m.def(#NAME "_multi",                                                        \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, double>(&NAME),                      \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
+                                                                               \
+  m.def(#NAME "_multi",                                                        \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &, double>(    \
+            &NAME),                                                            \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"));        \
+                                                                               \
+  m.def(#NAME "_multi",                                                        \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, const ArrayD &>(&NAME),              \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
+                                                                               \
+  m.def(#NAME "_multi",                                                        \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &>(&NAME),                              \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"));
+
+// Registers the c++ functions computing several features on several constant
+// window lengths at once, with and without sampling. The python function is
+// named "<NAME>_windows", and returns a list (one item per window length) of
+// lists of arrays (one item per feature).
+#define ADD_PY_DEF_WINDOWS(NAME, INPUT, OUTPUT)                                \
+  m.def(#NAME "_windows",                                                      \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const py::array_t<int64_t> &,                        \
+                          const std::vector<double> &>(&NAME##_windows),       \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("offsets").noconvert(), py::arg("window_lengths"));            \
+                                                                               \
+  m.def(#NAME "_windows",                                                      \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, const std::vector<double> &>(        \
+            &NAME##_windows),                                                  \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(),                            \
+        py::arg("window_lengths"));                                            \
+                                                                               \
+  m.def(#NAME "_windows",                                                      \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const std::vector<double> &>(&NAME##_windows),       \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_lengths"));
+
 // Similar to ADD_PY_DEF, but without inputs.
 #define ADD_PY_DEF_NO_INPUT(NAME, OUTPUT)                                      \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const ArrayD &, const py::array_t<int64_t> &,        \
+                          double>(&NAME),                                      \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("offsets").noconvert(), py::arg("window_length"));             \
+                                                                               \
   m.def(#NAME,                                                                 \
         py::overload_cast<const ArrayD &, const ArrayD &, double>(&NAME), "",  \
         py::arg("evset_timestamps").noconvert(),                               \
@@ -726,31 +3386,374 @@ REGISTER_CC_FUNC(moving_product, double, double, MovingProductAccumulator);
   m.def(#NAME, py::overload_cast<const ArrayD &, const ArrayD &>(&NAME), "",   \
         py::arg("evset_timestamps").noconvert(), py::arg("window_length"));
 
+// Similar to ADD_PY_DEF, but for the "scan" functions.
+#define ADD_PY_DEF_SCAN(NAME, INPUT, OUTPUT)                                   \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
+                          const py::array_t<int64_t> &>(&NAME),                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("offsets").noconvert());  \
+                                                                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
+                          const ArrayD &>(&NAME),                              \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert());                           \
+                                                                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &>(&NAME),  \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert());
+
+// Registers the "moving_aggregate" c++ functions, with and without sampling,
+// and with and without variable window length. "evset_values" is a list of
+// arrays of the same type, and "ops" is the list of statistics to compute.
+#define ADD_PY_DEF_AGGREGATE(INPUT)                                            \
+  m.def("moving_aggregate",                                                    \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const py::array_t<int64_t> &, double,                \
+                          const std::vector<std::string> &>(                   \
+            &moving_aggregate),                                                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("offsets").noconvert(), py::arg("window_length"),              \
+        py::arg("ops"));                                                       \
+                                                                               \
+  m.def("moving_aggregate",                                                    \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, double,                              \
+                          const std::vector<std::string> &>(                   \
+            &moving_aggregate),                                                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"),  \
+        py::arg("ops"));                                                       \
+                                                                               \
+  m.def("moving_aggregate",                                                    \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &, double,     \
+                          const std::vector<std::string> &>(                   \
+            &moving_aggregate),                                                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),         \
+        py::arg("ops"));                                                       \
+                                                                               \
+  m.def("moving_aggregate",                                                    \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, const ArrayD &,                      \
+                          const std::vector<std::string> &>(                   \
+            &moving_aggregate),                                                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"),  \
+        py::arg("ops"));                                                       \
+                                                                               \
+  m.def("moving_aggregate",                                                    \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, const std::vector<std::string> &>(   \
+            &moving_aggregate),                                                \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),         \
+        py::arg("ops"));
+
+// Registers the "moving_quantile" c++ functions, with and without sampling,
+// and with and without variable window length. "evset_values" is a list of
+// arrays of the same type.
+#define ADD_PY_DEF_QUANTILE(INPUT, OUTPUT)                                     \
+  m.def("moving_quantile",                                                     \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const py::array_t<int64_t> &, double, double>(       \
+            &moving_quantile),                                                 \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("offsets").noconvert(), py::arg("window_length"),              \
+        py::arg("quantile"));                                                  \
+                                                                               \
+  m.def("moving_quantile",                                                     \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, double, double>(&moving_quantile),   \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"),  \
+        py::arg("quantile"));                                                  \
+                                                                               \
+  m.def("moving_quantile",                                                     \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &, double,     \
+                          double>(&moving_quantile),                           \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),         \
+        py::arg("quantile"));                                                  \
+                                                                               \
+  m.def("moving_quantile",                                                     \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, const ArrayD &, double>(             \
+            &moving_quantile),                                                 \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"),  \
+        py::arg("quantile"));                                                  \
+                                                                               \
+  m.def("moving_quantile",                                                     \
+        py::overload_cast<const ArrayD &,                                      \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const ArrayD &, double>(&moving_quantile),           \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),         \
+        py::arg("quantile"));
+
+// Registers the "moving_approx_quantile" c++ functions, with and without
+// sampling, and with and without variable window length. "evset_values" is a
+// list of arrays of the same type.
+#define ADD_PY_DEF_APPROX_QUANTILE(INPUT, OUTPUT)                             \
+  m.def("moving_approx_quantile",                                             \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const py::array_t<int64_t> &, double, double,       \
+                          double>(&moving_approx_quantile),                   \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("offsets").noconvert(),  \
+        py::arg("window_length"), py::arg("quantile"),                        \
+        py::arg("relative_accuracy"));                                        \
+                                                                              \
+  m.def("moving_approx_quantile",                                             \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, double, double,                     \
+                          double>(&moving_approx_quantile),                   \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("quantile"), py::arg("relative_accuracy"));                   \
+                                                                              \
+  m.def("moving_approx_quantile",                                             \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &, double,    \
+                          double, double>(&moving_approx_quantile),           \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("quantile"), py::arg("relative_accuracy"));                   \
+                                                                              \
+  m.def("moving_approx_quantile",                                             \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, const ArrayD &, double,             \
+                          double>(&moving_approx_quantile),                   \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("quantile"), py::arg("relative_accuracy"));                   \
+                                                                              \
+  m.def("moving_approx_quantile",                                             \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, double,                             \
+                          double>(&moving_approx_quantile),                   \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("quantile"), py::arg("relative_accuracy"));
+
+// Registers the "moving_approx_distinct_count" c++ functions, with and without
+// sampling, and with and without variable window length. "evset_values" is a
+// list of arrays of the same type.
+#define ADD_PY_DEF_APPROX_DISTINCT_COUNT(INPUT)                               \
+  m.def("moving_approx_distinct_count",                                       \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const py::array_t<int64_t> &, double,               \
+                          int>(&moving_approx_distinct_count),                \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("offsets").noconvert(),  \
+        py::arg("window_length"), py::arg("precision"));                      \
+                                                                              \
+  m.def("moving_approx_distinct_count",                                       \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, double,                             \
+                          int>(&moving_approx_distinct_count),                \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("precision"));                                                \
+                                                                              \
+  m.def("moving_approx_distinct_count",                                       \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &, double,    \
+                          int>(&moving_approx_distinct_count),                \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("precision"));                                                \
+                                                                              \
+  m.def("moving_approx_distinct_count",                                       \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, const ArrayD &,                     \
+                          int>(&moving_approx_distinct_count),                \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("precision"));                                                \
+                                                                              \
+  m.def("moving_approx_distinct_count",                                       \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &,                                     \
+                          int>(&moving_approx_distinct_count),                \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("precision"));
+
+// Registers the "moving_approx_heavy_hitters" c++ functions, with and without
+// sampling, and with and without variable window length. "evset_values" is a
+// list of arrays of the same type.
+#define ADD_PY_DEF_HEAVY_HITTERS(INPUT)                                       \
+  m.def("moving_approx_heavy_hitters",                                        \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const py::array_t<int64_t> &, double, int,          \
+                          double>(&moving_approx_heavy_hitters),              \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("offsets").noconvert(),  \
+        py::arg("window_length"), py::arg("k"), py::arg("epsilon"));          \
+                                                                              \
+  m.def("moving_approx_heavy_hitters",                                        \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, double, int,                        \
+                          double>(&moving_approx_heavy_hitters),              \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("k"), py::arg("epsilon"));                                    \
+                                                                              \
+  m.def("moving_approx_heavy_hitters",                                        \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &, double,    \
+                          int, double>(&moving_approx_heavy_hitters),         \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("k"), py::arg("epsilon"));                                    \
+                                                                              \
+  m.def("moving_approx_heavy_hitters",                                        \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, const ArrayD &, int,                \
+                          double>(&moving_approx_heavy_hitters),              \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(),                                  \
+        py::arg("sampling_timestamps").noconvert(), py::arg("window_length"), \
+        py::arg("k"), py::arg("epsilon"));                                    \
+                                                                              \
+  m.def("moving_approx_heavy_hitters",                                        \
+        py::overload_cast<const ArrayD &,                                     \
+                          const std::vector<py::array_t<INPUT>> &,            \
+                          const ArrayD &, int,                                \
+                          double>(&moving_approx_heavy_hitters),              \
+        "", py::arg("evset_timestamps").noconvert(),                          \
+        py::arg("evset_values").noconvert(), py::arg("window_length"),        \
+        py::arg("k"), py::arg("epsilon"));
+
 void init_window(py::module &m) {
   ADD_PY_DEF(simple_moving_average, float, float)
+  ADD_PY_DEF_MULTI(simple_moving_average, float, float)
+  ADD_PY_DEF_WINDOWS(simple_moving_average, float, float)
   ADD_PY_DEF(simple_moving_average, double, double)
+  ADD_PY_DEF_MULTI(simple_moving_average, double, double)
+  ADD_PY_DEF_WINDOWS(simple_moving_average, double, double)
 
   ADD_PY_DEF(moving_standard_deviation, float, float)
+  ADD_PY_DEF_MULTI(moving_standard_deviation, float, float)
+  ADD_PY_DEF_WINDOWS(moving_standard_deviation, float, float)
   ADD_PY_DEF(moving_standard_deviation, double, double)
+  ADD_PY_DEF_MULTI(moving_standard_deviation, double, double)
+  ADD_PY_DEF_WINDOWS(moving_standard_deviation, double, double)
 
   ADD_PY_DEF(moving_sum, float, float)
+  ADD_PY_DEF_MULTI(moving_sum, float, float)
+  ADD_PY_DEF_WINDOWS(moving_sum, float, float)
   ADD_PY_DEF(moving_sum, double, double)
+  ADD_PY_DEF_MULTI(moving_sum, double, double)
+  ADD_PY_DEF_WINDOWS(moving_sum, double, double)
   ADD_PY_DEF(moving_sum, int32_t, int32_t)
+  ADD_PY_DEF_MULTI(moving_sum, int32_t, int32_t)
+  ADD_PY_DEF_WINDOWS(moving_sum, int32_t, int32_t)
   ADD_PY_DEF(moving_sum, int64_t, int64_t)
+  ADD_PY_DEF_MULTI(moving_sum, int64_t, int64_t)
+  ADD_PY_DEF_WINDOWS(moving_sum, int64_t, int64_t)
 
   ADD_PY_DEF(moving_min, float, float)
+  ADD_PY_DEF_MULTI(moving_min, float, float)
+  ADD_PY_DEF_WINDOWS(moving_min, float, float)
   ADD_PY_DEF(moving_min, double, double)
+  ADD_PY_DEF_MULTI(moving_min, double, double)
+  ADD_PY_DEF_WINDOWS(moving_min, double, double)
   ADD_PY_DEF(moving_min, int32_t, int32_t)
+  ADD_PY_DEF_MULTI(moving_min, int32_t, int32_t)
+  ADD_PY_DEF_WINDOWS(moving_min, int32_t, int32_t)
   ADD_PY_DEF(moving_min, int64_t, int64_t)
+  ADD_PY_DEF_MULTI(moving_min, int64_t, int64_t)
+  ADD_PY_DEF_WINDOWS(moving_min, int64_t, int64_t)
 
   ADD_PY_DEF(moving_max, float, float)
+  ADD_PY_DEF_MULTI(moving_max, float, float)
+  ADD_PY_DEF_WINDOWS(moving_max, float, float)
   ADD_PY_DEF(moving_max, double, double)
+  ADD_PY_DEF_MULTI(moving_max, double, double)
+  ADD_PY_DEF_WINDOWS(moving_max, double, double)
   ADD_PY_DEF(moving_max, int32_t, int32_t)
+  ADD_PY_DEF_MULTI(moving_max, int32_t, int32_t)
+  ADD_PY_DEF_WINDOWS(moving_max, int32_t, int32_t)
   ADD_PY_DEF(moving_max, int64_t, int64_t)
+  ADD_PY_DEF_MULTI(moving_max, int64_t, int64_t)
+  ADD_PY_DEF_WINDOWS(moving_max, int64_t, int64_t)
 
   ADD_PY_DEF_NO_INPUT(moving_count, int32_t)
 
   ADD_PY_DEF(moving_product, float, float)
+  ADD_PY_DEF_MULTI(moving_product, float, float)
+  ADD_PY_DEF_WINDOWS(moving_product, float, float)
   ADD_PY_DEF(moving_product, double, double)
-
+  ADD_PY_DEF_MULTI(moving_product, double, double)
+  ADD_PY_DEF_WINDOWS(moving_product, double, double)
+
+  ADD_PY_DEF_SCAN(cumsum, float, float)
+  ADD_PY_DEF_SCAN(cumsum, double, double)
+  ADD_PY_DEF_SCAN(cumsum, int32_t, int32_t)
+  ADD_PY_DEF_SCAN(cumsum, int64_t, int64_t)
+
+  ADD_PY_DEF_SCAN(cumprod, float, float)
+  ADD_PY_DEF_SCAN(cumprod, double, double)
+
+  ADD_PY_DEF_AGGREGATE(float)
+  ADD_PY_DEF_AGGREGATE(double)
+  ADD_PY_DEF_AGGREGATE(int32_t)
+  ADD_PY_DEF_AGGREGATE(int64_t)
+
+  ADD_PY_DEF_QUANTILE(float, float)
+  ADD_PY_DEF_QUANTILE(double, double)
+  ADD_PY_DEF_QUANTILE(int32_t, double)
+  ADD_PY_DEF_QUANTILE(int64_t, double)
+
+  ADD_PY_DEF_APPROX_QUANTILE(float, float)
+  ADD_PY_DEF_APPROX_QUANTILE(double, double)
+  ADD_PY_DEF_APPROX_QUANTILE(int32_t, double)
+  ADD_PY_DEF_APPROX_QUANTILE(int64_t, double)
+
+  ADD_PY_DEF_APPROX_DISTINCT_COUNT(float)
+  ADD_PY_DEF_APPROX_DISTINCT_COUNT(double)
+  ADD_PY_DEF_APPROX_DISTINCT_COUNT(int32_t)
+  ADD_PY_DEF_APPROX_DISTINCT_COUNT(int64_t)
+
+  ADD_PY_DEF_HEAVY_HITTERS(float)
+  ADD_PY_DEF_HEAVY_HITTERS(double)
+  ADD_PY_DEF_HEAVY_HITTERS(int32_t)
+  ADD_PY_DEF_HEAVY_HITTERS(int64_t)
 }
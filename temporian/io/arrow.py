@@ -0,0 +1,296 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for converting EventSets to Apache Arrow tables and vice versa."""
+
+import logging
+from typing import Any, List, Optional
+
+import numpy as np
+
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.dtype_normalization import (
+    _DTYPE_REVERSE_MAPPING,
+)
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    EventSet,
+)
+from temporian.implementation.numpy.data.io import event_set
+
+
+def import_pa():
+    try:
+        import pyarrow as pa
+
+        return pa
+    except ImportError:
+        logging.warning(
+            "`tp.from_arrow()` and `tp.to_arrow()` require PyArrow to be"
+            " installed. Install PyArrow with pip using `pip install pyarrow`."
+        )
+        raise
+
+
+def from_arrow(
+    data: Any,
+    indexes: Optional[List[str]] = None,
+    timestamps: str = "timestamp",
+    name: Optional[str] = None,
+    same_sampling_as: Optional[EventSet] = None,
+) -> EventSet:
+    """Converts Apache Arrow data into an [`EventSet`][temporian.EventSet].
+
+    `data` can be a `pyarrow.Table`, a `pyarrow.RecordBatch`, a
+    `pyarrow.RecordBatchReader` (e.g. an Arrow IPC stream, or
+    `pyarrow.parquet.ParquetFile.iter_batches()`), or any iterable of
+    `pyarrow.RecordBatch`. A Polars DataFrame can be converted with
+    `df.to_arrow()`.
+
+    Numerical columns stored in a single chunk are used without copy (i.e.,
+    the EventSet shares the Arrow buffers) when the data is not indexed and
+    the timestamps are sorted. String and binary columns (including Arrow
+    dictionary arrays) are converted into dictionary encoded features. Missing
+    strings are replaced by the empty string.
+
+    See [`tp.event_set()`][temporian.event_set] for the list of supported
+    timestamp and feature types.
+
+    Usage example:
+        ```python
+        >>> import pyarrow as pa
+        >>> table = pa.table({
+        ...     "timestamp": [1.0, 2.0, 3.0],
+        ...     "product": ["a", "b", "a"],
+        ...     "price": [10.0, 12.0, 11.0],
+        ... })
+        >>> evset = tp.from_arrow(table, indexes=["product"])
+        >>> evset.schema
+        features: [('price', float64)]
+        indexes: [('product', str_)]
+        is_unix_timestamp: False
+        <BLANKLINE>
+
+        >>> # A stream of record batches
+        >>> evset = tp.from_arrow(table.to_batches(max_chunksize=2))
+
+        ```
+
+    Args:
+        data: Arrow table, record batch, or stream of record batches.
+        indexes: Names of the columns to use as indexes. If empty
+            (default), the data is not indexed. Only integer and string columns
+            can be used as indexes.
+        timestamps: Name of the column containing the timestamps. See
+            [`tp.event_set()`][temporian.event_set] for the list of supported
+            timestamp types.
+        name: Optional name of the EventSet. Used for debugging, and
+            graph serialization.
+        same_sampling_as: If set, the new EventSet is checked and tagged as
+            having the same sampling as `same_sampling_as`. Some operators,
+            such as [`EventSet.filter()`][temporian.EventSet.filter], require
+            their inputs to have the same sampling.
+
+    Returns:
+        An EventSet.
+    """
+
+    pa = import_pa()
+
+    if isinstance(data, pa.Table):
+        table = data
+    elif isinstance(data, pa.RecordBatch):
+        table = pa.Table.from_batches([data])
+    elif isinstance(data, pa.RecordBatchReader):
+        table = data.read_all()
+    else:
+        batches = list(data)
+        if not batches:
+            raise ValueError("The stream of record batches is empty.")
+        table = pa.Table.from_batches(batches)
+
+    if timestamps not in table.column_names:
+        raise ValueError(
+            f"Timestamp column {timestamps!r} not found in the Arrow data."
+            f" Available columns: {table.column_names}."
+        )
+
+    features = {
+        column_name: _column_to_numpy(pa, table.column(column_name))
+        for column_name in table.column_names
+        if column_name != timestamps
+    }
+    timestamps_array = dictionary_encoding.decode(
+        _column_to_numpy(pa, table.column(timestamps))
+    )
+
+    return event_set(
+        timestamps=timestamps_array,
+        features=features,
+        indexes=indexes,
+        name=name,
+        same_sampling_as=same_sampling_as,
+    )
+
+
+def to_arrow(
+    evset: EventSet,
+    tp_string_to_arrow_string: bool = True,
+    timestamp_to_datetime: bool = True,
+    timestamps: bool = True,
+) -> "pyarrow.Table":
+    """Converts an [`EventSet`][temporian.EventSet] to an Apache Arrow table.
+
+    The table contains the indexes, the features, and the timestamps (in the
+    "timestamp" column). Numerical features are converted without copy when
+    the EventSet is not indexed or is stored in the columnar layout (e.g.
+    EventSets created with `indexes`, or with
+    [`EventSet.add_index()`][temporian.EventSet.add_index]). String features
+    and indexes are converted into Arrow dictionary arrays.
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3],
+        ...     features={"price": [10.0, 12.0, 11.0], "product": ["a", "b", "a"]},
+        ...     indexes=["product"],
+        ... )
+        >>> table = tp.to_arrow(evset)
+        >>> table.column_names
+        ['product', 'price', 'timestamp']
+        >>> table.column("product").type
+        DictionaryType(dictionary<values=string, indices=int32, ordered=0>)
+
+        ```
+
+    Args:
+        evset: Input EventSet.
+        tp_string_to_arrow_string: If true, Temporian strings are converted to
+            Arrow strings (utf8). Otherwise, they are converted to Arrow binary.
+        timestamp_to_datetime: If true, cast Temporian timestamps to Arrow
+            timestamps (with nanosecond precision) when `is_unix_timestamp` is
+            set to True.
+        timestamps: If true, the timestamps are included as a column.
+
+    Returns:
+        An Arrow table created from the EventSet.
+    """
+
+    pa = import_pa()
+
+    schema = evset.schema
+    columnar = evset.columnar
+    if columnar is None:
+        columnar = ColumnarData.from_dict(evset.data, schema)
+    sampling = columnar.sampling
+    num_events_per_index_key = np.diff(sampling.offsets)
+
+    def dictionary_array(codes: np.ndarray, vocabulary: np.ndarray):
+        vocabulary = pa.array(vocabulary, type=pa.binary())
+        if tp_string_to_arrow_string:
+            vocabulary = vocabulary.cast(pa.string())
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, type=pa.int32()), vocabulary
+        )
+
+    columns = {}
+
+    for index_idx, index in enumerate(schema.indexes):
+        values = np.array(
+            [index_key[index_idx] for index_key in sampling.index_keys],
+            dtype=_DTYPE_REVERSE_MAPPING[index.dtype],
+        )
+        if index.dtype == DType.STRING:
+            codes = np.repeat(
+                np.arange(len(values), dtype=dictionary_encoding.CODE_DTYPE),
+                num_events_per_index_key,
+            )
+            columns[index.name] = dictionary_array(codes, values)
+        else:
+            columns[index.name] = pa.array(
+                np.repeat(values, num_events_per_index_key)
+            )
+
+    for feature, values in zip(schema.features, columnar.features):
+        if feature.dtype == DType.STRING:
+            encoded = dictionary_encoding.encode(values)
+            columns[feature.name] = dictionary_array(
+                encoded.codes, encoded.vocabulary
+            )
+        else:
+            columns[feature.name] = pa.array(values)
+
+    if timestamps:
+        if schema.is_unix_timestamp and timestamp_to_datetime:
+            columns["timestamp"] = pa.array(
+                np.round(sampling.timestamps * 1e9)
+                .astype(np.int64)
+                .view("datetime64[ns]")
+            )
+        else:
+            columns["timestamp"] = pa.array(sampling.timestamps)
+
+    return pa.table(columns)
+
+
+def _column_to_numpy(pa, column: "pyarrow.ChunkedArray") -> np.ndarray:
+    """Converts an Arrow column into a Temporian compatible numpy array."""
+
+    if column.num_chunks == 0:
+        return _array_to_numpy(pa, pa.array([], type=column.type))
+    # Each chunk is converted separately, as the chunks of dictionary arrays
+    # can have different dictionaries.
+    arrays = [_array_to_numpy(pa, chunk) for chunk in column.chunks]
+    if len(arrays) == 1:
+        return arrays[0]
+    return dictionary_encoding.concatenate(arrays)
+
+
+def _array_to_numpy(pa, array: "pyarrow.Array") -> np.ndarray:
+    """Converts an Arrow array into a Temporian compatible numpy array.
+
+    Arrays of numerical values without missing values are converted without
+    copy.
+    """
+
+    if pa.types.is_dictionary(array.type) and _is_string_or_binary(
+        pa, array.type.value_type
+    ):
+        vocabulary = np.array(
+            [
+                value.encode() if isinstance(value, str) else value
+                for value in array.dictionary.to_pylist()
+            ],
+            dtype=np.bytes_,
+        )
+        codes = array.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return dictionary_encoding.from_codes(codes, vocabulary)
+
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+
+    if _is_string_or_binary(pa, array.type):
+        return _array_to_numpy(pa, array.dictionary_encode())
+
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _is_string_or_binary(pa, arrow_type: "pyarrow.DataType") -> bool:
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+    )
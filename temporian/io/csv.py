@@ -14,8 +14,22 @@
 
 """Utilities for reading and saving EventSets from/to disk."""
 
-from typing import List, Optional
-from temporian.implementation.numpy.data.event_set import EventSet
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from temporian.core.data.schema import Schema
+from temporian.core.typing import NormalizedIndexKey
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.dtype_normalization import (
+    numpy_array_to_tp_dtype,
+)
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    ColumnarSampling,
+    EventSet,
+    split_by_index_keys,
+)
 from temporian.io.pandas import from_pandas, to_pandas
 from temporian.utils.typecheck import typecheck
 
@@ -26,9 +40,22 @@ def from_csv(
     timestamps: str = "timestamp",
     indexes: Optional[List[str]] = None,
     sep: str = ",",
+    chunk_size: Optional[int] = None,
 ) -> EventSet:
     """Reads an [`EventSet`][temporian.EventSet] from a CSV file.
 
+    If `chunk_size` is set, the file is parsed by blocks of `chunk_size`
+    rows. Each block is converted and appended to the events of its index
+    keys, and the events of each index key are sorted once all the blocks are
+    read. This divides the peak memory usage by several times for large files
+    (the memory usage is roughly the size of the final EventSet). String
+    columns are dictionary encoded. The types of the index columns are
+    inferred on the entire file (which is parsed one more time, on the index
+    columns only), while the types of the feature columns are inferred
+    independently for each block: Integer and floating point blocks are
+    merged into floating point features, and non-string blocks of string
+    columns are converted into strings.
+
     Example:
         ```python
         >>> # Example CSV
@@ -61,6 +88,7 @@ def from_csv(
         indexes: Names of the columns to be used as indexes for the EventSet.
             If None, a flat EventSet will be created.
         sep: Separator to use.
+        chunk_size: If set, number of rows parsed at once.
 
     Returns:
         EventSet read from file.
@@ -71,8 +99,47 @@ def from_csv(
     if indexes is None:
         indexes = []
 
-    df = pd.read_csv(path, sep=sep)
-    return from_pandas(df, indexes=indexes, timestamps=timestamps)
+    if chunk_size is None:
+        df = pd.read_csv(path, sep=sep)
+        return from_pandas(df, indexes=indexes, timestamps=timestamps)
+
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size should be positive. Got {chunk_size}.")
+
+    buffers = _IndexKeyBuffers()
+    empty_df = None
+    index_dtypes = _index_dtypes(path, sep, indexes, chunk_size)
+    with pd.read_csv(
+        path, sep=sep, chunksize=chunk_size, dtype=index_dtypes
+    ) as reader:
+        for df in reader:
+            if empty_df is None:
+                empty_df = df.iloc[:0]
+            if len(df) == 0:
+                continue
+            # String columns (with the "object" or "str" pandas dtypes) are
+            # dictionary encoded once per block, instead of once per index
+            # key. Like in `from_pandas`, missing values become "nan".
+            for column in df.columns:
+                if column != timestamps and (
+                    df[column].dtype == "object"
+                    or pd.api.types.is_string_dtype(df[column].dtype)
+                ):
+                    df[column] = pd.Categorical(
+                        df[column].to_numpy(dtype=object).astype(str)
+                    )
+            buffers.append(
+                from_pandas(df, indexes=indexes, timestamps=timestamps)
+            )
+            del df
+
+    if not buffers.blocks:
+        # The file does not contain any (valid) events.
+        if empty_df is None:
+            empty_df = pd.read_csv(path, sep=sep, nrows=0, dtype=index_dtypes)
+        return from_pandas(empty_df, indexes=indexes, timestamps=timestamps)
+
+    return buffers.to_event_set()
 
 
 @typecheck
@@ -82,9 +149,14 @@ def to_csv(
     sep: str = ",",
     na_rep: Optional[str] = None,
     columns: Optional[List[str]] = None,
+    batch_size: int = 1_000_000,
 ):
     """Saves an [`EventSet`][temporian.EventSet] to a CSV file.
 
+    The index keys are written by batches of about `batch_size` events (the
+    events of an index key are never split across batches). Only one batch is
+    converted into a pandas DataFrame at a time.
+
     Example:
         ```python
         >>> output_path = str(tmp_dir / "output_data.csv")
@@ -99,6 +171,236 @@ def to_csv(
         sep: Separator to use.
         na_rep: Representation to use for missing values.
         columns: Columns to save. If `None`, saves all columns.
+        batch_size: Approximate number of events converted at once.
+    """
+
+    if batch_size <= 0:
+        raise ValueError(f"batch_size should be positive. Got {batch_size}.")
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        is_first_batch = True
+        for batch in split_by_index_keys(evset, batch_size):
+            df = to_pandas(batch)
+            df.to_csv(
+                f,
+                index=False,
+                header=is_first_batch,
+                sep=sep,
+                na_rep=na_rep,
+                columns=columns,
+            )
+            is_first_batch = False
+
+        if is_first_batch:
+            # The EventSet does not contain any events. Only write the header.
+            df = to_pandas(evset)
+            df.to_csv(f, index=False, sep=sep, na_rep=na_rep, columns=columns)
+
+
+def _index_dtypes(
+    path: str, sep: str, indexes: List[str], chunk_size: int
+) -> Dict[str, Any]:
+    """Types of the index columns of a CSV file, parsed by blocks.
+
+    Returns the types pandas would infer when parsing the entire file, so all
+    the blocks have the same index types.
+    """
+
+    import pandas as pd
+
+    if not indexes:
+        return {}
+
+    block_dtypes: Dict[str, List[np.dtype]] = {index: [] for index in indexes}
+    with pd.read_csv(
+        path, sep=sep, chunksize=chunk_size, usecols=indexes
+    ) as reader:
+        for df in reader:
+            for index in indexes:
+                block_dtypes[index].append(df[index].dtype)
+
+    index_dtypes = {}
+    for index, dtypes in block_dtypes.items():
+        if not dtypes:
+            continue
+        is_bool = [pd.api.types.is_bool_dtype(dtype) for dtype in dtypes]
+        if any(
+            not pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes
+        ) or (any(is_bool) and not all(is_bool)):
+            # Note: Mixing booleans and numbers results in strings.
+            index_dtypes[index] = str
+        else:
+            index_dtypes[index] = np.result_type(*dtypes)
+    return index_dtypes
+
+
+class _IndexKeyBuffers:
+    """Events of each index key, accumulated by blocks.
+
+    Used by `from_csv` to create an EventSet from blocks of events.
     """
-    df = to_pandas(evset)
-    df.to_csv(path, index=False, sep=sep, na_rep=na_rep, columns=columns)
+
+    def __init__(self):
+        self.schema: Optional[Schema] = None
+        # Timestamps and features of each block, for each index key.
+        self.blocks: Dict[
+            NormalizedIndexKey, List[Tuple[np.ndarray, List[np.ndarray]]]
+        ] = {}
+
+    def append(self, evset: EventSet) -> None:
+        """Appends the events of an EventSet."""
+
+        if self.schema is None:
+            self.schema = evset.schema
+        elif evset.schema.feature_names() != self.schema.feature_names():
+            raise ValueError("All the blocks should have the same columns.")
+        elif evset.schema.indexes != self.schema.indexes:
+            raise ValueError(
+                "All the blocks should have the same indexes. Got"
+                f" {evset.schema.indexes} and {self.schema.indexes}."
+            )
+
+        for index_key, index_data in evset.data.items():
+            self.blocks.setdefault(index_key, []).append(
+                (index_data.timestamps, index_data.features)
+            )
+
+    def to_event_set(self) -> EventSet:
+        """Merges the blocks into a columnar EventSet.
+
+        The output arrays are allocated once and filled index key by index
+        key, while the blocks are released.
+        """
+
+        assert self.schema is not None
+        index_keys = list(self.blocks.keys())
+        offsets = np.zeros(len(index_keys) + 1, dtype=np.int64)
+        np.cumsum(
+            [
+                sum(len(timestamps) for timestamps, _ in self.blocks[key])
+                for key in index_keys
+            ],
+            out=offsets[1:],
+        )
+        num_events = int(offsets[-1])
+
+        timestamps = np.empty(num_events, dtype=np.float64)
+        features = []
+        vocabularies: List[Optional[np.ndarray]] = []
+        for feature_idx in range(len(self.schema.features)):
+            values, vocabulary = self._allocate_feature(feature_idx, num_events)
+            features.append(values)
+            vocabularies.append(vocabulary)
+
+        for key_idx, index_key in enumerate(index_keys):
+            blocks = self.blocks.pop(index_key)
+            begin, end = offsets[key_idx], offsets[key_idx + 1]
+
+            # The blocks are sorted by timestamps. A stable sort keeps the
+            # order of the file for equal timestamps.
+            key_timestamps = np.concatenate([b[0] for b in blocks])
+            order = np.argsort(key_timestamps, kind="stable")
+            timestamps[begin:end] = key_timestamps[order]
+            del key_timestamps
+
+            for feature_idx, vocabulary in enumerate(vocabularies):
+                block_values = [b[1][feature_idx] for b in blocks]
+                if vocabulary is not None:
+                    block_values = [
+                        _codes_in_vocabulary(values, vocabulary)
+                        for values in block_values
+                    ]
+                features[feature_idx][begin:end] = np.concatenate(block_values)[
+                    order
+                ]
+            del blocks
+
+        features = [
+            (
+                dictionary_encoding.DictionaryEncodedArray(values, vocabulary)
+                if vocabulary is not None
+                else values
+            )
+            for values, vocabulary in zip(features, vocabularies)
+        ]
+        schema = Schema(
+            features=[
+                (feature.name, numpy_array_to_tp_dtype(feature.name, values))
+                for feature, values in zip(self.schema.features, features)
+            ],
+            indexes=[
+                (index.name, index.dtype) for index in self.schema.indexes
+            ],
+            is_unix_timestamp=self.schema.is_unix_timestamp,
+        )
+        columnar = ColumnarData(
+            sampling=ColumnarSampling(
+                index_keys=index_keys, offsets=offsets, timestamps=timestamps
+            ),
+            features=features,
+        )
+        return EventSet.from_columnar(columnar, schema=schema)
+
+    def _allocate_feature(
+        self, feature_idx: int, num_events: int
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Allocates the values of a feature.
+
+        Returns:
+            The uninitialized values (codes if the feature is a string), and
+            the vocabulary of the feature, or None if the feature is not a
+            string.
+        """
+
+        block_values = [
+            block[1][feature_idx]
+            for blocks in self.blocks.values()
+            for block in blocks
+        ]
+        is_string = any(
+            dictionary_encoding.is_encoded(values)
+            or values.dtype.type == np.bytes_
+            for values in block_values
+        )
+        if not is_string:
+            dtype = np.result_type(*[values.dtype for values in block_values])
+            return np.empty(num_events, dtype=dtype), None
+
+        # Blocks of the same EventSet share the same vocabulary.
+        vocabularies = {
+            id(values.vocabulary): values.vocabulary
+            for values in block_values
+            if dictionary_encoding.is_encoded(values)
+        }
+        vocabulary = np.unique(
+            np.concatenate(
+                list(vocabularies.values())
+                + [
+                    np.unique(_to_bytes(values))
+                    for values in block_values
+                    if not dictionary_encoding.is_encoded(values)
+                ]
+            )
+        )
+        return (
+            np.empty(num_events, dtype=dictionary_encoding.CODE_DTYPE),
+            vocabulary,
+        )
+
+
+def _to_bytes(values: np.ndarray) -> np.ndarray:
+    """Converts non-dictionary encoded values of a string feature to bytes."""
+
+    if values.dtype.type == np.bytes_:
+        return values
+    return np.char.encode(values.astype(str), "UTF-8")
+
+
+def _codes_in_vocabulary(
+    values: np.ndarray, vocabulary: np.ndarray
+) -> np.ndarray:
+    """Codes of string values in a sorted vocabulary containing them."""
+
+    if dictionary_encoding.is_encoded(values):
+        return np.searchsorted(vocabulary, values.vocabulary)[values.codes]
+    return np.searchsorted(vocabulary, _to_bytes(values))
@@ -0,0 +1,280 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Native on-disk format of EventSets.
+
+An EventSet is saved as a directory containing:
+- "schema.pbtxt": The schema, in text protobuf format.
+- "layout.json": The number of events and index keys, and the file name and
+    numpy dtype of each column.
+- "timestamps.bin": The timestamps of all the index keys, one after the other.
+- "offsets.bin": Int64 offsets in the timestamps of each index key (see
+    `ColumnarSampling`).
+- "index_<i>.bin": The values of the i-th index column, one per index key.
+- "feature_<i>.bin": The values of the i-th feature, aligned with the
+    timestamps. Dictionary encoded features are saved as int32 codes, and
+    their vocabulary in "feature_<i>.vocabulary.bin".
+
+All the columns are raw little-endian arrays, so they can be memory-mapped.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from temporian.core.data.schema import Schema
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.dtype_normalization import (
+    _DTYPE_REVERSE_MAPPING,
+)
+from temporian.implementation.numpy.data.event_set import (
+    ColumnarData,
+    ColumnarSampling,
+    EventSet,
+)
+from temporian.utils.typecheck import typecheck
+
+# Version of the on-disk format. Increased on incompatible changes.
+_FORMAT_VERSION = 1
+
+_SCHEMA_FILENAME = "schema.pbtxt"
+_LAYOUT_FILENAME = "layout.json"
+_TIMESTAMPS_FILENAME = "timestamps.bin"
+_OFFSETS_FILENAME = "offsets.bin"
+
+
+@typecheck
+def save_event_set(evset: EventSet, path: str) -> None:
+    """Saves an [`EventSet`][temporian.EventSet] to a directory in the native
+    Temporian format.
+
+    Each feature, the timestamps, and the index keys are saved in separate
+    files as raw little-endian arrays. Unlike
+    [`tp.to_parquet()`][temporian.to_parquet] or
+    [`tp.to_csv()`][temporian.to_csv], the files do not need to be parsed
+    when loaded with [`tp.load_event_set()`][temporian.load_event_set].
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3],
+        ...     features={"f": [0.1, 0.2, 0.3], "k": ["a", "b", "a"]},
+        ...     indexes=["k"],
+        ... )
+        >>> tp.save_event_set(evset, str(tmp_dir / "evset"))
+        >>> loaded = tp.load_event_set(str(tmp_dir / "evset"))
+        >>> loaded.get_index_keys(sort=True)
+        [(b'a',), (b'b',)]
+
+        ```
+
+    Args:
+        evset: EventSet to save.
+        path: Directory to save the EventSet in. Created if it does not exist.
+            Existing files with the same names are overwritten.
+    """
+
+    columnar = evset.columnar
+    if columnar is None:
+        columnar = ColumnarData.from_dict(evset.data, evset.schema)
+    sampling = columnar.sampling
+
+    os.makedirs(path, exist_ok=True)
+
+    def write(filename: str, values: np.ndarray) -> Dict[str, Any]:
+        values = _to_little_endian(values)
+        values.tofile(os.path.join(path, filename))
+        return {"file": filename, "dtype": values.dtype.str}
+
+    write(_TIMESTAMPS_FILENAME, sampling.timestamps)
+    write(_OFFSETS_FILENAME, sampling.offsets.astype(np.int64, copy=False))
+
+    indexes = []
+    for index_idx, index in enumerate(evset.schema.indexes):
+        values = np.array(
+            [index_key[index_idx] for index_key in sampling.index_keys],
+            dtype=_DTYPE_REVERSE_MAPPING[index.dtype],
+        )
+        indexes.append(write(f"index_{index_idx}.bin", values))
+
+    features = []
+    for feature_idx, values in enumerate(columnar.features):
+        filename = f"feature_{feature_idx}"
+        if dictionary_encoding.is_encoded(values):
+            feature = write(f"{filename}.bin", values.codes)
+            feature["vocabulary"] = write(
+                f"{filename}.vocabulary.bin", values.vocabulary
+            )
+        else:
+            feature = write(f"{filename}.bin", values)
+        features.append(feature)
+
+    layout = {
+        "format_version": _FORMAT_VERSION,
+        "num_events": len(sampling.timestamps),
+        "num_index_keys": len(sampling),
+        "timestamps": _TIMESTAMPS_FILENAME,
+        "offsets": _OFFSETS_FILENAME,
+        "indexes": indexes,
+        "features": features,
+    }
+    evset.schema.to_proto_file(os.path.join(path, _SCHEMA_FILENAME))
+    with open(os.path.join(path, _LAYOUT_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(layout, f, indent=2)
+
+
+@typecheck
+def load_event_set(
+    path: str, mmap_mode: Optional[str] = "r", name: Optional[str] = None
+) -> EventSet:
+    """Loads an [`EventSet`][temporian.EventSet] saved with
+    [`tp.save_event_set()`][temporian.save_event_set].
+
+    By default, the files are memory-mapped: Loading is instantaneous whatever
+    the size of the EventSet, and the data is read from disk when accessed.
+    Only the index keys are read eagerly.
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(timestamps=[1, 2, 3], features={"f": [4, 5, 6]})
+        >>> tp.save_event_set(evset, str(tmp_dir / "evset"))
+        >>> loaded = tp.load_event_set(str(tmp_dir / "evset"))
+        >>> loaded.moving_sum(2)
+        indexes: []
+        features: [('f', int64)]
+        events:
+            (3 events):
+                timestamps: [1. 2. 3.]
+                'f': [ 4  9 11]
+        ...
+
+        ```
+
+    Args:
+        path: Directory containing the EventSet.
+        mmap_mode: Memory-map mode of the files, as in `np.memmap`: "r" for
+            read-only, "c" for copy-on-write, or "r+" to write changes back to
+            the files. If None, the files are read into memory.
+        name: Optional name of the loaded EventSet.
+
+    Returns:
+        The loaded EventSet.
+    """
+
+    if mmap_mode not in [None, "r", "c", "r+"]:
+        raise ValueError(
+            'mmap_mode should be None, "r", "c" or "r+". Got'
+            f" {mmap_mode!r} instead."
+        )
+
+    with open(os.path.join(path, _LAYOUT_FILENAME), "r", encoding="utf-8") as f:
+        layout = json.load(f)
+    if layout["format_version"] != _FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported format version {layout['format_version']} in"
+            f" {path!r}. This version of Temporian supports version"
+            f" {_FORMAT_VERSION}."
+        )
+    schema = Schema.from_proto_file(os.path.join(path, _SCHEMA_FILENAME))
+    if len(layout["features"]) != len(schema.features) or len(
+        layout["indexes"]
+    ) != len(schema.indexes):
+        raise ValueError(
+            f"The layout of {path!r} does not match its schema {schema}."
+        )
+
+    num_events = layout["num_events"]
+    num_index_keys = layout["num_index_keys"]
+
+    def read(column: Dict[str, Any], size: Optional[int] = None) -> np.ndarray:
+        return _read_array(
+            os.path.join(path, column["file"]),
+            dtype=np.dtype(column["dtype"]),
+            size=size,
+            mmap_mode=mmap_mode,
+        )
+
+    timestamps = read(
+        {"file": layout["timestamps"], "dtype": "<f8"}, num_events
+    )
+    offsets = read(
+        {"file": layout["offsets"], "dtype": "<i8"}, num_index_keys + 1
+    )
+
+    # Index keys are python tuples, and are therefore read in memory.
+    index_columns: List[List[Any]] = [
+        np.asarray(read(index, num_index_keys)).tolist()
+        for index in layout["indexes"]
+    ]
+    index_keys = list(zip(*index_columns))
+    if not index_columns:
+        # A non-indexed EventSet has a single (empty) index key.
+        index_keys = [()] * num_index_keys
+
+    features = []
+    for feature in layout["features"]:
+        values = read(feature, num_events)
+        if "vocabulary" in feature:
+            values = dictionary_encoding.DictionaryEncodedArray(
+                values, read(feature["vocabulary"])
+            )
+        features.append(values)
+
+    columnar = ColumnarData(
+        sampling=ColumnarSampling(
+            index_keys=index_keys, offsets=offsets, timestamps=timestamps
+        ),
+        features=features,
+    )
+    return EventSet.from_columnar(columnar, schema=schema, name=name)
+
+
+def _to_little_endian(values: np.ndarray) -> np.ndarray:
+    """Converts an array to a contiguous little-endian array."""
+
+    return np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+
+
+def _read_array(
+    path: str, dtype: np.dtype, size: Optional[int], mmap_mode: Optional[str]
+) -> np.ndarray:
+    """Reads or memory-maps a raw array.
+
+    Args:
+        path: Path to the file.
+        dtype: Numpy dtype of the values.
+        size: Expected number of values. If None, the number of values is
+            inferred from the size of the file.
+        mmap_mode: See `load_event_set`.
+    """
+
+    num_bytes = os.path.getsize(path)
+    if size is None:
+        size = num_bytes // dtype.itemsize
+    if size * dtype.itemsize != num_bytes:
+        raise ValueError(
+            f"File {path!r} contains {num_bytes} bytes while"
+            f" {size} values of type {dtype} are expected."
+        )
+    if size == 0 or mmap_mode is None:
+        # Empty files cannot be memory-mapped.
+        values = np.fromfile(path, dtype=dtype)
+    else:
+        values = np.memmap(path, dtype=dtype, mode=mmap_mode, shape=(size,))
+    # Non-native byte order (i.e. on big-endian hosts).
+    if not values.dtype.isnative:
+        values = values.astype(values.dtype.newbyteorder("="))
+    return values
@@ -18,6 +18,7 @@ import numpy as np
 from numpy import ndarray
 
 from typing import Dict
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.event_set import EventSet
 
 
@@ -90,5 +91,8 @@ def to_numpy(
         for index_name, index_item in zip(index_names, index):
             dst[index_name].append(np.repeat(index_item, num_timestamps))
 
-    dst = {k: np.concatenate(v) for k, v in dst.items()}
+    dst = {
+        k: dictionary_encoding.decode(dictionary_encoding.concatenate(v))
+        for k, v in dst.items()
+    }
     return dst
@@ -17,6 +17,7 @@
 import numpy as np
 
 from typing import List, Optional
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.implementation.numpy.data.io import event_set
 from temporian.core.data.dtype import DType
@@ -29,6 +30,7 @@ def from_pandas(
     timestamps: str = "timestamp",
     name: Optional[str] = None,
     same_sampling_as: Optional[EventSet] = None,
+    presorted: bool = False,
 ) -> EventSet:
     """Converts a Pandas DataFrame into an [`EventSet`][temporian.EventSet].
 
@@ -67,6 +69,11 @@ def from_pandas(
             having the same sampling as `same_sampling_as`. Some operators,
             such as [`EventSet.filter()`][temporian.EventSet.filter], require
             their inputs to have the same sampling.
+        presorted: If true, the rows are expected to be grouped by index key
+            and sorted by timestamp within each index key (e.g. after
+            `df.sort_values([*indexes, timestamps])`). Such data is indexed
+            without hashing, and without copying the columns. See
+            [`tp.event_set()`][temporian.event_set].
 
     Returns:
         An EventSet.
@@ -77,14 +84,22 @@ def from_pandas(
         ValueError: If a column has an unsupported dtype.
     """
 
-    feature_dict = df.drop(columns=timestamps).to_dict("series")
+    # Note: Unlike "df.drop", the columns are not copied.
+    feature_dict = {
+        column: df[column] for column in df.columns if column != timestamps
+    }
 
     return event_set(
         timestamps=df[timestamps].to_numpy(),
-        features={k: v.to_numpy() for k, v in feature_dict.items()},
+        # Categorical columns are kept as is to be dictionary encoded.
+        features={
+            k: v.array if str(v.dtype) == "category" else v.to_numpy()
+            for k, v in feature_dict.items()
+        },
         indexes=indexes,
         name=name,
         same_sampling_as=same_sampling_as,
+        presorted=presorted,
     )
 
 
@@ -172,11 +187,20 @@ def to_pandas(
         for index_name, index_item in zip(index_names, index):
             dst[index_name].append(np.repeat(index_item, num_timestamps))
 
-    dst = {k: np.concatenate(v) for k, v in dst.items()}
+    dst = {k: dictionary_encoding.concatenate(v) for k, v in dst.items()}
+
+    # Dictionary encoded features are converted into pandas Categoricals.
+    for feature in evset.schema.features:
+        if dictionary_encoding.is_encoded(dst[feature.name]):
+            dst[feature.name] = dictionary_encoding.to_pandas_categorical(
+                dst[feature.name], to_str=tp_string_to_pd_string
+            )
 
     if tp_string_to_pd_string:
         for feature in evset.schema.features:
-            if feature.dtype == DType.STRING:
+            if feature.dtype == DType.STRING and isinstance(
+                dst[feature.name], np.ndarray
+            ):
                 dst[feature.name] = dst[feature.name].astype(str)
         for index in evset.schema.indexes:
             if index.dtype == DType.STRING:
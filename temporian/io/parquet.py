@@ -14,22 +14,69 @@
 
 """Utilities for reading and saving EventSets from/to disk."""
 
-from typing import List, Optional
+import json
+import math
+import os
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple
 
-from temporian.implementation.numpy.data.event_set import EventSet
-from temporian.io.pandas import from_pandas, to_pandas
+import numpy as np
+
+from temporian.core.typing import IndexKeyList
+from temporian.implementation.numpy.data.dtype_normalization import (
+    normalize_index_key_list,
+    normalize_timestamps,
+)
+from temporian.implementation.numpy.data.event_set import (
+    EventSet,
+    split_by_index_keys,
+)
+from temporian.io.arrow import from_arrow, import_pa, to_arrow
 from temporian.utils.typecheck import typecheck
 
+# Number of units of Arrow timestamps in a second.
+_ARROW_TIMESTAMP_UNITS_PER_SECOND = {"s": 1, "ms": 1e3, "us": 1e6, "ns": 1e9}
+
+# Files of the datasets saved with `to_parquet_dataset`.
+_PARTITION_FILENAME = "part-0.parquet"
+_COMMON_METADATA_FILENAME = "_common_metadata"
+
+# Arguments of `pyarrow.dataset.dataset` accepted by `from_parquet`.
+_DATASET_KWARGS = {
+    "schema",
+    "filesystem",
+    "partitioning",
+    "partition_base_dir",
+    "exclude_invalid_files",
+    "ignore_prefixes",
+}
+
+# Keys of the arrow schema metadata of the datasets.
+_INDEXES_METADATA_KEY = "temporian.indexes"
+_PARTITION_BY_METADATA_KEY = "temporian.partition_by"
+
 
 @typecheck
 def from_parquet(
     path: str,
     timestamps: str = "timestamp",
     indexes: Optional[List[str]] = None,
+    features: Optional[List[str]] = None,
+    time_range: Optional[Tuple[Any, Any]] = None,
+    index_values: Optional[IndexKeyList] = None,
     **kwargs,
 ) -> EventSet:
     """Reads an [`EventSet`][temporian.EventSet] from a parquet file.
 
+    The file is read with PyArrow, and the EventSet is created directly from
+    the Arrow record batches (see [`tp.from_arrow()`][temporian.from_arrow]).
+    Only the timestamps, indexes and `features` columns are read.
+
+    If `time_range` or `index_values` are set, only the matching events are
+    read. Row groups whose statistics (min and max values of the timestamps
+    and indexes) show that they contain no matching events are skipped
+    without being read.
+
     Example:
         ```python
         >>> temp_file = str(tmp_dir / "temporal_data.parquet")
@@ -47,29 +94,272 @@ def from_parquet(
 
         ```
 
+    Example reading a subset of the data:
+        ```python
+        >>> temp_file = str(tmp_dir / "sales.parquet")
+        >>> sales = tp.event_set(
+        ...     timestamps=[1, 2, 3, 4, 5],
+        ...     features={
+        ...         "store": ["A", "B", "A", "B", "A"],
+        ...         "price": [10.0, 11.0, 12.0, 13.0, 14.0],
+        ...         "quantity": [1, 2, 3, 4, 5],
+        ...     },
+        ... )
+        >>> tp.to_parquet(sales, temp_file)
+        >>> evset = tp.from_parquet(
+        ...     temp_file,
+        ...     indexes=["store"],
+        ...     features=["price"],
+        ...     time_range=(2, 5),
+        ...     index_values=["A"],
+        ... )
+        >>> evset
+        indexes: [('store', str_)]
+        features: [('price', float64)]
+        events:
+            store=b'A' (1 events):
+                timestamps: [3.]
+                'price': [12.]
+        ...
+
+        ```
+
     Args:
         path: Path to the file.
         timestamps: Name of the column to be used as timestamps for the
             EventSet.
         indexes: Names of the columns to be used as indexes for the EventSet.
             If None, a flat EventSet will be created.
+        features: Names of the columns to be used as features. If None, all
+            the columns other than the timestamps and indexes are used.
+        time_range: If set, `(begin, end)` range of timestamps to read.
+            `begin` is included and `end` is excluded. Bounds can be numbers,
+            dates or datetimes (e.g. `datetime.datetime`, `np.datetime64` or
+            strings), and can be None for unbounded ranges.
+        index_values: If set, only reads the events of these index keys (see
+            [`EventSet.select_index_values()`][temporian.EventSet.select_index_values]).
+        **kwargs: Arguments passed to `pyarrow.dataset.dataset` (e.g.
+            `filesystem`).
 
     Returns:
         EventSet read from file.
+
+    Raises:
+        ValueError: If `kwargs` contains arguments not supported by
+            `pyarrow.dataset.dataset`.
     """
 
-    import pandas as pd
+    pa = import_pa()
+    import pyarrow.dataset as ds
 
     if indexes is None:
         indexes = []
 
-    df = pd.read_parquet(path, **kwargs)
-    return from_pandas(df, indexes=indexes, timestamps=timestamps)
+    unsupported_kwargs = sorted(set(kwargs) - _DATASET_KWARGS)
+    if unsupported_kwargs:
+        raise ValueError(
+            f"Unsupported arguments {unsupported_kwargs}. The file is read"
+            " with `pyarrow.dataset.dataset` (not `pandas.read_parquet`),"
+            f" which supports the arguments {sorted(_DATASET_KWARGS)}. Use"
+            " `features`, `time_range` and `index_values` to select the"
+            " columns and events to read."
+        )
+
+    dataset = ds.dataset(path, format="parquet", **kwargs)
+    return _read_dataset(
+        pa,
+        ds,
+        dataset,
+        path,
+        timestamps,
+        indexes,
+        features,
+        time_range,
+        index_values,
+    )
+
+
+def _read_dataset(
+    pa,
+    ds,
+    dataset: Any,
+    path: str,
+    timestamps: str,
+    indexes: List[str],
+    features: Optional[List[str]],
+    time_range: Optional[Tuple[Any, Any]],
+    index_values: Optional[IndexKeyList],
+) -> EventSet:
+    """Reads the selected columns and events of a `pyarrow.dataset.Dataset`."""
+
+    arrow_schema = dataset.schema
+
+    if features is None:
+        # The index of a pandas DataFrame saved with `DataFrame.to_parquet` is
+        # not a feature.
+        pandas_metadata = arrow_schema.pandas_metadata or {}
+        pandas_index_columns = [
+            column
+            for column in pandas_metadata.get("index_columns", [])
+            if isinstance(column, str)
+        ]
+        features = [
+            column
+            for column in arrow_schema.names
+            if column != timestamps
+            and column not in indexes
+            and column not in pandas_index_columns
+        ]
+    columns = [timestamps] + indexes + features
+    for column in columns:
+        if column not in arrow_schema.names:
+            raise ValueError(
+                f"Column {column!r} not found in {path!r}. Available columns:"
+                f" {arrow_schema.names}."
+            )
+
+    conditions = []
+    if time_range is not None:
+        conditions.extend(
+            _time_range_conditions(
+                pa, ds, timestamps, arrow_schema.field(timestamps), time_range
+            )
+        )
+    if index_values is not None:
+        conditions.extend(
+            _index_values_conditions(
+                pa,
+                ds,
+                [arrow_schema.field(index) for index in indexes],
+                normalize_index_key_list(index_values),
+            )
+        )
+
+    filter_expression = None
+    for condition in conditions:
+        if filter_expression is None:
+            filter_expression = condition
+        else:
+            filter_expression = filter_expression & condition
+
+    scanner = dataset.scanner(columns=columns, filter=filter_expression)
+    return from_arrow(
+        scanner.to_reader(), indexes=indexes, timestamps=timestamps
+    )
+
+
+def _time_range_conditions(
+    pa, ds, timestamps: str, field: Any, time_range: Tuple[Any, Any]
+) -> List[Any]:
+    """Filter conditions on the timestamp column for `time_range`."""
+
+    if len(time_range) != 2:
+        raise ValueError(
+            "time_range should be a (begin, end) tuple. Got"
+            f" {time_range!r} instead."
+        )
+
+    arrow_type = field.type
+    if pa.types.is_timestamp(arrow_type):
+        units_per_second = _ARROW_TIMESTAMP_UNITS_PER_SECOND[arrow_type.unit]
+    elif pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+        units_per_second = 1
+    else:
+        raise ValueError(
+            f"time_range is not supported for timestamp column {timestamps!r}"
+            f" of type {arrow_type}."
+        )
+
+    def bound(value: Any) -> Any:
+        seconds, _ = normalize_timestamps(np.array([value]))
+        value = seconds[0] * units_per_second
+        if not pa.types.is_floating(arrow_type):
+            # "t >= v" and "t < v" are equivalent to "t >= ceil(v)" and
+            # "t < ceil(v)" for integer "t".
+            value = math.ceil(value)
+        return pa.scalar(value, type=arrow_type)
+
+    begin, end = time_range
+    conditions = []
+    if begin is not None:
+        conditions.append(ds.field(timestamps) >= bound(begin))
+    if end is not None:
+        conditions.append(ds.field(timestamps) < bound(end))
+    return conditions
+
+
+def _index_values_conditions(
+    pa, ds, fields: List[Any], index_keys: List[Tuple]
+) -> List[Any]:
+    """Filter conditions on the index columns for `index_values`."""
+
+    for index_key in index_keys:
+        if len(index_key) != len(fields):
+            raise ValueError(
+                f"Index key {index_key!r} does not match the indexes"
+                f" {[field.name for field in fields]}."
+            )
+    if not fields:
+        return []
+    if not index_keys:
+        return [ds.scalar(False)]
+
+    def arrow_value(value: Any, field: Any) -> Any:
+        arrow_type = field.type
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if isinstance(value, bytes) and (
+            pa.types.is_string(arrow_type)
+            or pa.types.is_large_string(arrow_type)
+        ):
+            value = value.decode()
+        return pa.scalar(value, type=arrow_type)
+
+    # The values of each index column. Used to skip row groups.
+    conditions = [
+        ds.field(field.name).isin(
+            pa.array(
+                [arrow_value(index_key[idx], field) for index_key in index_keys]
+            )
+        )
+        for idx, field in enumerate(fields)
+    ]
+
+    if len(fields) > 1:
+        # Exact combinations of index values.
+        exact_condition = None
+        for index_key in index_keys:
+            key_condition = None
+            for value, field in zip(index_key, fields):
+                value_condition = ds.field(field.name) == arrow_value(
+                    value, field
+                )
+                if key_condition is None:
+                    key_condition = value_condition
+                else:
+                    key_condition = key_condition & value_condition
+            if exact_condition is None:
+                exact_condition = key_condition
+            else:
+                exact_condition = exact_condition | key_condition
+        if exact_condition is not None:
+            conditions.append(exact_condition)
+
+    return conditions
 
 
 @typecheck
-def to_parquet(evset: EventSet, path: str, **kwargs):
-    """Saves an [`EventSet`][temporian.EventSet] to a CSV file.
+def to_parquet(
+    evset: EventSet, path: str, batch_size: int = 1_000_000, **kwargs
+):
+    """Saves an [`EventSet`][temporian.EventSet] to a parquet file.
+
+    The EventSet is written with a PyArrow `ParquetWriter`, without pandas
+    intermediate. The index keys are written in sorted order, by batches of
+    about `batch_size` events (the events of an index key are never split
+    across batches). Each batch is converted into an Arrow table (see
+    [`tp.to_arrow()`][temporian.to_arrow]) and written as a row group. String
+    features and indexes are written as dictionary encoded columns.
 
     Example:
         ```python
@@ -82,8 +372,369 @@ def to_parquet(evset: EventSet, path: str, **kwargs):
     Args:
         evset: EventSet to save.
         path: Path to the file.
+        batch_size: Approximate number of events per row group.
+        **kwargs: Arguments passed to `pyarrow.parquet.ParquetWriter` (e.g.
+            `compression`).
+    """
+
+    import_pa()
+
+    if batch_size <= 0:
+        raise ValueError(f"batch_size should be positive. Got {batch_size}.")
+
+    _write_parquet_file(evset, path, batch_size, [], **kwargs)
+
+
+def _write_parquet_file(
+    evset: EventSet,
+    path: str,
+    batch_size: int,
+    excluded_columns: List[str],
+    **kwargs,
+) -> None:
+    """Writes an EventSet to a parquet file, one row group per batch of index
+    keys.
+
+    Args:
+        evset: EventSet to save.
+        path: Path to the file.
+        batch_size: Approximate number of events per row group.
+        excluded_columns: Columns not written in the file.
+        **kwargs: Arguments passed to `pyarrow.parquet.ParquetWriter`.
+    """
+
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for batch in split_by_index_keys(evset, batch_size, sort=True):
+            table = to_arrow(batch).drop_columns(excluded_columns)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, **kwargs)
+            if table.num_rows > 0:
+                writer.write_table(table, row_group_size=table.num_rows)
+
+        if writer is None:
+            # The EventSet does not contain any events.
+            table = to_arrow(evset).drop_columns(excluded_columns)
+            writer = pq.ParquetWriter(path, table.schema, **kwargs)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+@typecheck
+def to_parquet_dataset(
+    evset: EventSet,
+    path: str,
+    partition_by: Optional[List[str]] = None,
+    batch_size: int = 1_000_000,
+    **kwargs,
+) -> None:
+    """Saves an [`EventSet`][temporian.EventSet] to a Hive partitioned parquet
+    dataset.
+
+    The events are split by the values of the `partition_by` indexes, and the
+    events of each partition are saved in a separate directory named after
+    the index values, e.g. "<path>/region=EU/store=12/part-0.parquet". The
+    partition indexes are encoded in the directory names, and not stored in
+    the parquet files.
+
+    The dataset can be read with
+    [`tp.from_parquet_dataset()`][temporian.from_parquet_dataset], which only
+    opens the partitions matching its `index_values` argument. The dataset
+    can also be read by other tools supporting Hive partitioning (e.g.
+    `pyarrow.dataset`, Spark or DuckDB).
+
+    Usage example:
+        ```python
+        >>> path = str(tmp_dir / "sales")
+        >>> sales = tp.event_set(
+        ...     timestamps=[1, 2, 3, 4],
+        ...     features={
+        ...         "region": ["EU", "EU", "US", "US"],
+        ...         "store": [1, 2, 1, 1],
+        ...         "price": [10.0, 11.0, 12.0, 13.0],
+        ...     },
+        ...     indexes=["region", "store"],
+        ... )
+        >>> tp.to_parquet_dataset(sales, path, partition_by=["region"])
+        >>> sorted(p.name for p in (tmp_dir / "sales").iterdir())
+        ['_common_metadata', 'region=EU', 'region=US']
+
+        ```
+
+    Args:
+        evset: EventSet to save.
+        path: Directory to save the dataset in. Created if it does not exist.
+            Existing partitions with the same index values are overwritten.
+        partition_by: Names of the indexes used to partition the data, in the
+            order of the directory levels. If None, all the indexes are used.
+        batch_size: Approximate number of events per row group.
+        **kwargs: Arguments passed to `pyarrow.parquet.ParquetWriter` (e.g.
+            `compression`).
     """
-    # TODO: include indexes in the file's metadata
-    # so that they can be recovered automatically
-    df = to_pandas(evset)
-    df.to_parquet(path, **kwargs)
+
+    import_pa()
+    import pyarrow.parquet as pq
+
+    index_names = evset.schema.index_names()
+    if partition_by is None:
+        partition_by = index_names
+    for name in partition_by:
+        if name not in index_names:
+            raise ValueError(
+                f"Cannot partition by {name!r} as it is not an index of the"
+                f" EventSet. Indexes: {index_names}."
+            )
+    if len(set(partition_by)) != len(partition_by):
+        raise ValueError(f"partition_by contains duplicates: {partition_by}.")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size should be positive. Got {batch_size}.")
+
+    partition_idxs = [index_names.index(name) for name in partition_by]
+
+    # Index keys of each partition.
+    partitions: Dict[Tuple, List[Tuple]] = {}
+    for index_key in evset.get_index_keys(sort=True):
+        partition = tuple(index_key[idx] for idx in partition_idxs)
+        partitions.setdefault(partition, []).append(index_key)
+
+    os.makedirs(path, exist_ok=True)
+    data = evset.data
+    for partition, index_keys in partitions.items():
+        directory = os.path.join(
+            path, _partition_directory(partition_by, partition)
+        )
+        os.makedirs(directory, exist_ok=True)
+        _write_parquet_file(
+            EventSet(
+                data={index_key: data[index_key] for index_key in index_keys},
+                schema=evset.schema,
+            ),
+            os.path.join(directory, _PARTITION_FILENAME),
+            batch_size,
+            partition_by,
+            **kwargs,
+        )
+
+    # The schema of the complete dataset, including the partition columns.
+    arrow_schema = to_arrow(
+        EventSet(data={}, schema=evset.schema)
+    ).schema.with_metadata(
+        {
+            _INDEXES_METADATA_KEY: json.dumps(index_names),
+            _PARTITION_BY_METADATA_KEY: json.dumps(partition_by),
+        }
+    )
+    pq.write_metadata(
+        arrow_schema, os.path.join(path, _COMMON_METADATA_FILENAME)
+    )
+
+
+@typecheck
+def from_parquet_dataset(
+    path: str,
+    timestamps: str = "timestamp",
+    indexes: Optional[List[str]] = None,
+    features: Optional[List[str]] = None,
+    time_range: Optional[Tuple[Any, Any]] = None,
+    index_values: Optional[IndexKeyList] = None,
+    **kwargs,
+) -> EventSet:
+    """Reads an [`EventSet`][temporian.EventSet] from a Hive partitioned
+    parquet dataset saved with
+    [`tp.to_parquet_dataset()`][temporian.to_parquet_dataset].
+
+    If `index_values` is set, only the directories of the partitions
+    matching `index_values` are listed and read. The cost of reading a subset
+    of the index keys is therefore proportional to the size of the subset,
+    not to the size of the dataset. The other arguments are applied as in
+    [`tp.from_parquet()`][temporian.from_parquet].
+
+    Usage example:
+        ```python
+        >>> path = str(tmp_dir / "sales_dataset")
+        >>> sales = tp.event_set(
+        ...     timestamps=[1, 2, 3, 4],
+        ...     features={
+        ...         "region": ["EU", "EU", "US", "US"],
+        ...         "store": [1, 2, 1, 1],
+        ...         "price": [10.0, 11.0, 12.0, 13.0],
+        ...     },
+        ...     indexes=["region", "store"],
+        ... )
+        >>> tp.to_parquet_dataset(sales, path, partition_by=["region"])
+        >>> tp.from_parquet_dataset(
+        ...     path, indexes=["region"], index_values=["US"]
+        ... )
+        indexes: [('region', str_)]
+        features: [('store', int64), ('price', float64)]
+        events:
+            region=b'US' (2 events):
+                timestamps: [3. 4.]
+                'store': [1 1]
+                'price': [12. 13.]
+        ...
+
+        ```
+
+    Args:
+        path: Directory of the dataset.
+        timestamps: Name of the column to be used as timestamps for the
+            EventSet.
+        indexes: Names of the columns to be used as indexes for the EventSet.
+            If None, the indexes of the saved EventSet are used.
+        features: Names of the columns to be used as features. If None, all
+            the columns other than the timestamps and indexes are used.
+        time_range: If set, `(begin, end)` range of timestamps to read. See
+            [`tp.from_parquet()`][temporian.from_parquet].
+        index_values: If set, only reads the events of these index keys (see
+            [`EventSet.select_index_values()`][temporian.EventSet.select_index_values]).
+        **kwargs: Arguments passed to `pyarrow.dataset.dataset`.
+
+    Returns:
+        EventSet read from the dataset.
+    """
+
+    pa = import_pa()
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    arrow_schema = pq.read_schema(os.path.join(path, _COMMON_METADATA_FILENAME))
+    metadata = arrow_schema.metadata or {}
+    if _PARTITION_BY_METADATA_KEY.encode() not in metadata:
+        raise ValueError(
+            f"{path!r} is not a dataset saved with tp.to_parquet_dataset()."
+        )
+    partition_by = json.loads(metadata[_PARTITION_BY_METADATA_KEY.encode()])
+    if indexes is None:
+        indexes = json.loads(metadata[_INDEXES_METADATA_KEY.encode()])
+
+    # Partition values are parsed from the directory names, and are therefore
+    # not dictionary encoded.
+    partition_fields = []
+    for name in partition_by:
+        field = arrow_schema.field(name)
+        if pa.types.is_dictionary(field.type):
+            field = field.with_type(field.type.value_type)
+        partition_fields.append(field)
+        arrow_schema = arrow_schema.set(
+            arrow_schema.get_field_index(name), field
+        )
+    partitioning = ds.partitioning(pa.schema(partition_fields), flavor="hive")
+
+    if index_values is None:
+        directories = [path]
+    else:
+        directories = _matching_partition_directories(
+            path,
+            partition_by,
+            indexes,
+            normalize_index_key_list(index_values),
+        )
+    files = _list_parquet_files(directories)
+
+    dataset = ds.dataset(
+        files,
+        schema=arrow_schema,
+        format="parquet",
+        partitioning=partitioning,
+        partition_base_dir=path,
+        **kwargs,
+    )
+    return _read_dataset(
+        pa,
+        ds,
+        dataset,
+        path,
+        timestamps,
+        indexes,
+        features,
+        time_range,
+        index_values,
+    )
+
+
+def _partition_directory(partition_by: List[str], partition: Tuple) -> str:
+    """Relative directory of a partition, e.g. "region=EU/store=12"."""
+
+    return os.path.join(
+        *[
+            f"{name}={_partition_value(value)}"
+            for name, value in zip(partition_by, partition)
+        ]
+    )
+
+
+def _partition_value(value: Any) -> str:
+    """Hive directory name of an index value."""
+
+    if isinstance(value, bytes):
+        value = value.decode()
+    # Escapes "/", "=" and "%". Decoded by pyarrow's Hive partitioning.
+    return urllib.parse.quote(str(value), safe="")
+
+
+def _matching_partition_directories(
+    path: str,
+    partition_by: List[str],
+    indexes: List[str],
+    index_keys: List[Tuple],
+) -> List[str]:
+    """Directories containing the events of `index_keys`.
+
+    The directories are built from the values of the leading partition
+    indexes that are read as indexes, without listing the other partitions.
+    """
+
+    for index_key in index_keys:
+        if len(index_key) != len(indexes):
+            raise ValueError(
+                f"Index key {index_key!r} does not match the indexes {indexes}."
+            )
+
+    num_levels = 0
+    while (
+        num_levels < len(partition_by) and partition_by[num_levels] in indexes
+    ):
+        num_levels += 1
+    level_idxs = [indexes.index(name) for name in partition_by[:num_levels]]
+
+    directories = []
+    for partition in dict.fromkeys(
+        tuple(index_key[idx] for idx in level_idxs) for index_key in index_keys
+    ):
+        if partition:
+            directories.append(
+                os.path.join(
+                    path,
+                    _partition_directory(partition_by[:num_levels], partition),
+                )
+            )
+        else:
+            directories.append(path)
+    return directories
+
+
+def _list_parquet_files(directories: List[str]) -> List[str]:
+    """Lists the data files in directories, ignoring missing directories."""
+
+    import pyarrow.fs
+
+    filesystem = pyarrow.fs.LocalFileSystem()
+    files = []
+    for directory in directories:
+        infos = filesystem.get_file_info(
+            pyarrow.fs.FileSelector(
+                directory, recursive=True, allow_not_found=True
+            )
+        )
+        files.extend(
+            info.path
+            for info in infos
+            if info.type == pyarrow.fs.FileType.File
+            and not info.base_name.startswith(("_", "."))
+        )
+    return sorted(files)
@@ -18,6 +18,7 @@ from typing import List, Optional
 
 import logging
 
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.event_set import EventSet
 from temporian.implementation.numpy.data.io import event_set
 from temporian.core.data.dtype import DType
@@ -197,7 +198,7 @@ def to_polars(
 
         # Features
         for feature_name, feature in zip(feature_names, data.features):
-            data_dict[feature_name].extend(feature)
+            data_dict[feature_name].extend(dictionary_encoding.decode(feature))
 
         # Indexes
         num_timestamps = len(data.timestamps)
@@ -22,6 +22,7 @@ import numpy as np
 
 from temporian.core.data.dtype import DType, tp_dtype_to_py_type
 from temporian.core.operators.drop_index import drop_index
+from temporian.implementation.numpy.data import dictionary_encoding
 from temporian.implementation.numpy.data.dtype_normalization import (
     tp_dtype_to_np_dtype,
 )
@@ -95,7 +96,9 @@ def to_tensorflow_dataset(
     dict_data = {timestamps: data.timestamps}
 
     for feature_idx, feature in enumerate(evset.schema.features):
-        dict_data[feature.name] = data.features[feature_idx]
+        dict_data[feature.name] = dictionary_encoding.decode(
+            data.features[feature_idx]
+        )
 
     return tf.data.Dataset.from_tensor_slices(dict_data)
 
@@ -164,7 +167,9 @@ def to_tensorflow_record(
                 elif feature_schema.dtype == DType.STRING:
                     f(ex, feature_schema.name).bytes_list.value[
                         :
-                    ] = index_value.features[feature_idx]
+                    ] = dictionary_encoding.decode(
+                        index_value.features[feature_idx]
+                    )
                 else:
                     raise ValueError("Non supported feature dtype")
 
@@ -0,0 +1,187 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+from absl.testing import absltest
+from absl.testing import parameterized
+
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.io import event_set
+from temporian.io.arrow import from_arrow, to_arrow
+
+
+class ArrowTest(parameterized.TestCase):
+    def setUp(self):
+        self.table = pa.table(
+            {
+                "timestamp": [1.0, 2.0, 3.0, 4.0],
+                "f1": [0.5, 1.5, 2.5, 3.5],
+                "f2": pa.array([1, 2, 3, 4], type=pa.int32()),
+                "f3": ["a", "b", None, "a"],
+                "f4": pa.array(["x", "y", "x", "x"]).dictionary_encode(),
+                "f5": [True, False, True, False],
+            }
+        )
+        self.expected = event_set(
+            timestamps=[1.0, 2.0, 3.0, 4.0],
+            features={
+                "f1": [0.5, 1.5, 2.5, 3.5],
+                "f2": np.array([1, 2, 3, 4], dtype=np.int32),
+                "f3": ["a", "b", "", "a"],
+                "f4": ["x", "y", "x", "x"],
+                "f5": [True, False, True, False],
+            },
+        )
+
+    def test_from_arrow(self):
+        evset = from_arrow(self.table)
+        self.assertEqual(evset, self.expected)
+        self.assertEqual(evset.schema, self.expected.schema)
+
+        features = evset.get_arbitrary_index_data().features
+        self.assertTrue(dictionary_encoding.is_encoded(features[2]))
+        self.assertTrue(dictionary_encoding.is_encoded(features[3]))
+
+    def test_from_arrow_zero_copy(self):
+        evset = from_arrow(self.table)
+        self.assertTrue(
+            np.shares_memory(
+                evset.get_arbitrary_index_data().features[0],
+                self.table.column("f1").chunk(0).to_numpy(),
+            )
+        )
+
+    @parameterized.parameters(
+        (lambda t: t.to_batches(max_chunksize=3),),
+        (lambda t: iter(t.to_batches(max_chunksize=1)),),
+        (
+            lambda t: pa.RecordBatchReader.from_batches(
+                t.schema, t.to_batches()
+            ),
+        ),
+        (lambda t: t.to_batches()[0],),
+        (lambda t: pa.concat_tables([t.slice(0, 2), t.slice(2)]),),
+    )
+    def test_from_record_batches(self, convert):
+        self.assertEqual(from_arrow(convert(self.table)), self.expected)
+
+    def test_from_record_batches_with_different_dictionaries(self):
+        batches = [
+            pa.RecordBatch.from_pydict(
+                {
+                    "timestamp": [1.0, 2.0],
+                    "f": pa.array(["b", "c"]).dictionary_encode(),
+                }
+            ),
+            pa.RecordBatch.from_pydict(
+                {
+                    "timestamp": [3.0],
+                    "f": pa.array(["a"]).dictionary_encode(),
+                }
+            ),
+        ]
+        self.assertEqual(
+            from_arrow(batches),
+            event_set(timestamps=[1, 2, 3], features={"f": ["b", "c", "a"]}),
+        )
+
+    def test_from_arrow_with_indexes(self):
+        evset = from_arrow(self.table, indexes=["f4"])
+        self.assertEqual(evset, self.expected.add_index("f4"))
+
+    def test_from_arrow_datetime(self):
+        table = pa.table(
+            {
+                "timestamp": pa.array(
+                    [datetime(2020, 1, 1), datetime(2020, 1, 2)],
+                    type=pa.timestamp("ms"),
+                ),
+                "f": [1, 2],
+            }
+        )
+        evset = from_arrow(table)
+        self.assertTrue(evset.schema.is_unix_timestamp)
+        np.testing.assert_array_equal(
+            evset.get_arbitrary_index_data().timestamps,
+            [1577836800.0, 1577923200.0],
+        )
+
+    def test_from_arrow_missing_timestamps(self):
+        with self.assertRaisesRegex(ValueError, "not found"):
+            from_arrow(self.table, timestamps="t")
+
+    def test_to_arrow(self):
+        table = to_arrow(self.expected)
+        self.assertEqual(
+            table.column_names, ["f1", "f2", "f3", "f4", "f5", "timestamp"]
+        )
+        self.assertEqual(table.column("f1").to_pylist(), [0.5, 1.5, 2.5, 3.5])
+        self.assertEqual(table.column("f2").type, pa.int32())
+        self.assertEqual(
+            table.column("f3").type, pa.dictionary(pa.int32(), pa.string())
+        )
+        self.assertEqual(table.column("f3").to_pylist(), ["a", "b", "", "a"])
+        self.assertEqual(table.column("timestamp").type, pa.float64())
+
+    def test_to_arrow_zero_copy(self):
+        table = to_arrow(self.expected)
+        self.assertTrue(
+            np.shares_memory(
+                self.expected.get_arbitrary_index_data().features[0],
+                table.column("f1").chunk(0).to_numpy(),
+            )
+        )
+
+    def test_to_arrow_with_indexes(self):
+        evset = self.expected.add_index(["f2", "f4"])
+        table = to_arrow(evset)
+        self.assertEqual(table.column_names[:2], ["f2", "f4"])
+        self.assertEqual(
+            table.column("f4").type, pa.dictionary(pa.int32(), pa.string())
+        )
+        self.assertEqual(from_arrow(table, indexes=["f2", "f4"]), evset)
+
+    def test_to_arrow_binary(self):
+        table = to_arrow(self.expected, tp_string_to_arrow_string=False)
+        self.assertEqual(
+            table.column("f3").type, pa.dictionary(pa.int32(), pa.binary())
+        )
+        self.assertEqual(from_arrow(table), self.expected)
+
+    def test_to_arrow_datetime(self):
+        evset = event_set(
+            timestamps=[datetime(2020, 1, 1, 0, 0, 1, 500000)],
+            features={"f": [1]},
+        )
+        table = to_arrow(evset)
+        self.assertEqual(table.column("timestamp").type, pa.timestamp("ns"))
+        self.assertEqual(
+            table.column("timestamp").to_pylist()[0].to_pydatetime(),
+            datetime(2020, 1, 1, 0, 0, 1, 500000),
+        )
+        self.assertEqual(from_arrow(table), evset)
+
+        table = to_arrow(evset, timestamp_to_datetime=False, timestamps=True)
+        self.assertEqual(table.column("timestamp").type, pa.float64())
+
+    def test_to_arrow_without_timestamps(self):
+        table = to_arrow(self.expected, timestamps=False)
+        self.assertNotIn("timestamp", table.column_names)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,149 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from absl.testing import absltest
+from absl.testing import parameterized
+
+from temporian.implementation.numpy.data import dictionary_encoding
+from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data.io import event_set
+from temporian.io.native import load_event_set, save_event_set
+from temporian.io.pandas import from_pandas
+
+
+class NativeTest(parameterized.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "evset")
+        self.evset = event_set(
+            timestamps=[1, 2, 3, 4, 5],
+            features={
+                "f1": [1.0, 2.0, np.nan, 4.0, 5.0],
+                "f2": np.array([1, 2, 3, 4, 5], dtype=np.int32),
+                "f3": ["a", "bb", "", "ccc", "a"],
+                "f4": [True, False, True, True, False],
+                "i1": [1, 1, 2, 2, 2],
+                "i2": ["x", "y", "x", "x", "x"],
+            },
+            indexes=["i1", "i2"],
+            is_unix_timestamp=True,
+        )
+
+    @parameterized.parameters("r", "c", None)
+    def test_save_and_load(self, mmap_mode):
+        save_event_set(self.evset, self.path)
+        result = load_event_set(self.path, mmap_mode=mmap_mode)
+        self.assertEqual(result, self.evset)
+        self.assertEqual(result.schema, self.evset.schema)
+        self.assertIsNotNone(result.columnar)
+        self.assertEqual(
+            isinstance(result.columnar.sampling.timestamps, np.memmap),
+            mmap_mode is not None,
+        )
+
+    def test_read_only(self):
+        save_event_set(self.evset, self.path)
+        result = load_event_set(self.path)
+        with self.assertRaises(ValueError):
+            result.columnar.features[0][0] = 10.0
+
+    def test_operators_on_loaded_evset(self):
+        save_event_set(self.evset, self.path)
+        result = load_event_set(self.path)
+        self.assertEqual(
+            result["f1"].moving_sum(2), self.evset["f1"].moving_sum(2)
+        )
+        self.assertEqual(
+            result.filter(result["f4"]), self.evset.filter(self.evset["f4"])
+        )
+        self.assertEqual(result.drop_index("i2"), self.evset.drop_index("i2"))
+
+    def test_files(self):
+        save_event_set(self.evset, self.path)
+        with open(os.path.join(self.path, "layout.json")) as f:
+            layout = json.load(f)
+        self.assertEqual(layout["num_events"], 5)
+        self.assertEqual(layout["num_index_keys"], 3)
+        self.assertEqual(
+            [feature["dtype"] for feature in layout["features"]],
+            ["<f8", "<i4", "|S3", "|b1"],
+        )
+        timestamps = np.fromfile(
+            os.path.join(self.path, "timestamps.bin"), dtype="<f8"
+        )
+        self.assertEqual(len(timestamps), 5)
+
+    def test_dict_layout(self):
+        evset = EventSet(
+            data={
+                (): IndexData(
+                    features=[np.array([1, 2, 3])],
+                    timestamps=np.array([1.0, 2.0, 3.0]),
+                )
+            },
+            schema=event_set(timestamps=[1], features={"a": [1]}).schema,
+        )
+        self.assertIsNone(evset.columnar)
+        save_event_set(evset, self.path)
+        self.assertEqual(load_event_set(self.path), evset)
+
+    def test_dictionary_encoded(self):
+        evset = from_pandas(
+            pd.DataFrame(
+                {
+                    "timestamp": [1, 2, 3],
+                    "f": pd.Categorical(["a", "b", "a"]),
+                }
+            )
+        )
+        save_event_set(evset, self.path)
+        result = load_event_set(self.path)
+        self.assertEqual(result, evset)
+        self.assertTrue(
+            dictionary_encoding.is_encoded(result.columnar.features[0])
+        )
+
+    def test_empty(self):
+        evset = event_set(
+            timestamps=np.array([], dtype=np.float64),
+            features={"a": np.array([], dtype=np.float32)},
+        )
+        save_event_set(evset, self.path)
+        self.assertEqual(load_event_set(self.path), evset)
+
+        empty_index = self.evset.filter(self.evset["f2"] > 10)
+        save_event_set(empty_index, self.path)
+        self.assertEqual(load_event_set(self.path), empty_index)
+
+    def test_wrong_mmap_mode(self):
+        save_event_set(self.evset, self.path)
+        with self.assertRaisesRegex(ValueError, "mmap_mode"):
+            load_event_set(self.path, mmap_mode="w+")
+
+    def test_truncated_file(self):
+        save_event_set(self.evset, self.path)
+        with open(os.path.join(self.path, "feature_0.bin"), "r+b") as f:
+            f.truncate(8)
+        with self.assertRaisesRegex(ValueError, "contains 8 bytes"):
+            load_event_set(self.path)
+
+
+if __name__ == "__main__":
+    absltest.main()
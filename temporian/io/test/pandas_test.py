@@ -119,6 +119,23 @@ class FromPandasTest(absltest.TestCase):
 
         self.assertEqual(evset, expected_evset)
 
+    def test_presorted(self):
+        df = pd.DataFrame(
+            {
+                "timestamp": [1.0, 2.0, 1.5, 3.0],
+                "store": ["A", "A", "B", "B"],
+                "costs": [10.0, 11.0, 12.0, 13.0],
+            }
+        )
+        evset = from_pandas(df, indexes=["store"], presorted=True)
+        self.assertEqual(evset, from_pandas(df, indexes=["store"]))
+        self.assertTrue(
+            np.shares_memory(
+                evset.get_index_value(("A",)).features[0],
+                df["costs"].to_numpy(),
+            )
+        )
+
     def test_string_in_index(self):
         evset = from_pandas(
             pd.DataFrame(
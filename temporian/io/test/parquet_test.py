@@ -14,14 +14,25 @@
 
 import datetime
 import math
-from tempfile import NamedTemporaryFile
+import os
+from tempfile import NamedTemporaryFile, mkdtemp
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 from absl.testing import absltest
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from temporian.implementation.numpy.data.io import event_set
-from temporian.io.parquet import from_parquet, to_parquet
+from temporian.io import parquet
+from temporian.io.parquet import (
+    from_parquet,
+    from_parquet_dataset,
+    to_parquet,
+    to_parquet_dataset,
+)
 from temporian.test.utils import assertEqualDFRandomRowOrder
 
 
@@ -41,6 +52,247 @@ class ParquetEventSet(absltest.TestCase):
         result = from_parquet(f.name, indexes=["product_id"])
         self.assertEqual(es, result)
 
+    def test_projection_and_filters(self) -> None:
+        es = event_set(
+            timestamps=np.arange(20.0),
+            features={
+                "k": np.repeat(["a", "b"], 10),
+                "j": np.tile([1, 2], 10),
+                "f1": np.arange(20),
+                "f2": np.arange(20.0),
+            },
+        )
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name)
+
+        result = from_parquet(
+            f.name,
+            indexes=["k", "j"],
+            features=["f2"],
+            time_range=(5, 16),
+            index_values=[("a", 1), ("b", 2)],
+        )
+        expected = event_set(
+            timestamps=[6.0, 8.0, 11.0, 13.0, 15.0],
+            features={
+                "k": ["a", "a", "b", "b", "b"],
+                "j": [1, 1, 2, 2, 2],
+                "f2": [6.0, 8.0, 11.0, 13.0, 15.0],
+            },
+            indexes=["k", "j"],
+        )
+        self.assertEqual(result, expected)
+
+        result = from_parquet(f.name, indexes=["k"], index_values="b")
+        self.assertEqual(result, es.add_index("k").select_index_values("b"))
+
+        result = from_parquet(f.name, indexes=["k"], index_values=[])
+        self.assertEqual(result.num_events(), 0)
+
+        result = from_parquet(f.name, time_range=(None, 2.5))
+        self.assertEqual(result, es.filter(es.timestamps() < 2.5))
+
+    def test_row_groups(self) -> None:
+        table = pa.table(
+            {
+                "timestamp": pa.array(
+                    np.arange(100, dtype=np.int64) * 1000,
+                    type=pa.timestamp("ms"),
+                ),
+                "customer": np.repeat(["a", "b", "c", "d"], 25),
+                "f": np.arange(100),
+            }
+        )
+        f = NamedTemporaryFile(delete=False, suffix=".parquet")
+        pq.write_table(table, f.name, row_group_size=10)
+
+        result = from_parquet(
+            f.name,
+            indexes=["customer"],
+            time_range=(
+                datetime.datetime(1970, 1, 1, 0, 0, 30),
+                np.datetime64("1970-01-01T00:00:52.5"),
+            ),
+            index_values=["b", "c"],
+        )
+        self.assertTrue(result.schema.is_unix_timestamp)
+        self.assertEqual(
+            result,
+            event_set(
+                timestamps=np.arange(30.0, 53.0),
+                features={
+                    "customer": ["b"] * 20 + ["c"] * 3,
+                    "f": np.arange(30, 53),
+                },
+                indexes=["customer"],
+                is_unix_timestamp=True,
+            ),
+        )
+
+    def test_to_parquet_row_groups(self) -> None:
+        es = event_set(
+            timestamps=np.arange(20.0),
+            features={
+                "k": np.repeat(["a", "b", "c", "d"], 5),
+                "f": np.arange(20),
+            },
+            indexes=["k"],
+        )
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name, batch_size=8)
+
+        parquet_file = pq.ParquetFile(f.name)
+        # One row group per batch of index keys.
+        self.assertEqual(parquet_file.metadata.num_row_groups, 4)
+        self.assertEqual(
+            parquet_file.schema_arrow.field("k").type,
+            pa.dictionary(pa.int32(), pa.string()),
+        )
+        self.assertEqual(from_parquet(f.name, indexes=["k"]), es)
+
+        to_parquet(es, f.name, batch_size=10)
+        self.assertEqual(pq.ParquetFile(f.name).metadata.num_row_groups, 2)
+
+    def test_to_parquet_empty(self) -> None:
+        es = event_set(timestamps=[1.0], features={"f": [1], "k": ["a"]})
+        es = es.filter(es["f"] > 1)
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name)
+        self.assertEqual(from_parquet(f.name).num_events(), 0)
+
+    def test_unknown_column(self) -> None:
+        es = event_set(timestamps=[1.0], features={"f": [1]})
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name)
+        with self.assertRaisesRegex(ValueError, "Column 'g' not found"):
+            from_parquet(f.name, features=["g"])
+
+    def test_pandas_index(self) -> None:
+        df = pd.DataFrame(
+            {"timestamp": [1.0, 2.0, 3.0], "v": [1, 2, 3]}, index=[4, 0, 7]
+        )
+        f = NamedTemporaryFile(delete=False)
+        # The index is saved in the "__index_level_0__" column.
+        df.to_parquet(f.name)
+        self.assertIn("__index_level_0__", pq.read_schema(f.name).names)
+
+        result = from_parquet(f.name)
+
+        expected = event_set(
+            timestamps=[1.0, 2.0, 3.0], features={"v": [1, 2, 3]}
+        )
+        self.assertEqual(result, expected)
+
+    def test_unsupported_kwargs(self) -> None:
+        es = event_set(timestamps=[1.0], features={"f": [1]})
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name)
+        with self.assertRaisesRegex(ValueError, "Unsupported arguments"):
+            from_parquet(f.name, engine="pyarrow")
+
+    def _sales(self):
+        return event_set(
+            timestamps=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            features={
+                "region": ["EU", "EU", "US", "US", "a/b=c%", "EU"],
+                "store": [1, 2, 1, 1, 3, 1],
+                "price": [10.0, 11.0, 12.0, 13.0, 14.0, 15.0],
+            },
+            indexes=["region", "store"],
+        )
+
+    def test_parquet_dataset(self) -> None:
+        es = self._sales()
+        path = mkdtemp()
+        to_parquet_dataset(es, path, partition_by=["region"])
+        self.assertCountEqual(
+            os.listdir(path),
+            [
+                "_common_metadata",
+                "region=EU",
+                "region=US",
+                "region=a%2Fb%3Dc%25",
+            ],
+        )
+        # The partition index is not stored in the files.
+        self.assertEqual(
+            pq.read_schema(
+                os.path.join(path, "region=EU", "part-0.parquet")
+            ).names,
+            ["store", "price", "timestamp"],
+        )
+
+        result = from_parquet_dataset(path)
+        self.assertEqual(result, es)
+        self.assertEqual(result.schema, es.schema)
+
+        result = from_parquet_dataset(
+            path, index_values=[("EU", 1), ("a/b=c%", 3), ("FR", 1)]
+        )
+        self.assertEqual(
+            result, es.select_index_values([("EU", 1), ("a/b=c%", 3)])
+        )
+
+        result = from_parquet_dataset(
+            path, indexes=["region"], features=["price"], time_range=(2, 6)
+        )
+        self.assertEqual(
+            result,
+            event_set(
+                timestamps=[2.0, 3.0, 4.0, 5.0],
+                features={
+                    "region": ["EU", "US", "US", "a/b=c%"],
+                    "price": [11.0, 12.0, 13.0, 14.0],
+                },
+                indexes=["region"],
+            ),
+        )
+
+    def test_parquet_dataset_only_reads_matching_partitions(self) -> None:
+        es = self._sales()
+        path = mkdtemp()
+        to_parquet_dataset(es, path)
+        self.assertTrue(
+            os.path.isdir(os.path.join(path, "region=EU", "store=2"))
+        )
+
+        with mock.patch.object(
+            parquet,
+            "_list_parquet_files",
+            wraps=parquet._list_parquet_files,
+        ) as list_files:
+            result = from_parquet_dataset(path, index_values=[("US", 1)])
+        list_files.assert_called_once_with(
+            [os.path.join(path, "region=US", "store=1")]
+        )
+        self.assertEqual(result, es.select_index_values([("US", 1)]))
+
+        # Only the first partition level matches "region".
+        with mock.patch.object(
+            parquet,
+            "_list_parquet_files",
+            wraps=parquet._list_parquet_files,
+        ) as list_files:
+            result = from_parquet_dataset(
+                path, indexes=["region"], index_values="EU"
+            )
+        list_files.assert_called_once_with([os.path.join(path, "region=EU")])
+        self.assertEqual(result.num_events(), 3)
+
+        result = from_parquet_dataset(path, index_values=[])
+        self.assertEqual(result.num_events(), 0)
+        self.assertEqual(result.schema, es.schema)
+
+    def test_parquet_dataset_errors(self) -> None:
+        es = self._sales()
+        path = mkdtemp()
+        with self.assertRaisesRegex(ValueError, "not an index"):
+            to_parquet_dataset(es, path, partition_by=["price"])
+
+        to_parquet(es, os.path.join(path, "_common_metadata"))
+        with self.assertRaisesRegex(ValueError, "tp.to_parquet_dataset"):
+            from_parquet_dataset(path)
+
 
 if __name__ == "__main__":
     absltest.main()
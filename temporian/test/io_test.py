@@ -1,11 +1,15 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 from absl.testing import absltest
 
 import temporian as tp
+from temporian.io import csv
+from temporian.io.csv import _IndexKeyBuffers
 from temporian.test.utils import get_test_data_path
 
 
@@ -59,6 +63,156 @@ class IOTest(absltest.TestCase):
 
             self.assertEqual(evset, saved_evset)
 
+    def test_to_csv_batches(self) -> None:
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5],
+            features={
+                "f": [1.0, 2.0, np.nan, 4.0, 5.0],
+                "k": ["b", "a", "b", "c", "a"],
+            },
+            indexes=["k"],
+        )
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            tp.to_csv(evset, path, batch_size=2, na_rep="NA")
+            with open(path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines[0], "k,f,timestamp")
+            # The events of each index key are contiguous and sorted.
+            self.assertEqual(
+                sorted(lines[1:], key=lambda line: line[0]),
+                [
+                    "a,2.0,2.0",
+                    "a,5.0,5.0",
+                    "b,1.0,1.0",
+                    "b,NA,3.0",
+                    "c,4.0,4.0",
+                ],
+            )
+
+            empty = evset.filter(evset["f"] > 10)
+            tp.to_csv(empty, path)
+            with open(path) as f:
+                self.assertEqual(f.read(), "k,f,timestamp\n")
+
+    def test_from_csv_chunked(self) -> None:
+        rng = np.random.default_rng(0)
+        n = 500
+        df = pd.DataFrame(
+            {
+                "timestamp": rng.integers(0, 50, n),
+                "k1": rng.choice(["a", "b", "c"], n),
+                "k2": rng.integers(0, 3, n),
+                "s": rng.choice(["x", "yy", None], n),
+                "f": rng.random(n),
+                # Integer in most blocks, float in the block with the NaN.
+                "i": rng.integers(0, 5, n).astype(str),
+                "order": np.arange(n),
+            }
+        )
+        df.loc[300, "i"] = ""
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            df.to_csv(path, index=False)
+            for indexes in [[], ["k1"], ["k1", "k2"]]:
+                expected = tp.from_csv(path, indexes=indexes)
+                evset = tp.from_csv(path, indexes=indexes, chunk_size=37)
+                self.assertEqual(evset, expected)
+                self.assertEqual(evset.schema, expected.schema)
+                self.assertIsNotNone(evset.columnar)
+
+                # Events with the same timestamp keep the order of the file.
+                order_idx = evset.schema.feature_names().index("order")
+                for index_key, index_data in expected.data.items():
+                    np.testing.assert_array_equal(
+                        evset.data[index_key].features[order_idx],
+                        index_data.features[order_idx],
+                    )
+
+    def test_from_csv_chunked_string_dtypes(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            with open(path, "w") as f:
+                f.write("timestamp,k,s\n1,a,x\n2,b,\n3,a,yy\n4,b,x\n")
+            # Pandas parses the strings with the "object" dtype, or with the
+            # "str" dtype if "future.infer_string" is enabled.
+            for infer_string in [False, True]:
+                with pd.option_context("future.infer_string", infer_string):
+                    expected = tp.from_csv(path, indexes=["k"])
+                    with mock.patch.object(
+                        csv, "from_pandas", wraps=csv.from_pandas
+                    ) as from_pandas:
+                        evset = tp.from_csv(path, indexes=["k"], chunk_size=3)
+                self.assertEqual(evset, expected)
+                self.assertEqual(evset.schema, expected.schema)
+
+                # The string columns of each block are dictionary encoded.
+                block_dfs = [c.args[0] for c in from_pandas.call_args_list]
+                self.assertLen(block_dfs, 2)
+                for df in block_dfs:
+                    for column in ["k", "s"]:
+                        self.assertIsInstance(
+                            df[column].dtype, pd.CategoricalDtype
+                        )
+
+    def test_from_csv_chunked_dates(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            with open(path, "w") as f:
+                f.write("date,f\n2023-01-02,1\n2023-01-01,2\n2023-01-03,3\n")
+            evset = tp.from_csv(path, timestamps="date", chunk_size=2)
+            self.assertEqual(evset, tp.from_csv(path, timestamps="date"))
+            self.assertTrue(evset.schema.is_unix_timestamp)
+
+    def test_from_csv_chunked_index_types(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            for content in [
+                # Some blocks of the index only contain missing values.
+                "timestamp,k,v\n1,a,1\n2,,2\n3,b,3\n4,,4\n5,a,5\n6,,6\n",
+                # The index is an integer in some blocks only.
+                "timestamp,k,v\n1,1,1\n2,x,2\n3,1,3\n4,2,4\n",
+                # The index is a float in some blocks only.
+                "timestamp,k,v\n1,1,1\n2,,2\n3,1,3\n",
+            ]:
+                with open(path, "w") as f:
+                    f.write(content)
+                expected = tp.from_csv(path, indexes=["k"])
+                evset = tp.from_csv(path, indexes=["k"], chunk_size=1)
+                self.assertEqual(evset, expected)
+                self.assertEqual(evset.schema, expected.schema)
+                self.assertEqual(
+                    evset.add_index("v").num_events(), evset.num_events()
+                )
+
+    def test_index_key_buffers_different_indexes(self) -> None:
+        buffers = _IndexKeyBuffers()
+        buffers.append(
+            tp.event_set(
+                timestamps=[1], features={"k": [1], "v": [1]}, indexes=["k"]
+            )
+        )
+        with self.assertRaisesRegex(ValueError, "same indexes"):
+            buffers.append(
+                tp.event_set(
+                    timestamps=[2],
+                    features={"k": ["x"], "v": [2]},
+                    indexes=["k"],
+                )
+            )
+
+    def test_from_csv_chunked_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            with open(path, "w") as f:
+                f.write("timestamp,f\n")
+            evset = tp.from_csv(path, chunk_size=10)
+            self.assertEqual(evset.num_events(), 0)
+
+            with self.assertRaisesRegex(ValueError, "chunk_size"):
+                tp.from_csv(path, chunk_size=0)
+
 
 if __name__ == "__main__":
     absltest.main()
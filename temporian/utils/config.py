@@ -75,3 +75,8 @@ display_disable_color = bool(
     os.environ.get("TEMPORIAN_DISPLAY_DISABLE_COLOR", False)
 )
 """Whether to disable color when displaying an EventSet in a notebook."""
+
+# Parallel execution
+num_index_threads = int(os.environ.get("TEMPORIAN_NUM_INDEX_THREADS", 1))
+"""Number of threads used by the operators to process the index keys of an
+EventSet in parallel. If 1, the index keys are processed sequentially."""